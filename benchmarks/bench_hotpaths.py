@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""Бенчмарк горячих путей игры на синтетическом словаре с JSON-базой для сравнения!
+
+    python benchmarks/bench_hotpaths.py --words 50000 --out results.json [--baseline baseline.json]
+
+Замеряются: ход быстрого, умного и сильного бота (searchAI), проверка слова игрока
+(search_word), выбор первого слова (begin_game), толкование слова из файла
+толкований (print_it: блок с диска и из кеша),
+проверка выделения (is_correct_select), запись хода в журнал (с fsync) и
+восстановление партии из журнала со снимком и без него, подсказка (первый ход и лучший ход позиции).
+С --baseline печатается сравнение и код возврата 1 при регрессии; код 1 и
+при p95 хода сильного бота больше бюджета STRONG_BUDGET с допуском threshold."""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from synthetic import make_dictionary
+from database import Database
+from engine import Game, Lexicon, Move
+from bots import FastBot, SmartBot, StrongBot, STRONG_BUDGET
+from startwords import StartWords
+from journal import Journal
+from definitions import Definitions, compile_definitions
+
+POSITIONS = 12  # позиций для замеров ходов ботов (от начала партии до эндшпиля)
+STRONG_RUNS = 20  # ходов сильного бота (каждый - почти весь бюджет времени)
+
+
+def measure(func, repeat: int) -> dict:
+    """Время одного вызова func(i) в микросекундах: среднее, медиана, p95!"""
+    times = []
+    for i in range(repeat):
+        t = time.perf_counter()
+        func(i)
+        times.append((time.perf_counter() - t) * 1e6)
+    times.sort()
+    return {'mean_us': sum(times) / len(times), 'p50_us': times[len(times) // 2],
+            'p95_us': times[min(len(times) - 1, int(len(times) * 0.95))], 'runs': len(times)}
+
+
+def positions(lexicon: Lexicon, count: int) -> list:
+    """Позиции партии умного бота с самим собой (снимки после каждого хода)!"""
+    random.seed(1)
+    game = Game.new(lexicon, random.choice([w for w in lexicon.words if len(w) == 5]))
+    game.tracker  # учет путей быстрого бота ведется в партии, как в приложении
+    result = [game.copy()]
+    bot = SmartBot()
+    while len(result) < count and not game.is_over():
+        move = bot.choose(game)
+        if move is None:
+            break
+        game.apply(move)
+        result.append(game.copy())
+    return result
+
+
+def run(path: str, repeat: int) -> dict:
+    db = Database(path)
+    results = {}
+
+    t = time.perf_counter()
+    lexicon = Lexicon(db.words)
+    lexicon.trie, lexicon.index
+    results['load_lexicon'] = {'mean_us': (time.perf_counter() - t) * 1e6, 'runs': 1}
+
+    games = positions(lexicon, POSITIONS)
+    words = lexicon.words
+    rnd = random.Random(2)
+
+    # begin_game: выбор случайного 5-буквенного слова (таблица rowid строится при первой игре)
+    start_words = StartWords.from_database(db)
+    results['begin_game'] = measure(lambda i: start_words.choose(rnd), repeat)
+
+    # searchAI: быстрый бот (снимок партии, как в потоке поиска) и умный бот
+    results['searchAI_fast'] = measure(lambda i: FastBot().choose(games[i % len(games)].copy()), repeat)
+    results['searchAI_smart'] = measure(lambda i: SmartBot().choose(games[i % len(games)]), repeat)
+    results['searchAI_strong'] = measure(lambda i: StrongBot().choose(games[i % len(games)]), min(repeat, STRONG_RUNS))
+
+    # search_word: проверка слова игрока (половина - несуществующие слова)
+    game = games[-1]
+    moves = game.legal_moves()[:50] or [Move((10, 15), words[0][:2])]
+    probes = [moves[i % len(moves)] if i % 2 else Move(moves[i % len(moves)].path, 'Ъ' * len(moves[i % len(moves)].path))
+              for i in range(repeat)]
+    results['search_word'] = measure(lambda i: game.check_move(probes[i]), repeat)
+
+    # print_it: толкование слова по нажатию в истории (блок читается и распаковывается или берется из кеша)
+    sample = [rnd.choice(words) for _ in range(repeat)]
+    with tempfile.TemporaryDirectory() as tmp:
+        compile_definitions(path, os.path.join(tmp, 'definitions.bin'))
+        definitions = Definitions(os.path.join(tmp, 'definitions.bin'), lexicon, db)
+        store = definitions.opened()
+
+        def cold(i):
+            store.cache.clear()
+            definitions.comment(sample[i])
+        results['print_it_cold'] = measure(cold, repeat)
+        results['print_it_cached'] = measure(lambda i: definitions.comment(sample[0]), repeat)
+        definitions.close()
+
+    # is_correct_select: проверка выделенного пути
+    paths = [move.path for move in moves] + [(0, 1, 2, 3, 4, 9), (4, 5), (10, 11)]
+    results['is_correct_select'] = measure(lambda i: game.check_selection(paths[i % len(paths)]), repeat)
+
+    # show_hint: первый найденный ход и лучший ход позиции (должны укладываться в кадр)
+    results['analyse_first'] = measure(lambda i: next(games[i % len(games)].analyse(first_n=1), None), repeat)
+    results['analyse_best'] = measure(lambda i: next(games[i % len(games)].analyse(True, 1), None), repeat)
+
+    # play_move / load_game: запись хода в журнал и восстановление партии
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = Journal(os.path.join(tmp, 'journal.bin'))
+        journal.start(games[0], 1, True, 0)
+        for game in games[1:]:  # партия целиком: снимок после каждых SNAPSHOT_EVERY ходов
+            journal.append(game)
+        journal.close()
+        results['journal_load_snapshot'] = measure(lambda i: Journal(journal.path).load(lexicon), repeat)
+        os.remove(journal.snapshot_path)
+        results['journal_load_replay'] = measure(lambda i: Journal(journal.path).load(lexicon), repeat)
+
+        journal = Journal(os.path.join(tmp, 'append.bin'))
+        journal.start(games[0], 1, True, 0)
+        results['journal_append'] = measure(lambda i: journal.append(games[-1]), repeat)
+        journal.close()
+
+    db.close()
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """Печатает сравнение с базой, True - если есть регрессия!"""
+    regress = False
+    for name, value in results.items():
+        old = baseline.get('results', {}).get(name)
+        if not old:
+            continue
+        key = 'p50_us' if 'p50_us' in value and 'p50_us' in old else 'mean_us'
+        ratio = value[key] / old[key] if old[key] else 1.0
+        mark = ''
+        if ratio > 1 + threshold:
+            mark, regress = '  <-- регрессия', True
+        print('{:<20} {:>12.1f} -> {:>12.1f} мкс ({:+.0%}){}'.format(name, old[key], value[key], ratio - 1, mark))
+    return regress
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=50000, help='размер синтетического словаря (10000-200000)')
+    parser.add_argument('--db', help='готовый словарь вместо синтетического')
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--out', default='bench_hotpaths.json')
+    parser.add_argument('--baseline', help='JSON предыдущего прогона для сравнения')
+    parser.add_argument('--threshold', type=float, default=0.25, help='допустимое замедление')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db or make_dictionary(os.path.join(tmp, 'dictionary.db'), args.words)
+        results = run(path, args.repeat)
+
+    for name, value in results.items():
+        print('{:<20} {:>12.1f} мкс'.format(name, value.get('p50_us', value['mean_us'])))
+
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump({'words': None if args.db else args.words, 'python': sys.version.split()[0],
+                   'results': results}, f, ensure_ascii=False, indent=2)
+
+    failed = False
+    strong = results['searchAI_strong']['p95_us']
+    if strong > STRONG_BUDGET * 1e6 * (1 + args.threshold):  # бюджет хода сильного бота не соблюдается
+        print('searchAI_strong: p95 {:.0f} мс при бюджете {:.0f} мс  <-- превышение'.format(strong / 1000, STRONG_BUDGET * 1000))
+        failed = True
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            if compare(results, json.load(f), args.threshold):
+                failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
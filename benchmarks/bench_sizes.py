@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Бенчмарк задержки хода на полях 5x5, 6x6 и 7x7 на синтетическом словаре!
+
+    python benchmarks/bench_sizes.py --words 50000 --games 5 --out bench_sizes.json
+
+Для каждого размера поля играются партии бота с самим собой (быстрый и
+умный бот) и замеряются: задержка хода, проверка наличия хода после хода
+(has_any_legal_move), лучший ход для подсказки (analyse) и пиковая память
+поиска хода (tracemalloc), которая не должна расти вместе с числом путей."""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from synthetic import make_dictionary
+from database import Database
+from engine import Game, Lexicon
+from bots import FastBot, SmartBot
+from startwords import StartWords
+
+SIZES = (5, 6, 7)
+BOTS = {'fast': FastBot, 'smart': SmartBot}
+
+
+def summary(times: list) -> dict:
+    """Задержки в миллисекундах: медиана, p95, максимум!"""
+    times = sorted(times)
+    return {'p50_ms': times[len(times) // 2] * 1000, 'p95_ms': times[min(len(times) - 1, int(len(times) * 0.95))] * 1000,
+            'max_ms': times[-1] * 1000, 'moves': len(times)}
+
+
+def play(lexicon: Lexicon, start_words: StartWords, size: int, bot_class, games: int) -> dict:
+    """Партии бота с самим собой на поле size x size!"""
+    latency, check, hint, peak = [], [], [], 0
+    for i in range(games):
+        random.seed(i)
+        game = Game.new(lexicon, start_words.choose(), 0, size)
+        bot = bot_class()
+        while True:
+            t = time.perf_counter()
+            over = game.is_over()  # проверка конца игры после каждого хода, как в next_turn
+            check.append(time.perf_counter() - t)
+            if over:
+                break
+
+            t = time.perf_counter()
+            next(game.analyse(True, 1), None)
+            hint.append(time.perf_counter() - t)
+
+            t = time.perf_counter()
+            move = bot.choose(game)
+            latency.append(time.perf_counter() - t)
+
+            tracemalloc.start()  # память - повтором поиска (под tracemalloc поиск в разы медленнее)
+            bot_class().choose(game.copy())
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            if move is None:
+                break
+            game.apply(move)
+    result = summary(latency)
+    result.update(has_move_p95_ms=summary(check)['p95_ms'], hint_p95_ms=summary(hint)['p95_ms'], peak_kb=peak / 1024)
+    return result
+
+
+def run(path: str, games: int) -> dict:
+    db = Database(path)
+    lexicon = Lexicon(db.words)
+    lexicon.trie, lexicon.index
+    results = {}
+    for size in SIZES:
+        start_words = StartWords.from_words(lexicon.words, size, keep=0)
+        for name, bot_class in BOTS.items():
+            results['{}x{}_{}'.format(size, size, name)] = play(lexicon, start_words, size, bot_class, games)
+    db.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=50000, help='размер синтетического словаря')
+    parser.add_argument('--db', help='готовый словарь вместо синтетического')
+    parser.add_argument('--games', type=int, default=5, help='партий на каждый размер и бота')
+    parser.add_argument('--out', default='bench_sizes.json')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.db or make_dictionary(os.path.join(tmp, 'dictionary.db'), args.words)
+        results = run(path, args.games)
+
+    print('{:<12} {:>8} {:>8} {:>8} {:>10} {:>10} {:>10}'.format('', 'p50 мс', 'p95 мс', 'max мс', 'ход? мс', 'совет мс', 'память КБ'))
+    for name, value in results.items():
+        print('{:<12} {:>8.2f} {:>8.2f} {:>8.2f} {:>10.2f} {:>10.2f} {:>10.0f}'.format(
+            name, value['p50_ms'], value['p95_ms'], value['max_ms'], value['has_move_p95_ms'], value['hint_p95_ms'], value['peak_kb']))
+
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump({'words': None if args.db else args.words, 'python': sys.version.split()[0],
+                   'results': results}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
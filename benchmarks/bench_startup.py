@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Микро-бенчмарк запуска: прежний модуль combi.py против ленивой PathTable!
+
+Каждый замер выполняется в отдельном чистом интерпретаторе. Время меряется
+без tracemalloc, память (объем, занятый после импорта) - отдельным запуском.
+
+    python benchmarks/bench_startup.py [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from paths import PathTable
+
+PROBE = '''
+import sys, time, tracemalloc
+sys.path.insert(0, {path!r})
+if {memory}: tracemalloc.start()
+t = time.perf_counter()
+{stmt}
+t = time.perf_counter() - t
+print(t, tracemalloc.get_traced_memory()[0] if {memory} else 0)
+'''
+
+LEGACY = 'from combi import COMBI; len(COMBI)'
+CASES = (
+    ('combi.py, разбор исходника', LEGACY, ['-B'], False),
+    ('combi.py, готовый .pyc', LEGACY, [], False),
+    ('import paths (при запуске)', 'import paths', [], True),
+    ('get_paths() (первый ход бота)', 'from paths import get_paths; len(get_paths())', [], True),
+)
+
+
+def write_legacy(directory: str) -> None:
+    """Воссоздает прежний модуль combi.py с литералом кортежей!"""
+    with open(os.path.join(directory, 'combi.py'), 'w', encoding='utf-8') as f:
+        f.write('# возможные комбинации построения слов для ИИ\nCOMBI = ' + repr(tuple(PathTable())) + '\n')
+
+
+def probe(path: str, stmt: str, flags: list, memory: bool) -> float:
+    out = subprocess.run([sys.executable] + flags + ['-c', PROBE.format(path=path, stmt=stmt, memory=memory)],
+                         check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout.split()
+    return float(out[1]) if memory else float(out[0])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as legacy:
+        write_legacy(legacy)
+        print('{:<32} {:>10} {:>12}'.format('', 'время, мс', 'память, КБ'))
+        for name, stmt, flags, own in CASES:
+            path = ROOT if own else legacy
+            times = [probe(path, stmt, flags, False) for _ in range(args.repeat)]
+            memory = probe(path, stmt, flags, True)
+            print('{:<32} {:>10.1f} {:>12.1f}'.format(name, statistics.median(times) * 1000, memory / 1024))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""Синтетический словарь для бенчмарков: таблица DICT (WORD, LEN, COMMENT)!
+
+    python benchmarks/synthetic.py --words 50000 --out /tmp/dictionary.db
+
+Настоящий dictionary.db в репозиторий не входит, поэтому бенчмарки работают
+на словаре той же схемы: слова из русских букв (чередование согласных и
+гласных, как в живых словах), длины от 2 до 15 с пиком на 5-8 буквах."""
+
+import argparse
+import random
+import sqlite3
+
+CONSONANTS = 'бвгджзйклмнпрстфхцчшщ'
+VOWELS = 'аеиоуыэюя'
+TAILS = 'ьъ'
+LENGTHS = (2, 3, 3, 4, 4, 4, 5, 5, 5, 5, 6, 6, 6, 6, 7, 7, 7, 7, 8, 8, 8, 9, 9, 10, 10, 11, 12, 13, 14, 15)
+
+
+def make_word(rnd: random.Random, length: int) -> str:
+    letters = []
+    vowel = rnd.random() < 0.3
+    for _ in range(length):
+        letters.append(rnd.choice(VOWELS if vowel else CONSONANTS))
+        vowel = not vowel if rnd.random() < 0.85 else vowel
+    if length > 3 and rnd.random() < 0.05:
+        letters[-1] = rnd.choice(TAILS)
+    return ''.join(letters)
+
+
+def make_words(count: int, seed: int = 1) -> list:
+    """count различных слов, одинаковых для одного seed!"""
+    rnd = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add(make_word(rnd, rnd.choice(LENGTHS)))
+    return sorted(words)
+
+
+def make_dictionary(path: str, count: int = 50000, seed: int = 1) -> str:
+    """Создает (перезаписывает) базу path с таблицей DICT!"""
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute('drop table if exists DICT')
+        conn.execute('create table DICT (WORD text, LEN integer, COMMENT text)')
+        rnd = random.Random(seed)
+        conn.executemany('insert into DICT values (?, ?, ?)', (
+            (word, len(word), '[b]' + word.upper() + '[/b]\n\n' + ' '.join(make_word(rnd, rnd.randint(2, 9)) for _ in range(rnd.randint(5, 20))))
+            for word in make_words(count, seed)))
+        conn.commit()
+    finally:
+        conn.close()
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=50000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--out', default='dictionary.db')
+    args = parser.parse_args()
+    make_dictionary(args.out, args.words, args.seed)
+
+
+if __name__ == '__main__':
+    main()
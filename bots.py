@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+
+from abc import ABC, abstractmethod
+from threading import Event
+from trie import find_moves, iter_moves
+from paths import TABLE_SIZES
+from state import LETTERS
+from engine import Move
+import random
+import time
+
+MASK64 = (1 << 64) - 1
+
+
+class SearchCancelled(Exception):
+    """Поиск хода прерван (новая игра, пауза приложения)!"""
+    pass
+
+
+class CancelToken:
+    """Признак отмены поиска, общий для главного потока и потока поиска!"""
+
+    def __init__(self) -> None:
+        self.event = Event()
+
+    def cancel(self) -> None:
+        self.event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.event.is_set()
+
+    def check(self) -> None:
+        if self.event.is_set():
+            raise SearchCancelled()
+
+
+def fast_move(state, paths, candidates, index, token: CancelToken = None, stats: dict = None) -> tuple:
+    """Быстрый бот: случайный перебор путей с одной пустой клеткой и поиск по шаблону!
+
+    Возвращает ход (путь, слово) или None и список исчерпанных путей.
+    В stats (если передан) - число просмотренных путей, повторных попыток и
+    слов, отброшенных как уже сыгранные."""
+    variants = list(candidates)
+    exhausted = []
+    rejected = 0
+    while variants:
+        if token: token.check()
+        pid = random.choice(variants)
+        selection = paths[pid]
+        matches = index.match(state.word(selection))
+        words = [word for word in matches if word not in state.used_words]
+        rejected += len(matches) - len(words)
+
+        if words:  # найдено в словаре
+            if stats is not None:
+                stats.update(candidates=len(exhausted) + 1, retries=len(exhausted), rejected_used=rejected)
+            return (selection, random.choice(words)), exhausted
+
+        # нет результата в переборке выбранных слов
+        variants.remove(pid)
+        exhausted.append(pid)
+
+    if stats is not None:
+        stats.update(candidates=len(exhausted), retries=len(exhausted), rejected_used=rejected)
+    return None, exhausted  # закончились возможные варианты, но результата нет ...
+
+
+def walk_move(state, trie, token: CancelToken = None, stats: dict = None):
+    """Быстрый бот без таблицы путей: ходы от случайных начальных клеток по префиксному дереву!
+
+    Начальные клетки перебираются в случайном порядке, ход выбирается
+    случайно среди ходов первой клетки, от которой они есть, поэтому обход
+    не просматривает все поле, а память не зависит от его размера."""
+    starts = list(range(len(state.letters)))
+    random.shuffle(starts)
+    moves = []
+    for path, word in iter_moves(state.matrix(), trie, state.used_words, state.size, starts):
+        if moves and path[0] != moves[0][0][0]:  # ходы следующей начальной клетки
+            break
+        moves.append((path, word))
+    if token: token.check()
+    if stats is not None:
+        stats['candidates'] = len(moves)
+    return random.choice(moves) if moves else None
+
+
+def smart_move(state, trie, token: CancelToken = None, stats: dict = None):
+    """Умный бот: самое длинное слово из всех ходов, найденных по префиксному дереву!"""
+    moves = find_moves(state.matrix(), trie, state.used_words, state.size)
+    if token: token.check()
+    if stats is not None:
+        stats['candidates'] = len(moves)
+    if not moves:
+        return None
+
+    len_max = max([len(word) for path, word in moves])  # max длина слова
+    return random.choice([move for move in moves if len(move[1]) == len_max])
+
+
+FAST, SMART, STRONG = 0, 1, 2  # уровни бота
+STRONG_BUDGET = 0.3  # время на ход сильного бота, сек
+
+_zobrist = {}
+
+
+def zobrist(size: int = 5) -> list:
+    """Случайные 64-битные ключи (клетка, код буквы) для хеша позиции!"""
+    if size not in _zobrist:
+        rnd = random.Random(size)
+        _zobrist[size] = [[rnd.getrandbits(64) for _ in LETTERS] for _ in range(size * size)]
+    return _zobrist[size]
+
+
+def position_key(state) -> int:
+    """Хеш Зобриста: буквы на поле и сыгранные слова (порядок ходов не важен)!"""
+    table = zobrist(state.size)
+    key = 0
+    for cell, code in enumerate(state.letters):
+        if code:
+            key ^= table[cell][code]
+    for word in state.used_words:
+        key ^= hash(word) & MASK64
+    return key
+
+
+class SearchTimeout(Exception):
+    """Время на ход истекло!"""
+    pass
+
+
+class StrongSearch:
+    """Сильный бот: негамакс с альфа-бета отсечением и итеративным углублением!
+
+    Оценка позиции - разница очков, которые еще наберут ходящий и соперник.
+    Ходы упорядочены по длине слова (сначала лучший ход из таблицы
+    транспозиций), глубина растет, пока не истечет бюджет времени, поэтому
+    задержка ограничена, а сила игры зависит от скорости устройства."""
+
+    EXACT, LOWER, UPPER = 0, 1, 2
+
+    def __init__(self, trie, budget: float = STRONG_BUDGET, token: CancelToken = None) -> None:
+        self.trie = trie
+        self.budget = budget
+        self.token = token
+        self.table = {}  # таблица транспозиций: ключ -> (глубина, оценка, тип, лучший ход)
+        self.deadline = 0.0
+        self.nodes = 0
+
+    def moves(self, state, best=None) -> list:
+        moves = find_moves(state.matrix(), self.trie, state.used_words, state.size)
+        moves.sort(key=lambda move: len(move[1]), reverse=True)
+        if best in moves:
+            moves.remove(best)
+            moves.insert(0, best)
+        return moves
+
+    def child(self, state, key: int, move) -> tuple:
+        path, word = move
+        state = state.copy()
+        cell = state.place(path, word, 0)
+        table = zobrist(state.size)
+        return state, key ^ table[cell][state.letters[cell]] ^ (hash(word) & MASK64)
+
+    def negamax(self, state, key: int, depth: int, alpha: int, beta: int) -> int:
+        self.nodes += 1
+        if self.token: self.token.check()
+        if time.perf_counter() > self.deadline:  # каждый узел - перебор ходов, проверяем время на каждом
+            raise SearchTimeout()
+
+        entry = self.table.get(key)
+        best_move = None
+        if entry:
+            e_depth, e_value, e_type, best_move = entry
+            if e_depth >= depth:
+                if e_type == self.EXACT:
+                    return e_value
+                if e_type == self.LOWER and e_value >= beta:
+                    return e_value
+                if e_type == self.UPPER and e_value <= alpha:
+                    return e_value
+
+        if depth == 0 or state.is_full():
+            return 0
+        moves = self.moves(state, best_move)
+        if not moves:  # ходов нет - партия окончена
+            return 0
+
+        alpha_start = alpha
+        value = -10 ** 6
+        for move in moves:
+            child, child_key = self.child(state, key, move)
+            score = len(move[1]) - self.negamax(child, child_key, depth - 1, -beta, -alpha)
+            if score > value:
+                value, best_move = score, move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        e_type = self.UPPER if value <= alpha_start else self.LOWER if value >= beta else self.EXACT
+        self.table[key] = (depth, value, e_type, best_move)
+        return value
+
+    def search(self, state):
+        """Лучший ход (путь, слово) в пределах бюджета времени или None!"""
+        self.deadline = time.perf_counter() + self.budget
+        key = position_key(state)
+        if self.token: self.token.check()
+        moves = self.moves(state)
+        if not moves:
+            return None
+        random.shuffle(moves)  # случайный выбор среди равных ходов
+        moves.sort(key=lambda move: len(move[1]), reverse=True)
+
+        best = moves[0]
+        depth_max = len(state.letters) - bin(state.occupied).count('1')  # не глубже числа пустых клеток
+        for depth in range(1, depth_max + 1):
+            alpha, found = -10 ** 6, None
+            try:
+                for move in moves:
+                    if time.perf_counter() > self.deadline:
+                        raise SearchTimeout()
+                    child, child_key = self.child(state, key, move)
+                    score = len(move[1]) - self.negamax(child, child_key, depth - 1, -10 ** 6, -alpha)
+                    if score > alpha:
+                        alpha, found = score, move
+            except SearchTimeout:
+                if found:  # полностью просчитанный ход лучше предыдущего
+                    best = found
+                break
+            best = found
+            moves.remove(best)
+            moves.insert(0, best)  # лучший ход первым на следующей глубине
+        return best
+
+
+def strong_move(state, trie, budget: float = STRONG_BUDGET, token: CancelToken = None, stats: dict = None):
+    """Сильный бот: поиск с просмотром ответов соперника в пределах бюджета времени!"""
+    search = StrongSearch(trie, budget, token)
+    try:
+        return search.search(state)
+    finally:
+        if stats is not None:
+            stats['nodes'] = search.nodes
+
+
+class Bot(ABC):
+    """Стратегия бота: выбор хода в партии (обычно - в снимке партии Game.copy)!
+
+    После choose в stats - счетчики последнего поиска для замеров."""
+
+    def __init__(self) -> None:
+        self.stats = {}
+
+    @abstractmethod
+    def choose(self, game, token: CancelToken = None):
+        """Ход Move или None, если ходов нет!"""
+
+
+class FastBot(Bot):
+    def choose(self, game, token: CancelToken = None):
+        self.stats = {}
+        if game.size not in TABLE_SIZES:
+            move = walk_move(game.state, game.lexicon.trie, token, self.stats)
+            return Move(*move) if move else None
+        tracker = game.tracker
+        move, exhausted = fast_move(game.state, tracker.paths, tracker.candidates(), game.lexicon.index, token, self.stats)
+        for pid in exhausted:
+            tracker.exclude(pid)
+        return Move(*move) if move else None
+
+
+class SmartBot(Bot):
+    def choose(self, game, token: CancelToken = None):
+        self.stats = {}
+        move = smart_move(game.state, game.lexicon.trie, token, self.stats)
+        return Move(*move) if move else None
+
+
+class StrongBot(Bot):
+    def __init__(self, budget: float = STRONG_BUDGET) -> None:
+        super().__init__()
+        self.budget = budget
+
+    def choose(self, game, token: CancelToken = None):
+        self.stats = {}
+        move = strong_move(game.state, game.lexicon.trie, self.budget, token, self.stats)
+        return Move(*move) if move else None
+
+
+STRATEGIES = {FAST: FastBot, SMART: SmartBot, STRONG: StrongBot}  # уровень бота -> стратегия
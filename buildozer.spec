@@ -13,7 +13,7 @@ package.domain = avbezdolny.kivyframework
 source.dir = .
 
 # (list) Source files to include (let empty to include all the files)
-source.include_exts = py,png,jpg,kv,atlas,ttf,wav,db
+source.include_exts = py,png,jpg,kv,atlas,ttf,wav,db,bin
 
 # (list) List of inclusions using pattern matching
 source.include_patterns = data/*.*
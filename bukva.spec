@@ -2,11 +2,15 @@
 from kivy_deps import sdl2, glew, gstreamer
 block_cipher = None
 
+# definitions.bin и dictionary.bin собираются из dictionary.db до сборки (README.md, раздел "Сборка"):
+#   python definitions.py dictionary.db definitions.bin
+#   python dictfile.py dictionary.db dictionary.bin --definitions definitions.bin
+
 
 a = Analysis(['main.py'],
              pathex=['C:\\Projects\\kivyframework\\bukva_kivy'],
              binaries=[],
-             datas=[('bukva.kv', '.'), ('Rubik.ttf', '.'), ('click.wav', '.'), ('popup.wav', '.'), ('move.wav', '.'), ('combi.py', '.'), ('dictionary.db', '.'), ('data/*.png', 'data'), ('data/*.atlas', 'data')],
+             datas=[('bukva.kv', '.'), ('Rubik.ttf', '.'), ('click.wav', '.'), ('popup.wav', '.'), ('move.wav', '.'), ('dictionary.db', '.'), ('definitions.bin', '.'), ('dictionary.bin', '.'), ('data/*.png', 'data'), ('data/*.atlas', 'data')],
              hiddenimports=[],
              hookspath=[],
              runtime_hooks=[],
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+
+class PathTracker:
+    """Инкрементальный учет вариантов ИИ по комбинациям путей!
+
+    Для каждого пути хранится число пустых клеток, а пути через клетку берутся
+    из общей для всех партий таблицы путей (PathTable.by_cell). Буква,
+    поставленная в клетку, меняет статус только путей через эту клетку,
+    поэтому множество вариантов с одной пустой клеткой поддерживается без
+    пересчета всех комбинаций."""
+
+    def __init__(self, paths) -> None:
+        self.paths = paths
+        self.by_cell = paths.by_cell  # клетка -> номера путей
+        self.blanks = bytearray(len(paths))  # число пустых клеток в пути
+        self.single = set()  # пути ровно с одной пустой клеткой
+        self.exhausted = set()  # пути, исключенные из поиска (нет подходящих слов)
+
+    def reset(self, matrix) -> None:
+        """Полный пересчет по полю (новая игра или восстановление)!"""
+        self.single.clear()
+        self.exhausted.clear()
+        for pid, path in enumerate(self.paths):
+            count = 0
+            for cell in path:
+                if matrix[cell] == ' ':
+                    count += 1
+            self.blanks[pid] = count
+            if count == 1:
+                self.single.add(pid)
+
+    def place(self, cell: int) -> None:
+        """В пустую клетку поставлена буква!"""
+        blanks, single = self.blanks, self.single
+        for pid in self.by_cell[cell]:
+            blanks[pid] -= 1
+            if blanks[pid] == 1:
+                if pid not in self.exhausted:
+                    single.add(pid)
+            elif blanks[pid] == 0:
+                single.discard(pid)
+
+    def unplace(self, cell: int) -> None:
+        """Буква убрана из клетки (отмена хода)!"""
+        blanks, single = self.blanks, self.single
+        for pid in self.by_cell[cell]:
+            blanks[pid] += 1
+            if blanks[pid] == 1:
+                if pid not in self.exhausted:
+                    single.add(pid)
+            elif blanks[pid] == 2:
+                single.discard(pid)
+
+    def copy(self) -> 'PathTracker':
+        tracker = PathTracker.__new__(PathTracker)
+        tracker.paths = self.paths
+        tracker.by_cell = self.by_cell
+        tracker.blanks = bytearray(self.blanks)
+        tracker.single = set(self.single)
+        tracker.exhausted = set(self.exhausted)
+        return tracker
+
+    def exclude(self, pid: int) -> None:
+        """Исключить путь из дальнейшего поиска!"""
+        self.exhausted.add(pid)
+        self.single.discard(pid)
+
+    def candidates(self) -> list:
+        """Номера путей с одной пустой клеткой, еще не исключенных из поиска!"""
+        return sorted(self.single)
@@ -1,2 +0,0 @@
-# возможные комбинации построения слов для ИИ
-COMBI = ((0, 1), (0, 5), (1, 0), (1, 2), (1, 6), (2, 1), (2, 3), (2, 7), (3, 2), (3, 4), (3, 8), (4, 3), (4, 9), (5, 0), (5, 6), (5, 10), (6, 1), (6, 5), (6, 7), (6, 11), (7, 2), (7, 6), (7, 8), (7, 12), (8, 3), (8, 7), (8, 9), (8, 13), (9, 4), (9, 8), (9, 14), (10, 5), (10, 11), (10, 15), (11, 6), (11, 10), (11, 12), (11, 16), (12, 7), (12, 11), (12, 13), (12, 17), (13, 8), (13, 12), (13, 14), (13, 18), (14, 9), (14, 13), (14, 19), (15, 10), (15, 16), (15, 20), (16, 11), (16, 15), (16, 17), (16, 21), (17, 12), (17, 16), (17, 18), (17, 22), (18, 13), (18, 17), (18, 19), (18, 23), (19, 14), (19, 18), (19, 24), (20, 15), (20, 21), (21, 16), (21, 20), (21, 22), (22, 17), (22, 21), (22, 23), (23, 18), (23, 22), (23, 24), (24, 19), (24, 23), (0, 1, 2), (0, 1, 6), (0, 5, 6), (0, 5, 10), (1, 0, 5), (1, 2, 3), (1, 2, 7), (1, 6, 5), (1, 6, 7), (1, 6, 11), (2, 1, 0), (2, 1, 6), (2, 3, 4), (2, 3, 8), (2, 7, 6), (2, 7, 8), (2, 7, 12), (3, 2, 1), (3, 2, 7), (3, 4, 9), (3, 8, 7), (3, 8, 9), (3, 8, 13), (4, 3, 2), (4, 3, 8), (4, 9, 8), (4, 9, 14), (5, 0, 1), (5, 6, 1), (5, 6, 7), (5, 6, 11), (5, 10, 11), (5, 10, 15), (6, 1, 0), (6, 1, 2), (6, 5, 0), (6, 5, 10), (6, 7, 2), (6, 7, 8), (6, 7, 12), (6, 11, 10), (6, 11, 12), (6, 11, 16), (7, 2, 1), (7, 2, 3), (7, 6, 1), (7, 6, 5), (7, 6, 11), (7, 8, 3), (7, 8, 9), (7, 8, 13), (7, 12, 11), (7, 12, 13), (7, 12, 17), (8, 3, 2), (8, 3, 4), (8, 7, 2), (8, 7, 6), (8, 7, 12), (8, 9, 4), (8, 9, 14), (8, 13, 12), (8, 13, 14), (8, 13, 18), (9, 4, 3), (9, 8, 3), (9, 8, 7), (9, 8, 13), (9, 14, 13), (9, 14, 19), (10, 5, 0), (10, 5, 6), (10, 11, 6), (10, 11, 12), (10, 11, 16), (10, 15, 16), (10, 15, 20), (11, 6, 1), (11, 6, 5), (11, 6, 7), (11, 10, 5), (11, 10, 15), (11, 12, 7), (11, 12, 13), (11, 12, 17), (11, 16, 15), (11, 16, 17), (11, 16, 21), (12, 7, 2), (12, 7, 6), (12, 7, 8), (12, 11, 6), (12, 11, 10), (12, 11, 16), (12, 13, 8), (12, 13, 14), (12, 13, 18), (12, 17, 16), (12, 17, 18), (12, 17, 22), (13, 8, 3), (13, 8, 7), (13, 8, 9), (13, 12, 7), (13, 12, 11), (13, 12, 17), (13, 14, 9), (13, 14, 19), (13, 18, 17), (13, 18, 19), (13, 18, 23), (14, 9, 4), (14, 9, 8), (14, 13, 8), (14, 13, 12), (14, 13, 18), (14, 19, 18), (14, 19, 24), (15, 10, 5), (15, 10, 11), (15, 16, 11), (15, 16, 17), (15, 16, 21), (15, 20, 21), (16, 11, 6), (16, 11, 10), (16, 11, 12), (16, 15, 10), (16, 15, 20), (16, 17, 12), (16, 17, 18), (16, 17, 22), (16, 21, 20), (16, 21, 22), (17, 12, 7), (17, 12, 11), (17, 12, 13), (17, 16, 11), (17, 16, 15), (17, 16, 21), (17, 18, 13), (17, 18, 19), (17, 18, 23), (17, 22, 21), (17, 22, 23), (18, 13, 8), (18, 13, 12), (18, 13, 14), (18, 17, 12), (18, 17, 16), (18, 17, 22), (18, 19, 14), (18, 19, 24), (18, 23, 22), (18, 23, 24), (19, 14, 9), (19, 14, 13), (19, 18, 13), (19, 18, 17), (19, 18, 23), (19, 24, 23), (20, 15, 10), (20, 15, 16), (20, 21, 16), (20, 21, 22), (21, 16, 11), (21, 16, 15), (21, 16, 17), (21, 20, 15), (21, 22, 17), (21, 22, 23), (22, 17, 12), (22, 17, 16), (22, 17, 18), (22, 21, 16), (22, 21, 20), (22, 23, 18), (22, 23, 24), (23, 18, 13), (23, 18, 17), (23, 18, 19), (23, 22, 17), (23, 22, 21), (23, 24, 19), (24, 19, 14), (24, 19, 18), (24, 23, 18), (24, 23, 22), (0, 1, 2, 3), (0, 1, 2, 7), (0, 1, 6, 5), (0, 1, 6, 7), (0, 1, 6, 11), (0, 5, 6, 1), (0, 5, 6, 7), (0, 5, 6, 11), (0, 5, 10, 11), (0, 5, 10, 15), (1, 0, 5, 6), (1, 0, 5, 10), (1, 2, 3, 4), (1, 2, 3, 8), (1, 2, 7, 6), (1, 2, 7, 8), (1, 2, 7, 12), (1, 6, 5, 0), (1, 6, 5, 10), (1, 6, 7, 2), (1, 6, 7, 8), (1, 6, 7, 12), (1, 6, 11, 10), (1, 6, 11, 12), (1, 6, 11, 16), (2, 1, 0, 5), (2, 1, 6, 5), (2, 1, 6, 7), (2, 1, 6, 11), (2, 3, 4, 9), (2, 3, 8, 7), (2, 3, 8, 9), (2, 3, 8, 13), (2, 7, 6, 1), (2, 7, 6, 5), (2, 7, 6, 11), (2, 7, 8, 3), (2, 7, 8, 9), (2, 7, 8, 13), (2, 7, 12, 11), (2, 7, 12, 13), (2, 7, 12, 17), (3, 2, 1, 0), (3, 2, 1, 6), (3, 2, 7, 6), (3, 2, 7, 8), (3, 2, 7, 12), (3, 4, 9, 8), (3, 4, 9, 14), (3, 8, 7, 2), (3, 8, 7, 6), (3, 8, 7, 12), (3, 8, 9, 4), (3, 8, 9, 14), (3, 8, 13, 12), (3, 8, 13, 14), (3, 8, 13, 18), (4, 3, 2, 1), (4, 3, 2, 7), (4, 3, 8, 7), (4, 3, 8, 9), (4, 3, 8, 13), (4, 9, 8, 3), (4, 9, 8, 7), (4, 9, 8, 13), (4, 9, 14, 13), (4, 9, 14, 19), (5, 0, 1, 2), (5, 0, 1, 6), (5, 6, 1, 0), (5, 6, 1, 2), (5, 6, 7, 2), (5, 6, 7, 8), (5, 6, 7, 12), (5, 6, 11, 10), (5, 6, 11, 12), (5, 6, 11, 16), (5, 10, 11, 6), (5, 10, 11, 12), (5, 10, 11, 16), (5, 10, 15, 16), (5, 10, 15, 20), (6, 1, 0, 5), (6, 1, 2, 3), (6, 1, 2, 7), (6, 5, 0, 1), (6, 5, 10, 11), (6, 5, 10, 15), (6, 7, 2, 1), (6, 7, 2, 3), (6, 7, 8, 3), (6, 7, 8, 9), (6, 7, 8, 13), (6, 7, 12, 11), (6, 7, 12, 13), (6, 7, 12, 17), (6, 11, 10, 5), (6, 11, 10, 15), (6, 11, 12, 7), (6, 11, 12, 13), (6, 11, 12, 17), (6, 11, 16, 15), (6, 11, 16, 17), (6, 11, 16, 21), (7, 2, 1, 0), (7, 2, 1, 6), (7, 2, 3, 4), (7, 2, 3, 8), (7, 6, 1, 0), (7, 6, 1, 2), (7, 6, 5, 0), (7, 6, 5, 10), (7, 6, 11, 10), (7, 6, 11, 12), (7, 6, 11, 16), (7, 8, 3, 2), (7, 8, 3, 4), (7, 8, 9, 4), (7, 8, 9, 14), (7, 8, 13, 12), (7, 8, 13, 14), (7, 8, 13, 18), (7, 12, 11, 6), (7, 12, 11, 10), (7, 12, 11, 16), (7, 12, 13, 8), (7, 12, 13, 14), (7, 12, 13, 18), (7, 12, 17, 16), (7, 12, 17, 18), (7, 12, 17, 22), (8, 3, 2, 1), (8, 3, 2, 7), (8, 3, 4, 9), (8, 7, 2, 1), (8, 7, 2, 3), (8, 7, 6, 1), (8, 7, 6, 5), (8, 7, 6, 11), (8, 7, 12, 11), (8, 7, 12, 13), (8, 7, 12, 17), (8, 9, 4, 3), (8, 9, 14, 13), (8, 9, 14, 19), (8, 13, 12, 7), (8, 13, 12, 11), (8, 13, 12, 17), (8, 13, 14, 9), (8, 13, 14, 19), (8, 13, 18, 17), (8, 13, 18, 19), (8, 13, 18, 23), (9, 4, 3, 2), (9, 4, 3, 8), (9, 8, 3, 2), (9, 8, 3, 4), (9, 8, 7, 2), (9, 8, 7, 6), (9, 8, 7, 12), (9, 8, 13, 12), (9, 8, 13, 14), (9, 8, 13, 18), (9, 14, 13, 8), (9, 14, 13, 12), (9, 14, 13, 18), (9, 14, 19, 18), (9, 14, 19, 24), (10, 5, 0, 1), (10, 5, 6, 1), (10, 5, 6, 7), (10, 5, 6, 11), (10, 11, 6, 1), (10, 11, 6, 5), (10, 11, 6, 7), (10, 11, 12, 7), (10, 11, 12, 13), (10, 11, 12, 17), (10, 11, 16, 15), (10, 11, 16, 17), (10, 11, 16, 21), (10, 15, 16, 11), (10, 15, 16, 17), (10, 15, 16, 21), (10, 15, 20, 21), (11, 6, 1, 0), (11, 6, 1, 2), (11, 6, 5, 0), (11, 6, 5, 10), (11, 6, 7, 2), (11, 6, 7, 8), (11, 6, 7, 12), (11, 10, 5, 0), (11, 10, 5, 6), (11, 10, 15, 16), (11, 10, 15, 20), (11, 12, 7, 2), (11, 12, 7, 6), (11, 12, 7, 8), (11, 12, 13, 8), (11, 12, 13, 14), (11, 12, 13, 18), (11, 12, 17, 16), (11, 12, 17, 18), (11, 12, 17, 22), (11, 16, 15, 10), (11, 16, 15, 20), (11, 16, 17, 12), (11, 16, 17, 18), (11, 16, 17, 22), (11, 16, 21, 20), (11, 16, 21, 22), (12, 7, 2, 1), (12, 7, 2, 3), (12, 7, 6, 1), (12, 7, 6, 5), (12, 7, 6, 11), (12, 7, 8, 3), (12, 7, 8, 9), (12, 7, 8, 13), (12, 11, 6, 1), (12, 11, 6, 5), (12, 11, 6, 7), (12, 11, 10, 5), (12, 11, 10, 15), (12, 11, 16, 15), (12, 11, 16, 17), (12, 11, 16, 21), (12, 13, 8, 3), (12, 13, 8, 7), (12, 13, 8, 9), (12, 13, 14, 9), (12, 13, 14, 19), (12, 13, 18, 17), (12, 13, 18, 19), (12, 13, 18, 23), (12, 17, 16, 11), (12, 17, 16, 15), (12, 17, 16, 21), (12, 17, 18, 13), (12, 17, 18, 19), (12, 17, 18, 23), (12, 17, 22, 21), (12, 17, 22, 23), (13, 8, 3, 2), (13, 8, 3, 4), (13, 8, 7, 2), (13, 8, 7, 6), (13, 8, 7, 12), (13, 8, 9, 4), (13, 8, 9, 14), (13, 12, 7, 2), (13, 12, 7, 6), (13, 12, 7, 8), (13, 12, 11, 6), (13, 12, 11, 10), (13, 12, 11, 16), (13, 12, 17, 16), (13, 12, 17, 18), (13, 12, 17, 22), (13, 14, 9, 4), (13, 14, 9, 8), (13, 14, 19, 18), (13, 14, 19, 24), (13, 18, 17, 12), (13, 18, 17, 16), (13, 18, 17, 22), (13, 18, 19, 14), (13, 18, 19, 24), (13, 18, 23, 22), (13, 18, 23, 24), (14, 9, 4, 3), (14, 9, 8, 3), (14, 9, 8, 7), (14, 9, 8, 13), (14, 13, 8, 3), (14, 13, 8, 7), (14, 13, 8, 9), (14, 13, 12, 7), (14, 13, 12, 11), (14, 13, 12, 17), (14, 13, 18, 17), (14, 13, 18, 19), (14, 13, 18, 23), (14, 19, 18, 13), (14, 19, 18, 17), (14, 19, 18, 23), (14, 19, 24, 23), (15, 10, 5, 0), (15, 10, 5, 6), (15, 10, 11, 6), (15, 10, 11, 12), (15, 10, 11, 16), (15, 16, 11, 6), (15, 16, 11, 10), (15, 16, 11, 12), (15, 16, 17, 12), (15, 16, 17, 18), (15, 16, 17, 22), (15, 16, 21, 20), (15, 16, 21, 22), (15, 20, 21, 16), (15, 20, 21, 22), (16, 11, 6, 1), (16, 11, 6, 5), (16, 11, 6, 7), (16, 11, 10, 5), (16, 11, 10, 15), (16, 11, 12, 7), (16, 11, 12, 13), (16, 11, 12, 17), (16, 15, 10, 5), (16, 15, 10, 11), (16, 15, 20, 21), (16, 17, 12, 7), (16, 17, 12, 11), (16, 17, 12, 13), (16, 17, 18, 13), (16, 17, 18, 19), (16, 17, 18, 23), (16, 17, 22, 21), (16, 17, 22, 23), (16, 21, 20, 15), (16, 21, 22, 17), (16, 21, 22, 23), (17, 12, 7, 2), (17, 12, 7, 6), (17, 12, 7, 8), (17, 12, 11, 6), (17, 12, 11, 10), (17, 12, 11, 16), (17, 12, 13, 8), (17, 12, 13, 14), (17, 12, 13, 18), (17, 16, 11, 6), (17, 16, 11, 10), (17, 16, 11, 12), (17, 16, 15, 10), (17, 16, 15, 20), (17, 16, 21, 20), (17, 16, 21, 22), (17, 18, 13, 8), (17, 18, 13, 12), (17, 18, 13, 14), (17, 18, 19, 14), (17, 18, 19, 24), (17, 18, 23, 22), (17, 18, 23, 24), (17, 22, 21, 16), (17, 22, 21, 20), (17, 22, 23, 18), (17, 22, 23, 24), (18, 13, 8, 3), (18, 13, 8, 7), (18, 13, 8, 9), (18, 13, 12, 7), (18, 13, 12, 11), (18, 13, 12, 17), (18, 13, 14, 9), (18, 13, 14, 19), (18, 17, 12, 7), (18, 17, 12, 11), (18, 17, 12, 13), (18, 17, 16, 11), (18, 17, 16, 15), (18, 17, 16, 21), (18, 17, 22, 21), (18, 17, 22, 23), (18, 19, 14, 9), (18, 19, 14, 13), (18, 19, 24, 23), (18, 23, 22, 17), (18, 23, 22, 21), (18, 23, 24, 19), (19, 14, 9, 4), (19, 14, 9, 8), (19, 14, 13, 8), (19, 14, 13, 12), (19, 14, 13, 18), (19, 18, 13, 8), (19, 18, 13, 12), (19, 18, 13, 14), (19, 18, 17, 12), (19, 18, 17, 16), (19, 18, 17, 22), (19, 18, 23, 22), (19, 18, 23, 24), (19, 24, 23, 18), (19, 24, 23, 22), (20, 15, 10, 5), (20, 15, 10, 11), (20, 15, 16, 11), (20, 15, 16, 17), (20, 15, 16, 21), (20, 21, 16, 11), (20, 21, 16, 15), (20, 21, 16, 17), (20, 21, 22, 17), (20, 21, 22, 23), (21, 16, 11, 6), (21, 16, 11, 10), (21, 16, 11, 12), (21, 16, 15, 10), (21, 16, 15, 20), (21, 16, 17, 12), (21, 16, 17, 18), (21, 16, 17, 22), (21, 20, 15, 10), (21, 20, 15, 16), (21, 22, 17, 12), (21, 22, 17, 16), (21, 22, 17, 18), (21, 22, 23, 18), (21, 22, 23, 24), (22, 17, 12, 7), (22, 17, 12, 11), (22, 17, 12, 13), (22, 17, 16, 11), (22, 17, 16, 15), (22, 17, 16, 21), (22, 17, 18, 13), (22, 17, 18, 19), (22, 17, 18, 23), (22, 21, 16, 11), (22, 21, 16, 15), (22, 21, 16, 17), (22, 21, 20, 15), (22, 23, 18, 13), (22, 23, 18, 17), (22, 23, 18, 19), (22, 23, 24, 19), (23, 18, 13, 8), (23, 18, 13, 12), (23, 18, 13, 14), (23, 18, 17, 12), (23, 18, 17, 16), (23, 18, 17, 22), (23, 18, 19, 14), (23, 18, 19, 24), (23, 22, 17, 12), (23, 22, 17, 16), (23, 22, 17, 18), (23, 22, 21, 16), (23, 22, 21, 20), (23, 24, 19, 14), (23, 24, 19, 18), (24, 19, 14, 9), (24, 19, 14, 13), (24, 19, 18, 13), (24, 19, 18, 17), (24, 19, 18, 23), (24, 23, 18, 13), (24, 23, 18, 17), (24, 23, 18, 19), (24, 23, 22, 17), (24, 23, 22, 21), (0, 1, 2, 3, 4), (0, 1, 2, 3, 8), (0, 1, 2, 7, 6), (0, 1, 2, 7, 8), (0, 1, 2, 7, 12), (0, 1, 6, 5, 10), (0, 1, 6, 7, 2), (0, 1, 6, 7, 8), (0, 1, 6, 7, 12), (0, 1, 6, 11, 10), (0, 1, 6, 11, 12), (0, 1, 6, 11, 16), (0, 5, 6, 1, 2), (0, 5, 6, 7, 2), (0, 5, 6, 7, 8), (0, 5, 6, 7, 12), (0, 5, 6, 11, 10), (0, 5, 6, 11, 12), (0, 5, 6, 11, 16), (0, 5, 10, 11, 6), (0, 5, 10, 11, 12), (0, 5, 10, 11, 16), (0, 5, 10, 15, 16), (0, 5, 10, 15, 20), (1, 0, 5, 6, 7), (1, 0, 5, 6, 11), (1, 0, 5, 10, 11), (1, 0, 5, 10, 15), (1, 2, 3, 4, 9), (1, 2, 3, 8, 7), (1, 2, 3, 8, 9), (1, 2, 3, 8, 13), (1, 2, 7, 6, 5), (1, 2, 7, 6, 11), (1, 2, 7, 8, 3), (1, 2, 7, 8, 9), (1, 2, 7, 8, 13), (1, 2, 7, 12, 11), (1, 2, 7, 12, 13), (1, 2, 7, 12, 17), (1, 6, 5, 10, 11), (1, 6, 5, 10, 15), (1, 6, 7, 2, 3), (1, 6, 7, 8, 3), (1, 6, 7, 8, 9), (1, 6, 7, 8, 13), (1, 6, 7, 12, 11), (1, 6, 7, 12, 13), (1, 6, 7, 12, 17), (1, 6, 11, 10, 5), (1, 6, 11, 10, 15), (1, 6, 11, 12, 7), (1, 6, 11, 12, 13), (1, 6, 11, 12, 17), (1, 6, 11, 16, 15), (1, 6, 11, 16, 17), (1, 6, 11, 16, 21), (2, 1, 0, 5, 6), (2, 1, 0, 5, 10), (2, 1, 6, 5, 0), (2, 1, 6, 5, 10), (2, 1, 6, 7, 8), (2, 1, 6, 7, 12), (2, 1, 6, 11, 10), (2, 1, 6, 11, 12), (2, 1, 6, 11, 16), (2, 3, 4, 9, 8), (2, 3, 4, 9, 14), (2, 3, 8, 7, 6), (2, 3, 8, 7, 12), (2, 3, 8, 9, 4), (2, 3, 8, 9, 14), (2, 3, 8, 13, 12), (2, 3, 8, 13, 14), (2, 3, 8, 13, 18), (2, 7, 6, 1, 0), (2, 7, 6, 5, 0), (2, 7, 6, 5, 10), (2, 7, 6, 11, 10), (2, 7, 6, 11, 12), (2, 7, 6, 11, 16), (2, 7, 8, 3, 4), (2, 7, 8, 9, 4), (2, 7, 8, 9, 14), (2, 7, 8, 13, 12), (2, 7, 8, 13, 14), (2, 7, 8, 13, 18), (2, 7, 12, 11, 6), (2, 7, 12, 11, 10), (2, 7, 12, 11, 16), (2, 7, 12, 13, 8), (2, 7, 12, 13, 14), (2, 7, 12, 13, 18), (2, 7, 12, 17, 16), (2, 7, 12, 17, 18), (2, 7, 12, 17, 22), (3, 2, 1, 0, 5), (3, 2, 1, 6, 5), (3, 2, 1, 6, 7), (3, 2, 1, 6, 11), (3, 2, 7, 6, 1), (3, 2, 7, 6, 5), (3, 2, 7, 6, 11), (3, 2, 7, 8, 9), (3, 2, 7, 8, 13), (3, 2, 7, 12, 11), (3, 2, 7, 12, 13), (3, 2, 7, 12, 17), (3, 4, 9, 8, 7), (3, 4, 9, 8, 13), (3, 4, 9, 14, 13), (3, 4, 9, 14, 19), (3, 8, 7, 2, 1), (3, 8, 7, 6, 1), (3, 8, 7, 6, 5), (3, 8, 7, 6, 11), (3, 8, 7, 12, 11), (3, 8, 7, 12, 13), (3, 8, 7, 12, 17), (3, 8, 9, 14, 13), (3, 8, 9, 14, 19), (3, 8, 13, 12, 7), (3, 8, 13, 12, 11), (3, 8, 13, 12, 17), (3, 8, 13, 14, 9), (3, 8, 13, 14, 19), (3, 8, 13, 18, 17), (3, 8, 13, 18, 19), (3, 8, 13, 18, 23), (4, 3, 2, 1, 0), (4, 3, 2, 1, 6), (4, 3, 2, 7, 6), (4, 3, 2, 7, 8), (4, 3, 2, 7, 12), (4, 3, 8, 7, 2), (4, 3, 8, 7, 6), (4, 3, 8, 7, 12), (4, 3, 8, 9, 14), (4, 3, 8, 13, 12), (4, 3, 8, 13, 14), (4, 3, 8, 13, 18), (4, 9, 8, 3, 2), (4, 9, 8, 7, 2), (4, 9, 8, 7, 6), (4, 9, 8, 7, 12), (4, 9, 8, 13, 12), (4, 9, 8, 13, 14), (4, 9, 8, 13, 18), (4, 9, 14, 13, 8), (4, 9, 14, 13, 12), (4, 9, 14, 13, 18), (4, 9, 14, 19, 18), (4, 9, 14, 19, 24), (5, 0, 1, 2, 3), (5, 0, 1, 2, 7), (5, 0, 1, 6, 7), (5, 0, 1, 6, 11), (5, 6, 1, 2, 3), (5, 6, 1, 2, 7), (5, 6, 7, 2, 1), (5, 6, 7, 2, 3), (5, 6, 7, 8, 3), (5, 6, 7, 8, 9), (5, 6, 7, 8, 13), (5, 6, 7, 12, 11), (5, 6, 7, 12, 13), (5, 6, 7, 12, 17), (5, 6, 11, 10, 15), (5, 6, 11, 12, 7), (5, 6, 11, 12, 13), (5, 6, 11, 12, 17), (5, 6, 11, 16, 15), (5, 6, 11, 16, 17), (5, 6, 11, 16, 21), (5, 10, 11, 6, 1), (5, 10, 11, 6, 7), (5, 10, 11, 12, 7), (5, 10, 11, 12, 13), (5, 10, 11, 12, 17), (5, 10, 11, 16, 15), (5, 10, 11, 16, 17), (5, 10, 11, 16, 21), (5, 10, 15, 16, 11), (5, 10, 15, 16, 17), (5, 10, 15, 16, 21), (5, 10, 15, 20, 21), (6, 1, 0, 5, 10), (6, 1, 2, 3, 4), (6, 1, 2, 3, 8), (6, 1, 2, 7, 8), (6, 1, 2, 7, 12), (6, 5, 0, 1, 2), (6, 5, 10, 11, 12), (6, 5, 10, 11, 16), (6, 5, 10, 15, 16), (6, 5, 10, 15, 20), (6, 7, 2, 1, 0), (6, 7, 2, 3, 4), (6, 7, 2, 3, 8), (6, 7, 8, 3, 2), (6, 7, 8, 3, 4), (6, 7, 8, 9, 4), (6, 7, 8, 9, 14), (6, 7, 8, 13, 12), (6, 7, 8, 13, 14), (6, 7, 8, 13, 18), (6, 7, 12, 11, 10), (6, 7, 12, 11, 16), (6, 7, 12, 13, 8), (6, 7, 12, 13, 14), (6, 7, 12, 13, 18), (6, 7, 12, 17, 16), (6, 7, 12, 17, 18), (6, 7, 12, 17, 22), (6, 11, 10, 5, 0), (6, 11, 10, 15, 16), (6, 11, 10, 15, 20), (6, 11, 12, 7, 2), (6, 11, 12, 7, 8), (6, 11, 12, 13, 8), (6, 11, 12, 13, 14), (6, 11, 12, 13, 18), (6, 11, 12, 17, 16), (6, 11, 12, 17, 18), (6, 11, 12, 17, 22), (6, 11, 16, 15, 10), (6, 11, 16, 15, 20), (6, 11, 16, 17, 12), (6, 11, 16, 17, 18), (6, 11, 16, 17, 22), (6, 11, 16, 21, 20), (6, 11, 16, 21, 22), (7, 2, 1, 0, 5), (7, 2, 1, 6, 5), (7, 2, 1, 6, 11), (7, 2, 3, 4, 9), (7, 2, 3, 8, 9), (7, 2, 3, 8, 13), (7, 6, 1, 0, 5), (7, 6, 1, 2, 3), (7, 6, 5, 0, 1), (7, 6, 5, 10, 11), (7, 6, 5, 10, 15), (7, 6, 11, 10, 5), (7, 6, 11, 10, 15), (7, 6, 11, 12, 13), (7, 6, 11, 12, 17), (7, 6, 11, 16, 15), (7, 6, 11, 16, 17), (7, 6, 11, 16, 21), (7, 8, 3, 2, 1), (7, 8, 3, 4, 9), (7, 8, 9, 4, 3), (7, 8, 9, 14, 13), (7, 8, 9, 14, 19), (7, 8, 13, 12, 11), (7, 8, 13, 12, 17), (7, 8, 13, 14, 9), (7, 8, 13, 14, 19), (7, 8, 13, 18, 17), (7, 8, 13, 18, 19), (7, 8, 13, 18, 23), (7, 12, 11, 6, 1), (7, 12, 11, 6, 5), (7, 12, 11, 10, 5), (7, 12, 11, 10, 15), (7, 12, 11, 16, 15), (7, 12, 11, 16, 17), (7, 12, 11, 16, 21), (7, 12, 13, 8, 3), (7, 12, 13, 8, 9), (7, 12, 13, 14, 9), (7, 12, 13, 14, 19), (7, 12, 13, 18, 17), (7, 12, 13, 18, 19), (7, 12, 13, 18, 23), (7, 12, 17, 16, 11), (7, 12, 17, 16, 15), (7, 12, 17, 16, 21), (7, 12, 17, 18, 13), (7, 12, 17, 18, 19), (7, 12, 17, 18, 23), (7, 12, 17, 22, 21), (7, 12, 17, 22, 23), (8, 3, 2, 1, 0), (8, 3, 2, 1, 6), (8, 3, 2, 7, 6), (8, 3, 2, 7, 12), (8, 3, 4, 9, 14), (8, 7, 2, 1, 0), (8, 7, 2, 1, 6), (8, 7, 2, 3, 4), (8, 7, 6, 1, 0), (8, 7, 6, 1, 2), (8, 7, 6, 5, 0), (8, 7, 6, 5, 10), (8, 7, 6, 11, 10), (8, 7, 6, 11, 12), (8, 7, 6, 11, 16), (8, 7, 12, 11, 6), (8, 7, 12, 11, 10), (8, 7, 12, 11, 16), (8, 7, 12, 13, 14), (8, 7, 12, 13, 18), (8, 7, 12, 17, 16), (8, 7, 12, 17, 18), (8, 7, 12, 17, 22), (8, 9, 4, 3, 2), (8, 9, 14, 13, 12), (8, 9, 14, 13, 18), (8, 9, 14, 19, 18), (8, 9, 14, 19, 24), (8, 13, 12, 7, 2), (8, 13, 12, 7, 6), (8, 13, 12, 11, 6), (8, 13, 12, 11, 10), (8, 13, 12, 11, 16), (8, 13, 12, 17, 16), (8, 13, 12, 17, 18), (8, 13, 12, 17, 22), (8, 13, 14, 9, 4), (8, 13, 14, 19, 18), (8, 13, 14, 19, 24), (8, 13, 18, 17, 12), (8, 13, 18, 17, 16), (8, 13, 18, 17, 22), (8, 13, 18, 19, 14), (8, 13, 18, 19, 24), (8, 13, 18, 23, 22), (8, 13, 18, 23, 24), (9, 4, 3, 2, 1), (9, 4, 3, 2, 7), (9, 4, 3, 8, 7), (9, 4, 3, 8, 13), (9, 8, 3, 2, 1), (9, 8, 3, 2, 7), (9, 8, 7, 2, 1), (9, 8, 7, 2, 3), (9, 8, 7, 6, 1), (9, 8, 7, 6, 5), (9, 8, 7, 6, 11), (9, 8, 7, 12, 11), (9, 8, 7, 12, 13), (9, 8, 7, 12, 17), (9, 8, 13, 12, 7), (9, 8, 13, 12, 11), (9, 8, 13, 12, 17), (9, 8, 13, 14, 19), (9, 8, 13, 18, 17), (9, 8, 13, 18, 19), (9, 8, 13, 18, 23), (9, 14, 13, 8, 3), (9, 14, 13, 8, 7), (9, 14, 13, 12, 7), (9, 14, 13, 12, 11), (9, 14, 13, 12, 17), (9, 14, 13, 18, 17), (9, 14, 13, 18, 19), (9, 14, 13, 18, 23), (9, 14, 19, 18, 13), (9, 14, 19, 18, 17), (9, 14, 19, 18, 23), (9, 14, 19, 24, 23), (10, 5, 0, 1, 2), (10, 5, 0, 1, 6), (10, 5, 6, 1, 0), (10, 5, 6, 1, 2), (10, 5, 6, 7, 2), (10, 5, 6, 7, 8), (10, 5, 6, 7, 12), (10, 5, 6, 11, 12), (10, 5, 6, 11, 16), (10, 11, 6, 1, 0), (10, 11, 6, 1, 2), (10, 11, 6, 5, 0), (10, 11, 6, 7, 2), (10, 11, 6, 7, 8), (10, 11, 6, 7, 12), (10, 11, 12, 7, 2), (10, 11, 12, 7, 6), (10, 11, 12, 7, 8), (10, 11, 12, 13, 8), (10, 11, 12, 13, 14), (10, 11, 12, 13, 18), (10, 11, 12, 17, 16), (10, 11, 12, 17, 18), (10, 11, 12, 17, 22), (10, 11, 16, 15, 20), (10, 11, 16, 17, 12), (10, 11, 16, 17, 18), (10, 11, 16, 17, 22), (10, 11, 16, 21, 20), (10, 11, 16, 21, 22), (10, 15, 16, 11, 6), (10, 15, 16, 11, 12), (10, 15, 16, 17, 12), (10, 15, 16, 17, 18), (10, 15, 16, 17, 22), (10, 15, 16, 21, 20), (10, 15, 16, 21, 22), (10, 15, 20, 21, 16), (10, 15, 20, 21, 22), (11, 6, 1, 0, 5), (11, 6, 1, 2, 3), (11, 6, 1, 2, 7), (11, 6, 5, 0, 1), (11, 6, 5, 10, 15), (11, 6, 7, 2, 1), (11, 6, 7, 2, 3), (11, 6, 7, 8, 3), (11, 6, 7, 8, 9), (11, 6, 7, 8, 13), (11, 6, 7, 12, 13), (11, 6, 7, 12, 17), (11, 10, 5, 0, 1), (11, 10, 5, 6, 1), (11, 10, 5, 6, 7), (11, 10, 15, 16, 17), (11, 10, 15, 16, 21), (11, 10, 15, 20, 21), (11, 12, 7, 2, 1), (11, 12, 7, 2, 3), (11, 12, 7, 6, 1), (11, 12, 7, 6, 5), (11, 12, 7, 8, 3), (11, 12, 7, 8, 9), (11, 12, 7, 8, 13), (11, 12, 13, 8, 3), (11, 12, 13, 8, 7), (11, 12, 13, 8, 9), (11, 12, 13, 14, 9), (11, 12, 13, 14, 19), (11, 12, 13, 18, 17), (11, 12, 13, 18, 19), (11, 12, 13, 18, 23), (11, 12, 17, 16, 15), (11, 12, 17, 16, 21), (11, 12, 17, 18, 13), (11, 12, 17, 18, 19), (11, 12, 17, 18, 23), (11, 12, 17, 22, 21), (11, 12, 17, 22, 23), (11, 16, 15, 10, 5), (11, 16, 15, 20, 21), (11, 16, 17, 12, 7), (11, 16, 17, 12, 13), (11, 16, 17, 18, 13), (11, 16, 17, 18, 19), (11, 16, 17, 18, 23), (11, 16, 17, 22, 21), (11, 16, 17, 22, 23), (11, 16, 21, 20, 15), (11, 16, 21, 22, 17), (11, 16, 21, 22, 23), (12, 7, 2, 1, 0), (12, 7, 2, 1, 6), (12, 7, 2, 3, 4), (12, 7, 2, 3, 8), (12, 7, 6, 1, 0), (12, 7, 6, 1, 2), (12, 7, 6, 5, 0), (12, 7, 6, 5, 10), (12, 7, 6, 11, 10), (12, 7, 6, 11, 16), (12, 7, 8, 3, 2), (12, 7, 8, 3, 4), (12, 7, 8, 9, 4), (12, 7, 8, 9, 14), (12, 7, 8, 13, 14), (12, 7, 8, 13, 18), (12, 11, 6, 1, 0), (12, 11, 6, 1, 2), (12, 11, 6, 5, 0), (12, 11, 6, 5, 10), (12, 11, 6, 7, 2), (12, 11, 6, 7, 8), (12, 11, 10, 5, 0), (12, 11, 10, 5, 6), (12, 11, 10, 15, 16), (12, 11, 10, 15, 20), (12, 11, 16, 15, 10), (12, 11, 16, 15, 20), (12, 11, 16, 17, 18), (12, 11, 16, 17, 22), (12, 11, 16, 21, 20), (12, 11, 16, 21, 22), (12, 13, 8, 3, 2), (12, 13, 8, 3, 4), (12, 13, 8, 7, 2), (12, 13, 8, 7, 6), (12, 13, 8, 9, 4), (12, 13, 8, 9, 14), (12, 13, 14, 9, 4), (12, 13, 14, 9, 8), (12, 13, 14, 19, 18), (12, 13, 14, 19, 24), (12, 13, 18, 17, 16), (12, 13, 18, 17, 22), (12, 13, 18, 19, 14), (12, 13, 18, 19, 24), (12, 13, 18, 23, 22), (12, 13, 18, 23, 24), (12, 17, 16, 11, 6), (12, 17, 16, 11, 10), (12, 17, 16, 15, 10), (12, 17, 16, 15, 20), (12, 17, 16, 21, 20), (12, 17, 16, 21, 22), (12, 17, 18, 13, 8), (12, 17, 18, 13, 14), (12, 17, 18, 19, 14), (12, 17, 18, 19, 24), (12, 17, 18, 23, 22), (12, 17, 18, 23, 24), (12, 17, 22, 21, 16), (12, 17, 22, 21, 20), (12, 17, 22, 23, 18), (12, 17, 22, 23, 24), (13, 8, 3, 2, 1), (13, 8, 3, 2, 7), (13, 8, 3, 4, 9), (13, 8, 7, 2, 1), (13, 8, 7, 2, 3), (13, 8, 7, 6, 1), (13, 8, 7, 6, 5), (13, 8, 7, 6, 11), (13, 8, 7, 12, 11), (13, 8, 7, 12, 17), (13, 8, 9, 4, 3), (13, 8, 9, 14, 19), (13, 12, 7, 2, 1), (13, 12, 7, 2, 3), (13, 12, 7, 6, 1), (13, 12, 7, 6, 5), (13, 12, 7, 6, 11), (13, 12, 7, 8, 3), (13, 12, 7, 8, 9), (13, 12, 11, 6, 1), (13, 12, 11, 6, 5), (13, 12, 11, 6, 7), (13, 12, 11, 10, 5), (13, 12, 11, 10, 15), (13, 12, 11, 16, 15), (13, 12, 11, 16, 17), (13, 12, 11, 16, 21), (13, 12, 17, 16, 11), (13, 12, 17, 16, 15), (13, 12, 17, 16, 21), (13, 12, 17, 18, 19), (13, 12, 17, 18, 23), (13, 12, 17, 22, 21), (13, 12, 17, 22, 23), (13, 14, 9, 4, 3), (13, 14, 9, 8, 3), (13, 14, 9, 8, 7), (13, 14, 19, 18, 17), (13, 14, 19, 18, 23), (13, 14, 19, 24, 23), (13, 18, 17, 12, 7), (13, 18, 17, 12, 11), (13, 18, 17, 16, 11), (13, 18, 17, 16, 15), (13, 18, 17, 16, 21), (13, 18, 17, 22, 21), (13, 18, 17, 22, 23), (13, 18, 19, 14, 9), (13, 18, 19, 24, 23), (13, 18, 23, 22, 17), (13, 18, 23, 22, 21), (13, 18, 23, 24, 19), (14, 9, 4, 3, 2), (14, 9, 4, 3, 8), (14, 9, 8, 3, 2), (14, 9, 8, 3, 4), (14, 9, 8, 7, 2), (14, 9, 8, 7, 6), (14, 9, 8, 7, 12), (14, 9, 8, 13, 12), (14, 9, 8, 13, 18), (14, 13, 8, 3, 2), (14, 13, 8, 3, 4), (14, 13, 8, 7, 2), (14, 13, 8, 7, 6), (14, 13, 8, 7, 12), (14, 13, 8, 9, 4), (14, 13, 12, 7, 2), (14, 13, 12, 7, 6), (14, 13, 12, 7, 8), (14, 13, 12, 11, 6), (14, 13, 12, 11, 10), (14, 13, 12, 11, 16), (14, 13, 12, 17, 16), (14, 13, 12, 17, 18), (14, 13, 12, 17, 22), (14, 13, 18, 17, 12), (14, 13, 18, 17, 16), (14, 13, 18, 17, 22), (14, 13, 18, 19, 24), (14, 13, 18, 23, 22), (14, 13, 18, 23, 24), (14, 19, 18, 13, 8), (14, 19, 18, 13, 12), (14, 19, 18, 17, 12), (14, 19, 18, 17, 16), (14, 19, 18, 17, 22), (14, 19, 18, 23, 22), (14, 19, 18, 23, 24), (14, 19, 24, 23, 18), (14, 19, 24, 23, 22), (15, 10, 5, 0, 1), (15, 10, 5, 6, 1), (15, 10, 5, 6, 7), (15, 10, 5, 6, 11), (15, 10, 11, 6, 1), (15, 10, 11, 6, 5), (15, 10, 11, 6, 7), (15, 10, 11, 12, 7), (15, 10, 11, 12, 13), (15, 10, 11, 12, 17), (15, 10, 11, 16, 17), (15, 10, 11, 16, 21), (15, 16, 11, 6, 1), (15, 16, 11, 6, 5), (15, 16, 11, 6, 7), (15, 16, 11, 10, 5), (15, 16, 11, 12, 7), (15, 16, 11, 12, 13), (15, 16, 11, 12, 17), (15, 16, 17, 12, 7), (15, 16, 17, 12, 11), (15, 16, 17, 12, 13), (15, 16, 17, 18, 13), (15, 16, 17, 18, 19), (15, 16, 17, 18, 23), (15, 16, 17, 22, 21), (15, 16, 17, 22, 23), (15, 16, 21, 22, 17), (15, 16, 21, 22, 23), (15, 20, 21, 16, 11), (15, 20, 21, 16, 17), (15, 20, 21, 22, 17), (15, 20, 21, 22, 23), (16, 11, 6, 1, 0), (16, 11, 6, 1, 2), (16, 11, 6, 5, 0), (16, 11, 6, 5, 10), (16, 11, 6, 7, 2), (16, 11, 6, 7, 8), (16, 11, 6, 7, 12), (16, 11, 10, 5, 0), (16, 11, 10, 5, 6), (16, 11, 10, 15, 20), (16, 11, 12, 7, 2), (16, 11, 12, 7, 6), (16, 11, 12, 7, 8), (16, 11, 12, 13, 8), (16, 11, 12, 13, 14), (16, 11, 12, 13, 18), (16, 11, 12, 17, 18), (16, 11, 12, 17, 22), (16, 15, 10, 5, 0), (16, 15, 10, 5, 6), (16, 15, 10, 11, 6), (16, 15, 10, 11, 12), (16, 15, 20, 21, 22), (16, 17, 12, 7, 2), (16, 17, 12, 7, 6), (16, 17, 12, 7, 8), (16, 17, 12, 11, 6), (16, 17, 12, 11, 10), (16, 17, 12, 13, 8), (16, 17, 12, 13, 14), (16, 17, 12, 13, 18), (16, 17, 18, 13, 8), (16, 17, 18, 13, 12), (16, 17, 18, 13, 14), (16, 17, 18, 19, 14), (16, 17, 18, 19, 24), (16, 17, 18, 23, 22), (16, 17, 18, 23, 24), (16, 17, 22, 21, 20), (16, 17, 22, 23, 18), (16, 17, 22, 23, 24), (16, 21, 20, 15, 10), (16, 21, 22, 17, 12), (16, 21, 22, 17, 18), (16, 21, 22, 23, 18), (16, 21, 22, 23, 24), (17, 12, 7, 2, 1), (17, 12, 7, 2, 3), (17, 12, 7, 6, 1), (17, 12, 7, 6, 5), (17, 12, 7, 6, 11), (17, 12, 7, 8, 3), (17, 12, 7, 8, 9), (17, 12, 7, 8, 13), (17, 12, 11, 6, 1), (17, 12, 11, 6, 5), (17, 12, 11, 6, 7), (17, 12, 11, 10, 5), (17, 12, 11, 10, 15), (17, 12, 11, 16, 15), (17, 12, 11, 16, 21), (17, 12, 13, 8, 3), (17, 12, 13, 8, 7), (17, 12, 13, 8, 9), (17, 12, 13, 14, 9), (17, 12, 13, 14, 19), (17, 12, 13, 18, 19), (17, 12, 13, 18, 23), (17, 16, 11, 6, 1), (17, 16, 11, 6, 5), (17, 16, 11, 6, 7), (17, 16, 11, 10, 5), (17, 16, 11, 10, 15), (17, 16, 11, 12, 7), (17, 16, 11, 12, 13), (17, 16, 15, 10, 5), (17, 16, 15, 10, 11), (17, 16, 15, 20, 21), (17, 16, 21, 20, 15), (17, 16, 21, 22, 23), (17, 18, 13, 8, 3), (17, 18, 13, 8, 7), (17, 18, 13, 8, 9), (17, 18, 13, 12, 7), (17, 18, 13, 12, 11), (17, 18, 13, 14, 9), (17, 18, 13, 14, 19), (17, 18, 19, 14, 9), (17, 18, 19, 14, 13), (17, 18, 19, 24, 23), (17, 18, 23, 22, 21), (17, 18, 23, 24, 19), (17, 22, 21, 16, 11), (17, 22, 21, 16, 15), (17, 22, 21, 20, 15), (17, 22, 23, 18, 13), (17, 22, 23, 18, 19), (17, 22, 23, 24, 19), (18, 13, 8, 3, 2), (18, 13, 8, 3, 4), (18, 13, 8, 7, 2), (18, 13, 8, 7, 6), (18, 13, 8, 7, 12), (18, 13, 8, 9, 4), (18, 13, 8, 9, 14), (18, 13, 12, 7, 2), (18, 13, 12, 7, 6), (18, 13, 12, 7, 8), (18, 13, 12, 11, 6), (18, 13, 12, 11, 10), (18, 13, 12, 11, 16), (18, 13, 12, 17, 16), (18, 13, 12, 17, 22), (18, 13, 14, 9, 4), (18, 13, 14, 9, 8), (18, 13, 14, 19, 24), (18, 17, 12, 7, 2), (18, 17, 12, 7, 6), (18, 17, 12, 7, 8), (18, 17, 12, 11, 6), (18, 17, 12, 11, 10), (18, 17, 12, 11, 16), (18, 17, 12, 13, 8), (18, 17, 12, 13, 14), (18, 17, 16, 11, 6), (18, 17, 16, 11, 10), (18, 17, 16, 11, 12), (18, 17, 16, 15, 10), (18, 17, 16, 15, 20), (18, 17, 16, 21, 20), (18, 17, 16, 21, 22), (18, 17, 22, 21, 16), (18, 17, 22, 21, 20), (18, 17, 22, 23, 24), (18, 19, 14, 9, 4), (18, 19, 14, 9, 8), (18, 19, 14, 13, 8), (18, 19, 14, 13, 12), (18, 19, 24, 23, 22), (18, 23, 22, 17, 12), (18, 23, 22, 17, 16), (18, 23, 22, 21, 16), (18, 23, 22, 21, 20), (18, 23, 24, 19, 14), (19, 14, 9, 4, 3), (19, 14, 9, 8, 3), (19, 14, 9, 8, 7), (19, 14, 9, 8, 13), (19, 14, 13, 8, 3), (19, 14, 13, 8, 7), (19, 14, 13, 8, 9), (19, 14, 13, 12, 7), (19, 14, 13, 12, 11), (19, 14, 13, 12, 17), (19, 14, 13, 18, 17), (19, 14, 13, 18, 23), (19, 18, 13, 8, 3), (19, 18, 13, 8, 7), (19, 18, 13, 8, 9), (19, 18, 13, 12, 7), (19, 18, 13, 12, 11), (19, 18, 13, 12, 17), (19, 18, 13, 14, 9), (19, 18, 17, 12, 7), (19, 18, 17, 12, 11), (19, 18, 17, 12, 13), (19, 18, 17, 16, 11), (19, 18, 17, 16, 15), (19, 18, 17, 16, 21), (19, 18, 17, 22, 21), (19, 18, 17, 22, 23), (19, 18, 23, 22, 17), (19, 18, 23, 22, 21), (19, 24, 23, 18, 13), (19, 24, 23, 18, 17), (19, 24, 23, 22, 17), (19, 24, 23, 22, 21), (20, 15, 10, 5, 0), (20, 15, 10, 5, 6), (20, 15, 10, 11, 6), (20, 15, 10, 11, 12), (20, 15, 10, 11, 16), (20, 15, 16, 11, 6), (20, 15, 16, 11, 10), (20, 15, 16, 11, 12), (20, 15, 16, 17, 12), (20, 15, 16, 17, 18), (20, 15, 16, 17, 22), (20, 15, 16, 21, 22), (20, 21, 16, 11, 6), (20, 21, 16, 11, 10), (20, 21, 16, 11, 12), (20, 21, 16, 15, 10), (20, 21, 16, 17, 12), (20, 21, 16, 17, 18), (20, 21, 16, 17, 22), (20, 21, 22, 17, 12), (20, 21, 22, 17, 16), (20, 21, 22, 17, 18), (20, 21, 22, 23, 18), (20, 21, 22, 23, 24), (21, 16, 11, 6, 1), (21, 16, 11, 6, 5), (21, 16, 11, 6, 7), (21, 16, 11, 10, 5), (21, 16, 11, 10, 15), (21, 16, 11, 12, 7), (21, 16, 11, 12, 13), (21, 16, 11, 12, 17), (21, 16, 15, 10, 5), (21, 16, 15, 10, 11), (21, 16, 17, 12, 7), (21, 16, 17, 12, 11), (21, 16, 17, 12, 13), (21, 16, 17, 18, 13), (21, 16, 17, 18, 19), (21, 16, 17, 18, 23), (21, 16, 17, 22, 23), (21, 20, 15, 10, 5), (21, 20, 15, 10, 11), (21, 20, 15, 16, 11), (21, 20, 15, 16, 17), (21, 22, 17, 12, 7), (21, 22, 17, 12, 11), (21, 22, 17, 12, 13), (21, 22, 17, 16, 11), (21, 22, 17, 16, 15), (21, 22, 17, 18, 13), (21, 22, 17, 18, 19), (21, 22, 17, 18, 23), (21, 22, 23, 18, 13), (21, 22, 23, 18, 17), (21, 22, 23, 18, 19), (21, 22, 23, 24, 19), (22, 17, 12, 7, 2), (22, 17, 12, 7, 6), (22, 17, 12, 7, 8), (22, 17, 12, 11, 6), (22, 17, 12, 11, 10), (22, 17, 12, 11, 16), (22, 17, 12, 13, 8), (22, 17, 12, 13, 14), (22, 17, 12, 13, 18), (22, 17, 16, 11, 6), (22, 17, 16, 11, 10), (22, 17, 16, 11, 12), (22, 17, 16, 15, 10), (22, 17, 16, 15, 20), (22, 17, 16, 21, 20), (22, 17, 18, 13, 8), (22, 17, 18, 13, 12), (22, 17, 18, 13, 14), (22, 17, 18, 19, 14), (22, 17, 18, 19, 24), (22, 17, 18, 23, 24), (22, 21, 16, 11, 6), (22, 21, 16, 11, 10), (22, 21, 16, 11, 12), (22, 21, 16, 15, 10), (22, 21, 16, 15, 20), (22, 21, 16, 17, 12), (22, 21, 16, 17, 18), (22, 21, 20, 15, 10), (22, 21, 20, 15, 16), (22, 23, 18, 13, 8), (22, 23, 18, 13, 12), (22, 23, 18, 13, 14), (22, 23, 18, 17, 12), (22, 23, 18, 17, 16), (22, 23, 18, 19, 14), (22, 23, 18, 19, 24), (22, 23, 24, 19, 14), (22, 23, 24, 19, 18), (23, 18, 13, 8, 3), (23, 18, 13, 8, 7), (23, 18, 13, 8, 9), (23, 18, 13, 12, 7), (23, 18, 13, 12, 11), (23, 18, 13, 12, 17), (23, 18, 13, 14, 9), (23, 18, 13, 14, 19), (23, 18, 17, 12, 7), (23, 18, 17, 12, 11), (23, 18, 17, 12, 13), (23, 18, 17, 16, 11), (23, 18, 17, 16, 15), (23, 18, 17, 16, 21), (23, 18, 17, 22, 21), (23, 18, 19, 14, 9), (23, 18, 19, 14, 13), (23, 22, 17, 12, 7), (23, 22, 17, 12, 11), (23, 22, 17, 12, 13), (23, 22, 17, 16, 11), (23, 22, 17, 16, 15), (23, 22, 17, 16, 21), (23, 22, 17, 18, 13), (23, 22, 17, 18, 19), (23, 22, 21, 16, 11), (23, 22, 21, 16, 15), (23, 22, 21, 16, 17), (23, 22, 21, 20, 15), (23, 24, 19, 14, 9), (23, 24, 19, 14, 13), (23, 24, 19, 18, 13), (23, 24, 19, 18, 17), (24, 19, 14, 9, 4), (24, 19, 14, 9, 8), (24, 19, 14, 13, 8), (24, 19, 14, 13, 12), (24, 19, 14, 13, 18), (24, 19, 18, 13, 8), (24, 19, 18, 13, 12), (24, 19, 18, 13, 14), (24, 19, 18, 17, 12), (24, 19, 18, 17, 16), (24, 19, 18, 17, 22), (24, 19, 18, 23, 22), (24, 23, 18, 13, 8), (24, 23, 18, 13, 12), (24, 23, 18, 13, 14), (24, 23, 18, 17, 12), (24, 23, 18, 17, 16), (24, 23, 18, 17, 22), (24, 23, 18, 19, 14), (24, 23, 22, 17, 12), (24, 23, 22, 17, 16), (24, 23, 22, 17, 18), (24, 23, 22, 21, 16), (24, 23, 22, 21, 20), (0, 1, 2, 3, 4, 9), (0, 1, 2, 3, 8, 7), (0, 1, 2, 3, 8, 9), (0, 1, 2, 3, 8, 13), (0, 1, 2, 7, 6, 5), (0, 1, 2, 7, 6, 11), (0, 1, 2, 7, 8, 3), (0, 1, 2, 7, 8, 9), (0, 1, 2, 7, 8, 13), (0, 1, 2, 7, 12, 11), (0, 1, 2, 7, 12, 13), (0, 1, 2, 7, 12, 17), (0, 1, 6, 5, 10, 11), (0, 1, 6, 5, 10, 15), (0, 1, 6, 7, 2, 3), (0, 1, 6, 7, 8, 3), (0, 1, 6, 7, 8, 9), (0, 1, 6, 7, 8, 13), (0, 1, 6, 7, 12, 11), (0, 1, 6, 7, 12, 13), (0, 1, 6, 7, 12, 17), (0, 1, 6, 11, 10, 5), (0, 1, 6, 11, 10, 15), (0, 1, 6, 11, 12, 7), (0, 1, 6, 11, 12, 13), (0, 1, 6, 11, 12, 17), (0, 1, 6, 11, 16, 15), (0, 1, 6, 11, 16, 17), (0, 1, 6, 11, 16, 21), (0, 5, 6, 1, 2, 3), (0, 5, 6, 1, 2, 7), (0, 5, 6, 7, 2, 1), (0, 5, 6, 7, 2, 3), (0, 5, 6, 7, 8, 3), (0, 5, 6, 7, 8, 9), (0, 5, 6, 7, 8, 13), (0, 5, 6, 7, 12, 11), (0, 5, 6, 7, 12, 13), (0, 5, 6, 7, 12, 17), (0, 5, 6, 11, 10, 15), (0, 5, 6, 11, 12, 7), (0, 5, 6, 11, 12, 13), (0, 5, 6, 11, 12, 17), (0, 5, 6, 11, 16, 15), (0, 5, 6, 11, 16, 17), (0, 5, 6, 11, 16, 21), (0, 5, 10, 11, 6, 1), (0, 5, 10, 11, 6, 7), (0, 5, 10, 11, 12, 7), (0, 5, 10, 11, 12, 13), (0, 5, 10, 11, 12, 17), (0, 5, 10, 11, 16, 15), (0, 5, 10, 11, 16, 17), (0, 5, 10, 11, 16, 21), (0, 5, 10, 15, 16, 11), (0, 5, 10, 15, 16, 17), (0, 5, 10, 15, 16, 21), (0, 5, 10, 15, 20, 21), (1, 0, 5, 6, 7, 2), (1, 0, 5, 6, 7, 8), (1, 0, 5, 6, 7, 12), (1, 0, 5, 6, 11, 10), (1, 0, 5, 6, 11, 12), (1, 0, 5, 6, 11, 16), (1, 0, 5, 10, 11, 6), (1, 0, 5, 10, 11, 12), (1, 0, 5, 10, 11, 16), (1, 0, 5, 10, 15, 16), (1, 0, 5, 10, 15, 20), (1, 2, 3, 4, 9, 8), (1, 2, 3, 4, 9, 14), (1, 2, 3, 8, 7, 6), (1, 2, 3, 8, 7, 12), (1, 2, 3, 8, 9, 4), (1, 2, 3, 8, 9, 14), (1, 2, 3, 8, 13, 12), (1, 2, 3, 8, 13, 14), (1, 2, 3, 8, 13, 18), (1, 2, 7, 6, 5, 0), (1, 2, 7, 6, 5, 10), (1, 2, 7, 6, 11, 10), (1, 2, 7, 6, 11, 12), (1, 2, 7, 6, 11, 16), (1, 2, 7, 8, 3, 4), (1, 2, 7, 8, 9, 4), (1, 2, 7, 8, 9, 14), (1, 2, 7, 8, 13, 12), (1, 2, 7, 8, 13, 14), (1, 2, 7, 8, 13, 18), (1, 2, 7, 12, 11, 6), (1, 2, 7, 12, 11, 10), (1, 2, 7, 12, 11, 16), (1, 2, 7, 12, 13, 8), (1, 2, 7, 12, 13, 14), (1, 2, 7, 12, 13, 18), (1, 2, 7, 12, 17, 16), (1, 2, 7, 12, 17, 18), (1, 2, 7, 12, 17, 22), (1, 6, 5, 10, 11, 12), (1, 6, 5, 10, 11, 16), (1, 6, 5, 10, 15, 16), (1, 6, 5, 10, 15, 20), (1, 6, 7, 2, 3, 4), (1, 6, 7, 2, 3, 8), (1, 6, 7, 8, 3, 2), (1, 6, 7, 8, 3, 4), (1, 6, 7, 8, 9, 4), (1, 6, 7, 8, 9, 14), (1, 6, 7, 8, 13, 12), (1, 6, 7, 8, 13, 14), (1, 6, 7, 8, 13, 18), (1, 6, 7, 12, 11, 10), (1, 6, 7, 12, 11, 16), (1, 6, 7, 12, 13, 8), (1, 6, 7, 12, 13, 14), (1, 6, 7, 12, 13, 18), (1, 6, 7, 12, 17, 16), (1, 6, 7, 12, 17, 18), (1, 6, 7, 12, 17, 22), (1, 6, 11, 10, 5, 0), (1, 6, 11, 10, 15, 16), (1, 6, 11, 10, 15, 20), (1, 6, 11, 12, 7, 2), (1, 6, 11, 12, 7, 8), (1, 6, 11, 12, 13, 8), (1, 6, 11, 12, 13, 14), (1, 6, 11, 12, 13, 18), (1, 6, 11, 12, 17, 16), (1, 6, 11, 12, 17, 18), (1, 6, 11, 12, 17, 22), (1, 6, 11, 16, 15, 10), (1, 6, 11, 16, 15, 20), (1, 6, 11, 16, 17, 12), (1, 6, 11, 16, 17, 18), (1, 6, 11, 16, 17, 22), (1, 6, 11, 16, 21, 20), (1, 6, 11, 16, 21, 22), (2, 1, 0, 5, 6, 7), (2, 1, 0, 5, 6, 11), (2, 1, 0, 5, 10, 11), (2, 1, 0, 5, 10, 15), (2, 1, 6, 5, 10, 11), (2, 1, 6, 5, 10, 15), (2, 1, 6, 7, 8, 3), (2, 1, 6, 7, 8, 9), (2, 1, 6, 7, 8, 13), (2, 1, 6, 7, 12, 11), (2, 1, 6, 7, 12, 13), (2, 1, 6, 7, 12, 17), (2, 1, 6, 11, 10, 5), (2, 1, 6, 11, 10, 15), (2, 1, 6, 11, 12, 7), (2, 1, 6, 11, 12, 13), (2, 1, 6, 11, 12, 17), (2, 1, 6, 11, 16, 15), (2, 1, 6, 11, 16, 17), (2, 1, 6, 11, 16, 21), (2, 3, 4, 9, 8, 7), (2, 3, 4, 9, 8, 13), (2, 3, 4, 9, 14, 13), (2, 3, 4, 9, 14, 19), (2, 3, 8, 7, 6, 1), (2, 3, 8, 7, 6, 5), (2, 3, 8, 7, 6, 11), (2, 3, 8, 7, 12, 11), (2, 3, 8, 7, 12, 13), (2, 3, 8, 7, 12, 17), (2, 3, 8, 9, 14, 13), (2, 3, 8, 9, 14, 19), (2, 3, 8, 13, 12, 7), (2, 3, 8, 13, 12, 11), (2, 3, 8, 13, 12, 17), (2, 3, 8, 13, 14, 9), (2, 3, 8, 13, 14, 19), (2, 3, 8, 13, 18, 17), (2, 3, 8, 13, 18, 19), (2, 3, 8, 13, 18, 23), (2, 7, 6, 1, 0, 5), (2, 7, 6, 5, 0, 1), (2, 7, 6, 5, 10, 11), (2, 7, 6, 5, 10, 15), (2, 7, 6, 11, 10, 5), (2, 7, 6, 11, 10, 15), (2, 7, 6, 11, 12, 13), (2, 7, 6, 11, 12, 17), (2, 7, 6, 11, 16, 15), (2, 7, 6, 11, 16, 17), (2, 7, 6, 11, 16, 21), (2, 7, 8, 3, 4, 9), (2, 7, 8, 9, 4, 3), (2, 7, 8, 9, 14, 13), (2, 7, 8, 9, 14, 19), (2, 7, 8, 13, 12, 11), (2, 7, 8, 13, 12, 17), (2, 7, 8, 13, 14, 9), (2, 7, 8, 13, 14, 19), (2, 7, 8, 13, 18, 17), (2, 7, 8, 13, 18, 19), (2, 7, 8, 13, 18, 23), (2, 7, 12, 11, 6, 1), (2, 7, 12, 11, 6, 5), (2, 7, 12, 11, 10, 5), (2, 7, 12, 11, 10, 15), (2, 7, 12, 11, 16, 15), (2, 7, 12, 11, 16, 17), (2, 7, 12, 11, 16, 21), (2, 7, 12, 13, 8, 3), (2, 7, 12, 13, 8, 9), (2, 7, 12, 13, 14, 9), (2, 7, 12, 13, 14, 19), (2, 7, 12, 13, 18, 17), (2, 7, 12, 13, 18, 19), (2, 7, 12, 13, 18, 23), (2, 7, 12, 17, 16, 11), (2, 7, 12, 17, 16, 15), (2, 7, 12, 17, 16, 21), (2, 7, 12, 17, 18, 13), (2, 7, 12, 17, 18, 19), (2, 7, 12, 17, 18, 23), (2, 7, 12, 17, 22, 21), (2, 7, 12, 17, 22, 23), (3, 2, 1, 0, 5, 6), (3, 2, 1, 0, 5, 10), (3, 2, 1, 6, 5, 0), (3, 2, 1, 6, 5, 10), (3, 2, 1, 6, 7, 8), (3, 2, 1, 6, 7, 12), (3, 2, 1, 6, 11, 10), (3, 2, 1, 6, 11, 12), (3, 2, 1, 6, 11, 16), (3, 2, 7, 6, 1, 0), (3, 2, 7, 6, 5, 0), (3, 2, 7, 6, 5, 10), (3, 2, 7, 6, 11, 10), (3, 2, 7, 6, 11, 12), (3, 2, 7, 6, 11, 16), (3, 2, 7, 8, 9, 4), (3, 2, 7, 8, 9, 14), (3, 2, 7, 8, 13, 12), (3, 2, 7, 8, 13, 14), (3, 2, 7, 8, 13, 18), (3, 2, 7, 12, 11, 6), (3, 2, 7, 12, 11, 10), (3, 2, 7, 12, 11, 16), (3, 2, 7, 12, 13, 8), (3, 2, 7, 12, 13, 14), (3, 2, 7, 12, 13, 18), (3, 2, 7, 12, 17, 16), (3, 2, 7, 12, 17, 18), (3, 2, 7, 12, 17, 22), (3, 4, 9, 8, 7, 2), (3, 4, 9, 8, 7, 6), (3, 4, 9, 8, 7, 12), (3, 4, 9, 8, 13, 12), (3, 4, 9, 8, 13, 14), (3, 4, 9, 8, 13, 18), (3, 4, 9, 14, 13, 8), (3, 4, 9, 14, 13, 12), (3, 4, 9, 14, 13, 18), (3, 4, 9, 14, 19, 18), (3, 4, 9, 14, 19, 24), (3, 8, 7, 2, 1, 0), (3, 8, 7, 2, 1, 6), (3, 8, 7, 6, 1, 0), (3, 8, 7, 6, 1, 2), (3, 8, 7, 6, 5, 0), (3, 8, 7, 6, 5, 10), (3, 8, 7, 6, 11, 10), (3, 8, 7, 6, 11, 12), (3, 8, 7, 6, 11, 16), (3, 8, 7, 12, 11, 6), (3, 8, 7, 12, 11, 10), (3, 8, 7, 12, 11, 16), (3, 8, 7, 12, 13, 14), (3, 8, 7, 12, 13, 18), (3, 8, 7, 12, 17, 16), (3, 8, 7, 12, 17, 18), (3, 8, 7, 12, 17, 22), (3, 8, 9, 14, 13, 12), (3, 8, 9, 14, 13, 18), (3, 8, 9, 14, 19, 18), (3, 8, 9, 14, 19, 24), (3, 8, 13, 12, 7, 2), (3, 8, 13, 12, 7, 6), (3, 8, 13, 12, 11, 6), (3, 8, 13, 12, 11, 10), (3, 8, 13, 12, 11, 16), (3, 8, 13, 12, 17, 16), (3, 8, 13, 12, 17, 18), (3, 8, 13, 12, 17, 22), (3, 8, 13, 14, 9, 4), (3, 8, 13, 14, 19, 18), (3, 8, 13, 14, 19, 24), (3, 8, 13, 18, 17, 12), (3, 8, 13, 18, 17, 16), (3, 8, 13, 18, 17, 22), (3, 8, 13, 18, 19, 14), (3, 8, 13, 18, 19, 24), (3, 8, 13, 18, 23, 22), (3, 8, 13, 18, 23, 24), (4, 3, 2, 1, 0, 5), (4, 3, 2, 1, 6, 5), (4, 3, 2, 1, 6, 7), (4, 3, 2, 1, 6, 11), (4, 3, 2, 7, 6, 1), (4, 3, 2, 7, 6, 5), (4, 3, 2, 7, 6, 11), (4, 3, 2, 7, 8, 9), (4, 3, 2, 7, 8, 13), (4, 3, 2, 7, 12, 11), (4, 3, 2, 7, 12, 13), (4, 3, 2, 7, 12, 17), (4, 3, 8, 7, 2, 1), (4, 3, 8, 7, 6, 1), (4, 3, 8, 7, 6, 5), (4, 3, 8, 7, 6, 11), (4, 3, 8, 7, 12, 11), (4, 3, 8, 7, 12, 13), (4, 3, 8, 7, 12, 17), (4, 3, 8, 9, 14, 13), (4, 3, 8, 9, 14, 19), (4, 3, 8, 13, 12, 7), (4, 3, 8, 13, 12, 11), (4, 3, 8, 13, 12, 17), (4, 3, 8, 13, 14, 9), (4, 3, 8, 13, 14, 19), (4, 3, 8, 13, 18, 17), (4, 3, 8, 13, 18, 19), (4, 3, 8, 13, 18, 23), (4, 9, 8, 3, 2, 1), (4, 9, 8, 3, 2, 7), (4, 9, 8, 7, 2, 1), (4, 9, 8, 7, 2, 3), (4, 9, 8, 7, 6, 1), (4, 9, 8, 7, 6, 5), (4, 9, 8, 7, 6, 11), (4, 9, 8, 7, 12, 11), (4, 9, 8, 7, 12, 13), (4, 9, 8, 7, 12, 17), (4, 9, 8, 13, 12, 7), (4, 9, 8, 13, 12, 11), (4, 9, 8, 13, 12, 17), (4, 9, 8, 13, 14, 19), (4, 9, 8, 13, 18, 17), (4, 9, 8, 13, 18, 19), (4, 9, 8, 13, 18, 23), (4, 9, 14, 13, 8, 3), (4, 9, 14, 13, 8, 7), (4, 9, 14, 13, 12, 7), (4, 9, 14, 13, 12, 11), (4, 9, 14, 13, 12, 17), (4, 9, 14, 13, 18, 17), (4, 9, 14, 13, 18, 19), (4, 9, 14, 13, 18, 23), (4, 9, 14, 19, 18, 13), (4, 9, 14, 19, 18, 17), (4, 9, 14, 19, 18, 23), (4, 9, 14, 19, 24, 23), (5, 0, 1, 2, 3, 4), (5, 0, 1, 2, 3, 8), (5, 0, 1, 2, 7, 6), (5, 0, 1, 2, 7, 8), (5, 0, 1, 2, 7, 12), (5, 0, 1, 6, 7, 2), (5, 0, 1, 6, 7, 8), (5, 0, 1, 6, 7, 12), (5, 0, 1, 6, 11, 10), (5, 0, 1, 6, 11, 12), (5, 0, 1, 6, 11, 16), (5, 6, 1, 2, 3, 4), (5, 6, 1, 2, 3, 8), (5, 6, 1, 2, 7, 8), (5, 6, 1, 2, 7, 12), (5, 6, 7, 2, 1, 0), (5, 6, 7, 2, 3, 4), (5, 6, 7, 2, 3, 8), (5, 6, 7, 8, 3, 2), (5, 6, 7, 8, 3, 4), (5, 6, 7, 8, 9, 4), (5, 6, 7, 8, 9, 14), (5, 6, 7, 8, 13, 12), (5, 6, 7, 8, 13, 14), (5, 6, 7, 8, 13, 18), (5, 6, 7, 12, 11, 10), (5, 6, 7, 12, 11, 16), (5, 6, 7, 12, 13, 8), (5, 6, 7, 12, 13, 14), (5, 6, 7, 12, 13, 18), (5, 6, 7, 12, 17, 16), (5, 6, 7, 12, 17, 18), (5, 6, 7, 12, 17, 22), (5, 6, 11, 10, 15, 16), (5, 6, 11, 10, 15, 20), (5, 6, 11, 12, 7, 2), (5, 6, 11, 12, 7, 8), (5, 6, 11, 12, 13, 8), (5, 6, 11, 12, 13, 14), (5, 6, 11, 12, 13, 18), (5, 6, 11, 12, 17, 16), (5, 6, 11, 12, 17, 18), (5, 6, 11, 12, 17, 22), (5, 6, 11, 16, 15, 10), (5, 6, 11, 16, 15, 20), (5, 6, 11, 16, 17, 12), (5, 6, 11, 16, 17, 18), (5, 6, 11, 16, 17, 22), (5, 6, 11, 16, 21, 20), (5, 6, 11, 16, 21, 22), (5, 10, 11, 6, 1, 0), (5, 10, 11, 6, 1, 2), (5, 10, 11, 6, 7, 2), (5, 10, 11, 6, 7, 8), (5, 10, 11, 6, 7, 12), (5, 10, 11, 12, 7, 2), (5, 10, 11, 12, 7, 6), (5, 10, 11, 12, 7, 8), (5, 10, 11, 12, 13, 8), (5, 10, 11, 12, 13, 14), (5, 10, 11, 12, 13, 18), (5, 10, 11, 12, 17, 16), (5, 10, 11, 12, 17, 18), (5, 10, 11, 12, 17, 22), (5, 10, 11, 16, 15, 20), (5, 10, 11, 16, 17, 12), (5, 10, 11, 16, 17, 18), (5, 10, 11, 16, 17, 22), (5, 10, 11, 16, 21, 20), (5, 10, 11, 16, 21, 22), (5, 10, 15, 16, 11, 6), (5, 10, 15, 16, 11, 12), (5, 10, 15, 16, 17, 12), (5, 10, 15, 16, 17, 18), (5, 10, 15, 16, 17, 22), (5, 10, 15, 16, 21, 20), (5, 10, 15, 16, 21, 22), (5, 10, 15, 20, 21, 16), (5, 10, 15, 20, 21, 22), (6, 1, 0, 5, 10, 11), (6, 1, 0, 5, 10, 15), (6, 1, 2, 3, 4, 9), (6, 1, 2, 3, 8, 7), (6, 1, 2, 3, 8, 9), (6, 1, 2, 3, 8, 13), (6, 1, 2, 7, 8, 3), (6, 1, 2, 7, 8, 9), (6, 1, 2, 7, 8, 13), (6, 1, 2, 7, 12, 11), (6, 1, 2, 7, 12, 13), (6, 1, 2, 7, 12, 17), (6, 5, 0, 1, 2, 3), (6, 5, 0, 1, 2, 7), (6, 5, 10, 11, 12, 7), (6, 5, 10, 11, 12, 13), (6, 5, 10, 11, 12, 17), (6, 5, 10, 11, 16, 15), (6, 5, 10, 11, 16, 17), (6, 5, 10, 11, 16, 21), (6, 5, 10, 15, 16, 11), (6, 5, 10, 15, 16, 17), (6, 5, 10, 15, 16, 21), (6, 5, 10, 15, 20, 21), (6, 7, 2, 1, 0, 5), (6, 7, 2, 3, 4, 9), (6, 7, 2, 3, 8, 9), (6, 7, 2, 3, 8, 13), (6, 7, 8, 3, 2, 1), (6, 7, 8, 3, 4, 9), (6, 7, 8, 9, 4, 3), (6, 7, 8, 9, 14, 13), (6, 7, 8, 9, 14, 19), (6, 7, 8, 13, 12, 11), (6, 7, 8, 13, 12, 17), (6, 7, 8, 13, 14, 9), (6, 7, 8, 13, 14, 19), (6, 7, 8, 13, 18, 17), (6, 7, 8, 13, 18, 19), (6, 7, 8, 13, 18, 23), (6, 7, 12, 11, 10, 5), (6, 7, 12, 11, 10, 15), (6, 7, 12, 11, 16, 15), (6, 7, 12, 11, 16, 17), (6, 7, 12, 11, 16, 21), (6, 7, 12, 13, 8, 3), (6, 7, 12, 13, 8, 9), (6, 7, 12, 13, 14, 9), (6, 7, 12, 13, 14, 19), (6, 7, 12, 13, 18, 17), (6, 7, 12, 13, 18, 19), (6, 7, 12, 13, 18, 23), (6, 7, 12, 17, 16, 11), (6, 7, 12, 17, 16, 15), (6, 7, 12, 17, 16, 21), (6, 7, 12, 17, 18, 13), (6, 7, 12, 17, 18, 19), (6, 7, 12, 17, 18, 23), (6, 7, 12, 17, 22, 21), (6, 7, 12, 17, 22, 23), (6, 11, 10, 5, 0, 1), (6, 11, 10, 15, 16, 17), (6, 11, 10, 15, 16, 21), (6, 11, 10, 15, 20, 21), (6, 11, 12, 7, 2, 1), (6, 11, 12, 7, 2, 3), (6, 11, 12, 7, 8, 3), (6, 11, 12, 7, 8, 9), (6, 11, 12, 7, 8, 13), (6, 11, 12, 13, 8, 3), (6, 11, 12, 13, 8, 7), (6, 11, 12, 13, 8, 9), (6, 11, 12, 13, 14, 9), (6, 11, 12, 13, 14, 19), (6, 11, 12, 13, 18, 17), (6, 11, 12, 13, 18, 19), (6, 11, 12, 13, 18, 23), (6, 11, 12, 17, 16, 15), (6, 11, 12, 17, 16, 21), (6, 11, 12, 17, 18, 13), (6, 11, 12, 17, 18, 19), (6, 11, 12, 17, 18, 23), (6, 11, 12, 17, 22, 21), (6, 11, 12, 17, 22, 23), (6, 11, 16, 15, 10, 5), (6, 11, 16, 15, 20, 21), (6, 11, 16, 17, 12, 7), (6, 11, 16, 17, 12, 13), (6, 11, 16, 17, 18, 13), (6, 11, 16, 17, 18, 19), (6, 11, 16, 17, 18, 23), (6, 11, 16, 17, 22, 21), (6, 11, 16, 17, 22, 23), (6, 11, 16, 21, 20, 15), (6, 11, 16, 21, 22, 17), (6, 11, 16, 21, 22, 23), (7, 2, 1, 0, 5, 6), (7, 2, 1, 0, 5, 10), (7, 2, 1, 6, 5, 0), (7, 2, 1, 6, 5, 10), (7, 2, 1, 6, 11, 10), (7, 2, 1, 6, 11, 12), (7, 2, 1, 6, 11, 16), (7, 2, 3, 4, 9, 8), (7, 2, 3, 4, 9, 14), (7, 2, 3, 8, 9, 4), (7, 2, 3, 8, 9, 14), (7, 2, 3, 8, 13, 12), (7, 2, 3, 8, 13, 14), (7, 2, 3, 8, 13, 18), (7, 6, 1, 0, 5, 10), (7, 6, 1, 2, 3, 4), (7, 6, 1, 2, 3, 8), (7, 6, 5, 0, 1, 2), (7, 6, 5, 10, 11, 12), (7, 6, 5, 10, 11, 16), (7, 6, 5, 10, 15, 16), (7, 6, 5, 10, 15, 20), (7, 6, 11, 10, 5, 0), (7, 6, 11, 10, 15, 16), (7, 6, 11, 10, 15, 20), (7, 6, 11, 12, 13, 8), (7, 6, 11, 12, 13, 14), (7, 6, 11, 12, 13, 18), (7, 6, 11, 12, 17, 16), (7, 6, 11, 12, 17, 18), (7, 6, 11, 12, 17, 22), (7, 6, 11, 16, 15, 10), (7, 6, 11, 16, 15, 20), (7, 6, 11, 16, 17, 12), (7, 6, 11, 16, 17, 18), (7, 6, 11, 16, 17, 22), (7, 6, 11, 16, 21, 20), (7, 6, 11, 16, 21, 22), (7, 8, 3, 2, 1, 0), (7, 8, 3, 2, 1, 6), (7, 8, 3, 4, 9, 14), (7, 8, 9, 4, 3, 2), (7, 8, 9, 14, 13, 12), (7, 8, 9, 14, 13, 18), (7, 8, 9, 14, 19, 18), (7, 8, 9, 14, 19, 24), (7, 8, 13, 12, 11, 6), (7, 8, 13, 12, 11, 10), (7, 8, 13, 12, 11, 16), (7, 8, 13, 12, 17, 16), (7, 8, 13, 12, 17, 18), (7, 8, 13, 12, 17, 22), (7, 8, 13, 14, 9, 4), (7, 8, 13, 14, 19, 18), (7, 8, 13, 14, 19, 24), (7, 8, 13, 18, 17, 12), (7, 8, 13, 18, 17, 16), (7, 8, 13, 18, 17, 22), (7, 8, 13, 18, 19, 14), (7, 8, 13, 18, 19, 24), (7, 8, 13, 18, 23, 22), (7, 8, 13, 18, 23, 24), (7, 12, 11, 6, 1, 0), (7, 12, 11, 6, 1, 2), (7, 12, 11, 6, 5, 0), (7, 12, 11, 6, 5, 10), (7, 12, 11, 10, 5, 0), (7, 12, 11, 10, 5, 6), (7, 12, 11, 10, 15, 16), (7, 12, 11, 10, 15, 20), (7, 12, 11, 16, 15, 10), (7, 12, 11, 16, 15, 20), (7, 12, 11, 16, 17, 18), (7, 12, 11, 16, 17, 22), (7, 12, 11, 16, 21, 20), (7, 12, 11, 16, 21, 22), (7, 12, 13, 8, 3, 2), (7, 12, 13, 8, 3, 4), (7, 12, 13, 8, 9, 4), (7, 12, 13, 8, 9, 14), (7, 12, 13, 14, 9, 4), (7, 12, 13, 14, 9, 8), (7, 12, 13, 14, 19, 18), (7, 12, 13, 14, 19, 24), (7, 12, 13, 18, 17, 16), (7, 12, 13, 18, 17, 22), (7, 12, 13, 18, 19, 14), (7, 12, 13, 18, 19, 24), (7, 12, 13, 18, 23, 22), (7, 12, 13, 18, 23, 24), (7, 12, 17, 16, 11, 6), (7, 12, 17, 16, 11, 10), (7, 12, 17, 16, 15, 10), (7, 12, 17, 16, 15, 20), (7, 12, 17, 16, 21, 20), (7, 12, 17, 16, 21, 22), (7, 12, 17, 18, 13, 8), (7, 12, 17, 18, 13, 14), (7, 12, 17, 18, 19, 14), (7, 12, 17, 18, 19, 24), (7, 12, 17, 18, 23, 22), (7, 12, 17, 18, 23, 24), (7, 12, 17, 22, 21, 16), (7, 12, 17, 22, 21, 20), (7, 12, 17, 22, 23, 18), (7, 12, 17, 22, 23, 24), (8, 3, 2, 1, 0, 5), (8, 3, 2, 1, 6, 5), (8, 3, 2, 1, 6, 7), (8, 3, 2, 1, 6, 11), (8, 3, 2, 7, 6, 1), (8, 3, 2, 7, 6, 5), (8, 3, 2, 7, 6, 11), (8, 3, 2, 7, 12, 11), (8, 3, 2, 7, 12, 13), (8, 3, 2, 7, 12, 17), (8, 3, 4, 9, 14, 13), (8, 3, 4, 9, 14, 19), (8, 7, 2, 1, 0, 5), (8, 7, 2, 1, 6, 5), (8, 7, 2, 1, 6, 11), (8, 7, 2, 3, 4, 9), (8, 7, 6, 1, 0, 5), (8, 7, 6, 1, 2, 3), (8, 7, 6, 5, 0, 1), (8, 7, 6, 5, 10, 11), (8, 7, 6, 5, 10, 15), (8, 7, 6, 11, 10, 5), (8, 7, 6, 11, 10, 15), (8, 7, 6, 11, 12, 13), (8, 7, 6, 11, 12, 17), (8, 7, 6, 11, 16, 15), (8, 7, 6, 11, 16, 17), (8, 7, 6, 11, 16, 21), (8, 7, 12, 11, 6, 1), (8, 7, 12, 11, 6, 5), (8, 7, 12, 11, 10, 5), (8, 7, 12, 11, 10, 15), (8, 7, 12, 11, 16, 15), (8, 7, 12, 11, 16, 17), (8, 7, 12, 11, 16, 21), (8, 7, 12, 13, 14, 9), (8, 7, 12, 13, 14, 19), (8, 7, 12, 13, 18, 17), (8, 7, 12, 13, 18, 19), (8, 7, 12, 13, 18, 23), (8, 7, 12, 17, 16, 11), (8, 7, 12, 17, 16, 15), (8, 7, 12, 17, 16, 21), (8, 7, 12, 17, 18, 13), (8, 7, 12, 17, 18, 19), (8, 7, 12, 17, 18, 23), (8, 7, 12, 17, 22, 21), (8, 7, 12, 17, 22, 23), (8, 9, 4, 3, 2, 1), (8, 9, 4, 3, 2, 7), (8, 9, 14, 13, 12, 7), (8, 9, 14, 13, 12, 11), (8, 9, 14, 13, 12, 17), (8, 9, 14, 13, 18, 17), (8, 9, 14, 13, 18, 19), (8, 9, 14, 13, 18, 23), (8, 9, 14, 19, 18, 13), (8, 9, 14, 19, 18, 17), (8, 9, 14, 19, 18, 23), (8, 9, 14, 19, 24, 23), (8, 13, 12, 7, 2, 1), (8, 13, 12, 7, 2, 3), (8, 13, 12, 7, 6, 1), (8, 13, 12, 7, 6, 5), (8, 13, 12, 7, 6, 11), (8, 13, 12, 11, 6, 1), (8, 13, 12, 11, 6, 5), (8, 13, 12, 11, 6, 7), (8, 13, 12, 11, 10, 5), (8, 13, 12, 11, 10, 15), (8, 13, 12, 11, 16, 15), (8, 13, 12, 11, 16, 17), (8, 13, 12, 11, 16, 21), (8, 13, 12, 17, 16, 11), (8, 13, 12, 17, 16, 15), (8, 13, 12, 17, 16, 21), (8, 13, 12, 17, 18, 19), (8, 13, 12, 17, 18, 23), (8, 13, 12, 17, 22, 21), (8, 13, 12, 17, 22, 23), (8, 13, 14, 9, 4, 3), (8, 13, 14, 19, 18, 17), (8, 13, 14, 19, 18, 23), (8, 13, 14, 19, 24, 23), (8, 13, 18, 17, 12, 7), (8, 13, 18, 17, 12, 11), (8, 13, 18, 17, 16, 11), (8, 13, 18, 17, 16, 15), (8, 13, 18, 17, 16, 21), (8, 13, 18, 17, 22, 21), (8, 13, 18, 17, 22, 23), (8, 13, 18, 19, 14, 9), (8, 13, 18, 19, 24, 23), (8, 13, 18, 23, 22, 17), (8, 13, 18, 23, 22, 21), (8, 13, 18, 23, 24, 19), (9, 4, 3, 2, 1, 0), (9, 4, 3, 2, 1, 6), (9, 4, 3, 2, 7, 6), (9, 4, 3, 2, 7, 8), (9, 4, 3, 2, 7, 12), (9, 4, 3, 8, 7, 2), (9, 4, 3, 8, 7, 6), (9, 4, 3, 8, 7, 12), (9, 4, 3, 8, 13, 12), (9, 4, 3, 8, 13, 14), (9, 4, 3, 8, 13, 18), (9, 8, 3, 2, 1, 0), (9, 8, 3, 2, 1, 6), (9, 8, 3, 2, 7, 6), (9, 8, 3, 2, 7, 12), (9, 8, 7, 2, 1, 0), (9, 8, 7, 2, 1, 6), (9, 8, 7, 2, 3, 4), (9, 8, 7, 6, 1, 0), (9, 8, 7, 6, 1, 2), (9, 8, 7, 6, 5, 0), (9, 8, 7, 6, 5, 10), (9, 8, 7, 6, 11, 10), (9, 8, 7, 6, 11, 12), (9, 8, 7, 6, 11, 16), (9, 8, 7, 12, 11, 6), (9, 8, 7, 12, 11, 10), (9, 8, 7, 12, 11, 16), (9, 8, 7, 12, 13, 14), (9, 8, 7, 12, 13, 18), (9, 8, 7, 12, 17, 16), (9, 8, 7, 12, 17, 18), (9, 8, 7, 12, 17, 22), (9, 8, 13, 12, 7, 2), (9, 8, 13, 12, 7, 6), (9, 8, 13, 12, 11, 6), (9, 8, 13, 12, 11, 10), (9, 8, 13, 12, 11, 16), (9, 8, 13, 12, 17, 16), (9, 8, 13, 12, 17, 18), (9, 8, 13, 12, 17, 22), (9, 8, 13, 14, 19, 18), (9, 8, 13, 14, 19, 24), (9, 8, 13, 18, 17, 12), (9, 8, 13, 18, 17, 16), (9, 8, 13, 18, 17, 22), (9, 8, 13, 18, 19, 14), (9, 8, 13, 18, 19, 24), (9, 8, 13, 18, 23, 22), (9, 8, 13, 18, 23, 24), (9, 14, 13, 8, 3, 2), (9, 14, 13, 8, 3, 4), (9, 14, 13, 8, 7, 2), (9, 14, 13, 8, 7, 6), (9, 14, 13, 8, 7, 12), (9, 14, 13, 12, 7, 2), (9, 14, 13, 12, 7, 6), (9, 14, 13, 12, 7, 8), (9, 14, 13, 12, 11, 6), (9, 14, 13, 12, 11, 10), (9, 14, 13, 12, 11, 16), (9, 14, 13, 12, 17, 16), (9, 14, 13, 12, 17, 18), (9, 14, 13, 12, 17, 22), (9, 14, 13, 18, 17, 12), (9, 14, 13, 18, 17, 16), (9, 14, 13, 18, 17, 22), (9, 14, 13, 18, 19, 24), (9, 14, 13, 18, 23, 22), (9, 14, 13, 18, 23, 24), (9, 14, 19, 18, 13, 8), (9, 14, 19, 18, 13, 12), (9, 14, 19, 18, 17, 12), (9, 14, 19, 18, 17, 16), (9, 14, 19, 18, 17, 22), (9, 14, 19, 18, 23, 22), (9, 14, 19, 18, 23, 24), (9, 14, 19, 24, 23, 18), (9, 14, 19, 24, 23, 22), (10, 5, 0, 1, 2, 3), (10, 5, 0, 1, 2, 7), (10, 5, 0, 1, 6, 7), (10, 5, 0, 1, 6, 11), (10, 5, 6, 1, 2, 3), (10, 5, 6, 1, 2, 7), (10, 5, 6, 7, 2, 1), (10, 5, 6, 7, 2, 3), (10, 5, 6, 7, 8, 3), (10, 5, 6, 7, 8, 9), (10, 5, 6, 7, 8, 13), (10, 5, 6, 7, 12, 11), (10, 5, 6, 7, 12, 13), (10, 5, 6, 7, 12, 17), (10, 5, 6, 11, 12, 7), (10, 5, 6, 11, 12, 13), (10, 5, 6, 11, 12, 17), (10, 5, 6, 11, 16, 15), (10, 5, 6, 11, 16, 17), (10, 5, 6, 11, 16, 21), (10, 11, 6, 1, 0, 5), (10, 11, 6, 1, 2, 3), (10, 11, 6, 1, 2, 7), (10, 11, 6, 5, 0, 1), (10, 11, 6, 7, 2, 1), (10, 11, 6, 7, 2, 3), (10, 11, 6, 7, 8, 3), (10, 11, 6, 7, 8, 9), (10, 11, 6, 7, 8, 13), (10, 11, 6, 7, 12, 13), (10, 11, 6, 7, 12, 17), (10, 11, 12, 7, 2, 1), (10, 11, 12, 7, 2, 3), (10, 11, 12, 7, 6, 1), (10, 11, 12, 7, 6, 5), (10, 11, 12, 7, 8, 3), (10, 11, 12, 7, 8, 9), (10, 11, 12, 7, 8, 13), (10, 11, 12, 13, 8, 3), (10, 11, 12, 13, 8, 7), (10, 11, 12, 13, 8, 9), (10, 11, 12, 13, 14, 9), (10, 11, 12, 13, 14, 19), (10, 11, 12, 13, 18, 17), (10, 11, 12, 13, 18, 19), (10, 11, 12, 13, 18, 23), (10, 11, 12, 17, 16, 15), (10, 11, 12, 17, 16, 21), (10, 11, 12, 17, 18, 13), (10, 11, 12, 17, 18, 19), (10, 11, 12, 17, 18, 23), (10, 11, 12, 17, 22, 21), (10, 11, 12, 17, 22, 23), (10, 11, 16, 15, 20, 21), (10, 11, 16, 17, 12, 7), (10, 11, 16, 17, 12, 13), (10, 11, 16, 17, 18, 13), (10, 11, 16, 17, 18, 19), (10, 11, 16, 17, 18, 23), (10, 11, 16, 17, 22, 21), (10, 11, 16, 17, 22, 23), (10, 11, 16, 21, 20, 15), (10, 11, 16, 21, 22, 17), (10, 11, 16, 21, 22, 23), (10, 15, 16, 11, 6, 1), (10, 15, 16, 11, 6, 5), (10, 15, 16, 11, 6, 7), (10, 15, 16, 11, 12, 7), (10, 15, 16, 11, 12, 13), (10, 15, 16, 11, 12, 17), (10, 15, 16, 17, 12, 7), (10, 15, 16, 17, 12, 11), (10, 15, 16, 17, 12, 13), (10, 15, 16, 17, 18, 13), (10, 15, 16, 17, 18, 19), (10, 15, 16, 17, 18, 23), (10, 15, 16, 17, 22, 21), (10, 15, 16, 17, 22, 23), (10, 15, 16, 21, 22, 17), (10, 15, 16, 21, 22, 23), (10, 15, 20, 21, 16, 11), (10, 15, 20, 21, 16, 17), (10, 15, 20, 21, 22, 17), (10, 15, 20, 21, 22, 23), (11, 6, 1, 0, 5, 10), (11, 6, 1, 2, 3, 4), (11, 6, 1, 2, 3, 8), (11, 6, 1, 2, 7, 8), (11, 6, 1, 2, 7, 12), (11, 6, 5, 0, 1, 2), (11, 6, 5, 10, 15, 16), (11, 6, 5, 10, 15, 20), (11, 6, 7, 2, 1, 0), (11, 6, 7, 2, 3, 4), (11, 6, 7, 2, 3, 8), (11, 6, 7, 8, 3, 2), (11, 6, 7, 8, 3, 4), (11, 6, 7, 8, 9, 4), (11, 6, 7, 8, 9, 14), (11, 6, 7, 8, 13, 12), (11, 6, 7, 8, 13, 14), (11, 6, 7, 8, 13, 18), (11, 6, 7, 12, 13, 8), (11, 6, 7, 12, 13, 14), (11, 6, 7, 12, 13, 18), (11, 6, 7, 12, 17, 16), (11, 6, 7, 12, 17, 18), (11, 6, 7, 12, 17, 22), (11, 10, 5, 0, 1, 2), (11, 10, 5, 0, 1, 6), (11, 10, 5, 6, 1, 0), (11, 10, 5, 6, 1, 2), (11, 10, 5, 6, 7, 2), (11, 10, 5, 6, 7, 8), (11, 10, 5, 6, 7, 12), (11, 10, 15, 16, 17, 12), (11, 10, 15, 16, 17, 18), (11, 10, 15, 16, 17, 22), (11, 10, 15, 16, 21, 20), (11, 10, 15, 16, 21, 22), (11, 10, 15, 20, 21, 16), (11, 10, 15, 20, 21, 22), (11, 12, 7, 2, 1, 0), (11, 12, 7, 2, 1, 6), (11, 12, 7, 2, 3, 4), (11, 12, 7, 2, 3, 8), (11, 12, 7, 6, 1, 0), (11, 12, 7, 6, 1, 2), (11, 12, 7, 6, 5, 0), (11, 12, 7, 6, 5, 10), (11, 12, 7, 8, 3, 2), (11, 12, 7, 8, 3, 4), (11, 12, 7, 8, 9, 4), (11, 12, 7, 8, 9, 14), (11, 12, 7, 8, 13, 14), (11, 12, 7, 8, 13, 18), (11, 12, 13, 8, 3, 2), (11, 12, 13, 8, 3, 4), (11, 12, 13, 8, 7, 2), (11, 12, 13, 8, 7, 6), (11, 12, 13, 8, 9, 4), (11, 12, 13, 8, 9, 14), (11, 12, 13, 14, 9, 4), (11, 12, 13, 14, 9, 8), (11, 12, 13, 14, 19, 18), (11, 12, 13, 14, 19, 24), (11, 12, 13, 18, 17, 16), (11, 12, 13, 18, 17, 22), (11, 12, 13, 18, 19, 14), (11, 12, 13, 18, 19, 24), (11, 12, 13, 18, 23, 22), (11, 12, 13, 18, 23, 24), (11, 12, 17, 16, 15, 10), (11, 12, 17, 16, 15, 20), (11, 12, 17, 16, 21, 20), (11, 12, 17, 16, 21, 22), (11, 12, 17, 18, 13, 8), (11, 12, 17, 18, 13, 14), (11, 12, 17, 18, 19, 14), (11, 12, 17, 18, 19, 24), (11, 12, 17, 18, 23, 22), (11, 12, 17, 18, 23, 24), (11, 12, 17, 22, 21, 16), (11, 12, 17, 22, 21, 20), (11, 12, 17, 22, 23, 18), (11, 12, 17, 22, 23, 24), (11, 16, 15, 10, 5, 0), (11, 16, 15, 10, 5, 6), (11, 16, 15, 20, 21, 22), (11, 16, 17, 12, 7, 2), (11, 16, 17, 12, 7, 6), (11, 16, 17, 12, 7, 8), (11, 16, 17, 12, 13, 8), (11, 16, 17, 12, 13, 14), (11, 16, 17, 12, 13, 18), (11, 16, 17, 18, 13, 8), (11, 16, 17, 18, 13, 12), (11, 16, 17, 18, 13, 14), (11, 16, 17, 18, 19, 14), (11, 16, 17, 18, 19, 24), (11, 16, 17, 18, 23, 22), (11, 16, 17, 18, 23, 24), (11, 16, 17, 22, 21, 20), (11, 16, 17, 22, 23, 18), (11, 16, 17, 22, 23, 24), (11, 16, 21, 20, 15, 10), (11, 16, 21, 22, 17, 12), (11, 16, 21, 22, 17, 18), (11, 16, 21, 22, 23, 18), (11, 16, 21, 22, 23, 24), (12, 7, 2, 1, 0, 5), (12, 7, 2, 1, 6, 5), (12, 7, 2, 1, 6, 11), (12, 7, 2, 3, 4, 9), (12, 7, 2, 3, 8, 9), (12, 7, 2, 3, 8, 13), (12, 7, 6, 1, 0, 5), (12, 7, 6, 1, 2, 3), (12, 7, 6, 5, 0, 1), (12, 7, 6, 5, 10, 11), (12, 7, 6, 5, 10, 15), (12, 7, 6, 11, 10, 5), (12, 7, 6, 11, 10, 15), (12, 7, 6, 11, 16, 15), (12, 7, 6, 11, 16, 17), (12, 7, 6, 11, 16, 21), (12, 7, 8, 3, 2, 1), (12, 7, 8, 3, 4, 9), (12, 7, 8, 9, 4, 3), (12, 7, 8, 9, 14, 13), (12, 7, 8, 9, 14, 19), (12, 7, 8, 13, 14, 9), (12, 7, 8, 13, 14, 19), (12, 7, 8, 13, 18, 17), (12, 7, 8, 13, 18, 19), (12, 7, 8, 13, 18, 23), (12, 11, 6, 1, 0, 5), (12, 11, 6, 1, 2, 3), (12, 11, 6, 1, 2, 7), (12, 11, 6, 5, 0, 1), (12, 11, 6, 5, 10, 15), (12, 11, 6, 7, 2, 1), (12, 11, 6, 7, 2, 3), (12, 11, 6, 7, 8, 3), (12, 11, 6, 7, 8, 9), (12, 11, 6, 7, 8, 13), (12, 11, 10, 5, 0, 1), (12, 11, 10, 5, 6, 1), (12, 11, 10, 5, 6, 7), (12, 11, 10, 15, 16, 17), (12, 11, 10, 15, 16, 21), (12, 11, 10, 15, 20, 21), (12, 11, 16, 15, 10, 5), (12, 11, 16, 15, 20, 21), (12, 11, 16, 17, 18, 13), (12, 11, 16, 17, 18, 19), (12, 11, 16, 17, 18, 23), (12, 11, 16, 17, 22, 21), (12, 11, 16, 17, 22, 23), (12, 11, 16, 21, 20, 15), (12, 11, 16, 21, 22, 17), (12, 11, 16, 21, 22, 23), (12, 13, 8, 3, 2, 1), (12, 13, 8, 3, 2, 7), (12, 13, 8, 3, 4, 9), (12, 13, 8, 7, 2, 1), (12, 13, 8, 7, 2, 3), (12, 13, 8, 7, 6, 1), (12, 13, 8, 7, 6, 5), (12, 13, 8, 7, 6, 11), (12, 13, 8, 9, 4, 3), (12, 13, 8, 9, 14, 19), (12, 13, 14, 9, 4, 3), (12, 13, 14, 9, 8, 3), (12, 13, 14, 9, 8, 7), (12, 13, 14, 19, 18, 17), (12, 13, 14, 19, 18, 23), (12, 13, 14, 19, 24, 23), (12, 13, 18, 17, 16, 11), (12, 13, 18, 17, 16, 15), (12, 13, 18, 17, 16, 21), (12, 13, 18, 17, 22, 21), (12, 13, 18, 17, 22, 23), (12, 13, 18, 19, 14, 9), (12, 13, 18, 19, 24, 23), (12, 13, 18, 23, 22, 17), (12, 13, 18, 23, 22, 21), (12, 13, 18, 23, 24, 19), (12, 17, 16, 11, 6, 1), (12, 17, 16, 11, 6, 5), (12, 17, 16, 11, 6, 7), (12, 17, 16, 11, 10, 5), (12, 17, 16, 11, 10, 15), (12, 17, 16, 15, 10, 5), (12, 17, 16, 15, 10, 11), (12, 17, 16, 15, 20, 21), (12, 17, 16, 21, 20, 15), (12, 17, 16, 21, 22, 23), (12, 17, 18, 13, 8, 3), (12, 17, 18, 13, 8, 7), (12, 17, 18, 13, 8, 9), (12, 17, 18, 13, 14, 9), (12, 17, 18, 13, 14, 19), (12, 17, 18, 19, 14, 9), (12, 17, 18, 19, 14, 13), (12, 17, 18, 19, 24, 23), (12, 17, 18, 23, 22, 21), (12, 17, 18, 23, 24, 19), (12, 17, 22, 21, 16, 11), (12, 17, 22, 21, 16, 15), (12, 17, 22, 21, 20, 15), (12, 17, 22, 23, 18, 13), (12, 17, 22, 23, 18, 19), (12, 17, 22, 23, 24, 19), (13, 8, 3, 2, 1, 0), (13, 8, 3, 2, 1, 6), (13, 8, 3, 2, 7, 6), (13, 8, 3, 2, 7, 12), (13, 8, 3, 4, 9, 14), (13, 8, 7, 2, 1, 0), (13, 8, 7, 2, 1, 6), (13, 8, 7, 2, 3, 4), (13, 8, 7, 6, 1, 0), (13, 8, 7, 6, 1, 2), (13, 8, 7, 6, 5, 0), (13, 8, 7, 6, 5, 10), (13, 8, 7, 6, 11, 10), (13, 8, 7, 6, 11, 12), (13, 8, 7, 6, 11, 16), (13, 8, 7, 12, 11, 6), (13, 8, 7, 12, 11, 10), (13, 8, 7, 12, 11, 16), (13, 8, 7, 12, 17, 16), (13, 8, 7, 12, 17, 18), (13, 8, 7, 12, 17, 22), (13, 8, 9, 4, 3, 2), (13, 8, 9, 14, 19, 18), (13, 8, 9, 14, 19, 24), (13, 12, 7, 2, 1, 0), (13, 12, 7, 2, 1, 6), (13, 12, 7, 2, 3, 4), (13, 12, 7, 2, 3, 8), (13, 12, 7, 6, 1, 0), (13, 12, 7, 6, 1, 2), (13, 12, 7, 6, 5, 0), (13, 12, 7, 6, 5, 10), (13, 12, 7, 6, 11, 10), (13, 12, 7, 6, 11, 16), (13, 12, 7, 8, 3, 2), (13, 12, 7, 8, 3, 4), (13, 12, 7, 8, 9, 4), (13, 12, 7, 8, 9, 14), (13, 12, 11, 6, 1, 0), (13, 12, 11, 6, 1, 2), (13, 12, 11, 6, 5, 0), (13, 12, 11, 6, 5, 10), (13, 12, 11, 6, 7, 2), (13, 12, 11, 6, 7, 8), (13, 12, 11, 10, 5, 0), (13, 12, 11, 10, 5, 6), (13, 12, 11, 10, 15, 16), (13, 12, 11, 10, 15, 20), (13, 12, 11, 16, 15, 10), (13, 12, 11, 16, 15, 20), (13, 12, 11, 16, 17, 18), (13, 12, 11, 16, 17, 22), (13, 12, 11, 16, 21, 20), (13, 12, 11, 16, 21, 22), (13, 12, 17, 16, 11, 6), (13, 12, 17, 16, 11, 10), (13, 12, 17, 16, 15, 10), (13, 12, 17, 16, 15, 20), (13, 12, 17, 16, 21, 20), (13, 12, 17, 16, 21, 22), (13, 12, 17, 18, 19, 14), (13, 12, 17, 18, 19, 24), (13, 12, 17, 18, 23, 22), (13, 12, 17, 18, 23, 24), (13, 12, 17, 22, 21, 16), (13, 12, 17, 22, 21, 20), (13, 12, 17, 22, 23, 18), (13, 12, 17, 22, 23, 24), (13, 14, 9, 4, 3, 2), (13, 14, 9, 4, 3, 8), (13, 14, 9, 8, 3, 2), (13, 14, 9, 8, 3, 4), (13, 14, 9, 8, 7, 2), (13, 14, 9, 8, 7, 6), (13, 14, 9, 8, 7, 12), (13, 14, 19, 18, 17, 12), (13, 14, 19, 18, 17, 16), (13, 14, 19, 18, 17, 22), (13, 14, 19, 18, 23, 22), (13, 14, 19, 18, 23, 24), (13, 14, 19, 24, 23, 18), (13, 14, 19, 24, 23, 22), (13, 18, 17, 12, 7, 2), (13, 18, 17, 12, 7, 6), (13, 18, 17, 12, 7, 8), (13, 18, 17, 12, 11, 6), (13, 18, 17, 12, 11, 10), (13, 18, 17, 12, 11, 16), (13, 18, 17, 16, 11, 6), (13, 18, 17, 16, 11, 10), (13, 18, 17, 16, 11, 12), (13, 18, 17, 16, 15, 10), (13, 18, 17, 16, 15, 20), (13, 18, 17, 16, 21, 20), (13, 18, 17, 16, 21, 22), (13, 18, 17, 22, 21, 16), (13, 18, 17, 22, 21, 20), (13, 18, 17, 22, 23, 24), (13, 18, 19, 14, 9, 4), (13, 18, 19, 14, 9, 8), (13, 18, 19, 24, 23, 22), (13, 18, 23, 22, 17, 12), (13, 18, 23, 22, 17, 16), (13, 18, 23, 22, 21, 16), (13, 18, 23, 22, 21, 20), (13, 18, 23, 24, 19, 14), (14, 9, 4, 3, 2, 1), (14, 9, 4, 3, 2, 7), (14, 9, 4, 3, 8, 7), (14, 9, 4, 3, 8, 13), (14, 9, 8, 3, 2, 1), (14, 9, 8, 3, 2, 7), (14, 9, 8, 7, 2, 1), (14, 9, 8, 7, 2, 3), (14, 9, 8, 7, 6, 1), (14, 9, 8, 7, 6, 5), (14, 9, 8, 7, 6, 11), (14, 9, 8, 7, 12, 11), (14, 9, 8, 7, 12, 13), (14, 9, 8, 7, 12, 17), (14, 9, 8, 13, 12, 7), (14, 9, 8, 13, 12, 11), (14, 9, 8, 13, 12, 17), (14, 9, 8, 13, 18, 17), (14, 9, 8, 13, 18, 19), (14, 9, 8, 13, 18, 23), (14, 13, 8, 3, 2, 1), (14, 13, 8, 3, 2, 7), (14, 13, 8, 3, 4, 9), (14, 13, 8, 7, 2, 1), (14, 13, 8, 7, 2, 3), (14, 13, 8, 7, 6, 1), (14, 13, 8, 7, 6, 5), (14, 13, 8, 7, 6, 11), (14, 13, 8, 7, 12, 11), (14, 13, 8, 7, 12, 17), (14, 13, 8, 9, 4, 3), (14, 13, 12, 7, 2, 1), (14, 13, 12, 7, 2, 3), (14, 13, 12, 7, 6, 1), (14, 13, 12, 7, 6, 5), (14, 13, 12, 7, 6, 11), (14, 13, 12, 7, 8, 3), (14, 13, 12, 7, 8, 9), (14, 13, 12, 11, 6, 1), (14, 13, 12, 11, 6, 5), (14, 13, 12, 11, 6, 7), (14, 13, 12, 11, 10, 5), (14, 13, 12, 11, 10, 15), (14, 13, 12, 11, 16, 15), (14, 13, 12, 11, 16, 17), (14, 13, 12, 11, 16, 21), (14, 13, 12, 17, 16, 11), (14, 13, 12, 17, 16, 15), (14, 13, 12, 17, 16, 21), (14, 13, 12, 17, 18, 19), (14, 13, 12, 17, 18, 23), (14, 13, 12, 17, 22, 21), (14, 13, 12, 17, 22, 23), (14, 13, 18, 17, 12, 7), (14, 13, 18, 17, 12, 11), (14, 13, 18, 17, 16, 11), (14, 13, 18, 17, 16, 15), (14, 13, 18, 17, 16, 21), (14, 13, 18, 17, 22, 21), (14, 13, 18, 17, 22, 23), (14, 13, 18, 19, 24, 23), (14, 13, 18, 23, 22, 17), (14, 13, 18, 23, 22, 21), (14, 13, 18, 23, 24, 19), (14, 19, 18, 13, 8, 3), (14, 19, 18, 13, 8, 7), (14, 19, 18, 13, 8, 9), (14, 19, 18, 13, 12, 7), (14, 19, 18, 13, 12, 11), (14, 19, 18, 13, 12, 17), (14, 19, 18, 17, 12, 7), (14, 19, 18, 17, 12, 11), (14, 19, 18, 17, 12, 13), (14, 19, 18, 17, 16, 11), (14, 19, 18, 17, 16, 15), (14, 19, 18, 17, 16, 21), (14, 19, 18, 17, 22, 21), (14, 19, 18, 17, 22, 23), (14, 19, 18, 23, 22, 17), (14, 19, 18, 23, 22, 21), (14, 19, 24, 23, 18, 13), (14, 19, 24, 23, 18, 17), (14, 19, 24, 23, 22, 17), (14, 19, 24, 23, 22, 21), (15, 10, 5, 0, 1, 2), (15, 10, 5, 0, 1, 6), (15, 10, 5, 6, 1, 0), (15, 10, 5, 6, 1, 2), (15, 10, 5, 6, 7, 2), (15, 10, 5, 6, 7, 8), (15, 10, 5, 6, 7, 12), (15, 10, 5, 6, 11, 12), (15, 10, 5, 6, 11, 16), (15, 10, 11, 6, 1, 0), (15, 10, 11, 6, 1, 2), (15, 10, 11, 6, 5, 0), (15, 10, 11, 6, 7, 2), (15, 10, 11, 6, 7, 8), (15, 10, 11, 6, 7, 12), (15, 10, 11, 12, 7, 2), (15, 10, 11, 12, 7, 6), (15, 10, 11, 12, 7, 8), (15, 10, 11, 12, 13, 8), (15, 10, 11, 12, 13, 14), (15, 10, 11, 12, 13, 18), (15, 10, 11, 12, 17, 16), (15, 10, 11, 12, 17, 18), (15, 10, 11, 12, 17, 22), (15, 10, 11, 16, 17, 12), (15, 10, 11, 16, 17, 18), (15, 10, 11, 16, 17, 22), (15, 10, 11, 16, 21, 20), (15, 10, 11, 16, 21, 22), (15, 16, 11, 6, 1, 0), (15, 16, 11, 6, 1, 2), (15, 16, 11, 6, 5, 0), (15, 16, 11, 6, 5, 10), (15, 16, 11, 6, 7, 2), (15, 16, 11, 6, 7, 8), (15, 16, 11, 6, 7, 12), (15, 16, 11, 10, 5, 0), (15, 16, 11, 10, 5, 6), (15, 16, 11, 12, 7, 2), (15, 16, 11, 12, 7, 6), (15, 16, 11, 12, 7, 8), (15, 16, 11, 12, 13, 8), (15, 16, 11, 12, 13, 14), (15, 16, 11, 12, 13, 18), (15, 16, 11, 12, 17, 18), (15, 16, 11, 12, 17, 22), (15, 16, 17, 12, 7, 2), (15, 16, 17, 12, 7, 6), (15, 16, 17, 12, 7, 8), (15, 16, 17, 12, 11, 6), (15, 16, 17, 12, 11, 10), (15, 16, 17, 12, 13, 8), (15, 16, 17, 12, 13, 14), (15, 16, 17, 12, 13, 18), (15, 16, 17, 18, 13, 8), (15, 16, 17, 18, 13, 12), (15, 16, 17, 18, 13, 14), (15, 16, 17, 18, 19, 14), (15, 16, 17, 18, 19, 24), (15, 16, 17, 18, 23, 22), (15, 16, 17, 18, 23, 24), (15, 16, 17, 22, 21, 20), (15, 16, 17, 22, 23, 18), (15, 16, 17, 22, 23, 24), (15, 16, 21, 22, 17, 12), (15, 16, 21, 22, 17, 18), (15, 16, 21, 22, 23, 18), (15, 16, 21, 22, 23, 24), (15, 20, 21, 16, 11, 6), (15, 20, 21, 16, 11, 10), (15, 20, 21, 16, 11, 12), (15, 20, 21, 16, 17, 12), (15, 20, 21, 16, 17, 18), (15, 20, 21, 16, 17, 22), (15, 20, 21, 22, 17, 12), (15, 20, 21, 22, 17, 16), (15, 20, 21, 22, 17, 18), (15, 20, 21, 22, 23, 18), (15, 20, 21, 22, 23, 24), (16, 11, 6, 1, 0, 5), (16, 11, 6, 1, 2, 3), (16, 11, 6, 1, 2, 7), (16, 11, 6, 5, 0, 1), (16, 11, 6, 5, 10, 15), (16, 11, 6, 7, 2, 1), (16, 11, 6, 7, 2, 3), (16, 11, 6, 7, 8, 3), (16, 11, 6, 7, 8, 9), (16, 11, 6, 7, 8, 13), (16, 11, 6, 7, 12, 13), (16, 11, 6, 7, 12, 17), (16, 11, 10, 5, 0, 1), (16, 11, 10, 5, 6, 1), (16, 11, 10, 5, 6, 7), (16, 11, 10, 15, 20, 21), (16, 11, 12, 7, 2, 1), (16, 11, 12, 7, 2, 3), (16, 11, 12, 7, 6, 1), (16, 11, 12, 7, 6, 5), (16, 11, 12, 7, 8, 3), (16, 11, 12, 7, 8, 9), (16, 11, 12, 7, 8, 13), (16, 11, 12, 13, 8, 3), (16, 11, 12, 13, 8, 7), (16, 11, 12, 13, 8, 9), (16, 11, 12, 13, 14, 9), (16, 11, 12, 13, 14, 19), (16, 11, 12, 13, 18, 17), (16, 11, 12, 13, 18, 19), (16, 11, 12, 13, 18, 23), (16, 11, 12, 17, 18, 13), (16, 11, 12, 17, 18, 19), (16, 11, 12, 17, 18, 23), (16, 11, 12, 17, 22, 21), (16, 11, 12, 17, 22, 23), (16, 15, 10, 5, 0, 1), (16, 15, 10, 5, 6, 1), (16, 15, 10, 5, 6, 7), (16, 15, 10, 5, 6, 11), (16, 15, 10, 11, 6, 1), (16, 15, 10, 11, 6, 5), (16, 15, 10, 11, 6, 7), (16, 15, 10, 11, 12, 7), (16, 15, 10, 11, 12, 13), (16, 15, 10, 11, 12, 17), (16, 15, 20, 21, 22, 17), (16, 15, 20, 21, 22, 23), (16, 17, 12, 7, 2, 1), (16, 17, 12, 7, 2, 3), (16, 17, 12, 7, 6, 1), (16, 17, 12, 7, 6, 5), (16, 17, 12, 7, 6, 11), (16, 17, 12, 7, 8, 3), (16, 17, 12, 7, 8, 9), (16, 17, 12, 7, 8, 13), (16, 17, 12, 11, 6, 1), (16, 17, 12, 11, 6, 5), (16, 17, 12, 11, 6, 7), (16, 17, 12, 11, 10, 5), (16, 17, 12, 11, 10, 15), (16, 17, 12, 13, 8, 3), (16, 17, 12, 13, 8, 7), (16, 17, 12, 13, 8, 9), (16, 17, 12, 13, 14, 9), (16, 17, 12, 13, 14, 19), (16, 17, 12, 13, 18, 19), (16, 17, 12, 13, 18, 23), (16, 17, 18, 13, 8, 3), (16, 17, 18, 13, 8, 7), (16, 17, 18, 13, 8, 9), (16, 17, 18, 13, 12, 7), (16, 17, 18, 13, 12, 11), (16, 17, 18, 13, 14, 9), (16, 17, 18, 13, 14, 19), (16, 17, 18, 19, 14, 9), (16, 17, 18, 19, 14, 13), (16, 17, 18, 19, 24, 23), (16, 17, 18, 23, 22, 21), (16, 17, 18, 23, 24, 19), (16, 17, 22, 21, 20, 15), (16, 17, 22, 23, 18, 13), (16, 17, 22, 23, 18, 19), (16, 17, 22, 23, 24, 19), (16, 21, 20, 15, 10, 5), (16, 21, 20, 15, 10, 11), (16, 21, 22, 17, 12, 7), (16, 21, 22, 17, 12, 11), (16, 21, 22, 17, 12, 13), (16, 21, 22, 17, 18, 13), (16, 21, 22, 17, 18, 19), (16, 21, 22, 17, 18, 23), (16, 21, 22, 23, 18, 13), (16, 21, 22, 23, 18, 17), (16, 21, 22, 23, 18, 19), (16, 21, 22, 23, 24, 19), (17, 12, 7, 2, 1, 0), (17, 12, 7, 2, 1, 6), (17, 12, 7, 2, 3, 4), (17, 12, 7, 2, 3, 8), (17, 12, 7, 6, 1, 0), (17, 12, 7, 6, 1, 2), (17, 12, 7, 6, 5, 0), (17, 12, 7, 6, 5, 10), (17, 12, 7, 6, 11, 10), (17, 12, 7, 6, 11, 16), (17, 12, 7, 8, 3, 2), (17, 12, 7, 8, 3, 4), (17, 12, 7, 8, 9, 4), (17, 12, 7, 8, 9, 14), (17, 12, 7, 8, 13, 14), (17, 12, 7, 8, 13, 18), (17, 12, 11, 6, 1, 0), (17, 12, 11, 6, 1, 2), (17, 12, 11, 6, 5, 0), (17, 12, 11, 6, 5, 10), (17, 12, 11, 6, 7, 2), (17, 12, 11, 6, 7, 8), (17, 12, 11, 10, 5, 0), (17, 12, 11, 10, 5, 6), (17, 12, 11, 10, 15, 16), (17, 12, 11, 10, 15, 20), (17, 12, 11, 16, 15, 10), (17, 12, 11, 16, 15, 20), (17, 12, 11, 16, 21, 20), (17, 12, 11, 16, 21, 22), (17, 12, 13, 8, 3, 2), (17, 12, 13, 8, 3, 4), (17, 12, 13, 8, 7, 2), (17, 12, 13, 8, 7, 6), (17, 12, 13, 8, 9, 4), (17, 12, 13, 8, 9, 14), (17, 12, 13, 14, 9, 4), (17, 12, 13, 14, 9, 8), (17, 12, 13, 14, 19, 18), (17, 12, 13, 14, 19, 24), (17, 12, 13, 18, 19, 14), (17, 12, 13, 18, 19, 24), (17, 12, 13, 18, 23, 22), (17, 12, 13, 18, 23, 24), (17, 16, 11, 6, 1, 0), (17, 16, 11, 6, 1, 2), (17, 16, 11, 6, 5, 0), (17, 16, 11, 6, 5, 10), (17, 16, 11, 6, 7, 2), (17, 16, 11, 6, 7, 8), (17, 16, 11, 6, 7, 12), (17, 16, 11, 10, 5, 0), (17, 16, 11, 10, 5, 6), (17, 16, 11, 10, 15, 20), (17, 16, 11, 12, 7, 2), (17, 16, 11, 12, 7, 6), (17, 16, 11, 12, 7, 8), (17, 16, 11, 12, 13, 8), (17, 16, 11, 12, 13, 14), (17, 16, 11, 12, 13, 18), (17, 16, 15, 10, 5, 0), (17, 16, 15, 10, 5, 6), (17, 16, 15, 10, 11, 6), (17, 16, 15, 10, 11, 12), (17, 16, 15, 20, 21, 22), (17, 16, 21, 20, 15, 10), (17, 16, 21, 22, 23, 18), (17, 16, 21, 22, 23, 24), (17, 18, 13, 8, 3, 2), (17, 18, 13, 8, 3, 4), (17, 18, 13, 8, 7, 2), (17, 18, 13, 8, 7, 6), (17, 18, 13, 8, 7, 12), (17, 18, 13, 8, 9, 4), (17, 18, 13, 8, 9, 14), (17, 18, 13, 12, 7, 2), (17, 18, 13, 12, 7, 6), (17, 18, 13, 12, 7, 8), (17, 18, 13, 12, 11, 6), (17, 18, 13, 12, 11, 10), (17, 18, 13, 12, 11, 16), (17, 18, 13, 14, 9, 4), (17, 18, 13, 14, 9, 8), (17, 18, 13, 14, 19, 24), (17, 18, 19, 14, 9, 4), (17, 18, 19, 14, 9, 8), (17, 18, 19, 14, 13, 8), (17, 18, 19, 14, 13, 12), (17, 18, 19, 24, 23, 22), (17, 18, 23, 22, 21, 16), (17, 18, 23, 22, 21, 20), (17, 18, 23, 24, 19, 14), (17, 22, 21, 16, 11, 6), (17, 22, 21, 16, 11, 10), (17, 22, 21, 16, 11, 12), (17, 22, 21, 16, 15, 10), (17, 22, 21, 16, 15, 20), (17, 22, 21, 20, 15, 10), (17, 22, 21, 20, 15, 16), (17, 22, 23, 18, 13, 8), (17, 22, 23, 18, 13, 12), (17, 22, 23, 18, 13, 14), (17, 22, 23, 18, 19, 14), (17, 22, 23, 18, 19, 24), (17, 22, 23, 24, 19, 14), (17, 22, 23, 24, 19, 18), (18, 13, 8, 3, 2, 1), (18, 13, 8, 3, 2, 7), (18, 13, 8, 3, 4, 9), (18, 13, 8, 7, 2, 1), (18, 13, 8, 7, 2, 3), (18, 13, 8, 7, 6, 1), (18, 13, 8, 7, 6, 5), (18, 13, 8, 7, 6, 11), (18, 13, 8, 7, 12, 11), (18, 13, 8, 7, 12, 17), (18, 13, 8, 9, 4, 3), (18, 13, 8, 9, 14, 19), (18, 13, 12, 7, 2, 1), (18, 13, 12, 7, 2, 3), (18, 13, 12, 7, 6, 1), (18, 13, 12, 7, 6, 5), (18, 13, 12, 7, 6, 11), (18, 13, 12, 7, 8, 3), (18, 13, 12, 7, 8, 9), (18, 13, 12, 11, 6, 1), (18, 13, 12, 11, 6, 5), (18, 13, 12, 11, 6, 7), (18, 13, 12, 11, 10, 5), (18, 13, 12, 11, 10, 15), (18, 13, 12, 11, 16, 15), (18, 13, 12, 11, 16, 17), (18, 13, 12, 11, 16, 21), (18, 13, 12, 17, 16, 11), (18, 13, 12, 17, 16, 15), (18, 13, 12, 17, 16, 21), (18, 13, 12, 17, 22, 21), (18, 13, 12, 17, 22, 23), (18, 13, 14, 9, 4, 3), (18, 13, 14, 9, 8, 3), (18, 13, 14, 9, 8, 7), (18, 13, 14, 19, 24, 23), (18, 17, 12, 7, 2, 1), (18, 17, 12, 7, 2, 3), (18, 17, 12, 7, 6, 1), (18, 17, 12, 7, 6, 5), (18, 17, 12, 7, 6, 11), (18, 17, 12, 7, 8, 3), (18, 17, 12, 7, 8, 9), (18, 17, 12, 7, 8, 13), (18, 17, 12, 11, 6, 1), (18, 17, 12, 11, 6, 5), (18, 17, 12, 11, 6, 7), (18, 17, 12, 11, 10, 5), (18, 17, 12, 11, 10, 15), (18, 17, 12, 11, 16, 15), (18, 17, 12, 11, 16, 21), (18, 17, 12, 13, 8, 3), (18, 17, 12, 13, 8, 7), (18, 17, 12, 13, 8, 9), (18, 17, 12, 13, 14, 9), (18, 17, 12, 13, 14, 19), (18, 17, 16, 11, 6, 1), (18, 17, 16, 11, 6, 5), (18, 17, 16, 11, 6, 7), (18, 17, 16, 11, 10, 5), (18, 17, 16, 11, 10, 15), (18, 17, 16, 11, 12, 7), (18, 17, 16, 11, 12, 13), (18, 17, 16, 15, 10, 5), (18, 17, 16, 15, 10, 11), (18, 17, 16, 15, 20, 21), (18, 17, 16, 21, 20, 15), (18, 17, 16, 21, 22, 23), (18, 17, 22, 21, 16, 11), (18, 17, 22, 21, 16, 15), (18, 17, 22, 21, 20, 15), (18, 17, 22, 23, 24, 19), (18, 19, 14, 9, 4, 3), (18, 19, 14, 9, 8, 3), (18, 19, 14, 9, 8, 7), (18, 19, 14, 9, 8, 13), (18, 19, 14, 13, 8, 3), (18, 19, 14, 13, 8, 7), (18, 19, 14, 13, 8, 9), (18, 19, 14, 13, 12, 7), (18, 19, 14, 13, 12, 11), (18, 19, 14, 13, 12, 17), (18, 19, 24, 23, 22, 17), (18, 19, 24, 23, 22, 21), (18, 23, 22, 17, 12, 7), (18, 23, 22, 17, 12, 11), (18, 23, 22, 17, 12, 13), (18, 23, 22, 17, 16, 11), (18, 23, 22, 17, 16, 15), (18, 23, 22, 17, 16, 21), (18, 23, 22, 21, 16, 11), (18, 23, 22, 21, 16, 15), (18, 23, 22, 21, 16, 17), (18, 23, 22, 21, 20, 15), (18, 23, 24, 19, 14, 9), (18, 23, 24, 19, 14, 13), (19, 14, 9, 4, 3, 2), (19, 14, 9, 4, 3, 8), (19, 14, 9, 8, 3, 2), (19, 14, 9, 8, 3, 4), (19, 14, 9, 8, 7, 2), (19, 14, 9, 8, 7, 6), (19, 14, 9, 8, 7, 12), (19, 14, 9, 8, 13, 12), (19, 14, 9, 8, 13, 18), (19, 14, 13, 8, 3, 2), (19, 14, 13, 8, 3, 4), (19, 14, 13, 8, 7, 2), (19, 14, 13, 8, 7, 6), (19, 14, 13, 8, 7, 12), (19, 14, 13, 8, 9, 4), (19, 14, 13, 12, 7, 2), (19, 14, 13, 12, 7, 6), (19, 14, 13, 12, 7, 8), (19, 14, 13, 12, 11, 6), (19, 14, 13, 12, 11, 10), (19, 14, 13, 12, 11, 16), (19, 14, 13, 12, 17, 16), (19, 14, 13, 12, 17, 18), (19, 14, 13, 12, 17, 22), (19, 14, 13, 18, 17, 12), (19, 14, 13, 18, 17, 16), (19, 14, 13, 18, 17, 22), (19, 14, 13, 18, 23, 22), (19, 14, 13, 18, 23, 24), (19, 18, 13, 8, 3, 2), (19, 18, 13, 8, 3, 4), (19, 18, 13, 8, 7, 2), (19, 18, 13, 8, 7, 6), (19, 18, 13, 8, 7, 12), (19, 18, 13, 8, 9, 4), (19, 18, 13, 8, 9, 14), (19, 18, 13, 12, 7, 2), (19, 18, 13, 12, 7, 6), (19, 18, 13, 12, 7, 8), (19, 18, 13, 12, 11, 6), (19, 18, 13, 12, 11, 10), (19, 18, 13, 12, 11, 16), (19, 18, 13, 12, 17, 16), (19, 18, 13, 12, 17, 22), (19, 18, 13, 14, 9, 4), (19, 18, 13, 14, 9, 8), (19, 18, 17, 12, 7, 2), (19, 18, 17, 12, 7, 6), (19, 18, 17, 12, 7, 8), (19, 18, 17, 12, 11, 6), (19, 18, 17, 12, 11, 10), (19, 18, 17, 12, 11, 16), (19, 18, 17, 12, 13, 8), (19, 18, 17, 12, 13, 14), (19, 18, 17, 16, 11, 6), (19, 18, 17, 16, 11, 10), (19, 18, 17, 16, 11, 12), (19, 18, 17, 16, 15, 10), (19, 18, 17, 16, 15, 20), (19, 18, 17, 16, 21, 20), (19, 18, 17, 16, 21, 22), (19, 18, 17, 22, 21, 16), (19, 18, 17, 22, 21, 20), (19, 18, 17, 22, 23, 24), (19, 18, 23, 22, 17, 12), (19, 18, 23, 22, 17, 16), (19, 18, 23, 22, 21, 16), (19, 18, 23, 22, 21, 20), (19, 24, 23, 18, 13, 8), (19, 24, 23, 18, 13, 12), (19, 24, 23, 18, 13, 14), (19, 24, 23, 18, 17, 12), (19, 24, 23, 18, 17, 16), (19, 24, 23, 18, 17, 22), (19, 24, 23, 22, 17, 12), (19, 24, 23, 22, 17, 16), (19, 24, 23, 22, 17, 18), (19, 24, 23, 22, 21, 16), (19, 24, 23, 22, 21, 20), (20, 15, 10, 5, 0, 1), (20, 15, 10, 5, 6, 1), (20, 15, 10, 5, 6, 7), (20, 15, 10, 5, 6, 11), (20, 15, 10, 11, 6, 1), (20, 15, 10, 11, 6, 5), (20, 15, 10, 11, 6, 7), (20, 15, 10, 11, 12, 7), (20, 15, 10, 11, 12, 13), (20, 15, 10, 11, 12, 17), (20, 15, 10, 11, 16, 17), (20, 15, 10, 11, 16, 21), (20, 15, 16, 11, 6, 1), (20, 15, 16, 11, 6, 5), (20, 15, 16, 11, 6, 7), (20, 15, 16, 11, 10, 5), (20, 15, 16, 11, 12, 7), (20, 15, 16, 11, 12, 13), (20, 15, 16, 11, 12, 17), (20, 15, 16, 17, 12, 7), (20, 15, 16, 17, 12, 11), (20, 15, 16, 17, 12, 13), (20, 15, 16, 17, 18, 13), (20, 15, 16, 17, 18, 19), (20, 15, 16, 17, 18, 23), (20, 15, 16, 17, 22, 21), (20, 15, 16, 17, 22, 23), (20, 15, 16, 21, 22, 17), (20, 15, 16, 21, 22, 23), (20, 21, 16, 11, 6, 1), (20, 21, 16, 11, 6, 5), (20, 21, 16, 11, 6, 7), (20, 21, 16, 11, 10, 5), (20, 21, 16, 11, 10, 15), (20, 21, 16, 11, 12, 7), (20, 21, 16, 11, 12, 13), (20, 21, 16, 11, 12, 17), (20, 21, 16, 15, 10, 5), (20, 21, 16, 15, 10, 11), (20, 21, 16, 17, 12, 7), (20, 21, 16, 17, 12, 11), (20, 21, 16, 17, 12, 13), (20, 21, 16, 17, 18, 13), (20, 21, 16, 17, 18, 19), (20, 21, 16, 17, 18, 23), (20, 21, 16, 17, 22, 23), (20, 21, 22, 17, 12, 7), (20, 21, 22, 17, 12, 11), (20, 21, 22, 17, 12, 13), (20, 21, 22, 17, 16, 11), (20, 21, 22, 17, 16, 15), (20, 21, 22, 17, 18, 13), (20, 21, 22, 17, 18, 19), (20, 21, 22, 17, 18, 23), (20, 21, 22, 23, 18, 13), (20, 21, 22, 23, 18, 17), (20, 21, 22, 23, 18, 19), (20, 21, 22, 23, 24, 19), (21, 16, 11, 6, 1, 0), (21, 16, 11, 6, 1, 2), (21, 16, 11, 6, 5, 0), (21, 16, 11, 6, 5, 10), (21, 16, 11, 6, 7, 2), (21, 16, 11, 6, 7, 8), (21, 16, 11, 6, 7, 12), (21, 16, 11, 10, 5, 0), (21, 16, 11, 10, 5, 6), (21, 16, 11, 10, 15, 20), (21, 16, 11, 12, 7, 2), (21, 16, 11, 12, 7, 6), (21, 16, 11, 12, 7, 8), (21, 16, 11, 12, 13, 8), (21, 16, 11, 12, 13, 14), (21, 16, 11, 12, 13, 18), (21, 16, 11, 12, 17, 18), (21, 16, 11, 12, 17, 22), (21, 16, 15, 10, 5, 0), (21, 16, 15, 10, 5, 6), (21, 16, 15, 10, 11, 6), (21, 16, 15, 10, 11, 12), (21, 16, 17, 12, 7, 2), (21, 16, 17, 12, 7, 6), (21, 16, 17, 12, 7, 8), (21, 16, 17, 12, 11, 6), (21, 16, 17, 12, 11, 10), (21, 16, 17, 12, 13, 8), (21, 16, 17, 12, 13, 14), (21, 16, 17, 12, 13, 18), (21, 16, 17, 18, 13, 8), (21, 16, 17, 18, 13, 12), (21, 16, 17, 18, 13, 14), (21, 16, 17, 18, 19, 14), (21, 16, 17, 18, 19, 24), (21, 16, 17, 18, 23, 22), (21, 16, 17, 18, 23, 24), (21, 16, 17, 22, 23, 18), (21, 16, 17, 22, 23, 24), (21, 20, 15, 10, 5, 0), (21, 20, 15, 10, 5, 6), (21, 20, 15, 10, 11, 6), (21, 20, 15, 10, 11, 12), (21, 20, 15, 10, 11, 16), (21, 20, 15, 16, 11, 6), (21, 20, 15, 16, 11, 10), (21, 20, 15, 16, 11, 12), (21, 20, 15, 16, 17, 12), (21, 20, 15, 16, 17, 18), (21, 20, 15, 16, 17, 22), (21, 22, 17, 12, 7, 2), (21, 22, 17, 12, 7, 6), (21, 22, 17, 12, 7, 8), (21, 22, 17, 12, 11, 6), (21, 22, 17, 12, 11, 10), (21, 22, 17, 12, 11, 16), (21, 22, 17, 12, 13, 8), (21, 22, 17, 12, 13, 14), (21, 22, 17, 12, 13, 18), (21, 22, 17, 16, 11, 6), (21, 22, 17, 16, 11, 10), (21, 22, 17, 16, 11, 12), (21, 22, 17, 16, 15, 10), (21, 22, 17, 16, 15, 20), (21, 22, 17, 18, 13, 8), (21, 22, 17, 18, 13, 12), (21, 22, 17, 18, 13, 14), (21, 22, 17, 18, 19, 14), (21, 22, 17, 18, 19, 24), (21, 22, 17, 18, 23, 24), (21, 22, 23, 18, 13, 8), (21, 22, 23, 18, 13, 12), (21, 22, 23, 18, 13, 14), (21, 22, 23, 18, 17, 12), (21, 22, 23, 18, 17, 16), (21, 22, 23, 18, 19, 14), (21, 22, 23, 18, 19, 24), (21, 22, 23, 24, 19, 14), (21, 22, 23, 24, 19, 18), (22, 17, 12, 7, 2, 1), (22, 17, 12, 7, 2, 3), (22, 17, 12, 7, 6, 1), (22, 17, 12, 7, 6, 5), (22, 17, 12, 7, 6, 11), (22, 17, 12, 7, 8, 3), (22, 17, 12, 7, 8, 9), (22, 17, 12, 7, 8, 13), (22, 17, 12, 11, 6, 1), (22, 17, 12, 11, 6, 5), (22, 17, 12, 11, 6, 7), (22, 17, 12, 11, 10, 5), (22, 17, 12, 11, 10, 15), (22, 17, 12, 11, 16, 15), (22, 17, 12, 11, 16, 21), (22, 17, 12, 13, 8, 3), (22, 17, 12, 13, 8, 7), (22, 17, 12, 13, 8, 9), (22, 17, 12, 13, 14, 9), (22, 17, 12, 13, 14, 19), (22, 17, 12, 13, 18, 19), (22, 17, 12, 13, 18, 23), (22, 17, 16, 11, 6, 1), (22, 17, 16, 11, 6, 5), (22, 17, 16, 11, 6, 7), (22, 17, 16, 11, 10, 5), (22, 17, 16, 11, 10, 15), (22, 17, 16, 11, 12, 7), (22, 17, 16, 11, 12, 13), (22, 17, 16, 15, 10, 5), (22, 17, 16, 15, 10, 11), (22, 17, 16, 15, 20, 21), (22, 17, 16, 21, 20, 15), (22, 17, 18, 13, 8, 3), (22, 17, 18, 13, 8, 7), (22, 17, 18, 13, 8, 9), (22, 17, 18, 13, 12, 7), (22, 17, 18, 13, 12, 11), (22, 17, 18, 13, 14, 9), (22, 17, 18, 13, 14, 19), (22, 17, 18, 19, 14, 9), (22, 17, 18, 19, 14, 13), (22, 17, 18, 19, 24, 23), (22, 17, 18, 23, 24, 19), (22, 21, 16, 11, 6, 1), (22, 21, 16, 11, 6, 5), (22, 21, 16, 11, 6, 7), (22, 21, 16, 11, 10, 5), (22, 21, 16, 11, 10, 15), (22, 21, 16, 11, 12, 7), (22, 21, 16, 11, 12, 13), (22, 21, 16, 11, 12, 17), (22, 21, 16, 15, 10, 5), (22, 21, 16, 15, 10, 11), (22, 21, 16, 17, 12, 7), (22, 21, 16, 17, 12, 11), (22, 21, 16, 17, 12, 13), (22, 21, 16, 17, 18, 13), (22, 21, 16, 17, 18, 19), (22, 21, 16, 17, 18, 23), (22, 21, 20, 15, 10, 5), (22, 21, 20, 15, 10, 11), (22, 21, 20, 15, 16, 11), (22, 21, 20, 15, 16, 17), (22, 23, 18, 13, 8, 3), (22, 23, 18, 13, 8, 7), (22, 23, 18, 13, 8, 9), (22, 23, 18, 13, 12, 7), (22, 23, 18, 13, 12, 11), (22, 23, 18, 13, 12, 17), (22, 23, 18, 13, 14, 9), (22, 23, 18, 13, 14, 19), (22, 23, 18, 17, 12, 7), (22, 23, 18, 17, 12, 11), (22, 23, 18, 17, 12, 13), (22, 23, 18, 17, 16, 11), (22, 23, 18, 17, 16, 15), (22, 23, 18, 17, 16, 21), (22, 23, 18, 19, 14, 9), (22, 23, 18, 19, 14, 13), (22, 23, 24, 19, 14, 9), (22, 23, 24, 19, 14, 13), (22, 23, 24, 19, 18, 13), (22, 23, 24, 19, 18, 17), (23, 18, 13, 8, 3, 2), (23, 18, 13, 8, 3, 4), (23, 18, 13, 8, 7, 2), (23, 18, 13, 8, 7, 6), (23, 18, 13, 8, 7, 12), (23, 18, 13, 8, 9, 4), (23, 18, 13, 8, 9, 14), (23, 18, 13, 12, 7, 2), (23, 18, 13, 12, 7, 6), (23, 18, 13, 12, 7, 8), (23, 18, 13, 12, 11, 6), (23, 18, 13, 12, 11, 10), (23, 18, 13, 12, 11, 16), (23, 18, 13, 12, 17, 16), (23, 18, 13, 12, 17, 22), (23, 18, 13, 14, 9, 4), (23, 18, 13, 14, 9, 8), (23, 18, 13, 14, 19, 24), (23, 18, 17, 12, 7, 2), (23, 18, 17, 12, 7, 6), (23, 18, 17, 12, 7, 8), (23, 18, 17, 12, 11, 6), (23, 18, 17, 12, 11, 10), (23, 18, 17, 12, 11, 16), (23, 18, 17, 12, 13, 8), (23, 18, 17, 12, 13, 14), (23, 18, 17, 16, 11, 6), (23, 18, 17, 16, 11, 10), (23, 18, 17, 16, 11, 12), (23, 18, 17, 16, 15, 10), (23, 18, 17, 16, 15, 20), (23, 18, 17, 16, 21, 20), (23, 18, 17, 16, 21, 22), (23, 18, 17, 22, 21, 16), (23, 18, 17, 22, 21, 20), (23, 18, 19, 14, 9, 4), (23, 18, 19, 14, 9, 8), (23, 18, 19, 14, 13, 8), (23, 18, 19, 14, 13, 12), (23, 22, 17, 12, 7, 2), (23, 22, 17, 12, 7, 6), (23, 22, 17, 12, 7, 8), (23, 22, 17, 12, 11, 6), (23, 22, 17, 12, 11, 10), (23, 22, 17, 12, 11, 16), (23, 22, 17, 12, 13, 8), (23, 22, 17, 12, 13, 14), (23, 22, 17, 12, 13, 18), (23, 22, 17, 16, 11, 6), (23, 22, 17, 16, 11, 10), (23, 22, 17, 16, 11, 12), (23, 22, 17, 16, 15, 10), (23, 22, 17, 16, 15, 20), (23, 22, 17, 16, 21, 20), (23, 22, 17, 18, 13, 8), (23, 22, 17, 18, 13, 12), (23, 22, 17, 18, 13, 14), (23, 22, 17, 18, 19, 14), (23, 22, 17, 18, 19, 24), (23, 22, 21, 16, 11, 6), (23, 22, 21, 16, 11, 10), (23, 22, 21, 16, 11, 12), (23, 22, 21, 16, 15, 10), (23, 22, 21, 16, 15, 20), (23, 22, 21, 16, 17, 12), (23, 22, 21, 16, 17, 18), (23, 22, 21, 20, 15, 10), (23, 22, 21, 20, 15, 16), (23, 24, 19, 14, 9, 4), (23, 24, 19, 14, 9, 8), (23, 24, 19, 14, 13, 8), (23, 24, 19, 14, 13, 12), (23, 24, 19, 14, 13, 18), (23, 24, 19, 18, 13, 8), (23, 24, 19, 18, 13, 12), (23, 24, 19, 18, 13, 14), (23, 24, 19, 18, 17, 12), (23, 24, 19, 18, 17, 16), (23, 24, 19, 18, 17, 22), (24, 19, 14, 9, 4, 3), (24, 19, 14, 9, 8, 3), (24, 19, 14, 9, 8, 7), (24, 19, 14, 9, 8, 13), (24, 19, 14, 13, 8, 3), (24, 19, 14, 13, 8, 7), (24, 19, 14, 13, 8, 9), (24, 19, 14, 13, 12, 7), (24, 19, 14, 13, 12, 11), (24, 19, 14, 13, 12, 17), (24, 19, 14, 13, 18, 17), (24, 19, 14, 13, 18, 23), (24, 19, 18, 13, 8, 3), (24, 19, 18, 13, 8, 7), (24, 19, 18, 13, 8, 9), (24, 19, 18, 13, 12, 7), (24, 19, 18, 13, 12, 11), (24, 19, 18, 13, 12, 17), (24, 19, 18, 13, 14, 9), (24, 19, 18, 17, 12, 7), (24, 19, 18, 17, 12, 11), (24, 19, 18, 17, 12, 13), (24, 19, 18, 17, 16, 11), (24, 19, 18, 17, 16, 15), (24, 19, 18, 17, 16, 21), (24, 19, 18, 17, 22, 21), (24, 19, 18, 17, 22, 23), (24, 19, 18, 23, 22, 17), (24, 19, 18, 23, 22, 21), (24, 23, 18, 13, 8, 3), (24, 23, 18, 13, 8, 7), (24, 23, 18, 13, 8, 9), (24, 23, 18, 13, 12, 7), (24, 23, 18, 13, 12, 11), (24, 23, 18, 13, 12, 17), (24, 23, 18, 13, 14, 9), (24, 23, 18, 13, 14, 19), (24, 23, 18, 17, 12, 7), (24, 23, 18, 17, 12, 11), (24, 23, 18, 17, 12, 13), (24, 23, 18, 17, 16, 11), (24, 23, 18, 17, 16, 15), (24, 23, 18, 17, 16, 21), (24, 23, 18, 17, 22, 21), (24, 23, 18, 19, 14, 9), (24, 23, 18, 19, 14, 13), (24, 23, 22, 17, 12, 7), (24, 23, 22, 17, 12, 11), (24, 23, 22, 17, 12, 13), (24, 23, 22, 17, 16, 11), (24, 23, 22, 17, 16, 15), (24, 23, 22, 17, 16, 21), (24, 23, 22, 17, 18, 13), (24, 23, 22, 17, 18, 19), (24, 23, 22, 21, 16, 11), (24, 23, 22, 21, 16, 15), (24, 23, 22, 21, 16, 17), (24, 23, 22, 21, 20, 15), (0, 1, 2, 3, 4, 9, 8), (0, 1, 2, 3, 4, 9, 14), (0, 1, 2, 3, 8, 7, 6), (0, 1, 2, 3, 8, 7, 12), (0, 1, 2, 3, 8, 9, 4), (0, 1, 2, 3, 8, 9, 14), (0, 1, 2, 3, 8, 13, 12), (0, 1, 2, 3, 8, 13, 14), (0, 1, 2, 3, 8, 13, 18), (0, 1, 2, 7, 6, 5, 10), (0, 1, 2, 7, 6, 11, 10), (0, 1, 2, 7, 6, 11, 12), (0, 1, 2, 7, 6, 11, 16), (0, 1, 2, 7, 8, 3, 4), (0, 1, 2, 7, 8, 9, 4), (0, 1, 2, 7, 8, 9, 14), (0, 1, 2, 7, 8, 13, 12), (0, 1, 2, 7, 8, 13, 14), (0, 1, 2, 7, 8, 13, 18), (0, 1, 2, 7, 12, 11, 6), (0, 1, 2, 7, 12, 11, 10), (0, 1, 2, 7, 12, 11, 16), (0, 1, 2, 7, 12, 13, 8), (0, 1, 2, 7, 12, 13, 14), (0, 1, 2, 7, 12, 13, 18), (0, 1, 2, 7, 12, 17, 16), (0, 1, 2, 7, 12, 17, 18), (0, 1, 2, 7, 12, 17, 22), (0, 1, 6, 5, 10, 11, 12), (0, 1, 6, 5, 10, 11, 16), (0, 1, 6, 5, 10, 15, 16), (0, 1, 6, 5, 10, 15, 20), (0, 1, 6, 7, 2, 3, 4), (0, 1, 6, 7, 2, 3, 8), (0, 1, 6, 7, 8, 3, 2), (0, 1, 6, 7, 8, 3, 4), (0, 1, 6, 7, 8, 9, 4), (0, 1, 6, 7, 8, 9, 14), (0, 1, 6, 7, 8, 13, 12), (0, 1, 6, 7, 8, 13, 14), (0, 1, 6, 7, 8, 13, 18), (0, 1, 6, 7, 12, 11, 10), (0, 1, 6, 7, 12, 11, 16), (0, 1, 6, 7, 12, 13, 8), (0, 1, 6, 7, 12, 13, 14), (0, 1, 6, 7, 12, 13, 18), (0, 1, 6, 7, 12, 17, 16), (0, 1, 6, 7, 12, 17, 18), (0, 1, 6, 7, 12, 17, 22), (0, 1, 6, 11, 10, 15, 16), (0, 1, 6, 11, 10, 15, 20), (0, 1, 6, 11, 12, 7, 2), (0, 1, 6, 11, 12, 7, 8), (0, 1, 6, 11, 12, 13, 8), (0, 1, 6, 11, 12, 13, 14), (0, 1, 6, 11, 12, 13, 18), (0, 1, 6, 11, 12, 17, 16), (0, 1, 6, 11, 12, 17, 18), (0, 1, 6, 11, 12, 17, 22), (0, 1, 6, 11, 16, 15, 10), (0, 1, 6, 11, 16, 15, 20), (0, 1, 6, 11, 16, 17, 12), (0, 1, 6, 11, 16, 17, 18), (0, 1, 6, 11, 16, 17, 22), (0, 1, 6, 11, 16, 21, 20), (0, 1, 6, 11, 16, 21, 22), (0, 5, 6, 1, 2, 3, 4), (0, 5, 6, 1, 2, 3, 8), (0, 5, 6, 1, 2, 7, 8), (0, 5, 6, 1, 2, 7, 12), (0, 5, 6, 7, 2, 3, 4), (0, 5, 6, 7, 2, 3, 8), (0, 5, 6, 7, 8, 3, 2), (0, 5, 6, 7, 8, 3, 4), (0, 5, 6, 7, 8, 9, 4), (0, 5, 6, 7, 8, 9, 14), (0, 5, 6, 7, 8, 13, 12), (0, 5, 6, 7, 8, 13, 14), (0, 5, 6, 7, 8, 13, 18), (0, 5, 6, 7, 12, 11, 10), (0, 5, 6, 7, 12, 11, 16), (0, 5, 6, 7, 12, 13, 8), (0, 5, 6, 7, 12, 13, 14), (0, 5, 6, 7, 12, 13, 18), (0, 5, 6, 7, 12, 17, 16), (0, 5, 6, 7, 12, 17, 18), (0, 5, 6, 7, 12, 17, 22), (0, 5, 6, 11, 10, 15, 16), (0, 5, 6, 11, 10, 15, 20), (0, 5, 6, 11, 12, 7, 2), (0, 5, 6, 11, 12, 7, 8), (0, 5, 6, 11, 12, 13, 8), (0, 5, 6, 11, 12, 13, 14), (0, 5, 6, 11, 12, 13, 18), (0, 5, 6, 11, 12, 17, 16), (0, 5, 6, 11, 12, 17, 18), (0, 5, 6, 11, 12, 17, 22), (0, 5, 6, 11, 16, 15, 10), (0, 5, 6, 11, 16, 15, 20), (0, 5, 6, 11, 16, 17, 12), (0, 5, 6, 11, 16, 17, 18), (0, 5, 6, 11, 16, 17, 22), (0, 5, 6, 11, 16, 21, 20), (0, 5, 6, 11, 16, 21, 22), (0, 5, 10, 11, 6, 1, 2), (0, 5, 10, 11, 6, 7, 2), (0, 5, 10, 11, 6, 7, 8), (0, 5, 10, 11, 6, 7, 12), (0, 5, 10, 11, 12, 7, 2), (0, 5, 10, 11, 12, 7, 6), (0, 5, 10, 11, 12, 7, 8), (0, 5, 10, 11, 12, 13, 8), (0, 5, 10, 11, 12, 13, 14), (0, 5, 10, 11, 12, 13, 18), (0, 5, 10, 11, 12, 17, 16), (0, 5, 10, 11, 12, 17, 18), (0, 5, 10, 11, 12, 17, 22), (0, 5, 10, 11, 16, 15, 20), (0, 5, 10, 11, 16, 17, 12), (0, 5, 10, 11, 16, 17, 18), (0, 5, 10, 11, 16, 17, 22), (0, 5, 10, 11, 16, 21, 20), (0, 5, 10, 11, 16, 21, 22), (0, 5, 10, 15, 16, 11, 6), (0, 5, 10, 15, 16, 11, 12), (0, 5, 10, 15, 16, 17, 12), (0, 5, 10, 15, 16, 17, 18), (0, 5, 10, 15, 16, 17, 22), (0, 5, 10, 15, 16, 21, 20), (0, 5, 10, 15, 16, 21, 22), (0, 5, 10, 15, 20, 21, 16), (0, 5, 10, 15, 20, 21, 22), (1, 0, 5, 6, 7, 2, 3), (1, 0, 5, 6, 7, 8, 3), (1, 0, 5, 6, 7, 8, 9), (1, 0, 5, 6, 7, 8, 13), (1, 0, 5, 6, 7, 12, 11), (1, 0, 5, 6, 7, 12, 13), (1, 0, 5, 6, 7, 12, 17), (1, 0, 5, 6, 11, 10, 15), (1, 0, 5, 6, 11, 12, 7), (1, 0, 5, 6, 11, 12, 13), (1, 0, 5, 6, 11, 12, 17), (1, 0, 5, 6, 11, 16, 15), (1, 0, 5, 6, 11, 16, 17), (1, 0, 5, 6, 11, 16, 21), (1, 0, 5, 10, 11, 6, 7), (1, 0, 5, 10, 11, 12, 7), (1, 0, 5, 10, 11, 12, 13), (1, 0, 5, 10, 11, 12, 17), (1, 0, 5, 10, 11, 16, 15), (1, 0, 5, 10, 11, 16, 17), (1, 0, 5, 10, 11, 16, 21), (1, 0, 5, 10, 15, 16, 11), (1, 0, 5, 10, 15, 16, 17), (1, 0, 5, 10, 15, 16, 21), (1, 0, 5, 10, 15, 20, 21), (1, 2, 3, 4, 9, 8, 7), (1, 2, 3, 4, 9, 8, 13), (1, 2, 3, 4, 9, 14, 13), (1, 2, 3, 4, 9, 14, 19), (1, 2, 3, 8, 7, 6, 5), (1, 2, 3, 8, 7, 6, 11), (1, 2, 3, 8, 7, 12, 11), (1, 2, 3, 8, 7, 12, 13), (1, 2, 3, 8, 7, 12, 17), (1, 2, 3, 8, 9, 14, 13), (1, 2, 3, 8, 9, 14, 19), (1, 2, 3, 8, 13, 12, 7), (1, 2, 3, 8, 13, 12, 11), (1, 2, 3, 8, 13, 12, 17), (1, 2, 3, 8, 13, 14, 9), (1, 2, 3, 8, 13, 14, 19), (1, 2, 3, 8, 13, 18, 17), (1, 2, 3, 8, 13, 18, 19), (1, 2, 3, 8, 13, 18, 23), (1, 2, 7, 6, 5, 10, 11), (1, 2, 7, 6, 5, 10, 15), (1, 2, 7, 6, 11, 10, 5), (1, 2, 7, 6, 11, 10, 15), (1, 2, 7, 6, 11, 12, 13), (1, 2, 7, 6, 11, 12, 17), (1, 2, 7, 6, 11, 16, 15), (1, 2, 7, 6, 11, 16, 17), (1, 2, 7, 6, 11, 16, 21), (1, 2, 7, 8, 3, 4, 9), (1, 2, 7, 8, 9, 4, 3), (1, 2, 7, 8, 9, 14, 13), (1, 2, 7, 8, 9, 14, 19), (1, 2, 7, 8, 13, 12, 11), (1, 2, 7, 8, 13, 12, 17), (1, 2, 7, 8, 13, 14, 9), (1, 2, 7, 8, 13, 14, 19), (1, 2, 7, 8, 13, 18, 17), (1, 2, 7, 8, 13, 18, 19), (1, 2, 7, 8, 13, 18, 23), (1, 2, 7, 12, 11, 6, 5), (1, 2, 7, 12, 11, 10, 5), (1, 2, 7, 12, 11, 10, 15), (1, 2, 7, 12, 11, 16, 15), (1, 2, 7, 12, 11, 16, 17), (1, 2, 7, 12, 11, 16, 21), (1, 2, 7, 12, 13, 8, 3), (1, 2, 7, 12, 13, 8, 9), (1, 2, 7, 12, 13, 14, 9), (1, 2, 7, 12, 13, 14, 19), (1, 2, 7, 12, 13, 18, 17), (1, 2, 7, 12, 13, 18, 19), (1, 2, 7, 12, 13, 18, 23), (1, 2, 7, 12, 17, 16, 11), (1, 2, 7, 12, 17, 16, 15), (1, 2, 7, 12, 17, 16, 21), (1, 2, 7, 12, 17, 18, 13), (1, 2, 7, 12, 17, 18, 19), (1, 2, 7, 12, 17, 18, 23), (1, 2, 7, 12, 17, 22, 21), (1, 2, 7, 12, 17, 22, 23), (1, 6, 5, 10, 11, 12, 7), (1, 6, 5, 10, 11, 12, 13), (1, 6, 5, 10, 11, 12, 17), (1, 6, 5, 10, 11, 16, 15), (1, 6, 5, 10, 11, 16, 17), (1, 6, 5, 10, 11, 16, 21), (1, 6, 5, 10, 15, 16, 11), (1, 6, 5, 10, 15, 16, 17), (1, 6, 5, 10, 15, 16, 21), (1, 6, 5, 10, 15, 20, 21), (1, 6, 7, 2, 3, 4, 9), (1, 6, 7, 2, 3, 8, 9), (1, 6, 7, 2, 3, 8, 13), (1, 6, 7, 8, 3, 4, 9), (1, 6, 7, 8, 9, 4, 3), (1, 6, 7, 8, 9, 14, 13), (1, 6, 7, 8, 9, 14, 19), (1, 6, 7, 8, 13, 12, 11), (1, 6, 7, 8, 13, 12, 17), (1, 6, 7, 8, 13, 14, 9), (1, 6, 7, 8, 13, 14, 19), (1, 6, 7, 8, 13, 18, 17), (1, 6, 7, 8, 13, 18, 19), (1, 6, 7, 8, 13, 18, 23), (1, 6, 7, 12, 11, 10, 5), (1, 6, 7, 12, 11, 10, 15), (1, 6, 7, 12, 11, 16, 15), (1, 6, 7, 12, 11, 16, 17), (1, 6, 7, 12, 11, 16, 21), (1, 6, 7, 12, 13, 8, 3), (1, 6, 7, 12, 13, 8, 9), (1, 6, 7, 12, 13, 14, 9), (1, 6, 7, 12, 13, 14, 19), (1, 6, 7, 12, 13, 18, 17), (1, 6, 7, 12, 13, 18, 19), (1, 6, 7, 12, 13, 18, 23), (1, 6, 7, 12, 17, 16, 11), (1, 6, 7, 12, 17, 16, 15), (1, 6, 7, 12, 17, 16, 21), (1, 6, 7, 12, 17, 18, 13), (1, 6, 7, 12, 17, 18, 19), (1, 6, 7, 12, 17, 18, 23), (1, 6, 7, 12, 17, 22, 21), (1, 6, 7, 12, 17, 22, 23), (1, 6, 11, 10, 15, 16, 17), (1, 6, 11, 10, 15, 16, 21), (1, 6, 11, 10, 15, 20, 21), (1, 6, 11, 12, 7, 2, 3), (1, 6, 11, 12, 7, 8, 3), (1, 6, 11, 12, 7, 8, 9), (1, 6, 11, 12, 7, 8, 13), (1, 6, 11, 12, 13, 8, 3), (1, 6, 11, 12, 13, 8, 7), (1, 6, 11, 12, 13, 8, 9), (1, 6, 11, 12, 13, 14, 9), (1, 6, 11, 12, 13, 14, 19), (1, 6, 11, 12, 13, 18, 17), (1, 6, 11, 12, 13, 18, 19), (1, 6, 11, 12, 13, 18, 23), (1, 6, 11, 12, 17, 16, 15), (1, 6, 11, 12, 17, 16, 21), (1, 6, 11, 12, 17, 18, 13), (1, 6, 11, 12, 17, 18, 19), (1, 6, 11, 12, 17, 18, 23), (1, 6, 11, 12, 17, 22, 21), (1, 6, 11, 12, 17, 22, 23), (1, 6, 11, 16, 15, 10, 5), (1, 6, 11, 16, 15, 20, 21), (1, 6, 11, 16, 17, 12, 7), (1, 6, 11, 16, 17, 12, 13), (1, 6, 11, 16, 17, 18, 13), (1, 6, 11, 16, 17, 18, 19), (1, 6, 11, 16, 17, 18, 23), (1, 6, 11, 16, 17, 22, 21), (1, 6, 11, 16, 17, 22, 23), (1, 6, 11, 16, 21, 20, 15), (1, 6, 11, 16, 21, 22, 17), (1, 6, 11, 16, 21, 22, 23), (2, 1, 0, 5, 6, 7, 8), (2, 1, 0, 5, 6, 7, 12), (2, 1, 0, 5, 6, 11, 10), (2, 1, 0, 5, 6, 11, 12), (2, 1, 0, 5, 6, 11, 16), (2, 1, 0, 5, 10, 11, 6), (2, 1, 0, 5, 10, 11, 12), (2, 1, 0, 5, 10, 11, 16), (2, 1, 0, 5, 10, 15, 16), (2, 1, 0, 5, 10, 15, 20), (2, 1, 6, 5, 10, 11, 12), (2, 1, 6, 5, 10, 11, 16), (2, 1, 6, 5, 10, 15, 16), (2, 1, 6, 5, 10, 15, 20), (2, 1, 6, 7, 8, 3, 4), (2, 1, 6, 7, 8, 9, 4), (2, 1, 6, 7, 8, 9, 14), (2, 1, 6, 7, 8, 13, 12), (2, 1, 6, 7, 8, 13, 14), (2, 1, 6, 7, 8, 13, 18), (2, 1, 6, 7, 12, 11, 10), (2, 1, 6, 7, 12, 11, 16), (2, 1, 6, 7, 12, 13, 8), (2, 1, 6, 7, 12, 13, 14), (2, 1, 6, 7, 12, 13, 18), (2, 1, 6, 7, 12, 17, 16), (2, 1, 6, 7, 12, 17, 18), (2, 1, 6, 7, 12, 17, 22), (2, 1, 6, 11, 10, 5, 0), (2, 1, 6, 11, 10, 15, 16), (2, 1, 6, 11, 10, 15, 20), (2, 1, 6, 11, 12, 7, 8), (2, 1, 6, 11, 12, 13, 8), (2, 1, 6, 11, 12, 13, 14), (2, 1, 6, 11, 12, 13, 18), (2, 1, 6, 11, 12, 17, 16), (2, 1, 6, 11, 12, 17, 18), (2, 1, 6, 11, 12, 17, 22), (2, 1, 6, 11, 16, 15, 10), (2, 1, 6, 11, 16, 15, 20), (2, 1, 6, 11, 16, 17, 12), (2, 1, 6, 11, 16, 17, 18), (2, 1, 6, 11, 16, 17, 22), (2, 1, 6, 11, 16, 21, 20), (2, 1, 6, 11, 16, 21, 22), (2, 3, 4, 9, 8, 7, 6), (2, 3, 4, 9, 8, 7, 12), (2, 3, 4, 9, 8, 13, 12), (2, 3, 4, 9, 8, 13, 14), (2, 3, 4, 9, 8, 13, 18), (2, 3, 4, 9, 14, 13, 8), (2, 3, 4, 9, 14, 13, 12), (2, 3, 4, 9, 14, 13, 18), (2, 3, 4, 9, 14, 19, 18), (2, 3, 4, 9, 14, 19, 24), (2, 3, 8, 7, 6, 1, 0), (2, 3, 8, 7, 6, 5, 0), (2, 3, 8, 7, 6, 5, 10), (2, 3, 8, 7, 6, 11, 10), (2, 3, 8, 7, 6, 11, 12), (2, 3, 8, 7, 6, 11, 16), (2, 3, 8, 7, 12, 11, 6), (2, 3, 8, 7, 12, 11, 10), (2, 3, 8, 7, 12, 11, 16), (2, 3, 8, 7, 12, 13, 14), (2, 3, 8, 7, 12, 13, 18), (2, 3, 8, 7, 12, 17, 16), (2, 3, 8, 7, 12, 17, 18), (2, 3, 8, 7, 12, 17, 22), (2, 3, 8, 9, 14, 13, 12), (2, 3, 8, 9, 14, 13, 18), (2, 3, 8, 9, 14, 19, 18), (2, 3, 8, 9, 14, 19, 24), (2, 3, 8, 13, 12, 7, 6), (2, 3, 8, 13, 12, 11, 6), (2, 3, 8, 13, 12, 11, 10), (2, 3, 8, 13, 12, 11, 16), (2, 3, 8, 13, 12, 17, 16), (2, 3, 8, 13, 12, 17, 18), (2, 3, 8, 13, 12, 17, 22), (2, 3, 8, 13, 14, 9, 4), (2, 3, 8, 13, 14, 19, 18), (2, 3, 8, 13, 14, 19, 24), (2, 3, 8, 13, 18, 17, 12), (2, 3, 8, 13, 18, 17, 16), (2, 3, 8, 13, 18, 17, 22), (2, 3, 8, 13, 18, 19, 14), (2, 3, 8, 13, 18, 19, 24), (2, 3, 8, 13, 18, 23, 22), (2, 3, 8, 13, 18, 23, 24), (2, 7, 6, 1, 0, 5, 10), (2, 7, 6, 5, 10, 11, 12), (2, 7, 6, 5, 10, 11, 16), (2, 7, 6, 5, 10, 15, 16), (2, 7, 6, 5, 10, 15, 20), (2, 7, 6, 11, 10, 5, 0), (2, 7, 6, 11, 10, 15, 16), (2, 7, 6, 11, 10, 15, 20), (2, 7, 6, 11, 12, 13, 8), (2, 7, 6, 11, 12, 13, 14), (2, 7, 6, 11, 12, 13, 18), (2, 7, 6, 11, 12, 17, 16), (2, 7, 6, 11, 12, 17, 18), (2, 7, 6, 11, 12, 17, 22), (2, 7, 6, 11, 16, 15, 10), (2, 7, 6, 11, 16, 15, 20), (2, 7, 6, 11, 16, 17, 12), (2, 7, 6, 11, 16, 17, 18), (2, 7, 6, 11, 16, 17, 22), (2, 7, 6, 11, 16, 21, 20), (2, 7, 6, 11, 16, 21, 22), (2, 7, 8, 3, 4, 9, 14), (2, 7, 8, 9, 14, 13, 12), (2, 7, 8, 9, 14, 13, 18), (2, 7, 8, 9, 14, 19, 18), (2, 7, 8, 9, 14, 19, 24), (2, 7, 8, 13, 12, 11, 6), (2, 7, 8, 13, 12, 11, 10), (2, 7, 8, 13, 12, 11, 16), (2, 7, 8, 13, 12, 17, 16), (2, 7, 8, 13, 12, 17, 18), (2, 7, 8, 13, 12, 17, 22), (2, 7, 8, 13, 14, 9, 4), (2, 7, 8, 13, 14, 19, 18), (2, 7, 8, 13, 14, 19, 24), (2, 7, 8, 13, 18, 17, 12), (2, 7, 8, 13, 18, 17, 16), (2, 7, 8, 13, 18, 17, 22), (2, 7, 8, 13, 18, 19, 14), (2, 7, 8, 13, 18, 19, 24), (2, 7, 8, 13, 18, 23, 22), (2, 7, 8, 13, 18, 23, 24), (2, 7, 12, 11, 6, 1, 0), (2, 7, 12, 11, 6, 5, 0), (2, 7, 12, 11, 6, 5, 10), (2, 7, 12, 11, 10, 5, 0), (2, 7, 12, 11, 10, 5, 6), (2, 7, 12, 11, 10, 15, 16), (2, 7, 12, 11, 10, 15, 20), (2, 7, 12, 11, 16, 15, 10), (2, 7, 12, 11, 16, 15, 20), (2, 7, 12, 11, 16, 17, 18), (2, 7, 12, 11, 16, 17, 22), (2, 7, 12, 11, 16, 21, 20), (2, 7, 12, 11, 16, 21, 22), (2, 7, 12, 13, 8, 3, 4), (2, 7, 12, 13, 8, 9, 4), (2, 7, 12, 13, 8, 9, 14), (2, 7, 12, 13, 14, 9, 4), (2, 7, 12, 13, 14, 9, 8), (2, 7, 12, 13, 14, 19, 18), (2, 7, 12, 13, 14, 19, 24), (2, 7, 12, 13, 18, 17, 16), (2, 7, 12, 13, 18, 17, 22), (2, 7, 12, 13, 18, 19, 14), (2, 7, 12, 13, 18, 19, 24), (2, 7, 12, 13, 18, 23, 22), (2, 7, 12, 13, 18, 23, 24), (2, 7, 12, 17, 16, 11, 6), (2, 7, 12, 17, 16, 11, 10), (2, 7, 12, 17, 16, 15, 10), (2, 7, 12, 17, 16, 15, 20), (2, 7, 12, 17, 16, 21, 20), (2, 7, 12, 17, 16, 21, 22), (2, 7, 12, 17, 18, 13, 8), (2, 7, 12, 17, 18, 13, 14), (2, 7, 12, 17, 18, 19, 14), (2, 7, 12, 17, 18, 19, 24), (2, 7, 12, 17, 18, 23, 22), (2, 7, 12, 17, 18, 23, 24), (2, 7, 12, 17, 22, 21, 16), (2, 7, 12, 17, 22, 21, 20), (2, 7, 12, 17, 22, 23, 18), (2, 7, 12, 17, 22, 23, 24), (3, 2, 1, 0, 5, 6, 7), (3, 2, 1, 0, 5, 6, 11), (3, 2, 1, 0, 5, 10, 11), (3, 2, 1, 0, 5, 10, 15), (3, 2, 1, 6, 5, 10, 11), (3, 2, 1, 6, 5, 10, 15), (3, 2, 1, 6, 7, 8, 9), (3, 2, 1, 6, 7, 8, 13), (3, 2, 1, 6, 7, 12, 11), (3, 2, 1, 6, 7, 12, 13), (3, 2, 1, 6, 7, 12, 17), (3, 2, 1, 6, 11, 10, 5), (3, 2, 1, 6, 11, 10, 15), (3, 2, 1, 6, 11, 12, 7), (3, 2, 1, 6, 11, 12, 13), (3, 2, 1, 6, 11, 12, 17), (3, 2, 1, 6, 11, 16, 15), (3, 2, 1, 6, 11, 16, 17), (3, 2, 1, 6, 11, 16, 21), (3, 2, 7, 6, 1, 0, 5), (3, 2, 7, 6, 5, 0, 1), (3, 2, 7, 6, 5, 10, 11), (3, 2, 7, 6, 5, 10, 15), (3, 2, 7, 6, 11, 10, 5), (3, 2, 7, 6, 11, 10, 15), (3, 2, 7, 6, 11, 12, 13), (3, 2, 7, 6, 11, 12, 17), (3, 2, 7, 6, 11, 16, 15), (3, 2, 7, 6, 11, 16, 17), (3, 2, 7, 6, 11, 16, 21), (3, 2, 7, 8, 9, 14, 13), (3, 2, 7, 8, 9, 14, 19), (3, 2, 7, 8, 13, 12, 11), (3, 2, 7, 8, 13, 12, 17), (3, 2, 7, 8, 13, 14, 9), (3, 2, 7, 8, 13, 14, 19), (3, 2, 7, 8, 13, 18, 17), (3, 2, 7, 8, 13, 18, 19), (3, 2, 7, 8, 13, 18, 23), (3, 2, 7, 12, 11, 6, 1), (3, 2, 7, 12, 11, 6, 5), (3, 2, 7, 12, 11, 10, 5), (3, 2, 7, 12, 11, 10, 15), (3, 2, 7, 12, 11, 16, 15), (3, 2, 7, 12, 11, 16, 17), (3, 2, 7, 12, 11, 16, 21), (3, 2, 7, 12, 13, 8, 9), (3, 2, 7, 12, 13, 14, 9), (3, 2, 7, 12, 13, 14, 19), (3, 2, 7, 12, 13, 18, 17), (3, 2, 7, 12, 13, 18, 19), (3, 2, 7, 12, 13, 18, 23), (3, 2, 7, 12, 17, 16, 11), (3, 2, 7, 12, 17, 16, 15), (3, 2, 7, 12, 17, 16, 21), (3, 2, 7, 12, 17, 18, 13), (3, 2, 7, 12, 17, 18, 19), (3, 2, 7, 12, 17, 18, 23), (3, 2, 7, 12, 17, 22, 21), (3, 2, 7, 12, 17, 22, 23), (3, 4, 9, 8, 7, 2, 1), (3, 4, 9, 8, 7, 6, 1), (3, 4, 9, 8, 7, 6, 5), (3, 4, 9, 8, 7, 6, 11), (3, 4, 9, 8, 7, 12, 11), (3, 4, 9, 8, 7, 12, 13), (3, 4, 9, 8, 7, 12, 17), (3, 4, 9, 8, 13, 12, 7), (3, 4, 9, 8, 13, 12, 11), (3, 4, 9, 8, 13, 12, 17), (3, 4, 9, 8, 13, 14, 19), (3, 4, 9, 8, 13, 18, 17), (3, 4, 9, 8, 13, 18, 19), (3, 4, 9, 8, 13, 18, 23), (3, 4, 9, 14, 13, 8, 7), (3, 4, 9, 14, 13, 12, 7), (3, 4, 9, 14, 13, 12, 11), (3, 4, 9, 14, 13, 12, 17), (3, 4, 9, 14, 13, 18, 17), (3, 4, 9, 14, 13, 18, 19), (3, 4, 9, 14, 13, 18, 23), (3, 4, 9, 14, 19, 18, 13), (3, 4, 9, 14, 19, 18, 17), (3, 4, 9, 14, 19, 18, 23), (3, 4, 9, 14, 19, 24, 23), (3, 8, 7, 2, 1, 0, 5), (3, 8, 7, 2, 1, 6, 5), (3, 8, 7, 2, 1, 6, 11), (3, 8, 7, 6, 1, 0, 5), (3, 8, 7, 6, 5, 0, 1), (3, 8, 7, 6, 5, 10, 11), (3, 8, 7, 6, 5, 10, 15), (3, 8, 7, 6, 11, 10, 5), (3, 8, 7, 6, 11, 10, 15), (3, 8, 7, 6, 11, 12, 13), (3, 8, 7, 6, 11, 12, 17), (3, 8, 7, 6, 11, 16, 15), (3, 8, 7, 6, 11, 16, 17), (3, 8, 7, 6, 11, 16, 21), (3, 8, 7, 12, 11, 6, 1), (3, 8, 7, 12, 11, 6, 5), (3, 8, 7, 12, 11, 10, 5), (3, 8, 7, 12, 11, 10, 15), (3, 8, 7, 12, 11, 16, 15), (3, 8, 7, 12, 11, 16, 17), (3, 8, 7, 12, 11, 16, 21), (3, 8, 7, 12, 13, 14, 9), (3, 8, 7, 12, 13, 14, 19), (3, 8, 7, 12, 13, 18, 17), (3, 8, 7, 12, 13, 18, 19), (3, 8, 7, 12, 13, 18, 23), (3, 8, 7, 12, 17, 16, 11), (3, 8, 7, 12, 17, 16, 15), (3, 8, 7, 12, 17, 16, 21), (3, 8, 7, 12, 17, 18, 13), (3, 8, 7, 12, 17, 18, 19), (3, 8, 7, 12, 17, 18, 23), (3, 8, 7, 12, 17, 22, 21), (3, 8, 7, 12, 17, 22, 23), (3, 8, 9, 14, 13, 12, 7), (3, 8, 9, 14, 13, 12, 11), (3, 8, 9, 14, 13, 12, 17), (3, 8, 9, 14, 13, 18, 17), (3, 8, 9, 14, 13, 18, 19), (3, 8, 9, 14, 13, 18, 23), (3, 8, 9, 14, 19, 18, 13), (3, 8, 9, 14, 19, 18, 17), (3, 8, 9, 14, 19, 18, 23), (3, 8, 9, 14, 19, 24, 23), (3, 8, 13, 12, 7, 2, 1), (3, 8, 13, 12, 7, 6, 1), (3, 8, 13, 12, 7, 6, 5), (3, 8, 13, 12, 7, 6, 11), (3, 8, 13, 12, 11, 6, 1), (3, 8, 13, 12, 11, 6, 5), (3, 8, 13, 12, 11, 6, 7), (3, 8, 13, 12, 11, 10, 5), (3, 8, 13, 12, 11, 10, 15), (3, 8, 13, 12, 11, 16, 15), (3, 8, 13, 12, 11, 16, 17), (3, 8, 13, 12, 11, 16, 21), (3, 8, 13, 12, 17, 16, 11), (3, 8, 13, 12, 17, 16, 15), (3, 8, 13, 12, 17, 16, 21), (3, 8, 13, 12, 17, 18, 19), (3, 8, 13, 12, 17, 18, 23), (3, 8, 13, 12, 17, 22, 21), (3, 8, 13, 12, 17, 22, 23), (3, 8, 13, 14, 19, 18, 17), (3, 8, 13, 14, 19, 18, 23), (3, 8, 13, 14, 19, 24, 23), (3, 8, 13, 18, 17, 12, 7), (3, 8, 13, 18, 17, 12, 11), (3, 8, 13, 18, 17, 16, 11), (3, 8, 13, 18, 17, 16, 15), (3, 8, 13, 18, 17, 16, 21), (3, 8, 13, 18, 17, 22, 21), (3, 8, 13, 18, 17, 22, 23), (3, 8, 13, 18, 19, 14, 9), (3, 8, 13, 18, 19, 24, 23), (3, 8, 13, 18, 23, 22, 17), (3, 8, 13, 18, 23, 22, 21), (3, 8, 13, 18, 23, 24, 19), (4, 3, 2, 1, 0, 5, 6), (4, 3, 2, 1, 0, 5, 10), (4, 3, 2, 1, 6, 5, 0), (4, 3, 2, 1, 6, 5, 10), (4, 3, 2, 1, 6, 7, 8), (4, 3, 2, 1, 6, 7, 12), (4, 3, 2, 1, 6, 11, 10), (4, 3, 2, 1, 6, 11, 12), (4, 3, 2, 1, 6, 11, 16), (4, 3, 2, 7, 6, 1, 0), (4, 3, 2, 7, 6, 5, 0), (4, 3, 2, 7, 6, 5, 10), (4, 3, 2, 7, 6, 11, 10), (4, 3, 2, 7, 6, 11, 12), (4, 3, 2, 7, 6, 11, 16), (4, 3, 2, 7, 8, 9, 14), (4, 3, 2, 7, 8, 13, 12), (4, 3, 2, 7, 8, 13, 14), (4, 3, 2, 7, 8, 13, 18), (4, 3, 2, 7, 12, 11, 6), (4, 3, 2, 7, 12, 11, 10), (4, 3, 2, 7, 12, 11, 16), (4, 3, 2, 7, 12, 13, 8), (4, 3, 2, 7, 12, 13, 14), (4, 3, 2, 7, 12, 13, 18), (4, 3, 2, 7, 12, 17, 16), (4, 3, 2, 7, 12, 17, 18), (4, 3, 2, 7, 12, 17, 22), (4, 3, 8, 7, 2, 1, 0), (4, 3, 8, 7, 2, 1, 6), (4, 3, 8, 7, 6, 1, 0), (4, 3, 8, 7, 6, 1, 2), (4, 3, 8, 7, 6, 5, 0), (4, 3, 8, 7, 6, 5, 10), (4, 3, 8, 7, 6, 11, 10), (4, 3, 8, 7, 6, 11, 12), (4, 3, 8, 7, 6, 11, 16), (4, 3, 8, 7, 12, 11, 6), (4, 3, 8, 7, 12, 11, 10), (4, 3, 8, 7, 12, 11, 16), (4, 3, 8, 7, 12, 13, 14), (4, 3, 8, 7, 12, 13, 18), (4, 3, 8, 7, 12, 17, 16), (4, 3, 8, 7, 12, 17, 18), (4, 3, 8, 7, 12, 17, 22), (4, 3, 8, 9, 14, 13, 12), (4, 3, 8, 9, 14, 13, 18), (4, 3, 8, 9, 14, 19, 18), (4, 3, 8, 9, 14, 19, 24), (4, 3, 8, 13, 12, 7, 2), (4, 3, 8, 13, 12, 7, 6), (4, 3, 8, 13, 12, 11, 6), (4, 3, 8, 13, 12, 11, 10), (4, 3, 8, 13, 12, 11, 16), (4, 3, 8, 13, 12, 17, 16), (4, 3, 8, 13, 12, 17, 18), (4, 3, 8, 13, 12, 17, 22), (4, 3, 8, 13, 14, 19, 18), (4, 3, 8, 13, 14, 19, 24), (4, 3, 8, 13, 18, 17, 12), (4, 3, 8, 13, 18, 17, 16), (4, 3, 8, 13, 18, 17, 22), (4, 3, 8, 13, 18, 19, 14), (4, 3, 8, 13, 18, 19, 24), (4, 3, 8, 13, 18, 23, 22), (4, 3, 8, 13, 18, 23, 24), (4, 9, 8, 3, 2, 1, 0), (4, 9, 8, 3, 2, 1, 6), (4, 9, 8, 3, 2, 7, 6), (4, 9, 8, 3, 2, 7, 12), (4, 9, 8, 7, 2, 1, 0), (4, 9, 8, 7, 2, 1, 6), (4, 9, 8, 7, 6, 1, 0), (4, 9, 8, 7, 6, 1, 2), (4, 9, 8, 7, 6, 5, 0), (4, 9, 8, 7, 6, 5, 10), (4, 9, 8, 7, 6, 11, 10), (4, 9, 8, 7, 6, 11, 12), (4, 9, 8, 7, 6, 11, 16), (4, 9, 8, 7, 12, 11, 6), (4, 9, 8, 7, 12, 11, 10), (4, 9, 8, 7, 12, 11, 16), (4, 9, 8, 7, 12, 13, 14), (4, 9, 8, 7, 12, 13, 18), (4, 9, 8, 7, 12, 17, 16), (4, 9, 8, 7, 12, 17, 18), (4, 9, 8, 7, 12, 17, 22), (4, 9, 8, 13, 12, 7, 2), (4, 9, 8, 13, 12, 7, 6), (4, 9, 8, 13, 12, 11, 6), (4, 9, 8, 13, 12, 11, 10), (4, 9, 8, 13, 12, 11, 16), (4, 9, 8, 13, 12, 17, 16), (4, 9, 8, 13, 12, 17, 18), (4, 9, 8, 13, 12, 17, 22), (4, 9, 8, 13, 14, 19, 18), (4, 9, 8, 13, 14, 19, 24), (4, 9, 8, 13, 18, 17, 12), (4, 9, 8, 13, 18, 17, 16), (4, 9, 8, 13, 18, 17, 22), (4, 9, 8, 13, 18, 19, 14), (4, 9, 8, 13, 18, 19, 24), (4, 9, 8, 13, 18, 23, 22), (4, 9, 8, 13, 18, 23, 24), (4, 9, 14, 13, 8, 3, 2), (4, 9, 14, 13, 8, 7, 2), (4, 9, 14, 13, 8, 7, 6), (4, 9, 14, 13, 8, 7, 12), (4, 9, 14, 13, 12, 7, 2), (4, 9, 14, 13, 12, 7, 6), (4, 9, 14, 13, 12, 7, 8), (4, 9, 14, 13, 12, 11, 6), (4, 9, 14, 13, 12, 11, 10), (4, 9, 14, 13, 12, 11, 16), (4, 9, 14, 13, 12, 17, 16), (4, 9, 14, 13, 12, 17, 18), (4, 9, 14, 13, 12, 17, 22), (4, 9, 14, 13, 18, 17, 12), (4, 9, 14, 13, 18, 17, 16), (4, 9, 14, 13, 18, 17, 22), (4, 9, 14, 13, 18, 19, 24), (4, 9, 14, 13, 18, 23, 22), (4, 9, 14, 13, 18, 23, 24), (4, 9, 14, 19, 18, 13, 8), (4, 9, 14, 19, 18, 13, 12), (4, 9, 14, 19, 18, 17, 12), (4, 9, 14, 19, 18, 17, 16), (4, 9, 14, 19, 18, 17, 22), (4, 9, 14, 19, 18, 23, 22), (4, 9, 14, 19, 18, 23, 24), (4, 9, 14, 19, 24, 23, 18), (4, 9, 14, 19, 24, 23, 22), (5, 0, 1, 2, 3, 4, 9), (5, 0, 1, 2, 3, 8, 7), (5, 0, 1, 2, 3, 8, 9), (5, 0, 1, 2, 3, 8, 13), (5, 0, 1, 2, 7, 6, 11), (5, 0, 1, 2, 7, 8, 3), (5, 0, 1, 2, 7, 8, 9), (5, 0, 1, 2, 7, 8, 13), (5, 0, 1, 2, 7, 12, 11), (5, 0, 1, 2, 7, 12, 13), (5, 0, 1, 2, 7, 12, 17), (5, 0, 1, 6, 7, 2, 3), (5, 0, 1, 6, 7, 8, 3), (5, 0, 1, 6, 7, 8, 9), (5, 0, 1, 6, 7, 8, 13), (5, 0, 1, 6, 7, 12, 11), (5, 0, 1, 6, 7, 12, 13), (5, 0, 1, 6, 7, 12, 17), (5, 0, 1, 6, 11, 10, 15), (5, 0, 1, 6, 11, 12, 7), (5, 0, 1, 6, 11, 12, 13), (5, 0, 1, 6, 11, 12, 17), (5, 0, 1, 6, 11, 16, 15), (5, 0, 1, 6, 11, 16, 17), (5, 0, 1, 6, 11, 16, 21), (5, 6, 1, 2, 3, 4, 9), (5, 6, 1, 2, 3, 8, 7), (5, 6, 1, 2, 3, 8, 9), (5, 6, 1, 2, 3, 8, 13), (5, 6, 1, 2, 7, 8, 3), (5, 6, 1, 2, 7, 8, 9), (5, 6, 1, 2, 7, 8, 13), (5, 6, 1, 2, 7, 12, 11), (5, 6, 1, 2, 7, 12, 13), (5, 6, 1, 2, 7, 12, 17), (5, 6, 7, 2, 3, 4, 9), (5, 6, 7, 2, 3, 8, 9), (5, 6, 7, 2, 3, 8, 13), (5, 6, 7, 8, 3, 2, 1), (5, 6, 7, 8, 3, 4, 9), (5, 6, 7, 8, 9, 4, 3), (5, 6, 7, 8, 9, 14, 13), (5, 6, 7, 8, 9, 14, 19), (5, 6, 7, 8, 13, 12, 11), (5, 6, 7, 8, 13, 12, 17), (5, 6, 7, 8, 13, 14, 9), (5, 6, 7, 8, 13, 14, 19), (5, 6, 7, 8, 13, 18, 17), (5, 6, 7, 8, 13, 18, 19), (5, 6, 7, 8, 13, 18, 23), (5, 6, 7, 12, 11, 10, 15), (5, 6, 7, 12, 11, 16, 15), (5, 6, 7, 12, 11, 16, 17), (5, 6, 7, 12, 11, 16, 21), (5, 6, 7, 12, 13, 8, 3), (5, 6, 7, 12, 13, 8, 9), (5, 6, 7, 12, 13, 14, 9), (5, 6, 7, 12, 13, 14, 19), (5, 6, 7, 12, 13, 18, 17), (5, 6, 7, 12, 13, 18, 19), (5, 6, 7, 12, 13, 18, 23), (5, 6, 7, 12, 17, 16, 11), (5, 6, 7, 12, 17, 16, 15), (5, 6, 7, 12, 17, 16, 21), (5, 6, 7, 12, 17, 18, 13), (5, 6, 7, 12, 17, 18, 19), (5, 6, 7, 12, 17, 18, 23), (5, 6, 7, 12, 17, 22, 21), (5, 6, 7, 12, 17, 22, 23), (5, 6, 11, 10, 15, 16, 17), (5, 6, 11, 10, 15, 16, 21), (5, 6, 11, 10, 15, 20, 21), (5, 6, 11, 12, 7, 2, 1), (5, 6, 11, 12, 7, 2, 3), (5, 6, 11, 12, 7, 8, 3), (5, 6, 11, 12, 7, 8, 9), (5, 6, 11, 12, 7, 8, 13), (5, 6, 11, 12, 13, 8, 3), (5, 6, 11, 12, 13, 8, 7), (5, 6, 11, 12, 13, 8, 9), (5, 6, 11, 12, 13, 14, 9), (5, 6, 11, 12, 13, 14, 19), (5, 6, 11, 12, 13, 18, 17), (5, 6, 11, 12, 13, 18, 19), (5, 6, 11, 12, 13, 18, 23), (5, 6, 11, 12, 17, 16, 15), (5, 6, 11, 12, 17, 16, 21), (5, 6, 11, 12, 17, 18, 13), (5, 6, 11, 12, 17, 18, 19), (5, 6, 11, 12, 17, 18, 23), (5, 6, 11, 12, 17, 22, 21), (5, 6, 11, 12, 17, 22, 23), (5, 6, 11, 16, 15, 20, 21), (5, 6, 11, 16, 17, 12, 7), (5, 6, 11, 16, 17, 12, 13), (5, 6, 11, 16, 17, 18, 13), (5, 6, 11, 16, 17, 18, 19), (5, 6, 11, 16, 17, 18, 23), (5, 6, 11, 16, 17, 22, 21), (5, 6, 11, 16, 17, 22, 23), (5, 6, 11, 16, 21, 20, 15), (5, 6, 11, 16, 21, 22, 17), (5, 6, 11, 16, 21, 22, 23), (5, 10, 11, 6, 1, 2, 3), (5, 10, 11, 6, 1, 2, 7), (5, 10, 11, 6, 7, 2, 1), (5, 10, 11, 6, 7, 2, 3), (5, 10, 11, 6, 7, 8, 3), (5, 10, 11, 6, 7, 8, 9), (5, 10, 11, 6, 7, 8, 13), (5, 10, 11, 6, 7, 12, 13), (5, 10, 11, 6, 7, 12, 17), (5, 10, 11, 12, 7, 2, 1), (5, 10, 11, 12, 7, 2, 3), (5, 10, 11, 12, 7, 6, 1), (5, 10, 11, 12, 7, 8, 3), (5, 10, 11, 12, 7, 8, 9), (5, 10, 11, 12, 7, 8, 13), (5, 10, 11, 12, 13, 8, 3), (5, 10, 11, 12, 13, 8, 7), (5, 10, 11, 12, 13, 8, 9), (5, 10, 11, 12, 13, 14, 9), (5, 10, 11, 12, 13, 14, 19), (5, 10, 11, 12, 13, 18, 17), (5, 10, 11, 12, 13, 18, 19), (5, 10, 11, 12, 13, 18, 23), (5, 10, 11, 12, 17, 16, 15), (5, 10, 11, 12, 17, 16, 21), (5, 10, 11, 12, 17, 18, 13), (5, 10, 11, 12, 17, 18, 19), (5, 10, 11, 12, 17, 18, 23), (5, 10, 11, 12, 17, 22, 21), (5, 10, 11, 12, 17, 22, 23), (5, 10, 11, 16, 15, 20, 21), (5, 10, 11, 16, 17, 12, 7), (5, 10, 11, 16, 17, 12, 13), (5, 10, 11, 16, 17, 18, 13), (5, 10, 11, 16, 17, 18, 19), (5, 10, 11, 16, 17, 18, 23), (5, 10, 11, 16, 17, 22, 21), (5, 10, 11, 16, 17, 22, 23), (5, 10, 11, 16, 21, 20, 15), (5, 10, 11, 16, 21, 22, 17), (5, 10, 11, 16, 21, 22, 23), (5, 10, 15, 16, 11, 6, 1), (5, 10, 15, 16, 11, 6, 7), (5, 10, 15, 16, 11, 12, 7), (5, 10, 15, 16, 11, 12, 13), (5, 10, 15, 16, 11, 12, 17), (5, 10, 15, 16, 17, 12, 7), (5, 10, 15, 16, 17, 12, 11), (5, 10, 15, 16, 17, 12, 13), (5, 10, 15, 16, 17, 18, 13), (5, 10, 15, 16, 17, 18, 19), (5, 10, 15, 16, 17, 18, 23), (5, 10, 15, 16, 17, 22, 21), (5, 10, 15, 16, 17, 22, 23), (5, 10, 15, 16, 21, 22, 17), (5, 10, 15, 16, 21, 22, 23), (5, 10, 15, 20, 21, 16, 11), (5, 10, 15, 20, 21, 16, 17), (5, 10, 15, 20, 21, 22, 17), (5, 10, 15, 20, 21, 22, 23), (6, 1, 0, 5, 10, 11, 12), (6, 1, 0, 5, 10, 11, 16), (6, 1, 0, 5, 10, 15, 16), (6, 1, 0, 5, 10, 15, 20), (6, 1, 2, 3, 4, 9, 8), (6, 1, 2, 3, 4, 9, 14), (6, 1, 2, 3, 8, 7, 12), (6, 1, 2, 3, 8, 9, 4), (6, 1, 2, 3, 8, 9, 14), (6, 1, 2, 3, 8, 13, 12), (6, 1, 2, 3, 8, 13, 14), (6, 1, 2, 3, 8, 13, 18), (6, 1, 2, 7, 8, 3, 4), (6, 1, 2, 7, 8, 9, 4), (6, 1, 2, 7, 8, 9, 14), (6, 1, 2, 7, 8, 13, 12), (6, 1, 2, 7, 8, 13, 14), (6, 1, 2, 7, 8, 13, 18), (6, 1, 2, 7, 12, 11, 10), (6, 1, 2, 7, 12, 11, 16), (6, 1, 2, 7, 12, 13, 8), (6, 1, 2, 7, 12, 13, 14), (6, 1, 2, 7, 12, 13, 18), (6, 1, 2, 7, 12, 17, 16), (6, 1, 2, 7, 12, 17, 18), (6, 1, 2, 7, 12, 17, 22), (6, 5, 0, 1, 2, 3, 4), (6, 5, 0, 1, 2, 3, 8), (6, 5, 0, 1, 2, 7, 8), (6, 5, 0, 1, 2, 7, 12), (6, 5, 10, 11, 12, 7, 2), (6, 5, 10, 11, 12, 7, 8), (6, 5, 10, 11, 12, 13, 8), (6, 5, 10, 11, 12, 13, 14), (6, 5, 10, 11, 12, 13, 18), (6, 5, 10, 11, 12, 17, 16), (6, 5, 10, 11, 12, 17, 18), (6, 5, 10, 11, 12, 17, 22), (6, 5, 10, 11, 16, 15, 20), (6, 5, 10, 11, 16, 17, 12), (6, 5, 10, 11, 16, 17, 18), (6, 5, 10, 11, 16, 17, 22), (6, 5, 10, 11, 16, 21, 20), (6, 5, 10, 11, 16, 21, 22), (6, 5, 10, 15, 16, 11, 12), (6, 5, 10, 15, 16, 17, 12), (6, 5, 10, 15, 16, 17, 18), (6, 5, 10, 15, 16, 17, 22), (6, 5, 10, 15, 16, 21, 20), (6, 5, 10, 15, 16, 21, 22), (6, 5, 10, 15, 20, 21, 16), (6, 5, 10, 15, 20, 21, 22), (6, 7, 2, 1, 0, 5, 10), (6, 7, 2, 3, 4, 9, 8), (6, 7, 2, 3, 4, 9, 14), (6, 7, 2, 3, 8, 9, 4), (6, 7, 2, 3, 8, 9, 14), (6, 7, 2, 3, 8, 13, 12), (6, 7, 2, 3, 8, 13, 14), (6, 7, 2, 3, 8, 13, 18), (6, 7, 8, 3, 2, 1, 0), (6, 7, 8, 3, 4, 9, 14), (6, 7, 8, 9, 4, 3, 2), (6, 7, 8, 9, 14, 13, 12), (6, 7, 8, 9, 14, 13, 18), (6, 7, 8, 9, 14, 19, 18), (6, 7, 8, 9, 14, 19, 24), (6, 7, 8, 13, 12, 11, 10), (6, 7, 8, 13, 12, 11, 16), (6, 7, 8, 13, 12, 17, 16), (6, 7, 8, 13, 12, 17, 18), (6, 7, 8, 13, 12, 17, 22), (6, 7, 8, 13, 14, 9, 4), (6, 7, 8, 13, 14, 19, 18), (6, 7, 8, 13, 14, 19, 24), (6, 7, 8, 13, 18, 17, 12), (6, 7, 8, 13, 18, 17, 16), (6, 7, 8, 13, 18, 17, 22), (6, 7, 8, 13, 18, 19, 14), (6, 7, 8, 13, 18, 19, 24), (6, 7, 8, 13, 18, 23, 22), (6, 7, 8, 13, 18, 23, 24), (6, 7, 12, 11, 10, 5, 0), (6, 7, 12, 11, 10, 15, 16), (6, 7, 12, 11, 10, 15, 20), (6, 7, 12, 11, 16, 15, 10), (6, 7, 12, 11, 16, 15, 20), (6, 7, 12, 11, 16, 17, 18), (6, 7, 12, 11, 16, 17, 22), (6, 7, 12, 11, 16, 21, 20), (6, 7, 12, 11, 16, 21, 22), (6, 7, 12, 13, 8, 3, 2), (6, 7, 12, 13, 8, 3, 4), (6, 7, 12, 13, 8, 9, 4), (6, 7, 12, 13, 8, 9, 14), (6, 7, 12, 13, 14, 9, 4), (6, 7, 12, 13, 14, 9, 8), (6, 7, 12, 13, 14, 19, 18), (6, 7, 12, 13, 14, 19, 24), (6, 7, 12, 13, 18, 17, 16), (6, 7, 12, 13, 18, 17, 22), (6, 7, 12, 13, 18, 19, 14), (6, 7, 12, 13, 18, 19, 24), (6, 7, 12, 13, 18, 23, 22), (6, 7, 12, 13, 18, 23, 24), (6, 7, 12, 17, 16, 11, 10), (6, 7, 12, 17, 16, 15, 10), (6, 7, 12, 17, 16, 15, 20), (6, 7, 12, 17, 16, 21, 20), (6, 7, 12, 17, 16, 21, 22), (6, 7, 12, 17, 18, 13, 8), (6, 7, 12, 17, 18, 13, 14), (6, 7, 12, 17, 18, 19, 14), (6, 7, 12, 17, 18, 19, 24), (6, 7, 12, 17, 18, 23, 22), (6, 7, 12, 17, 18, 23, 24), (6, 7, 12, 17, 22, 21, 16), (6, 7, 12, 17, 22, 21, 20), (6, 7, 12, 17, 22, 23, 18), (6, 7, 12, 17, 22, 23, 24), (6, 11, 10, 5, 0, 1, 2), (6, 11, 10, 15, 16, 17, 12), (6, 11, 10, 15, 16, 17, 18), (6, 11, 10, 15, 16, 17, 22), (6, 11, 10, 15, 16, 21, 20), (6, 11, 10, 15, 16, 21, 22), (6, 11, 10, 15, 20, 21, 16), (6, 11, 10, 15, 20, 21, 22), (6, 11, 12, 7, 2, 1, 0), (6, 11, 12, 7, 2, 3, 4), (6, 11, 12, 7, 2, 3, 8), (6, 11, 12, 7, 8, 3, 2), (6, 11, 12, 7, 8, 3, 4), (6, 11, 12, 7, 8, 9, 4), (6, 11, 12, 7, 8, 9, 14), (6, 11, 12, 7, 8, 13, 14), (6, 11, 12, 7, 8, 13, 18), (6, 11, 12, 13, 8, 3, 2), (6, 11, 12, 13, 8, 3, 4), (6, 11, 12, 13, 8, 7, 2), (6, 11, 12, 13, 8, 9, 4), (6, 11, 12, 13, 8, 9, 14), (6, 11, 12, 13, 14, 9, 4), (6, 11, 12, 13, 14, 9, 8), (6, 11, 12, 13, 14, 19, 18), (6, 11, 12, 13, 14, 19, 24), (6, 11, 12, 13, 18, 17, 16), (6, 11, 12, 13, 18, 17, 22), (6, 11, 12, 13, 18, 19, 14), (6, 11, 12, 13, 18, 19, 24), (6, 11, 12, 13, 18, 23, 22), (6, 11, 12, 13, 18, 23, 24), (6, 11, 12, 17, 16, 15, 10), (6, 11, 12, 17, 16, 15, 20), (6, 11, 12, 17, 16, 21, 20), (6, 11, 12, 17, 16, 21, 22), (6, 11, 12, 17, 18, 13, 8), (6, 11, 12, 17, 18, 13, 14), (6, 11, 12, 17, 18, 19, 14), (6, 11, 12, 17, 18, 19, 24), (6, 11, 12, 17, 18, 23, 22), (6, 11, 12, 17, 18, 23, 24), (6, 11, 12, 17, 22, 21, 16), (6, 11, 12, 17, 22, 21, 20), (6, 11, 12, 17, 22, 23, 18), (6, 11, 12, 17, 22, 23, 24), (6, 11, 16, 15, 10, 5, 0), (6, 11, 16, 15, 20, 21, 22), (6, 11, 16, 17, 12, 7, 2), (6, 11, 16, 17, 12, 7, 8), (6, 11, 16, 17, 12, 13, 8), (6, 11, 16, 17, 12, 13, 14), (6, 11, 16, 17, 12, 13, 18), (6, 11, 16, 17, 18, 13, 8), (6, 11, 16, 17, 18, 13, 12), (6, 11, 16, 17, 18, 13, 14), (6, 11, 16, 17, 18, 19, 14), (6, 11, 16, 17, 18, 19, 24), (6, 11, 16, 17, 18, 23, 22), (6, 11, 16, 17, 18, 23, 24), (6, 11, 16, 17, 22, 21, 20), (6, 11, 16, 17, 22, 23, 18), (6, 11, 16, 17, 22, 23, 24), (6, 11, 16, 21, 20, 15, 10), (6, 11, 16, 21, 22, 17, 12), (6, 11, 16, 21, 22, 17, 18), (6, 11, 16, 21, 22, 23, 18), (6, 11, 16, 21, 22, 23, 24), (7, 2, 1, 0, 5, 6, 11), (7, 2, 1, 0, 5, 10, 11), (7, 2, 1, 0, 5, 10, 15), (7, 2, 1, 6, 5, 10, 11), (7, 2, 1, 6, 5, 10, 15), (7, 2, 1, 6, 11, 10, 5), (7, 2, 1, 6, 11, 10, 15), (7, 2, 1, 6, 11, 12, 13), (7, 2, 1, 6, 11, 12, 17), (7, 2, 1, 6, 11, 16, 15), (7, 2, 1, 6, 11, 16, 17), (7, 2, 1, 6, 11, 16, 21), (7, 2, 3, 4, 9, 8, 13), (7, 2, 3, 4, 9, 14, 13), (7, 2, 3, 4, 9, 14, 19), (7, 2, 3, 8, 9, 14, 13), (7, 2, 3, 8, 9, 14, 19), (7, 2, 3, 8, 13, 12, 11), (7, 2, 3, 8, 13, 12, 17), (7, 2, 3, 8, 13, 14, 9), (7, 2, 3, 8, 13, 14, 19), (7, 2, 3, 8, 13, 18, 17), (7, 2, 3, 8, 13, 18, 19), (7, 2, 3, 8, 13, 18, 23), (7, 6, 1, 0, 5, 10, 11), (7, 6, 1, 0, 5, 10, 15), (7, 6, 1, 2, 3, 4, 9), (7, 6, 1, 2, 3, 8, 9), (7, 6, 1, 2, 3, 8, 13), (7, 6, 5, 0, 1, 2, 3), (7, 6, 5, 10, 11, 12, 13), (7, 6, 5, 10, 11, 12, 17), (7, 6, 5, 10, 11, 16, 15), (7, 6, 5, 10, 11, 16, 17), (7, 6, 5, 10, 11, 16, 21), (7, 6, 5, 10, 15, 16, 11), (7, 6, 5, 10, 15, 16, 17), (7, 6, 5, 10, 15, 16, 21), (7, 6, 5, 10, 15, 20, 21), (7, 6, 11, 10, 5, 0, 1), (7, 6, 11, 10, 15, 16, 17), (7, 6, 11, 10, 15, 16, 21), (7, 6, 11, 10, 15, 20, 21), (7, 6, 11, 12, 13, 8, 3), (7, 6, 11, 12, 13, 8, 9), (7, 6, 11, 12, 13, 14, 9), (7, 6, 11, 12, 13, 14, 19), (7, 6, 11, 12, 13, 18, 17), (7, 6, 11, 12, 13, 18, 19), (7, 6, 11, 12, 13, 18, 23), (7, 6, 11, 12, 17, 16, 15), (7, 6, 11, 12, 17, 16, 21), (7, 6, 11, 12, 17, 18, 13), (7, 6, 11, 12, 17, 18, 19), (7, 6, 11, 12, 17, 18, 23), (7, 6, 11, 12, 17, 22, 21), (7, 6, 11, 12, 17, 22, 23), (7, 6, 11, 16, 15, 10, 5), (7, 6, 11, 16, 15, 20, 21), (7, 6, 11, 16, 17, 12, 13), (7, 6, 11, 16, 17, 18, 13), (7, 6, 11, 16, 17, 18, 19), (7, 6, 11, 16, 17, 18, 23), (7, 6, 11, 16, 17, 22, 21), (7, 6, 11, 16, 17, 22, 23), (7, 6, 11, 16, 21, 20, 15), (7, 6, 11, 16, 21, 22, 17), (7, 6, 11, 16, 21, 22, 23), (7, 8, 3, 2, 1, 0, 5), (7, 8, 3, 2, 1, 6, 5), (7, 8, 3, 2, 1, 6, 11), (7, 8, 3, 4, 9, 14, 13), (7, 8, 3, 4, 9, 14, 19), (7, 8, 9, 4, 3, 2, 1), (7, 8, 9, 14, 13, 12, 11), (7, 8, 9, 14, 13, 12, 17), (7, 8, 9, 14, 13, 18, 17), (7, 8, 9, 14, 13, 18, 19), (7, 8, 9, 14, 13, 18, 23), (7, 8, 9, 14, 19, 18, 13), (7, 8, 9, 14, 19, 18, 17), (7, 8, 9, 14, 19, 18, 23), (7, 8, 9, 14, 19, 24, 23), (7, 8, 13, 12, 11, 6, 1), (7, 8, 13, 12, 11, 6, 5), (7, 8, 13, 12, 11, 10, 5), (7, 8, 13, 12, 11, 10, 15), (7, 8, 13, 12, 11, 16, 15), (7, 8, 13, 12, 11, 16, 17), (7, 8, 13, 12, 11, 16, 21), (7, 8, 13, 12, 17, 16, 11), (7, 8, 13, 12, 17, 16, 15), (7, 8, 13, 12, 17, 16, 21), (7, 8, 13, 12, 17, 18, 19), (7, 8, 13, 12, 17, 18, 23), (7, 8, 13, 12, 17, 22, 21), (7, 8, 13, 12, 17, 22, 23), (7, 8, 13, 14, 9, 4, 3), (7, 8, 13, 14, 19, 18, 17), (7, 8, 13, 14, 19, 18, 23), (7, 8, 13, 14, 19, 24, 23), (7, 8, 13, 18, 17, 12, 11), (7, 8, 13, 18, 17, 16, 11), (7, 8, 13, 18, 17, 16, 15), (7, 8, 13, 18, 17, 16, 21), (7, 8, 13, 18, 17, 22, 21), (7, 8, 13, 18, 17, 22, 23), (7, 8, 13, 18, 19, 14, 9), (7, 8, 13, 18, 19, 24, 23), (7, 8, 13, 18, 23, 22, 17), (7, 8, 13, 18, 23, 22, 21), (7, 8, 13, 18, 23, 24, 19), (7, 12, 11, 6, 1, 0, 5), (7, 12, 11, 6, 1, 2, 3), (7, 12, 11, 6, 5, 0, 1), (7, 12, 11, 6, 5, 10, 15), (7, 12, 11, 10, 5, 0, 1), (7, 12, 11, 10, 5, 6, 1), (7, 12, 11, 10, 15, 16, 17), (7, 12, 11, 10, 15, 16, 21), (7, 12, 11, 10, 15, 20, 21), (7, 12, 11, 16, 15, 10, 5), (7, 12, 11, 16, 15, 20, 21), (7, 12, 11, 16, 17, 18, 13), (7, 12, 11, 16, 17, 18, 19), (7, 12, 11, 16, 17, 18, 23), (7, 12, 11, 16, 17, 22, 21), (7, 12, 11, 16, 17, 22, 23), (7, 12, 11, 16, 21, 20, 15), (7, 12, 11, 16, 21, 22, 17), (7, 12, 11, 16, 21, 22, 23), (7, 12, 13, 8, 3, 2, 1), (7, 12, 13, 8, 3, 4, 9), (7, 12, 13, 8, 9, 4, 3), (7, 12, 13, 8, 9, 14, 19), (7, 12, 13, 14, 9, 4, 3), (7, 12, 13, 14, 9, 8, 3), (7, 12, 13, 14, 19, 18, 17), (7, 12, 13, 14, 19, 18, 23), (7, 12, 13, 14, 19, 24, 23), (7, 12, 13, 18, 17, 16, 11), (7, 12, 13, 18, 17, 16, 15), (7, 12, 13, 18, 17, 16, 21), (7, 12, 13, 18, 17, 22, 21), (7, 12, 13, 18, 17, 22, 23), (7, 12, 13, 18, 19, 14, 9), (7, 12, 13, 18, 19, 24, 23), (7, 12, 13, 18, 23, 22, 17), (7, 12, 13, 18, 23, 22, 21), (7, 12, 13, 18, 23, 24, 19), (7, 12, 17, 16, 11, 6, 1), (7, 12, 17, 16, 11, 6, 5), (7, 12, 17, 16, 11, 10, 5), (7, 12, 17, 16, 11, 10, 15), (7, 12, 17, 16, 15, 10, 5), (7, 12, 17, 16, 15, 10, 11), (7, 12, 17, 16, 15, 20, 21), (7, 12, 17, 16, 21, 20, 15), (7, 12, 17, 16, 21, 22, 23), (7, 12, 17, 18, 13, 8, 3), (7, 12, 17, 18, 13, 8, 9), (7, 12, 17, 18, 13, 14, 9), (7, 12, 17, 18, 13, 14, 19), (7, 12, 17, 18, 19, 14, 9), (7, 12, 17, 18, 19, 14, 13), (7, 12, 17, 18, 19, 24, 23), (7, 12, 17, 18, 23, 22, 21), (7, 12, 17, 18, 23, 24, 19), (7, 12, 17, 22, 21, 16, 11), (7, 12, 17, 22, 21, 16, 15), (7, 12, 17, 22, 21, 20, 15), (7, 12, 17, 22, 23, 18, 13), (7, 12, 17, 22, 23, 18, 19), (7, 12, 17, 22, 23, 24, 19), (8, 3, 2, 1, 0, 5, 6), (8, 3, 2, 1, 0, 5, 10), (8, 3, 2, 1, 6, 5, 0), (8, 3, 2, 1, 6, 5, 10), (8, 3, 2, 1, 6, 7, 12), (8, 3, 2, 1, 6, 11, 10), (8, 3, 2, 1, 6, 11, 12), (8, 3, 2, 1, 6, 11, 16), (8, 3, 2, 7, 6, 1, 0), (8, 3, 2, 7, 6, 5, 0), (8, 3, 2, 7, 6, 5, 10), (8, 3, 2, 7, 6, 11, 10), (8, 3, 2, 7, 6, 11, 12), (8, 3, 2, 7, 6, 11, 16), (8, 3, 2, 7, 12, 11, 6), (8, 3, 2, 7, 12, 11, 10), (8, 3, 2, 7, 12, 11, 16), (8, 3, 2, 7, 12, 13, 14), (8, 3, 2, 7, 12, 13, 18), (8, 3, 2, 7, 12, 17, 16), (8, 3, 2, 7, 12, 17, 18), (8, 3, 2, 7, 12, 17, 22), (8, 3, 4, 9, 14, 13, 12), (8, 3, 4, 9, 14, 13, 18), (8, 3, 4, 9, 14, 19, 18), (8, 3, 4, 9, 14, 19, 24), (8, 7, 2, 1, 0, 5, 6), (8, 7, 2, 1, 0, 5, 10), (8, 7, 2, 1, 6, 5, 0), (8, 7, 2, 1, 6, 5, 10), (8, 7, 2, 1, 6, 11, 10), (8, 7, 2, 1, 6, 11, 12), (8, 7, 2, 1, 6, 11, 16), (8, 7, 2, 3, 4, 9, 14), (8, 7, 6, 1, 0, 5, 10), (8, 7, 6, 1, 2, 3, 4), (8, 7, 6, 5, 0, 1, 2), (8, 7, 6, 5, 10, 11, 12), (8, 7, 6, 5, 10, 11, 16), (8, 7, 6, 5, 10, 15, 16), (8, 7, 6, 5, 10, 15, 20), (8, 7, 6, 11, 10, 5, 0), (8, 7, 6, 11, 10, 15, 16), (8, 7, 6, 11, 10, 15, 20), (8, 7, 6, 11, 12, 13, 14), (8, 7, 6, 11, 12, 13, 18), (8, 7, 6, 11, 12, 17, 16), (8, 7, 6, 11, 12, 17, 18), (8, 7, 6, 11, 12, 17, 22), (8, 7, 6, 11, 16, 15, 10), (8, 7, 6, 11, 16, 15, 20), (8, 7, 6, 11, 16, 17, 12), (8, 7, 6, 11, 16, 17, 18), (8, 7, 6, 11, 16, 17, 22), (8, 7, 6, 11, 16, 21, 20), (8, 7, 6, 11, 16, 21, 22), (8, 7, 12, 11, 6, 1, 0), (8, 7, 12, 11, 6, 1, 2), (8, 7, 12, 11, 6, 5, 0), (8, 7, 12, 11, 6, 5, 10), (8, 7, 12, 11, 10, 5, 0), (8, 7, 12, 11, 10, 5, 6), (8, 7, 12, 11, 10, 15, 16), (8, 7, 12, 11, 10, 15, 20), (8, 7, 12, 11, 16, 15, 10), (8, 7, 12, 11, 16, 15, 20), (8, 7, 12, 11, 16, 17, 18), (8, 7, 12, 11, 16, 17, 22), (8, 7, 12, 11, 16, 21, 20), (8, 7, 12, 11, 16, 21, 22), (8, 7, 12, 13, 14, 9, 4), (8, 7, 12, 13, 14, 19, 18), (8, 7, 12, 13, 14, 19, 24), (8, 7, 12, 13, 18, 17, 16), (8, 7, 12, 13, 18, 17, 22), (8, 7, 12, 13, 18, 19, 14), (8, 7, 12, 13, 18, 19, 24), (8, 7, 12, 13, 18, 23, 22), (8, 7, 12, 13, 18, 23, 24), (8, 7, 12, 17, 16, 11, 6), (8, 7, 12, 17, 16, 11, 10), (8, 7, 12, 17, 16, 15, 10), (8, 7, 12, 17, 16, 15, 20), (8, 7, 12, 17, 16, 21, 20), (8, 7, 12, 17, 16, 21, 22), (8, 7, 12, 17, 18, 13, 14), (8, 7, 12, 17, 18, 19, 14), (8, 7, 12, 17, 18, 19, 24), (8, 7, 12, 17, 18, 23, 22), (8, 7, 12, 17, 18, 23, 24), (8, 7, 12, 17, 22, 21, 16), (8, 7, 12, 17, 22, 21, 20), (8, 7, 12, 17, 22, 23, 18), (8, 7, 12, 17, 22, 23, 24), (8, 9, 4, 3, 2, 1, 0), (8, 9, 4, 3, 2, 1, 6), (8, 9, 4, 3, 2, 7, 6), (8, 9, 4, 3, 2, 7, 12), (8, 9, 14, 13, 12, 7, 2), (8, 9, 14, 13, 12, 7, 6), (8, 9, 14, 13, 12, 11, 6), (8, 9, 14, 13, 12, 11, 10), (8, 9, 14, 13, 12, 11, 16), (8, 9, 14, 13, 12, 17, 16), (8, 9, 14, 13, 12, 17, 18), (8, 9, 14, 13, 12, 17, 22), (8, 9, 14, 13, 18, 17, 12), (8, 9, 14, 13, 18, 17, 16), (8, 9, 14, 13, 18, 17, 22), (8, 9, 14, 13, 18, 19, 24), (8, 9, 14, 13, 18, 23, 22), (8, 9, 14, 13, 18, 23, 24), (8, 9, 14, 19, 18, 13, 12), (8, 9, 14, 19, 18, 17, 12), (8, 9, 14, 19, 18, 17, 16), (8, 9, 14, 19, 18, 17, 22), (8, 9, 14, 19, 18, 23, 22), (8, 9, 14, 19, 18, 23, 24), (8, 9, 14, 19, 24, 23, 18), (8, 9, 14, 19, 24, 23, 22), (8, 13, 12, 7, 2, 1, 0), (8, 13, 12, 7, 2, 1, 6), (8, 13, 12, 7, 2, 3, 4), (8, 13, 12, 7, 6, 1, 0), (8, 13, 12, 7, 6, 1, 2), (8, 13, 12, 7, 6, 5, 0), (8, 13, 12, 7, 6, 5, 10), (8, 13, 12, 7, 6, 11, 10), (8, 13, 12, 7, 6, 11, 16), (8, 13, 12, 11, 6, 1, 0), (8, 13, 12, 11, 6, 1, 2), (8, 13, 12, 11, 6, 5, 0), (8, 13, 12, 11, 6, 5, 10), (8, 13, 12, 11, 6, 7, 2), (8, 13, 12, 11, 10, 5, 0), (8, 13, 12, 11, 10, 5, 6), (8, 13, 12, 11, 10, 15, 16), (8, 13, 12, 11, 10, 15, 20), (8, 13, 12, 11, 16, 15, 10), (8, 13, 12, 11, 16, 15, 20), (8, 13, 12, 11, 16, 17, 18), (8, 13, 12, 11, 16, 17, 22), (8, 13, 12, 11, 16, 21, 20), (8, 13, 12, 11, 16, 21, 22), (8, 13, 12, 17, 16, 11, 6), (8, 13, 12, 17, 16, 11, 10), (8, 13, 12, 17, 16, 15, 10), (8, 13, 12, 17, 16, 15, 20), (8, 13, 12, 17, 16, 21, 20), (8, 13, 12, 17, 16, 21, 22), (8, 13, 12, 17, 18, 19, 14), (8, 13, 12, 17, 18, 19, 24), (8, 13, 12, 17, 18, 23, 22), (8, 13, 12, 17, 18, 23, 24), (8, 13, 12, 17, 22, 21, 16), (8, 13, 12, 17, 22, 21, 20), (8, 13, 12, 17, 22, 23, 18), (8, 13, 12, 17, 22, 23, 24), (8, 13, 14, 9, 4, 3, 2), (8, 13, 14, 19, 18, 17, 12), (8, 13, 14, 19, 18, 17, 16), (8, 13, 14, 19, 18, 17, 22), (8, 13, 14, 19, 18, 23, 22), (8, 13, 14, 19, 18, 23, 24), (8, 13, 14, 19, 24, 23, 18), (8, 13, 14, 19, 24, 23, 22), (8, 13, 18, 17, 12, 7, 2), (8, 13, 18, 17, 12, 7, 6), (8, 13, 18, 17, 12, 11, 6), (8, 13, 18, 17, 12, 11, 10), (8, 13, 18, 17, 12, 11, 16), (8, 13, 18, 17, 16, 11, 6), (8, 13, 18, 17, 16, 11, 10), (8, 13, 18, 17, 16, 11, 12), (8, 13, 18, 17, 16, 15, 10), (8, 13, 18, 17, 16, 15, 20), (8, 13, 18, 17, 16, 21, 20), (8, 13, 18, 17, 16, 21, 22), (8, 13, 18, 17, 22, 21, 16), (8, 13, 18, 17, 22, 21, 20), (8, 13, 18, 17, 22, 23, 24), (8, 13, 18, 19, 14, 9, 4), (8, 13, 18, 19, 24, 23, 22), (8, 13, 18, 23, 22, 17, 12), (8, 13, 18, 23, 22, 17, 16), (8, 13, 18, 23, 22, 21, 16), (8, 13, 18, 23, 22, 21, 20), (8, 13, 18, 23, 24, 19, 14), (9, 4, 3, 2, 1, 0, 5), (9, 4, 3, 2, 1, 6, 5), (9, 4, 3, 2, 1, 6, 7), (9, 4, 3, 2, 1, 6, 11), (9, 4, 3, 2, 7, 6, 1), (9, 4, 3, 2, 7, 6, 5), (9, 4, 3, 2, 7, 6, 11), (9, 4, 3, 2, 7, 8, 13), (9, 4, 3, 2, 7, 12, 11), (9, 4, 3, 2, 7, 12, 13), (9, 4, 3, 2, 7, 12, 17), (9, 4, 3, 8, 7, 2, 1), (9, 4, 3, 8, 7, 6, 1), (9, 4, 3, 8, 7, 6, 5), (9, 4, 3, 8, 7, 6, 11), (9, 4, 3, 8, 7, 12, 11), (9, 4, 3, 8, 7, 12, 13), (9, 4, 3, 8, 7, 12, 17), (9, 4, 3, 8, 13, 12, 7), (9, 4, 3, 8, 13, 12, 11), (9, 4, 3, 8, 13, 12, 17), (9, 4, 3, 8, 13, 14, 19), (9, 4, 3, 8, 13, 18, 17), (9, 4, 3, 8, 13, 18, 19), (9, 4, 3, 8, 13, 18, 23), (9, 8, 3, 2, 1, 0, 5), (9, 8, 3, 2, 1, 6, 5), (9, 8, 3, 2, 1, 6, 7), (9, 8, 3, 2, 1, 6, 11), (9, 8, 3, 2, 7, 6, 1), (9, 8, 3, 2, 7, 6, 5), (9, 8, 3, 2, 7, 6, 11), (9, 8, 3, 2, 7, 12, 11), (9, 8, 3, 2, 7, 12, 13), (9, 8, 3, 2, 7, 12, 17), (9, 8, 7, 2, 1, 0, 5), (9, 8, 7, 2, 1, 6, 5), (9, 8, 7, 2, 1, 6, 11), (9, 8, 7, 6, 1, 0, 5), (9, 8, 7, 6, 1, 2, 3), (9, 8, 7, 6, 5, 0, 1), (9, 8, 7, 6, 5, 10, 11), (9, 8, 7, 6, 5, 10, 15), (9, 8, 7, 6, 11, 10, 5), (9, 8, 7, 6, 11, 10, 15), (9, 8, 7, 6, 11, 12, 13), (9, 8, 7, 6, 11, 12, 17), (9, 8, 7, 6, 11, 16, 15), (9, 8, 7, 6, 11, 16, 17), (9, 8, 7, 6, 11, 16, 21), (9, 8, 7, 12, 11, 6, 1), (9, 8, 7, 12, 11, 6, 5), (9, 8, 7, 12, 11, 10, 5), (9, 8, 7, 12, 11, 10, 15), (9, 8, 7, 12, 11, 16, 15), (9, 8, 7, 12, 11, 16, 17), (9, 8, 7, 12, 11, 16, 21), (9, 8, 7, 12, 13, 14, 19), (9, 8, 7, 12, 13, 18, 17), (9, 8, 7, 12, 13, 18, 19), (9, 8, 7, 12, 13, 18, 23), (9, 8, 7, 12, 17, 16, 11), (9, 8, 7, 12, 17, 16, 15), (9, 8, 7, 12, 17, 16, 21), (9, 8, 7, 12, 17, 18, 13), (9, 8, 7, 12, 17, 18, 19), (9, 8, 7, 12, 17, 18, 23), (9, 8, 7, 12, 17, 22, 21), (9, 8, 7, 12, 17, 22, 23), (9, 8, 13, 12, 7, 2, 1), (9, 8, 13, 12, 7, 2, 3), (9, 8, 13, 12, 7, 6, 1), (9, 8, 13, 12, 7, 6, 5), (9, 8, 13, 12, 7, 6, 11), (9, 8, 13, 12, 11, 6, 1), (9, 8, 13, 12, 11, 6, 5), (9, 8, 13, 12, 11, 6, 7), (9, 8, 13, 12, 11, 10, 5), (9, 8, 13, 12, 11, 10, 15), (9, 8, 13, 12, 11, 16, 15), (9, 8, 13, 12, 11, 16, 17), (9, 8, 13, 12, 11, 16, 21), (9, 8, 13, 12, 17, 16, 11), (9, 8, 13, 12, 17, 16, 15), (9, 8, 13, 12, 17, 16, 21), (9, 8, 13, 12, 17, 18, 19), (9, 8, 13, 12, 17, 18, 23), (9, 8, 13, 12, 17, 22, 21), (9, 8, 13, 12, 17, 22, 23), (9, 8, 13, 14, 19, 18, 17), (9, 8, 13, 14, 19, 18, 23), (9, 8, 13, 14, 19, 24, 23), (9, 8, 13, 18, 17, 12, 7), (9, 8, 13, 18, 17, 12, 11), (9, 8, 13, 18, 17, 16, 11), (9, 8, 13, 18, 17, 16, 15), (9, 8, 13, 18, 17, 16, 21), (9, 8, 13, 18, 17, 22, 21), (9, 8, 13, 18, 17, 22, 23), (9, 8, 13, 18, 19, 24, 23), (9, 8, 13, 18, 23, 22, 17), (9, 8, 13, 18, 23, 22, 21), (9, 8, 13, 18, 23, 24, 19), (9, 14, 13, 8, 3, 2, 1), (9, 14, 13, 8, 3, 2, 7), (9, 14, 13, 8, 7, 2, 1), (9, 14, 13, 8, 7, 2, 3), (9, 14, 13, 8, 7, 6, 1), (9, 14, 13, 8, 7, 6, 5), (9, 14, 13, 8, 7, 6, 11), (9, 14, 13, 8, 7, 12, 11), (9, 14, 13, 8, 7, 12, 17), (9, 14, 13, 12, 7, 2, 1), (9, 14, 13, 12, 7, 2, 3), (9, 14, 13, 12, 7, 6, 1), (9, 14, 13, 12, 7, 6, 5), (9, 14, 13, 12, 7, 6, 11), (9, 14, 13, 12, 7, 8, 3), (9, 14, 13, 12, 11, 6, 1), (9, 14, 13, 12, 11, 6, 5), (9, 14, 13, 12, 11, 6, 7), (9, 14, 13, 12, 11, 10, 5), (9, 14, 13, 12, 11, 10, 15), (9, 14, 13, 12, 11, 16, 15), (9, 14, 13, 12, 11, 16, 17), (9, 14, 13, 12, 11, 16, 21), (9, 14, 13, 12, 17, 16, 11), (9, 14, 13, 12, 17, 16, 15), (9, 14, 13, 12, 17, 16, 21), (9, 14, 13, 12, 17, 18, 19), (9, 14, 13, 12, 17, 18, 23), (9, 14, 13, 12, 17, 22, 21), (9, 14, 13, 12, 17, 22, 23), (9, 14, 13, 18, 17, 12, 7), (9, 14, 13, 18, 17, 12, 11), (9, 14, 13, 18, 17, 16, 11), (9, 14, 13, 18, 17, 16, 15), (9, 14, 13, 18, 17, 16, 21), (9, 14, 13, 18, 17, 22, 21), (9, 14, 13, 18, 17, 22, 23), (9, 14, 13, 18, 19, 24, 23), (9, 14, 13, 18, 23, 22, 17), (9, 14, 13, 18, 23, 22, 21), (9, 14, 13, 18, 23, 24, 19), (9, 14, 19, 18, 13, 8, 3), (9, 14, 19, 18, 13, 8, 7), (9, 14, 19, 18, 13, 12, 7), (9, 14, 19, 18, 13, 12, 11), (9, 14, 19, 18, 13, 12, 17), (9, 14, 19, 18, 17, 12, 7), (9, 14, 19, 18, 17, 12, 11), (9, 14, 19, 18, 17, 12, 13), (9, 14, 19, 18, 17, 16, 11), (9, 14, 19, 18, 17, 16, 15), (9, 14, 19, 18, 17, 16, 21), (9, 14, 19, 18, 17, 22, 21), (9, 14, 19, 18, 17, 22, 23), (9, 14, 19, 18, 23, 22, 17), (9, 14, 19, 18, 23, 22, 21), (9, 14, 19, 24, 23, 18, 13), (9, 14, 19, 24, 23, 18, 17), (9, 14, 19, 24, 23, 22, 17), (9, 14, 19, 24, 23, 22, 21), (10, 5, 0, 1, 2, 3, 4), (10, 5, 0, 1, 2, 3, 8), (10, 5, 0, 1, 2, 7, 6), (10, 5, 0, 1, 2, 7, 8), (10, 5, 0, 1, 2, 7, 12), (10, 5, 0, 1, 6, 7, 2), (10, 5, 0, 1, 6, 7, 8), (10, 5, 0, 1, 6, 7, 12), (10, 5, 0, 1, 6, 11, 12), (10, 5, 0, 1, 6, 11, 16), (10, 5, 6, 1, 2, 3, 4), (10, 5, 6, 1, 2, 3, 8), (10, 5, 6, 1, 2, 7, 8), (10, 5, 6, 1, 2, 7, 12), (10, 5, 6, 7, 2, 1, 0), (10, 5, 6, 7, 2, 3, 4), (10, 5, 6, 7, 2, 3, 8), (10, 5, 6, 7, 8, 3, 2), (10, 5, 6, 7, 8, 3, 4), (10, 5, 6, 7, 8, 9, 4), (10, 5, 6, 7, 8, 9, 14), (10, 5, 6, 7, 8, 13, 12), (10, 5, 6, 7, 8, 13, 14), (10, 5, 6, 7, 8, 13, 18), (10, 5, 6, 7, 12, 11, 16), (10, 5, 6, 7, 12, 13, 8), (10, 5, 6, 7, 12, 13, 14), (10, 5, 6, 7, 12, 13, 18), (10, 5, 6, 7, 12, 17, 16), (10, 5, 6, 7, 12, 17, 18), (10, 5, 6, 7, 12, 17, 22), (10, 5, 6, 11, 12, 7, 2), (10, 5, 6, 11, 12, 7, 8), (10, 5, 6, 11, 12, 13, 8), (10, 5, 6, 11, 12, 13, 14), (10, 5, 6, 11, 12, 13, 18), (10, 5, 6, 11, 12, 17, 16), (10, 5, 6, 11, 12, 17, 18), (10, 5, 6, 11, 12, 17, 22), (10, 5, 6, 11, 16, 15, 20), (10, 5, 6, 11, 16, 17, 12), (10, 5, 6, 11, 16, 17, 18), (10, 5, 6, 11, 16, 17, 22), (10, 5, 6, 11, 16, 21, 20), (10, 5, 6, 11, 16, 21, 22), (10, 11, 6, 1, 2, 3, 4), (10, 11, 6, 1, 2, 3, 8), (10, 11, 6, 1, 2, 7, 8), (10, 11, 6, 1, 2, 7, 12), (10, 11, 6, 5, 0, 1, 2), (10, 11, 6, 7, 2, 1, 0), (10, 11, 6, 7, 2, 3, 4), (10, 11, 6, 7, 2, 3, 8), (10, 11, 6, 7, 8, 3, 2), (10, 11, 6, 7, 8, 3, 4), (10, 11, 6, 7, 8, 9, 4), (10, 11, 6, 7, 8, 9, 14), (10, 11, 6, 7, 8, 13, 12), (10, 11, 6, 7, 8, 13, 14), (10, 11, 6, 7, 8, 13, 18), (10, 11, 6, 7, 12, 13, 8), (10, 11, 6, 7, 12, 13, 14), (10, 11, 6, 7, 12, 13, 18), (10, 11, 6, 7, 12, 17, 16), (10, 11, 6, 7, 12, 17, 18), (10, 11, 6, 7, 12, 17, 22), (10, 11, 12, 7, 2, 1, 0), (10, 11, 12, 7, 2, 1, 6), (10, 11, 12, 7, 2, 3, 4), (10, 11, 12, 7, 2, 3, 8), (10, 11, 12, 7, 6, 1, 0), (10, 11, 12, 7, 6, 1, 2), (10, 11, 12, 7, 6, 5, 0), (10, 11, 12, 7, 8, 3, 2), (10, 11, 12, 7, 8, 3, 4), (10, 11, 12, 7, 8, 9, 4), (10, 11, 12, 7, 8, 9, 14), (10, 11, 12, 7, 8, 13, 14), (10, 11, 12, 7, 8, 13, 18), (10, 11, 12, 13, 8, 3, 2), (10, 11, 12, 13, 8, 3, 4), (10, 11, 12, 13, 8, 7, 2), (10, 11, 12, 13, 8, 7, 6), (10, 11, 12, 13, 8, 9, 4), (10, 11, 12, 13, 8, 9, 14), (10, 11, 12, 13, 14, 9, 4), (10, 11, 12, 13, 14, 9, 8), (10, 11, 12, 13, 14, 19, 18), (10, 11, 12, 13, 14, 19, 24), (10, 11, 12, 13, 18, 17, 16), (10, 11, 12, 13, 18, 17, 22), (10, 11, 12, 13, 18, 19, 14), (10, 11, 12, 13, 18, 19, 24), (10, 11, 12, 13, 18, 23, 22), (10, 11, 12, 13, 18, 23, 24), (10, 11, 12, 17, 16, 15, 20), (10, 11, 12, 17, 16, 21, 20), (10, 11, 12, 17, 16, 21, 22), (10, 11, 12, 17, 18, 13, 8), (10, 11, 12, 17, 18, 13, 14), (10, 11, 12, 17, 18, 19, 14), (10, 11, 12, 17, 18, 19, 24), (10, 11, 12, 17, 18, 23, 22), (10, 11, 12, 17, 18, 23, 24), (10, 11, 12, 17, 22, 21, 16), (10, 11, 12, 17, 22, 21, 20), (10, 11, 12, 17, 22, 23, 18), (10, 11, 12, 17, 22, 23, 24), (10, 11, 16, 15, 20, 21, 22), (10, 11, 16, 17, 12, 7, 2), (10, 11, 16, 17, 12, 7, 6), (10, 11, 16, 17, 12, 7, 8), (10, 11, 16, 17, 12, 13, 8), (10, 11, 16, 17, 12, 13, 14), (10, 11, 16, 17, 12, 13, 18), (10, 11, 16, 17, 18, 13, 8), (10, 11, 16, 17, 18, 13, 12), (10, 11, 16, 17, 18, 13, 14), (10, 11, 16, 17, 18, 19, 14), (10, 11, 16, 17, 18, 19, 24), (10, 11, 16, 17, 18, 23, 22), (10, 11, 16, 17, 18, 23, 24), (10, 11, 16, 17, 22, 21, 20), (10, 11, 16, 17, 22, 23, 18), (10, 11, 16, 17, 22, 23, 24), (10, 11, 16, 21, 22, 17, 12), (10, 11, 16, 21, 22, 17, 18), (10, 11, 16, 21, 22, 23, 18), (10, 11, 16, 21, 22, 23, 24), (10, 15, 16, 11, 6, 1, 0), (10, 15, 16, 11, 6, 1, 2), (10, 15, 16, 11, 6, 5, 0), (10, 15, 16, 11, 6, 7, 2), (10, 15, 16, 11, 6, 7, 8), (10, 15, 16, 11, 6, 7, 12), (10, 15, 16, 11, 12, 7, 2), (10, 15, 16, 11, 12, 7, 6), (10, 15, 16, 11, 12, 7, 8), (10, 15, 16, 11, 12, 13, 8), (10, 15, 16, 11, 12, 13, 14), (10, 15, 16, 11, 12, 13, 18), (10, 15, 16, 11, 12, 17, 18), (10, 15, 16, 11, 12, 17, 22), (10, 15, 16, 17, 12, 7, 2), (10, 15, 16, 17, 12, 7, 6), (10, 15, 16, 17, 12, 7, 8), (10, 15, 16, 17, 12, 11, 6), (10, 15, 16, 17, 12, 13, 8), (10, 15, 16, 17, 12, 13, 14), (10, 15, 16, 17, 12, 13, 18), (10, 15, 16, 17, 18, 13, 8), (10, 15, 16, 17, 18, 13, 12), (10, 15, 16, 17, 18, 13, 14), (10, 15, 16, 17, 18, 19, 14), (10, 15, 16, 17, 18, 19, 24), (10, 15, 16, 17, 18, 23, 22), (10, 15, 16, 17, 18, 23, 24), (10, 15, 16, 17, 22, 21, 20), (10, 15, 16, 17, 22, 23, 18), (10, 15, 16, 17, 22, 23, 24), (10, 15, 16, 21, 22, 17, 12), (10, 15, 16, 21, 22, 17, 18), (10, 15, 16, 21, 22, 23, 18), (10, 15, 16, 21, 22, 23, 24), (10, 15, 20, 21, 16, 11, 6), (10, 15, 20, 21, 16, 11, 12), (10, 15, 20, 21, 16, 17, 12), (10, 15, 20, 21, 16, 17, 18), (10, 15, 20, 21, 16, 17, 22), (10, 15, 20, 21, 22, 17, 12), (10, 15, 20, 21, 22, 17, 16), (10, 15, 20, 21, 22, 17, 18), (10, 15, 20, 21, 22, 23, 18), (10, 15, 20, 21, 22, 23, 24), (11, 6, 1, 0, 5, 10, 15), (11, 6, 1, 2, 3, 4, 9), (11, 6, 1, 2, 3, 8, 7), (11, 6, 1, 2, 3, 8, 9), (11, 6, 1, 2, 3, 8, 13), (11, 6, 1, 2, 7, 8, 3), (11, 6, 1, 2, 7, 8, 9), (11, 6, 1, 2, 7, 8, 13), (11, 6, 1, 2, 7, 12, 13), (11, 6, 1, 2, 7, 12, 17), (11, 6, 5, 0, 1, 2, 3), (11, 6, 5, 0, 1, 2, 7), (11, 6, 5, 10, 15, 16, 17), (11, 6, 5, 10, 15, 16, 21), (11, 6, 5, 10, 15, 20, 21), (11, 6, 7, 2, 1, 0, 5), (11, 6, 7, 2, 3, 4, 9), (11, 6, 7, 2, 3, 8, 9), (11, 6, 7, 2, 3, 8, 13), (11, 6, 7, 8, 3, 2, 1), (11, 6, 7, 8, 3, 4, 9), (11, 6, 7, 8, 9, 4, 3), (11, 6, 7, 8, 9, 14, 13), (11, 6, 7, 8, 9, 14, 19), (11, 6, 7, 8, 13, 12, 17), (11, 6, 7, 8, 13, 14, 9), (11, 6, 7, 8, 13, 14, 19), (11, 6, 7, 8, 13, 18, 17), (11, 6, 7, 8, 13, 18, 19), (11, 6, 7, 8, 13, 18, 23), (11, 6, 7, 12, 13, 8, 3), (11, 6, 7, 12, 13, 8, 9), (11, 6, 7, 12, 13, 14, 9), (11, 6, 7, 12, 13, 14, 19), (11, 6, 7, 12, 13, 18, 17), (11, 6, 7, 12, 13, 18, 19), (11, 6, 7, 12, 13, 18, 23), (11, 6, 7, 12, 17, 16, 15), (11, 6, 7, 12, 17, 16, 21), (11, 6, 7, 12, 17, 18, 13), (11, 6, 7, 12, 17, 18, 19), (11, 6, 7, 12, 17, 18, 23), (11, 6, 7, 12, 17, 22, 21), (11, 6, 7, 12, 17, 22, 23), (11, 10, 5, 0, 1, 2, 3), (11, 10, 5, 0, 1, 2, 7), (11, 10, 5, 0, 1, 6, 7), (11, 10, 5, 6, 1, 2, 3), (11, 10, 5, 6, 1, 2, 7), (11, 10, 5, 6, 7, 2, 1), (11, 10, 5, 6, 7, 2, 3), (11, 10, 5, 6, 7, 8, 3), (11, 10, 5, 6, 7, 8, 9), (11, 10, 5, 6, 7, 8, 13), (11, 10, 5, 6, 7, 12, 13), (11, 10, 5, 6, 7, 12, 17), (11, 10, 15, 16, 17, 12, 7), (11, 10, 15, 16, 17, 12, 13), (11, 10, 15, 16, 17, 18, 13), (11, 10, 15, 16, 17, 18, 19), (11, 10, 15, 16, 17, 18, 23), (11, 10, 15, 16, 17, 22, 21), (11, 10, 15, 16, 17, 22, 23), (11, 10, 15, 16, 21, 22, 17), (11, 10, 15, 16, 21, 22, 23), (11, 10, 15, 20, 21, 16, 17), (11, 10, 15, 20, 21, 22, 17), (11, 10, 15, 20, 21, 22, 23), (11, 12, 7, 2, 1, 0, 5), (11, 12, 7, 2, 1, 6, 5), (11, 12, 7, 2, 3, 4, 9), (11, 12, 7, 2, 3, 8, 9), (11, 12, 7, 2, 3, 8, 13), (11, 12, 7, 6, 1, 0, 5), (11, 12, 7, 6, 1, 2, 3), (11, 12, 7, 6, 5, 0, 1), (11, 12, 7, 6, 5, 10, 15), (11, 12, 7, 8, 3, 2, 1), (11, 12, 7, 8, 3, 4, 9), (11, 12, 7, 8, 9, 4, 3), (11, 12, 7, 8, 9, 14, 13), (11, 12, 7, 8, 9, 14, 19), (11, 12, 7, 8, 13, 14, 9), (11, 12, 7, 8, 13, 14, 19), (11, 12, 7, 8, 13, 18, 17), (11, 12, 7, 8, 13, 18, 19), (11, 12, 7, 8, 13, 18, 23), (11, 12, 13, 8, 3, 2, 1), (11, 12, 13, 8, 3, 2, 7), (11, 12, 13, 8, 3, 4, 9), (11, 12, 13, 8, 7, 2, 1), (11, 12, 13, 8, 7, 2, 3), (11, 12, 13, 8, 7, 6, 1), (11, 12, 13, 8, 7, 6, 5), (11, 12, 13, 8, 9, 4, 3), (11, 12, 13, 8, 9, 14, 19), (11, 12, 13, 14, 9, 4, 3), (11, 12, 13, 14, 9, 8, 3), (11, 12, 13, 14, 9, 8, 7), (11, 12, 13, 14, 19, 18, 17), (11, 12, 13, 14, 19, 18, 23), (11, 12, 13, 14, 19, 24, 23), (11, 12, 13, 18, 17, 16, 15), (11, 12, 13, 18, 17, 16, 21), (11, 12, 13, 18, 17, 22, 21), (11, 12, 13, 18, 17, 22, 23), (11, 12, 13, 18, 19, 14, 9), (11, 12, 13, 18, 19, 24, 23), (11, 12, 13, 18, 23, 22, 17), (11, 12, 13, 18, 23, 22, 21), (11, 12, 13, 18, 23, 24, 19), (11, 12, 17, 16, 15, 10, 5), (11, 12, 17, 16, 15, 20, 21), (11, 12, 17, 16, 21, 20, 15), (11, 12, 17, 16, 21, 22, 23), (11, 12, 17, 18, 13, 8, 3), (11, 12, 17, 18, 13, 8, 7), (11, 12, 17, 18, 13, 8, 9), (11, 12, 17, 18, 13, 14, 9), (11, 12, 17, 18, 13, 14, 19), (11, 12, 17, 18, 19, 14, 9), (11, 12, 17, 18, 19, 14, 13), (11, 12, 17, 18, 19, 24, 23), (11, 12, 17, 18, 23, 22, 21), (11, 12, 17, 18, 23, 24, 19), (11, 12, 17, 22, 21, 16, 15), (11, 12, 17, 22, 21, 20, 15), (11, 12, 17, 22, 23, 18, 13), (11, 12, 17, 22, 23, 18, 19), (11, 12, 17, 22, 23, 24, 19), (11, 16, 15, 10, 5, 0, 1), (11, 16, 15, 10, 5, 6, 1), (11, 16, 15, 10, 5, 6, 7), (11, 16, 15, 20, 21, 22, 17), (11, 16, 15, 20, 21, 22, 23), (11, 16, 17, 12, 7, 2, 1), (11, 16, 17, 12, 7, 2, 3), (11, 16, 17, 12, 7, 6, 1), (11, 16, 17, 12, 7, 6, 5), (11, 16, 17, 12, 7, 8, 3), (11, 16, 17, 12, 7, 8, 9), (11, 16, 17, 12, 7, 8, 13), (11, 16, 17, 12, 13, 8, 3), (11, 16, 17, 12, 13, 8, 7), (11, 16, 17, 12, 13, 8, 9), (11, 16, 17, 12, 13, 14, 9), (11, 16, 17, 12, 13, 14, 19), (11, 16, 17, 12, 13, 18, 19), (11, 16, 17, 12, 13, 18, 23), (11, 16, 17, 18, 13, 8, 3), (11, 16, 17, 18, 13, 8, 7), (11, 16, 17, 18, 13, 8, 9), (11, 16, 17, 18, 13, 12, 7), (11, 16, 17, 18, 13, 14, 9), (11, 16, 17, 18, 13, 14, 19), (11, 16, 17, 18, 19, 14, 9), (11, 16, 17, 18, 19, 14, 13), (11, 16, 17, 18, 19, 24, 23), (11, 16, 17, 18, 23, 22, 21), (11, 16, 17, 18, 23, 24, 19), (11, 16, 17, 22, 21, 20, 15), (11, 16, 17, 22, 23, 18, 13), (11, 16, 17, 22, 23, 18, 19), (11, 16, 17, 22, 23, 24, 19), (11, 16, 21, 20, 15, 10, 5), (11, 16, 21, 22, 17, 12, 7), (11, 16, 21, 22, 17, 12, 13), (11, 16, 21, 22, 17, 18, 13), (11, 16, 21, 22, 17, 18, 19), (11, 16, 21, 22, 17, 18, 23), (11, 16, 21, 22, 23, 18, 13), (11, 16, 21, 22, 23, 18, 17), (11, 16, 21, 22, 23, 18, 19), (11, 16, 21, 22, 23, 24, 19), (12, 7, 2, 1, 0, 5, 6), (12, 7, 2, 1, 0, 5, 10), (12, 7, 2, 1, 6, 5, 0), (12, 7, 2, 1, 6, 5, 10), (12, 7, 2, 1, 6, 11, 10), (12, 7, 2, 1, 6, 11, 16), (12, 7, 2, 3, 4, 9, 8), (12, 7, 2, 3, 4, 9, 14), (12, 7, 2, 3, 8, 9, 4), (12, 7, 2, 3, 8, 9, 14), (12, 7, 2, 3, 8, 13, 14), (12, 7, 2, 3, 8, 13, 18), (12, 7, 6, 1, 0, 5, 10), (12, 7, 6, 1, 2, 3, 4), (12, 7, 6, 1, 2, 3, 8), (12, 7, 6, 5, 0, 1, 2), (12, 7, 6, 5, 10, 11, 16), (12, 7, 6, 5, 10, 15, 16), (12, 7, 6, 5, 10, 15, 20), (12, 7, 6, 11, 10, 5, 0), (12, 7, 6, 11, 10, 15, 16), (12, 7, 6, 11, 10, 15, 20), (12, 7, 6, 11, 16, 15, 10), (12, 7, 6, 11, 16, 15, 20), (12, 7, 6, 11, 16, 17, 18), (12, 7, 6, 11, 16, 17, 22), (12, 7, 6, 11, 16, 21, 20), (12, 7, 6, 11, 16, 21, 22), (12, 7, 8, 3, 2, 1, 0), (12, 7, 8, 3, 2, 1, 6), (12, 7, 8, 3, 4, 9, 14), (12, 7, 8, 9, 4, 3, 2), (12, 7, 8, 9, 14, 13, 18), (12, 7, 8, 9, 14, 19, 18), (12, 7, 8, 9, 14, 19, 24), (12, 7, 8, 13, 14, 9, 4), (12, 7, 8, 13, 14, 19, 18), (12, 7, 8, 13, 14, 19, 24), (12, 7, 8, 13, 18, 17, 16), (12, 7, 8, 13, 18, 17, 22), (12, 7, 8, 13, 18, 19, 14), (12, 7, 8, 13, 18, 19, 24), (12, 7, 8, 13, 18, 23, 22), (12, 7, 8, 13, 18, 23, 24), (12, 11, 6, 1, 0, 5, 10), (12, 11, 6, 1, 2, 3, 4), (12, 11, 6, 1, 2, 3, 8), (12, 11, 6, 1, 2, 7, 8), (12, 11, 6, 5, 0, 1, 2), (12, 11, 6, 5, 10, 15, 16), (12, 11, 6, 5, 10, 15, 20), (12, 11, 6, 7, 2, 1, 0), (12, 11, 6, 7, 2, 3, 4), (12, 11, 6, 7, 2, 3, 8), (12, 11, 6, 7, 8, 3, 2), (12, 11, 6, 7, 8, 3, 4), (12, 11, 6, 7, 8, 9, 4), (12, 11, 6, 7, 8, 9, 14), (12, 11, 6, 7, 8, 13, 14), (12, 11, 6, 7, 8, 13, 18), (12, 11, 10, 5, 0, 1, 2), (12, 11, 10, 5, 0, 1, 6), (12, 11, 10, 5, 6, 1, 0), (12, 11, 10, 5, 6, 1, 2), (12, 11, 10, 5, 6, 7, 2), (12, 11, 10, 5, 6, 7, 8), (12, 11, 10, 15, 16, 17, 18), (12, 11, 10, 15, 16, 17, 22), (12, 11, 10, 15, 16, 21, 20), (12, 11, 10, 15, 16, 21, 22), (12, 11, 10, 15, 20, 21, 16), (12, 11, 10, 15, 20, 21, 22), (12, 11, 16, 15, 10, 5, 0), (12, 11, 16, 15, 10, 5, 6), (12, 11, 16, 15, 20, 21, 22), (12, 11, 16, 17, 18, 13, 8), (12, 11, 16, 17, 18, 13, 14), (12, 11, 16, 17, 18, 19, 14), (12, 11, 16, 17, 18, 19, 24), (12, 11, 16, 17, 18, 23, 22), (12, 11, 16, 17, 18, 23, 24), (12, 11, 16, 17, 22, 21, 20), (12, 11, 16, 17, 22, 23, 18), (12, 11, 16, 17, 22, 23, 24), (12, 11, 16, 21, 20, 15, 10), (12, 11, 16, 21, 22, 17, 18), (12, 11, 16, 21, 22, 23, 18), (12, 11, 16, 21, 22, 23, 24), (12, 13, 8, 3, 2, 1, 0), (12, 13, 8, 3, 2, 1, 6), (12, 13, 8, 3, 2, 7, 6), (12, 13, 8, 3, 4, 9, 14), (12, 13, 8, 7, 2, 1, 0), (12, 13, 8, 7, 2, 1, 6), (12, 13, 8, 7, 2, 3, 4), (12, 13, 8, 7, 6, 1, 0), (12, 13, 8, 7, 6, 1, 2), (12, 13, 8, 7, 6, 5, 0), (12, 13, 8, 7, 6, 5, 10), (12, 13, 8, 7, 6, 11, 10), (12, 13, 8, 7, 6, 11, 16), (12, 13, 8, 9, 4, 3, 2), (12, 13, 8, 9, 14, 19, 18), (12, 13, 8, 9, 14, 19, 24), (12, 13, 14, 9, 4, 3, 2), (12, 13, 14, 9, 4, 3, 8), (12, 13, 14, 9, 8, 3, 2), (12, 13, 14, 9, 8, 3, 4), (12, 13, 14, 9, 8, 7, 2), (12, 13, 14, 9, 8, 7, 6), (12, 13, 14, 19, 18, 17, 16), (12, 13, 14, 19, 18, 17, 22), (12, 13, 14, 19, 18, 23, 22), (12, 13, 14, 19, 18, 23, 24), (12, 13, 14, 19, 24, 23, 18), (12, 13, 14, 19, 24, 23, 22), (12, 13, 18, 17, 16, 11, 6), (12, 13, 18, 17, 16, 11, 10), (12, 13, 18, 17, 16, 15, 10), (12, 13, 18, 17, 16, 15, 20), (12, 13, 18, 17, 16, 21, 20), (12, 13, 18, 17, 16, 21, 22), (12, 13, 18, 17, 22, 21, 16), (12, 13, 18, 17, 22, 21, 20), (12, 13, 18, 17, 22, 23, 24), (12, 13, 18, 19, 14, 9, 4), (12, 13, 18, 19, 14, 9, 8), (12, 13, 18, 19, 24, 23, 22), (12, 13, 18, 23, 22, 17, 16), (12, 13, 18, 23, 22, 21, 16), (12, 13, 18, 23, 22, 21, 20), (12, 13, 18, 23, 24, 19, 14), (12, 17, 16, 11, 6, 1, 0), (12, 17, 16, 11, 6, 1, 2), (12, 17, 16, 11, 6, 5, 0), (12, 17, 16, 11, 6, 5, 10), (12, 17, 16, 11, 6, 7, 2), (12, 17, 16, 11, 6, 7, 8), (12, 17, 16, 11, 10, 5, 0), (12, 17, 16, 11, 10, 5, 6), (12, 17, 16, 11, 10, 15, 20), (12, 17, 16, 15, 10, 5, 0), (12, 17, 16, 15, 10, 5, 6), (12, 17, 16, 15, 10, 11, 6), (12, 17, 16, 15, 20, 21, 22), (12, 17, 16, 21, 20, 15, 10), (12, 17, 16, 21, 22, 23, 18), (12, 17, 16, 21, 22, 23, 24), (12, 17, 18, 13, 8, 3, 2), (12, 17, 18, 13, 8, 3, 4), (12, 17, 18, 13, 8, 7, 2), (12, 17, 18, 13, 8, 7, 6), (12, 17, 18, 13, 8, 9, 4), (12, 17, 18, 13, 8, 9, 14), (12, 17, 18, 13, 14, 9, 4), (12, 17, 18, 13, 14, 9, 8), (12, 17, 18, 13, 14, 19, 24), (12, 17, 18, 19, 14, 9, 4), (12, 17, 18, 19, 14, 9, 8), (12, 17, 18, 19, 14, 13, 8), (12, 17, 18, 19, 24, 23, 22), (12, 17, 18, 23, 22, 21, 16), (12, 17, 18, 23, 22, 21, 20), (12, 17, 18, 23, 24, 19, 14), (12, 17, 22, 21, 16, 11, 6), (12, 17, 22, 21, 16, 11, 10), (12, 17, 22, 21, 16, 15, 10), (12, 17, 22, 21, 16, 15, 20), (12, 17, 22, 21, 20, 15, 10), (12, 17, 22, 21, 20, 15, 16), (12, 17, 22, 23, 18, 13, 8), (12, 17, 22, 23, 18, 13, 14), (12, 17, 22, 23, 18, 19, 14), (12, 17, 22, 23, 18, 19, 24), (12, 17, 22, 23, 24, 19, 14), (12, 17, 22, 23, 24, 19, 18), (13, 8, 3, 2, 1, 0, 5), (13, 8, 3, 2, 1, 6, 5), (13, 8, 3, 2, 1, 6, 7), (13, 8, 3, 2, 1, 6, 11), (13, 8, 3, 2, 7, 6, 1), (13, 8, 3, 2, 7, 6, 5), (13, 8, 3, 2, 7, 6, 11), (13, 8, 3, 2, 7, 12, 11), (13, 8, 3, 2, 7, 12, 17), (13, 8, 3, 4, 9, 14, 19), (13, 8, 7, 2, 1, 0, 5), (13, 8, 7, 2, 1, 6, 5), (13, 8, 7, 2, 1, 6, 11), (13, 8, 7, 2, 3, 4, 9), (13, 8, 7, 6, 1, 0, 5), (13, 8, 7, 6, 1, 2, 3), (13, 8, 7, 6, 5, 0, 1), (13, 8, 7, 6, 5, 10, 11), (13, 8, 7, 6, 5, 10, 15), (13, 8, 7, 6, 11, 10, 5), (13, 8, 7, 6, 11, 10, 15), (13, 8, 7, 6, 11, 12, 17), (13, 8, 7, 6, 11, 16, 15), (13, 8, 7, 6, 11, 16, 17), (13, 8, 7, 6, 11, 16, 21), (13, 8, 7, 12, 11, 6, 1), (13, 8, 7, 12, 11, 6, 5), (13, 8, 7, 12, 11, 10, 5), (13, 8, 7, 12, 11, 10, 15), (13, 8, 7, 12, 11, 16, 15), (13, 8, 7, 12, 11, 16, 17), (13, 8, 7, 12, 11, 16, 21), (13, 8, 7, 12, 17, 16, 11), (13, 8, 7, 12, 17, 16, 15), (13, 8, 7, 12, 17, 16, 21), (13, 8, 7, 12, 17, 18, 19), (13, 8, 7, 12, 17, 18, 23), (13, 8, 7, 12, 17, 22, 21), (13, 8, 7, 12, 17, 22, 23), (13, 8, 9, 4, 3, 2, 1), (13, 8, 9, 4, 3, 2, 7), (13, 8, 9, 14, 19, 18, 17), (13, 8, 9, 14, 19, 18, 23), (13, 8, 9, 14, 19, 24, 23), (13, 12, 7, 2, 1, 0, 5), (13, 12, 7, 2, 1, 6, 5), (13, 12, 7, 2, 1, 6, 11), (13, 12, 7, 2, 3, 4, 9), (13, 12, 7, 2, 3, 8, 9), (13, 12, 7, 6, 1, 0, 5), (13, 12, 7, 6, 1, 2, 3), (13, 12, 7, 6, 5, 0, 1), (13, 12, 7, 6, 5, 10, 11), (13, 12, 7, 6, 5, 10, 15), (13, 12, 7, 6, 11, 10, 5), (13, 12, 7, 6, 11, 10, 15), (13, 12, 7, 6, 11, 16, 15), (13, 12, 7, 6, 11, 16, 17), (13, 12, 7, 6, 11, 16, 21), (13, 12, 7, 8, 3, 2, 1), (13, 12, 7, 8, 3, 4, 9), (13, 12, 7, 8, 9, 4, 3), (13, 12, 7, 8, 9, 14, 19), (13, 12, 11, 6, 1, 0, 5), (13, 12, 11, 6, 1, 2, 3), (13, 12, 11, 6, 1, 2, 7), (13, 12, 11, 6, 5, 0, 1), (13, 12, 11, 6, 5, 10, 15), (13, 12, 11, 6, 7, 2, 1), (13, 12, 11, 6, 7, 2, 3), (13, 12, 11, 6, 7, 8, 3), (13, 12, 11, 6, 7, 8, 9), (13, 12, 11, 10, 5, 0, 1), (13, 12, 11, 10, 5, 6, 1), (13, 12, 11, 10, 5, 6, 7), (13, 12, 11, 10, 15, 16, 17), (13, 12, 11, 10, 15, 16, 21), (13, 12, 11, 10, 15, 20, 21), (13, 12, 11, 16, 15, 10, 5), (13, 12, 11, 16, 15, 20, 21), (13, 12, 11, 16, 17, 18, 19), (13, 12, 11, 16, 17, 18, 23), (13, 12, 11, 16, 17, 22, 21), (13, 12, 11, 16, 17, 22, 23), (13, 12, 11, 16, 21, 20, 15), (13, 12, 11, 16, 21, 22, 17), (13, 12, 11, 16, 21, 22, 23), (13, 12, 17, 16, 11, 6, 1), (13, 12, 17, 16, 11, 6, 5), (13, 12, 17, 16, 11, 6, 7), (13, 12, 17, 16, 11, 10, 5), (13, 12, 17, 16, 11, 10, 15), (13, 12, 17, 16, 15, 10, 5), (13, 12, 17, 16, 15, 10, 11), (13, 12, 17, 16, 15, 20, 21), (13, 12, 17, 16, 21, 20, 15), (13, 12, 17, 16, 21, 22, 23), (13, 12, 17, 18, 19, 14, 9), (13, 12, 17, 18, 19, 24, 23), (13, 12, 17, 18, 23, 22, 21), (13, 12, 17, 18, 23, 24, 19), (13, 12, 17, 22, 21, 16, 11), (13, 12, 17, 22, 21, 16, 15), (13, 12, 17, 22, 21, 20, 15), (13, 12, 17, 22, 23, 18, 19), (13, 12, 17, 22, 23, 24, 19), (13, 14, 9, 4, 3, 2, 1), (13, 14, 9, 4, 3, 2, 7), (13, 14, 9, 4, 3, 8, 7), (13, 14, 9, 8, 3, 2, 1), (13, 14, 9, 8, 3, 2, 7), (13, 14, 9, 8, 7, 2, 1), (13, 14, 9, 8, 7, 2, 3), (13, 14, 9, 8, 7, 6, 1), (13, 14, 9, 8, 7, 6, 5), (13, 14, 9, 8, 7, 6, 11), (13, 14, 9, 8, 7, 12, 11), (13, 14, 9, 8, 7, 12, 17), (13, 14, 19, 18, 17, 12, 7), (13, 14, 19, 18, 17, 12, 11), (13, 14, 19, 18, 17, 16, 11), (13, 14, 19, 18, 17, 16, 15), (13, 14, 19, 18, 17, 16, 21), (13, 14, 19, 18, 17, 22, 21), (13, 14, 19, 18, 17, 22, 23), (13, 14, 19, 18, 23, 22, 17), (13, 14, 19, 18, 23, 22, 21), (13, 14, 19, 24, 23, 18, 17), (13, 14, 19, 24, 23, 22, 17), (13, 14, 19, 24, 23, 22, 21), (13, 18, 17, 12, 7, 2, 1), (13, 18, 17, 12, 7, 2, 3), (13, 18, 17, 12, 7, 6, 1), (13, 18, 17, 12, 7, 6, 5), (13, 18, 17, 12, 7, 6, 11), (13, 18, 17, 12, 7, 8, 3), (13, 18, 17, 12, 7, 8, 9), (13, 18, 17, 12, 11, 6, 1), (13, 18, 17, 12, 11, 6, 5), (13, 18, 17, 12, 11, 6, 7), (13, 18, 17, 12, 11, 10, 5), (13, 18, 17, 12, 11, 10, 15), (13, 18, 17, 12, 11, 16, 15), (13, 18, 17, 12, 11, 16, 21), (13, 18, 17, 16, 11, 6, 1), (13, 18, 17, 16, 11, 6, 5), (13, 18, 17, 16, 11, 6, 7), (13, 18, 17, 16, 11, 10, 5), (13, 18, 17, 16, 11, 10, 15), (13, 18, 17, 16, 11, 12, 7), (13, 18, 17, 16, 15, 10, 5), (13, 18, 17, 16, 15, 10, 11), (13, 18, 17, 16, 15, 20, 21), (13, 18, 17, 16, 21, 20, 15), (13, 18, 17, 16, 21, 22, 23), (13, 18, 17, 22, 21, 16, 11), (13, 18, 17, 22, 21, 16, 15), (13, 18, 17, 22, 21, 20, 15), (13, 18, 17, 22, 23, 24, 19), (13, 18, 19, 14, 9, 4, 3), (13, 18, 19, 14, 9, 8, 3), (13, 18, 19, 14, 9, 8, 7), (13, 18, 19, 24, 23, 22, 17), (13, 18, 19, 24, 23, 22, 21), (13, 18, 23, 22, 17, 12, 7), (13, 18, 23, 22, 17, 12, 11), (13, 18, 23, 22, 17, 16, 11), (13, 18, 23, 22, 17, 16, 15), (13, 18, 23, 22, 17, 16, 21), (13, 18, 23, 22, 21, 16, 11), (13, 18, 23, 22, 21, 16, 15), (13, 18, 23, 22, 21, 16, 17), (13, 18, 23, 22, 21, 20, 15), (13, 18, 23, 24, 19, 14, 9), (14, 9, 4, 3, 2, 1, 0), (14, 9, 4, 3, 2, 1, 6), (14, 9, 4, 3, 2, 7, 6), (14, 9, 4, 3, 2, 7, 8), (14, 9, 4, 3, 2, 7, 12), (14, 9, 4, 3, 8, 7, 2), (14, 9, 4, 3, 8, 7, 6), (14, 9, 4, 3, 8, 7, 12), (14, 9, 4, 3, 8, 13, 12), (14, 9, 4, 3, 8, 13, 18), (14, 9, 8, 3, 2, 1, 0), (14, 9, 8, 3, 2, 1, 6), (14, 9, 8, 3, 2, 7, 6), (14, 9, 8, 3, 2, 7, 12), (14, 9, 8, 7, 2, 1, 0), (14, 9, 8, 7, 2, 1, 6), (14, 9, 8, 7, 2, 3, 4), (14, 9, 8, 7, 6, 1, 0), (14, 9, 8, 7, 6, 1, 2), (14, 9, 8, 7, 6, 5, 0), (14, 9, 8, 7, 6, 5, 10), (14, 9, 8, 7, 6, 11, 10), (14, 9, 8, 7, 6, 11, 12), (14, 9, 8, 7, 6, 11, 16), (14, 9, 8, 7, 12, 11, 6), (14, 9, 8, 7, 12, 11, 10), (14, 9, 8, 7, 12, 11, 16), (14, 9, 8, 7, 12, 13, 18), (14, 9, 8, 7, 12, 17, 16), (14, 9, 8, 7, 12, 17, 18), (14, 9, 8, 7, 12, 17, 22), (14, 9, 8, 13, 12, 7, 2), (14, 9, 8, 13, 12, 7, 6), (14, 9, 8, 13, 12, 11, 6), (14, 9, 8, 13, 12, 11, 10), (14, 9, 8, 13, 12, 11, 16), (14, 9, 8, 13, 12, 17, 16), (14, 9, 8, 13, 12, 17, 18), (14, 9, 8, 13, 12, 17, 22), (14, 9, 8, 13, 18, 17, 12), (14, 9, 8, 13, 18, 17, 16), (14, 9, 8, 13, 18, 17, 22), (14, 9, 8, 13, 18, 19, 24), (14, 9, 8, 13, 18, 23, 22), (14, 9, 8, 13, 18, 23, 24), (14, 13, 8, 3, 2, 1, 0), (14, 13, 8, 3, 2, 1, 6), (14, 13, 8, 3, 2, 7, 6), (14, 13, 8, 3, 2, 7, 12), (14, 13, 8, 7, 2, 1, 0), (14, 13, 8, 7, 2, 1, 6), (14, 13, 8, 7, 2, 3, 4), (14, 13, 8, 7, 6, 1, 0), (14, 13, 8, 7, 6, 1, 2), (14, 13, 8, 7, 6, 5, 0), (14, 13, 8, 7, 6, 5, 10), (14, 13, 8, 7, 6, 11, 10), (14, 13, 8, 7, 6, 11, 12), (14, 13, 8, 7, 6, 11, 16), (14, 13, 8, 7, 12, 11, 6), (14, 13, 8, 7, 12, 11, 10), (14, 13, 8, 7, 12, 11, 16), (14, 13, 8, 7, 12, 17, 16), (14, 13, 8, 7, 12, 17, 18), (14, 13, 8, 7, 12, 17, 22), (14, 13, 8, 9, 4, 3, 2), (14, 13, 12, 7, 2, 1, 0), (14, 13, 12, 7, 2, 1, 6), (14, 13, 12, 7, 2, 3, 4), (14, 13, 12, 7, 2, 3, 8), (14, 13, 12, 7, 6, 1, 0), (14, 13, 12, 7, 6, 1, 2), (14, 13, 12, 7, 6, 5, 0), (14, 13, 12, 7, 6, 5, 10), (14, 13, 12, 7, 6, 11, 10), (14, 13, 12, 7, 6, 11, 16), (14, 13, 12, 7, 8, 3, 2), (14, 13, 12, 7, 8, 3, 4), (14, 13, 12, 7, 8, 9, 4), (14, 13, 12, 11, 6, 1, 0), (14, 13, 12, 11, 6, 1, 2), (14, 13, 12, 11, 6, 5, 0), (14, 13, 12, 11, 6, 5, 10), (14, 13, 12, 11, 6, 7, 2), (14, 13, 12, 11, 6, 7, 8), (14, 13, 12, 11, 10, 5, 0), (14, 13, 12, 11, 10, 5, 6), (14, 13, 12, 11, 10, 15, 16), (14, 13, 12, 11, 10, 15, 20), (14, 13, 12, 11, 16, 15, 10), (14, 13, 12, 11, 16, 15, 20), (14, 13, 12, 11, 16, 17, 18), (14, 13, 12, 11, 16, 17, 22), (14, 13, 12, 11, 16, 21, 20), (14, 13, 12, 11, 16, 21, 22), (14, 13, 12, 17, 16, 11, 6), (14, 13, 12, 17, 16, 11, 10), (14, 13, 12, 17, 16, 15, 10), (14, 13, 12, 17, 16, 15, 20), (14, 13, 12, 17, 16, 21, 20), (14, 13, 12, 17, 16, 21, 22), (14, 13, 12, 17, 18, 19, 24), (14, 13, 12, 17, 18, 23, 22), (14, 13, 12, 17, 18, 23, 24), (14, 13, 12, 17, 22, 21, 16), (14, 13, 12, 17, 22, 21, 20), (14, 13, 12, 17, 22, 23, 18), (14, 13, 12, 17, 22, 23, 24), (14, 13, 18, 17, 12, 7, 2), (14, 13, 18, 17, 12, 7, 6), (14, 13, 18, 17, 12, 7, 8), (14, 13, 18, 17, 12, 11, 6), (14, 13, 18, 17, 12, 11, 10), (14, 13, 18, 17, 12, 11, 16), (14, 13, 18, 17, 16, 11, 6), (14, 13, 18, 17, 16, 11, 10), (14, 13, 18, 17, 16, 11, 12), (14, 13, 18, 17, 16, 15, 10), (14, 13, 18, 17, 16, 15, 20), (14, 13, 18, 17, 16, 21, 20), (14, 13, 18, 17, 16, 21, 22), (14, 13, 18, 17, 22, 21, 16), (14, 13, 18, 17, 22, 21, 20), (14, 13, 18, 17, 22, 23, 24), (14, 13, 18, 19, 24, 23, 22), (14, 13, 18, 23, 22, 17, 12), (14, 13, 18, 23, 22, 17, 16), (14, 13, 18, 23, 22, 21, 16), (14, 13, 18, 23, 22, 21, 20), (14, 19, 18, 13, 8, 3, 2), (14, 19, 18, 13, 8, 3, 4), (14, 19, 18, 13, 8, 7, 2), (14, 19, 18, 13, 8, 7, 6), (14, 19, 18, 13, 8, 7, 12), (14, 19, 18, 13, 8, 9, 4), (14, 19, 18, 13, 12, 7, 2), (14, 19, 18, 13, 12, 7, 6), (14, 19, 18, 13, 12, 7, 8), (14, 19, 18, 13, 12, 11, 6), (14, 19, 18, 13, 12, 11, 10), (14, 19, 18, 13, 12, 11, 16), (14, 19, 18, 13, 12, 17, 16), (14, 19, 18, 13, 12, 17, 22), (14, 19, 18, 17, 12, 7, 2), (14, 19, 18, 17, 12, 7, 6), (14, 19, 18, 17, 12, 7, 8), (14, 19, 18, 17, 12, 11, 6), (14, 19, 18, 17, 12, 11, 10), (14, 19, 18, 17, 12, 11, 16), (14, 19, 18, 17, 12, 13, 8), (14, 19, 18, 17, 16, 11, 6), (14, 19, 18, 17, 16, 11, 10), (14, 19, 18, 17, 16, 11, 12), (14, 19, 18, 17, 16, 15, 10), (14, 19, 18, 17, 16, 15, 20), (14, 19, 18, 17, 16, 21, 20), (14, 19, 18, 17, 16, 21, 22), (14, 19, 18, 17, 22, 21, 16), (14, 19, 18, 17, 22, 21, 20), (14, 19, 18, 17, 22, 23, 24), (14, 19, 18, 23, 22, 17, 12), (14, 19, 18, 23, 22, 17, 16), (14, 19, 18, 23, 22, 21, 16), (14, 19, 18, 23, 22, 21, 20), (14, 19, 24, 23, 18, 13, 8), (14, 19, 24, 23, 18, 13, 12), (14, 19, 24, 23, 18, 17, 12), (14, 19, 24, 23, 18, 17, 16), (14, 19, 24, 23, 18, 17, 22), (14, 19, 24, 23, 22, 17, 12), (14, 19, 24, 23, 22, 17, 16), (14, 19, 24, 23, 22, 17, 18), (14, 19, 24, 23, 22, 21, 16), (14, 19, 24, 23, 22, 21, 20), (15, 10, 5, 0, 1, 2, 3), (15, 10, 5, 0, 1, 2, 7), (15, 10, 5, 0, 1, 6, 7), (15, 10, 5, 0, 1, 6, 11), (15, 10, 5, 6, 1, 2, 3), (15, 10, 5, 6, 1, 2, 7), (15, 10, 5, 6, 7, 2, 1), (15, 10, 5, 6, 7, 2, 3), (15, 10, 5, 6, 7, 8, 3), (15, 10, 5, 6, 7, 8, 9), (15, 10, 5, 6, 7, 8, 13), (15, 10, 5, 6, 7, 12, 11), (15, 10, 5, 6, 7, 12, 13), (15, 10, 5, 6, 7, 12, 17), (15, 10, 5, 6, 11, 12, 7), (15, 10, 5, 6, 11, 12, 13), (15, 10, 5, 6, 11, 12, 17), (15, 10, 5, 6, 11, 16, 17), (15, 10, 5, 6, 11, 16, 21), (15, 10, 11, 6, 1, 0, 5), (15, 10, 11, 6, 1, 2, 3), (15, 10, 11, 6, 1, 2, 7), (15, 10, 11, 6, 5, 0, 1), (15, 10, 11, 6, 7, 2, 1), (15, 10, 11, 6, 7, 2, 3), (15, 10, 11, 6, 7, 8, 3), (15, 10, 11, 6, 7, 8, 9), (15, 10, 11, 6, 7, 8, 13), (15, 10, 11, 6, 7, 12, 13), (15, 10, 11, 6, 7, 12, 17), (15, 10, 11, 12, 7, 2, 1), (15, 10, 11, 12, 7, 2, 3), (15, 10, 11, 12, 7, 6, 1), (15, 10, 11, 12, 7, 6, 5), (15, 10, 11, 12, 7, 8, 3), (15, 10, 11, 12, 7, 8, 9), (15, 10, 11, 12, 7, 8, 13), (15, 10, 11, 12, 13, 8, 3), (15, 10, 11, 12, 13, 8, 7), (15, 10, 11, 12, 13, 8, 9), (15, 10, 11, 12, 13, 14, 9), (15, 10, 11, 12, 13, 14, 19), (15, 10, 11, 12, 13, 18, 17), (15, 10, 11, 12, 13, 18, 19), (15, 10, 11, 12, 13, 18, 23), (15, 10, 11, 12, 17, 16, 21), (15, 10, 11, 12, 17, 18, 13), (15, 10, 11, 12, 17, 18, 19), (15, 10, 11, 12, 17, 18, 23), (15, 10, 11, 12, 17, 22, 21), (15, 10, 11, 12, 17, 22, 23), (15, 10, 11, 16, 17, 12, 7), (15, 10, 11, 16, 17, 12, 13), (15, 10, 11, 16, 17, 18, 13), (15, 10, 11, 16, 17, 18, 19), (15, 10, 11, 16, 17, 18, 23), (15, 10, 11, 16, 17, 22, 21), (15, 10, 11, 16, 17, 22, 23), (15, 10, 11, 16, 21, 22, 17), (15, 10, 11, 16, 21, 22, 23), (15, 16, 11, 6, 1, 0, 5), (15, 16, 11, 6, 1, 2, 3), (15, 16, 11, 6, 1, 2, 7), (15, 16, 11, 6, 5, 0, 1), (15, 16, 11, 6, 7, 2, 1), (15, 16, 11, 6, 7, 2, 3), (15, 16, 11, 6, 7, 8, 3), (15, 16, 11, 6, 7, 8, 9), (15, 16, 11, 6, 7, 8, 13), (15, 16, 11, 6, 7, 12, 13), (15, 16, 11, 6, 7, 12, 17), (15, 16, 11, 10, 5, 0, 1), (15, 16, 11, 10, 5, 6, 1), (15, 16, 11, 10, 5, 6, 7), (15, 16, 11, 12, 7, 2, 1), (15, 16, 11, 12, 7, 2, 3), (15, 16, 11, 12, 7, 6, 1), (15, 16, 11, 12, 7, 6, 5), (15, 16, 11, 12, 7, 8, 3), (15, 16, 11, 12, 7, 8, 9), (15, 16, 11, 12, 7, 8, 13), (15, 16, 11, 12, 13, 8, 3), (15, 16, 11, 12, 13, 8, 7), (15, 16, 11, 12, 13, 8, 9), (15, 16, 11, 12, 13, 14, 9), (15, 16, 11, 12, 13, 14, 19), (15, 16, 11, 12, 13, 18, 17), (15, 16, 11, 12, 13, 18, 19), (15, 16, 11, 12, 13, 18, 23), (15, 16, 11, 12, 17, 18, 13), (15, 16, 11, 12, 17, 18, 19), (15, 16, 11, 12, 17, 18, 23), (15, 16, 11, 12, 17, 22, 21), (15, 16, 11, 12, 17, 22, 23), (15, 16, 17, 12, 7, 2, 1), (15, 16, 17, 12, 7, 2, 3), (15, 16, 17, 12, 7, 6, 1), (15, 16, 17, 12, 7, 6, 5), (15, 16, 17, 12, 7, 6, 11), (15, 16, 17, 12, 7, 8, 3), (15, 16, 17, 12, 7, 8, 9), (15, 16, 17, 12, 7, 8, 13), (15, 16, 17, 12, 11, 6, 1), (15, 16, 17, 12, 11, 6, 5), (15, 16, 17, 12, 11, 6, 7), (15, 16, 17, 12, 11, 10, 5), (15, 16, 17, 12, 13, 8, 3), (15, 16, 17, 12, 13, 8, 7), (15, 16, 17, 12, 13, 8, 9), (15, 16, 17, 12, 13, 14, 9), (15, 16, 17, 12, 13, 14, 19), (15, 16, 17, 12, 13, 18, 19), (15, 16, 17, 12, 13, 18, 23), (15, 16, 17, 18, 13, 8, 3), (15, 16, 17, 18, 13, 8, 7), (15, 16, 17, 18, 13, 8, 9), (15, 16, 17, 18, 13, 12, 7), (15, 16, 17, 18, 13, 12, 11), (15, 16, 17, 18, 13, 14, 9), (15, 16, 17, 18, 13, 14, 19), (15, 16, 17, 18, 19, 14, 9), (15, 16, 17, 18, 19, 14, 13), (15, 16, 17, 18, 19, 24, 23), (15, 16, 17, 18, 23, 22, 21), (15, 16, 17, 18, 23, 24, 19), (15, 16, 17, 22, 23, 18, 13), (15, 16, 17, 22, 23, 18, 19), (15, 16, 17, 22, 23, 24, 19), (15, 16, 21, 22, 17, 12, 7), (15, 16, 21, 22, 17, 12, 11), (15, 16, 21, 22, 17, 12, 13), (15, 16, 21, 22, 17, 18, 13), (15, 16, 21, 22, 17, 18, 19), (15, 16, 21, 22, 17, 18, 23), (15, 16, 21, 22, 23, 18, 13), (15, 16, 21, 22, 23, 18, 17), (15, 16, 21, 22, 23, 18, 19), (15, 16, 21, 22, 23, 24, 19), (15, 20, 21, 16, 11, 6, 1), (15, 20, 21, 16, 11, 6, 5), (15, 20, 21, 16, 11, 6, 7), (15, 20, 21, 16, 11, 10, 5), (15, 20, 21, 16, 11, 12, 7), (15, 20, 21, 16, 11, 12, 13), (15, 20, 21, 16, 11, 12, 17), (15, 20, 21, 16, 17, 12, 7), (15, 20, 21, 16, 17, 12, 11), (15, 20, 21, 16, 17, 12, 13), (15, 20, 21, 16, 17, 18, 13), (15, 20, 21, 16, 17, 18, 19), (15, 20, 21, 16, 17, 18, 23), (15, 20, 21, 16, 17, 22, 23), (15, 20, 21, 22, 17, 12, 7), (15, 20, 21, 22, 17, 12, 11), (15, 20, 21, 22, 17, 12, 13), (15, 20, 21, 22, 17, 16, 11), (15, 20, 21, 22, 17, 18, 13), (15, 20, 21, 22, 17, 18, 19), (15, 20, 21, 22, 17, 18, 23), (15, 20, 21, 22, 23, 18, 13), (15, 20, 21, 22, 23, 18, 17), (15, 20, 21, 22, 23, 18, 19), (15, 20, 21, 22, 23, 24, 19), (16, 11, 6, 1, 0, 5, 10), (16, 11, 6, 1, 2, 3, 4), (16, 11, 6, 1, 2, 3, 8), (16, 11, 6, 1, 2, 7, 8), (16, 11, 6, 1, 2, 7, 12), (16, 11, 6, 5, 0, 1, 2), (16, 11, 6, 5, 10, 15, 20), (16, 11, 6, 7, 2, 1, 0), (16, 11, 6, 7, 2, 3, 4), (16, 11, 6, 7, 2, 3, 8), (16, 11, 6, 7, 8, 3, 2), (16, 11, 6, 7, 8, 3, 4), (16, 11, 6, 7, 8, 9, 4), (16, 11, 6, 7, 8, 9, 14), (16, 11, 6, 7, 8, 13, 12), (16, 11, 6, 7, 8, 13, 14), (16, 11, 6, 7, 8, 13, 18), (16, 11, 6, 7, 12, 13, 8), (16, 11, 6, 7, 12, 13, 14), (16, 11, 6, 7, 12, 13, 18), (16, 11, 6, 7, 12, 17, 18), (16, 11, 6, 7, 12, 17, 22), (16, 11, 10, 5, 0, 1, 2), (16, 11, 10, 5, 0, 1, 6), (16, 11, 10, 5, 6, 1, 0), (16, 11, 10, 5, 6, 1, 2), (16, 11, 10, 5, 6, 7, 2), (16, 11, 10, 5, 6, 7, 8), (16, 11, 10, 5, 6, 7, 12), (16, 11, 10, 15, 20, 21, 22), (16, 11, 12, 7, 2, 1, 0), (16, 11, 12, 7, 2, 1, 6), (16, 11, 12, 7, 2, 3, 4), (16, 11, 12, 7, 2, 3, 8), (16, 11, 12, 7, 6, 1, 0), (16, 11, 12, 7, 6, 1, 2), (16, 11, 12, 7, 6, 5, 0), (16, 11, 12, 7, 6, 5, 10), (16, 11, 12, 7, 8, 3, 2), (16, 11, 12, 7, 8, 3, 4), (16, 11, 12, 7, 8, 9, 4), (16, 11, 12, 7, 8, 9, 14), (16, 11, 12, 7, 8, 13, 14), (16, 11, 12, 7, 8, 13, 18), (16, 11, 12, 13, 8, 3, 2), (16, 11, 12, 13, 8, 3, 4), (16, 11, 12, 13, 8, 7, 2), (16, 11, 12, 13, 8, 7, 6), (16, 11, 12, 13, 8, 9, 4), (16, 11, 12, 13, 8, 9, 14), (16, 11, 12, 13, 14, 9, 4), (16, 11, 12, 13, 14, 9, 8), (16, 11, 12, 13, 14, 19, 18), (16, 11, 12, 13, 14, 19, 24), (16, 11, 12, 13, 18, 17, 22), (16, 11, 12, 13, 18, 19, 14), (16, 11, 12, 13, 18, 19, 24), (16, 11, 12, 13, 18, 23, 22), (16, 11, 12, 13, 18, 23, 24), (16, 11, 12, 17, 18, 13, 8), (16, 11, 12, 17, 18, 13, 14), (16, 11, 12, 17, 18, 19, 14), (16, 11, 12, 17, 18, 19, 24), (16, 11, 12, 17, 18, 23, 22), (16, 11, 12, 17, 18, 23, 24), (16, 11, 12, 17, 22, 21, 20), (16, 11, 12, 17, 22, 23, 18), (16, 11, 12, 17, 22, 23, 24), (16, 15, 10, 5, 0, 1, 2), (16, 15, 10, 5, 0, 1, 6), (16, 15, 10, 5, 6, 1, 0), (16, 15, 10, 5, 6, 1, 2), (16, 15, 10, 5, 6, 7, 2), (16, 15, 10, 5, 6, 7, 8), (16, 15, 10, 5, 6, 7, 12), (16, 15, 10, 5, 6, 11, 12), (16, 15, 10, 11, 6, 1, 0), (16, 15, 10, 11, 6, 1, 2), (16, 15, 10, 11, 6, 5, 0), (16, 15, 10, 11, 6, 7, 2), (16, 15, 10, 11, 6, 7, 8), (16, 15, 10, 11, 6, 7, 12), (16, 15, 10, 11, 12, 7, 2), (16, 15, 10, 11, 12, 7, 6), (16, 15, 10, 11, 12, 7, 8), (16, 15, 10, 11, 12, 13, 8), (16, 15, 10, 11, 12, 13, 14), (16, 15, 10, 11, 12, 13, 18), (16, 15, 10, 11, 12, 17, 18), (16, 15, 10, 11, 12, 17, 22), (16, 15, 20, 21, 22, 17, 12), (16, 15, 20, 21, 22, 17, 18), (16, 15, 20, 21, 22, 23, 18), (16, 15, 20, 21, 22, 23, 24), (16, 17, 12, 7, 2, 1, 0), (16, 17, 12, 7, 2, 1, 6), (16, 17, 12, 7, 2, 3, 4), (16, 17, 12, 7, 2, 3, 8), (16, 17, 12, 7, 6, 1, 0), (16, 17, 12, 7, 6, 1, 2), (16, 17, 12, 7, 6, 5, 0), (16, 17, 12, 7, 6, 5, 10), (16, 17, 12, 7, 6, 11, 10), (16, 17, 12, 7, 8, 3, 2), (16, 17, 12, 7, 8, 3, 4), (16, 17, 12, 7, 8, 9, 4), (16, 17, 12, 7, 8, 9, 14), (16, 17, 12, 7, 8, 13, 14), (16, 17, 12, 7, 8, 13, 18), (16, 17, 12, 11, 6, 1, 0), (16, 17, 12, 11, 6, 1, 2), (16, 17, 12, 11, 6, 5, 0), (16, 17, 12, 11, 6, 5, 10), (16, 17, 12, 11, 6, 7, 2), (16, 17, 12, 11, 6, 7, 8), (16, 17, 12, 11, 10, 5, 0), (16, 17, 12, 11, 10, 5, 6), (16, 17, 12, 11, 10, 15, 20), (16, 17, 12, 13, 8, 3, 2), (16, 17, 12, 13, 8, 3, 4), (16, 17, 12, 13, 8, 7, 2), (16, 17, 12, 13, 8, 7, 6), (16, 17, 12, 13, 8, 9, 4), (16, 17, 12, 13, 8, 9, 14), (16, 17, 12, 13, 14, 9, 4), (16, 17, 12, 13, 14, 9, 8), (16, 17, 12, 13, 14, 19, 18), (16, 17, 12, 13, 14, 19, 24), (16, 17, 12, 13, 18, 19, 14), (16, 17, 12, 13, 18, 19, 24), (16, 17, 12, 13, 18, 23, 22), (16, 17, 12, 13, 18, 23, 24), (16, 17, 18, 13, 8, 3, 2), (16, 17, 18, 13, 8, 3, 4), (16, 17, 18, 13, 8, 7, 2), (16, 17, 18, 13, 8, 7, 6), (16, 17, 18, 13, 8, 7, 12), (16, 17, 18, 13, 8, 9, 4), (16, 17, 18, 13, 8, 9, 14), (16, 17, 18, 13, 12, 7, 2), (16, 17, 18, 13, 12, 7, 6), (16, 17, 18, 13, 12, 7, 8), (16, 17, 18, 13, 12, 11, 6), (16, 17, 18, 13, 12, 11, 10), (16, 17, 18, 13, 14, 9, 4), (16, 17, 18, 13, 14, 9, 8), (16, 17, 18, 13, 14, 19, 24), (16, 17, 18, 19, 14, 9, 4), (16, 17, 18, 19, 14, 9, 8), (16, 17, 18, 19, 14, 13, 8), (16, 17, 18, 19, 14, 13, 12), (16, 17, 18, 19, 24, 23, 22), (16, 17, 18, 23, 22, 21, 20), (16, 17, 18, 23, 24, 19, 14), (16, 17, 22, 21, 20, 15, 10), (16, 17, 22, 23, 18, 13, 8), (16, 17, 22, 23, 18, 13, 12), (16, 17, 22, 23, 18, 13, 14), (16, 17, 22, 23, 18, 19, 14), (16, 17, 22, 23, 18, 19, 24), (16, 17, 22, 23, 24, 19, 14), (16, 17, 22, 23, 24, 19, 18), (16, 21, 20, 15, 10, 5, 0), (16, 21, 20, 15, 10, 5, 6), (16, 21, 20, 15, 10, 11, 6), (16, 21, 20, 15, 10, 11, 12), (16, 21, 22, 17, 12, 7, 2), (16, 21, 22, 17, 12, 7, 6), (16, 21, 22, 17, 12, 7, 8), (16, 21, 22, 17, 12, 11, 6), (16, 21, 22, 17, 12, 11, 10), (16, 21, 22, 17, 12, 13, 8), (16, 21, 22, 17, 12, 13, 14), (16, 21, 22, 17, 12, 13, 18), (16, 21, 22, 17, 18, 13, 8), (16, 21, 22, 17, 18, 13, 12), (16, 21, 22, 17, 18, 13, 14), (16, 21, 22, 17, 18, 19, 14), (16, 21, 22, 17, 18, 19, 24), (16, 21, 22, 17, 18, 23, 24), (16, 21, 22, 23, 18, 13, 8), (16, 21, 22, 23, 18, 13, 12), (16, 21, 22, 23, 18, 13, 14), (16, 21, 22, 23, 18, 17, 12), (16, 21, 22, 23, 18, 19, 14), (16, 21, 22, 23, 18, 19, 24), (16, 21, 22, 23, 24, 19, 14), (16, 21, 22, 23, 24, 19, 18), (17, 12, 7, 2, 1, 0, 5), (17, 12, 7, 2, 1, 6, 5), (17, 12, 7, 2, 1, 6, 11), (17, 12, 7, 2, 3, 4, 9), (17, 12, 7, 2, 3, 8, 9), (17, 12, 7, 2, 3, 8, 13), (17, 12, 7, 6, 1, 0, 5), (17, 12, 7, 6, 1, 2, 3), (17, 12, 7, 6, 5, 0, 1), (17, 12, 7, 6, 5, 10, 11), (17, 12, 7, 6, 5, 10, 15), (17, 12, 7, 6, 11, 10, 5), (17, 12, 7, 6, 11, 10, 15), (17, 12, 7, 6, 11, 16, 15), (17, 12, 7, 6, 11, 16, 21), (17, 12, 7, 8, 3, 2, 1), (17, 12, 7, 8, 3, 4, 9), (17, 12, 7, 8, 9, 4, 3), (17, 12, 7, 8, 9, 14, 13), (17, 12, 7, 8, 9, 14, 19), (17, 12, 7, 8, 13, 14, 9), (17, 12, 7, 8, 13, 14, 19), (17, 12, 7, 8, 13, 18, 19), (17, 12, 7, 8, 13, 18, 23), (17, 12, 11, 6, 1, 0, 5), (17, 12, 11, 6, 1, 2, 3), (17, 12, 11, 6, 1, 2, 7), (17, 12, 11, 6, 5, 0, 1), (17, 12, 11, 6, 5, 10, 15), (17, 12, 11, 6, 7, 2, 1), (17, 12, 11, 6, 7, 2, 3), (17, 12, 11, 6, 7, 8, 3), (17, 12, 11, 6, 7, 8, 9), (17, 12, 11, 6, 7, 8, 13), (17, 12, 11, 10, 5, 0, 1), (17, 12, 11, 10, 5, 6, 1), (17, 12, 11, 10, 5, 6, 7), (17, 12, 11, 10, 15, 16, 21), (17, 12, 11, 10, 15, 20, 21), (17, 12, 11, 16, 15, 10, 5), (17, 12, 11, 16, 15, 20, 21), (17, 12, 11, 16, 21, 20, 15), (17, 12, 11, 16, 21, 22, 23), (17, 12, 13, 8, 3, 2, 1), (17, 12, 13, 8, 3, 2, 7), (17, 12, 13, 8, 3, 4, 9), (17, 12, 13, 8, 7, 2, 1), (17, 12, 13, 8, 7, 2, 3), (17, 12, 13, 8, 7, 6, 1), (17, 12, 13, 8, 7, 6, 5), (17, 12, 13, 8, 7, 6, 11), (17, 12, 13, 8, 9, 4, 3), (17, 12, 13, 8, 9, 14, 19), (17, 12, 13, 14, 9, 4, 3), (17, 12, 13, 14, 9, 8, 3), (17, 12, 13, 14, 9, 8, 7), (17, 12, 13, 14, 19, 18, 23), (17, 12, 13, 14, 19, 24, 23), (17, 12, 13, 18, 19, 14, 9), (17, 12, 13, 18, 19, 24, 23), (17, 12, 13, 18, 23, 22, 21), (17, 12, 13, 18, 23, 24, 19), (17, 16, 11, 6, 1, 0, 5), (17, 16, 11, 6, 1, 2, 3), (17, 16, 11, 6, 1, 2, 7), (17, 16, 11, 6, 5, 0, 1), (17, 16, 11, 6, 5, 10, 15), (17, 16, 11, 6, 7, 2, 1), (17, 16, 11, 6, 7, 2, 3), (17, 16, 11, 6, 7, 8, 3), (17, 16, 11, 6, 7, 8, 9), (17, 16, 11, 6, 7, 8, 13), (17, 16, 11, 6, 7, 12, 13), (17, 16, 11, 10, 5, 0, 1), (17, 16, 11, 10, 5, 6, 1), (17, 16, 11, 10, 5, 6, 7), (17, 16, 11, 10, 15, 20, 21), (17, 16, 11, 12, 7, 2, 1), (17, 16, 11, 12, 7, 2, 3), (17, 16, 11, 12, 7, 6, 1), (17, 16, 11, 12, 7, 6, 5), (17, 16, 11, 12, 7, 8, 3), (17, 16, 11, 12, 7, 8, 9), (17, 16, 11, 12, 7, 8, 13), (17, 16, 11, 12, 13, 8, 3), (17, 16, 11, 12, 13, 8, 7), (17, 16, 11, 12, 13, 8, 9), (17, 16, 11, 12, 13, 14, 9), (17, 16, 11, 12, 13, 14, 19), (17, 16, 11, 12, 13, 18, 19), (17, 16, 11, 12, 13, 18, 23), (17, 16, 15, 10, 5, 0, 1), (17, 16, 15, 10, 5, 6, 1), (17, 16, 15, 10, 5, 6, 7), (17, 16, 15, 10, 5, 6, 11), (17, 16, 15, 10, 11, 6, 1), (17, 16, 15, 10, 11, 6, 5), (17, 16, 15, 10, 11, 6, 7), (17, 16, 15, 10, 11, 12, 7), (17, 16, 15, 10, 11, 12, 13), (17, 16, 15, 20, 21, 22, 23), (17, 16, 21, 20, 15, 10, 5), (17, 16, 21, 20, 15, 10, 11), (17, 16, 21, 22, 23, 18, 13), (17, 16, 21, 22, 23, 18, 19), (17, 16, 21, 22, 23, 24, 19), (17, 18, 13, 8, 3, 2, 1), (17, 18, 13, 8, 3, 2, 7), (17, 18, 13, 8, 3, 4, 9), (17, 18, 13, 8, 7, 2, 1), (17, 18, 13, 8, 7, 2, 3), (17, 18, 13, 8, 7, 6, 1), (17, 18, 13, 8, 7, 6, 5), (17, 18, 13, 8, 7, 6, 11), (17, 18, 13, 8, 7, 12, 11), (17, 18, 13, 8, 9, 4, 3), (17, 18, 13, 8, 9, 14, 19), (17, 18, 13, 12, 7, 2, 1), (17, 18, 13, 12, 7, 2, 3), (17, 18, 13, 12, 7, 6, 1), (17, 18, 13, 12, 7, 6, 5), (17, 18, 13, 12, 7, 6, 11), (17, 18, 13, 12, 7, 8, 3), (17, 18, 13, 12, 7, 8, 9), (17, 18, 13, 12, 11, 6, 1), (17, 18, 13, 12, 11, 6, 5), (17, 18, 13, 12, 11, 6, 7), (17, 18, 13, 12, 11, 10, 5), (17, 18, 13, 12, 11, 10, 15), (17, 18, 13, 12, 11, 16, 15), (17, 18, 13, 12, 11, 16, 21), (17, 18, 13, 14, 9, 4, 3), (17, 18, 13, 14, 9, 8, 3), (17, 18, 13, 14, 9, 8, 7), (17, 18, 13, 14, 19, 24, 23), (17, 18, 19, 14, 9, 4, 3), (17, 18, 19, 14, 9, 8, 3), (17, 18, 19, 14, 9, 8, 7), (17, 18, 19, 14, 9, 8, 13), (17, 18, 19, 14, 13, 8, 3), (17, 18, 19, 14, 13, 8, 7), (17, 18, 19, 14, 13, 8, 9), (17, 18, 19, 14, 13, 12, 7), (17, 18, 19, 14, 13, 12, 11), (17, 18, 19, 24, 23, 22, 21), (17, 18, 23, 22, 21, 16, 11), (17, 18, 23, 22, 21, 16, 15), (17, 18, 23, 22, 21, 20, 15), (17, 18, 23, 24, 19, 14, 9), (17, 18, 23, 24, 19, 14, 13), (17, 22, 21, 16, 11, 6, 1), (17, 22, 21, 16, 11, 6, 5), (17, 22, 21, 16, 11, 6, 7), (17, 22, 21, 16, 11, 10, 5), (17, 22, 21, 16, 11, 10, 15), (17, 22, 21, 16, 11, 12, 7), (17, 22, 21, 16, 11, 12, 13), (17, 22, 21, 16, 15, 10, 5), (17, 22, 21, 16, 15, 10, 11), (17, 22, 21, 20, 15, 10, 5), (17, 22, 21, 20, 15, 10, 11), (17, 22, 21, 20, 15, 16, 11), (17, 22, 23, 18, 13, 8, 3), (17, 22, 23, 18, 13, 8, 7), (17, 22, 23, 18, 13, 8, 9), (17, 22, 23, 18, 13, 12, 7), (17, 22, 23, 18, 13, 12, 11), (17, 22, 23, 18, 13, 14, 9), (17, 22, 23, 18, 13, 14, 19), (17, 22, 23, 18, 19, 14, 9), (17, 22, 23, 18, 19, 14, 13), (17, 22, 23, 24, 19, 14, 9), (17, 22, 23, 24, 19, 14, 13), (17, 22, 23, 24, 19, 18, 13), (18, 13, 8, 3, 2, 1, 0), (18, 13, 8, 3, 2, 1, 6), (18, 13, 8, 3, 2, 7, 6), (18, 13, 8, 3, 2, 7, 12), (18, 13, 8, 3, 4, 9, 14), (18, 13, 8, 7, 2, 1, 0), (18, 13, 8, 7, 2, 1, 6), (18, 13, 8, 7, 2, 3, 4), (18, 13, 8, 7, 6, 1, 0), (18, 13, 8, 7, 6, 1, 2), (18, 13, 8, 7, 6, 5, 0), (18, 13, 8, 7, 6, 5, 10), (18, 13, 8, 7, 6, 11, 10), (18, 13, 8, 7, 6, 11, 12), (18, 13, 8, 7, 6, 11, 16), (18, 13, 8, 7, 12, 11, 6), (18, 13, 8, 7, 12, 11, 10), (18, 13, 8, 7, 12, 11, 16), (18, 13, 8, 7, 12, 17, 16), (18, 13, 8, 7, 12, 17, 22), (18, 13, 8, 9, 4, 3, 2), (18, 13, 8, 9, 14, 19, 24), (18, 13, 12, 7, 2, 1, 0), (18, 13, 12, 7, 2, 1, 6), (18, 13, 12, 7, 2, 3, 4), (18, 13, 12, 7, 2, 3, 8), (18, 13, 12, 7, 6, 1, 0), (18, 13, 12, 7, 6, 1, 2), (18, 13, 12, 7, 6, 5, 0), (18, 13, 12, 7, 6, 5, 10), (18, 13, 12, 7, 6, 11, 10), (18, 13, 12, 7, 6, 11, 16), (18, 13, 12, 7, 8, 3, 2), (18, 13, 12, 7, 8, 3, 4), (18, 13, 12, 7, 8, 9, 4), (18, 13, 12, 7, 8, 9, 14), (18, 13, 12, 11, 6, 1, 0), (18, 13, 12, 11, 6, 1, 2), (18, 13, 12, 11, 6, 5, 0), (18, 13, 12, 11, 6, 5, 10), (18, 13, 12, 11, 6, 7, 2), (18, 13, 12, 11, 6, 7, 8), (18, 13, 12, 11, 10, 5, 0), (18, 13, 12, 11, 10, 5, 6), (18, 13, 12, 11, 10, 15, 16), (18, 13, 12, 11, 10, 15, 20), (18, 13, 12, 11, 16, 15, 10), (18, 13, 12, 11, 16, 15, 20), (18, 13, 12, 11, 16, 17, 22), (18, 13, 12, 11, 16, 21, 20), (18, 13, 12, 11, 16, 21, 22), (18, 13, 12, 17, 16, 11, 6), (18, 13, 12, 17, 16, 11, 10), (18, 13, 12, 17, 16, 15, 10), (18, 13, 12, 17, 16, 15, 20), (18, 13, 12, 17, 16, 21, 20), (18, 13, 12, 17, 16, 21, 22), (18, 13, 12, 17, 22, 21, 16), (18, 13, 12, 17, 22, 21, 20), (18, 13, 12, 17, 22, 23, 24), (18, 13, 14, 9, 4, 3, 2), (18, 13, 14, 9, 4, 3, 8), (18, 13, 14, 9, 8, 3, 2), (18, 13, 14, 9, 8, 3, 4), (18, 13, 14, 9, 8, 7, 2), (18, 13, 14, 9, 8, 7, 6), (18, 13, 14, 9, 8, 7, 12), (18, 13, 14, 19, 24, 23, 22), (18, 17, 12, 7, 2, 1, 0), (18, 17, 12, 7, 2, 1, 6), (18, 17, 12, 7, 2, 3, 4), (18, 17, 12, 7, 2, 3, 8), (18, 17, 12, 7, 6, 1, 0), (18, 17, 12, 7, 6, 1, 2), (18, 17, 12, 7, 6, 5, 0), (18, 17, 12, 7, 6, 5, 10), (18, 17, 12, 7, 6, 11, 10), (18, 17, 12, 7, 6, 11, 16), (18, 17, 12, 7, 8, 3, 2), (18, 17, 12, 7, 8, 3, 4), (18, 17, 12, 7, 8, 9, 4), (18, 17, 12, 7, 8, 9, 14), (18, 17, 12, 7, 8, 13, 14), (18, 17, 12, 11, 6, 1, 0), (18, 17, 12, 11, 6, 1, 2), (18, 17, 12, 11, 6, 5, 0), (18, 17, 12, 11, 6, 5, 10), (18, 17, 12, 11, 6, 7, 2), (18, 17, 12, 11, 6, 7, 8), (18, 17, 12, 11, 10, 5, 0), (18, 17, 12, 11, 10, 5, 6), (18, 17, 12, 11, 10, 15, 16), (18, 17, 12, 11, 10, 15, 20), (18, 17, 12, 11, 16, 15, 10), (18, 17, 12, 11, 16, 15, 20), (18, 17, 12, 11, 16, 21, 20), (18, 17, 12, 11, 16, 21, 22), (18, 17, 12, 13, 8, 3, 2), (18, 17, 12, 13, 8, 3, 4), (18, 17, 12, 13, 8, 7, 2), (18, 17, 12, 13, 8, 7, 6), (18, 17, 12, 13, 8, 9, 4), (18, 17, 12, 13, 8, 9, 14), (18, 17, 12, 13, 14, 9, 4), (18, 17, 12, 13, 14, 9, 8), (18, 17, 12, 13, 14, 19, 24), (18, 17, 16, 11, 6, 1, 0), (18, 17, 16, 11, 6, 1, 2), (18, 17, 16, 11, 6, 5, 0), (18, 17, 16, 11, 6, 5, 10), (18, 17, 16, 11, 6, 7, 2), (18, 17, 16, 11, 6, 7, 8), (18, 17, 16, 11, 6, 7, 12), (18, 17, 16, 11, 10, 5, 0), (18, 17, 16, 11, 10, 5, 6), (18, 17, 16, 11, 10, 15, 20), (18, 17, 16, 11, 12, 7, 2), (18, 17, 16, 11, 12, 7, 6), (18, 17, 16, 11, 12, 7, 8), (18, 17, 16, 11, 12, 13, 8), (18, 17, 16, 11, 12, 13, 14), (18, 17, 16, 15, 10, 5, 0), (18, 17, 16, 15, 10, 5, 6), (18, 17, 16, 15, 10, 11, 6), (18, 17, 16, 15, 10, 11, 12), (18, 17, 16, 15, 20, 21, 22), (18, 17, 16, 21, 20, 15, 10), (18, 17, 16, 21, 22, 23, 24), (18, 17, 22, 21, 16, 11, 6), (18, 17, 22, 21, 16, 11, 10), (18, 17, 22, 21, 16, 11, 12), (18, 17, 22, 21, 16, 15, 10), (18, 17, 22, 21, 16, 15, 20), (18, 17, 22, 21, 20, 15, 10), (18, 17, 22, 21, 20, 15, 16), (18, 17, 22, 23, 24, 19, 14), (18, 19, 14, 9, 4, 3, 2), (18, 19, 14, 9, 4, 3, 8), (18, 19, 14, 9, 8, 3, 2), (18, 19, 14, 9, 8, 3, 4), (18, 19, 14, 9, 8, 7, 2), (18, 19, 14, 9, 8, 7, 6), (18, 19, 14, 9, 8, 7, 12), (18, 19, 14, 9, 8, 13, 12), (18, 19, 14, 13, 8, 3, 2), (18, 19, 14, 13, 8, 3, 4), (18, 19, 14, 13, 8, 7, 2), (18, 19, 14, 13, 8, 7, 6), (18, 19, 14, 13, 8, 7, 12), (18, 19, 14, 13, 8, 9, 4), (18, 19, 14, 13, 12, 7, 2), (18, 19, 14, 13, 12, 7, 6), (18, 19, 14, 13, 12, 7, 8), (18, 19, 14, 13, 12, 11, 6), (18, 19, 14, 13, 12, 11, 10), (18, 19, 14, 13, 12, 11, 16), (18, 19, 14, 13, 12, 17, 16), (18, 19, 14, 13, 12, 17, 22), (18, 19, 24, 23, 22, 17, 12), (18, 19, 24, 23, 22, 17, 16), (18, 19, 24, 23, 22, 21, 16), (18, 19, 24, 23, 22, 21, 20), (18, 23, 22, 17, 12, 7, 2), (18, 23, 22, 17, 12, 7, 6), (18, 23, 22, 17, 12, 7, 8), (18, 23, 22, 17, 12, 11, 6), (18, 23, 22, 17, 12, 11, 10), (18, 23, 22, 17, 12, 11, 16), (18, 23, 22, 17, 12, 13, 8), (18, 23, 22, 17, 12, 13, 14), (18, 23, 22, 17, 16, 11, 6), (18, 23, 22, 17, 16, 11, 10), (18, 23, 22, 17, 16, 11, 12), (18, 23, 22, 17, 16, 15, 10), (18, 23, 22, 17, 16, 15, 20), (18, 23, 22, 17, 16, 21, 20), (18, 23, 22, 21, 16, 11, 6), (18, 23, 22, 21, 16, 11, 10), (18, 23, 22, 21, 16, 11, 12), (18, 23, 22, 21, 16, 15, 10), (18, 23, 22, 21, 16, 15, 20), (18, 23, 22, 21, 16, 17, 12), (18, 23, 22, 21, 20, 15, 10), (18, 23, 22, 21, 20, 15, 16), (18, 23, 24, 19, 14, 9, 4), (18, 23, 24, 19, 14, 9, 8), (18, 23, 24, 19, 14, 13, 8), (18, 23, 24, 19, 14, 13, 12), (19, 14, 9, 4, 3, 2, 1), (19, 14, 9, 4, 3, 2, 7), (19, 14, 9, 4, 3, 8, 7), (19, 14, 9, 4, 3, 8, 13), (19, 14, 9, 8, 3, 2, 1), (19, 14, 9, 8, 3, 2, 7), (19, 14, 9, 8, 7, 2, 1), (19, 14, 9, 8, 7, 2, 3), (19, 14, 9, 8, 7, 6, 1), (19, 14, 9, 8, 7, 6, 5), (19, 14, 9, 8, 7, 6, 11), (19, 14, 9, 8, 7, 12, 11), (19, 14, 9, 8, 7, 12, 13), (19, 14, 9, 8, 7, 12, 17), (19, 14, 9, 8, 13, 12, 7), (19, 14, 9, 8, 13, 12, 11), (19, 14, 9, 8, 13, 12, 17), (19, 14, 9, 8, 13, 18, 17), (19, 14, 9, 8, 13, 18, 23), (19, 14, 13, 8, 3, 2, 1), (19, 14, 13, 8, 3, 2, 7), (19, 14, 13, 8, 3, 4, 9), (19, 14, 13, 8, 7, 2, 1), (19, 14, 13, 8, 7, 2, 3), (19, 14, 13, 8, 7, 6, 1), (19, 14, 13, 8, 7, 6, 5), (19, 14, 13, 8, 7, 6, 11), (19, 14, 13, 8, 7, 12, 11), (19, 14, 13, 8, 7, 12, 17), (19, 14, 13, 8, 9, 4, 3), (19, 14, 13, 12, 7, 2, 1), (19, 14, 13, 12, 7, 2, 3), (19, 14, 13, 12, 7, 6, 1), (19, 14, 13, 12, 7, 6, 5), (19, 14, 13, 12, 7, 6, 11), (19, 14, 13, 12, 7, 8, 3), (19, 14, 13, 12, 7, 8, 9), (19, 14, 13, 12, 11, 6, 1), (19, 14, 13, 12, 11, 6, 5), (19, 14, 13, 12, 11, 6, 7), (19, 14, 13, 12, 11, 10, 5), (19, 14, 13, 12, 11, 10, 15), (19, 14, 13, 12, 11, 16, 15), (19, 14, 13, 12, 11, 16, 17), (19, 14, 13, 12, 11, 16, 21), (19, 14, 13, 12, 17, 16, 11), (19, 14, 13, 12, 17, 16, 15), (19, 14, 13, 12, 17, 16, 21), (19, 14, 13, 12, 17, 18, 23), (19, 14, 13, 12, 17, 22, 21), (19, 14, 13, 12, 17, 22, 23), (19, 14, 13, 18, 17, 12, 7), (19, 14, 13, 18, 17, 12, 11), (19, 14, 13, 18, 17, 16, 11), (19, 14, 13, 18, 17, 16, 15), (19, 14, 13, 18, 17, 16, 21), (19, 14, 13, 18, 17, 22, 21), (19, 14, 13, 18, 17, 22, 23), (19, 14, 13, 18, 23, 22, 17), (19, 14, 13, 18, 23, 22, 21), (19, 18, 13, 8, 3, 2, 1), (19, 18, 13, 8, 3, 2, 7), (19, 18, 13, 8, 3, 4, 9), (19, 18, 13, 8, 7, 2, 1), (19, 18, 13, 8, 7, 2, 3), (19, 18, 13, 8, 7, 6, 1), (19, 18, 13, 8, 7, 6, 5), (19, 18, 13, 8, 7, 6, 11), (19, 18, 13, 8, 7, 12, 11), (19, 18, 13, 8, 7, 12, 17), (19, 18, 13, 8, 9, 4, 3), (19, 18, 13, 12, 7, 2, 1), (19, 18, 13, 12, 7, 2, 3), (19, 18, 13, 12, 7, 6, 1), (19, 18, 13, 12, 7, 6, 5), (19, 18, 13, 12, 7, 6, 11), (19, 18, 13, 12, 7, 8, 3), (19, 18, 13, 12, 7, 8, 9), (19, 18, 13, 12, 11, 6, 1), (19, 18, 13, 12, 11, 6, 5), (19, 18, 13, 12, 11, 6, 7), (19, 18, 13, 12, 11, 10, 5), (19, 18, 13, 12, 11, 10, 15), (19, 18, 13, 12, 11, 16, 15), (19, 18, 13, 12, 11, 16, 17), (19, 18, 13, 12, 11, 16, 21), (19, 18, 13, 12, 17, 16, 11), (19, 18, 13, 12, 17, 16, 15), (19, 18, 13, 12, 17, 16, 21), (19, 18, 13, 12, 17, 22, 21), (19, 18, 13, 12, 17, 22, 23), (19, 18, 13, 14, 9, 4, 3), (19, 18, 13, 14, 9, 8, 3), (19, 18, 13, 14, 9, 8, 7), (19, 18, 17, 12, 7, 2, 1), (19, 18, 17, 12, 7, 2, 3), (19, 18, 17, 12, 7, 6, 1), (19, 18, 17, 12, 7, 6, 5), (19, 18, 17, 12, 7, 6, 11), (19, 18, 17, 12, 7, 8, 3), (19, 18, 17, 12, 7, 8, 9), (19, 18, 17, 12, 7, 8, 13), (19, 18, 17, 12, 11, 6, 1), (19, 18, 17, 12, 11, 6, 5), (19, 18, 17, 12, 11, 6, 7), (19, 18, 17, 12, 11, 10, 5), (19, 18, 17, 12, 11, 10, 15), (19, 18, 17, 12, 11, 16, 15), (19, 18, 17, 12, 11, 16, 21), (19, 18, 17, 12, 13, 8, 3), (19, 18, 17, 12, 13, 8, 7), (19, 18, 17, 12, 13, 8, 9), (19, 18, 17, 12, 13, 14, 9), (19, 18, 17, 16, 11, 6, 1), (19, 18, 17, 16, 11, 6, 5), (19, 18, 17, 16, 11, 6, 7), (19, 18, 17, 16, 11, 10, 5), (19, 18, 17, 16, 11, 10, 15), (19, 18, 17, 16, 11, 12, 7), (19, 18, 17, 16, 11, 12, 13), (19, 18, 17, 16, 15, 10, 5), (19, 18, 17, 16, 15, 10, 11), (19, 18, 17, 16, 15, 20, 21), (19, 18, 17, 16, 21, 20, 15), (19, 18, 17, 16, 21, 22, 23), (19, 18, 17, 22, 21, 16, 11), (19, 18, 17, 22, 21, 16, 15), (19, 18, 17, 22, 21, 20, 15), (19, 18, 23, 22, 17, 12, 7), (19, 18, 23, 22, 17, 12, 11), (19, 18, 23, 22, 17, 12, 13), (19, 18, 23, 22, 17, 16, 11), (19, 18, 23, 22, 17, 16, 15), (19, 18, 23, 22, 17, 16, 21), (19, 18, 23, 22, 21, 16, 11), (19, 18, 23, 22, 21, 16, 15), (19, 18, 23, 22, 21, 16, 17), (19, 18, 23, 22, 21, 20, 15), (19, 24, 23, 18, 13, 8, 3), (19, 24, 23, 18, 13, 8, 7), (19, 24, 23, 18, 13, 8, 9), (19, 24, 23, 18, 13, 12, 7), (19, 24, 23, 18, 13, 12, 11), (19, 24, 23, 18, 13, 12, 17), (19, 24, 23, 18, 13, 14, 9), (19, 24, 23, 18, 17, 12, 7), (19, 24, 23, 18, 17, 12, 11), (19, 24, 23, 18, 17, 12, 13), (19, 24, 23, 18, 17, 16, 11), (19, 24, 23, 18, 17, 16, 15), (19, 24, 23, 18, 17, 16, 21), (19, 24, 23, 18, 17, 22, 21), (19, 24, 23, 22, 17, 12, 7), (19, 24, 23, 22, 17, 12, 11), (19, 24, 23, 22, 17, 12, 13), (19, 24, 23, 22, 17, 16, 11), (19, 24, 23, 22, 17, 16, 15), (19, 24, 23, 22, 17, 16, 21), (19, 24, 23, 22, 17, 18, 13), (19, 24, 23, 22, 21, 16, 11), (19, 24, 23, 22, 21, 16, 15), (19, 24, 23, 22, 21, 16, 17), (19, 24, 23, 22, 21, 20, 15), (20, 15, 10, 5, 0, 1, 2), (20, 15, 10, 5, 0, 1, 6), (20, 15, 10, 5, 6, 1, 0), (20, 15, 10, 5, 6, 1, 2), (20, 15, 10, 5, 6, 7, 2), (20, 15, 10, 5, 6, 7, 8), (20, 15, 10, 5, 6, 7, 12), (20, 15, 10, 5, 6, 11, 12), (20, 15, 10, 5, 6, 11, 16), (20, 15, 10, 11, 6, 1, 0), (20, 15, 10, 11, 6, 1, 2), (20, 15, 10, 11, 6, 5, 0), (20, 15, 10, 11, 6, 7, 2), (20, 15, 10, 11, 6, 7, 8), (20, 15, 10, 11, 6, 7, 12), (20, 15, 10, 11, 12, 7, 2), (20, 15, 10, 11, 12, 7, 6), (20, 15, 10, 11, 12, 7, 8), (20, 15, 10, 11, 12, 13, 8), (20, 15, 10, 11, 12, 13, 14), (20, 15, 10, 11, 12, 13, 18), (20, 15, 10, 11, 12, 17, 16), (20, 15, 10, 11, 12, 17, 18), (20, 15, 10, 11, 12, 17, 22), (20, 15, 10, 11, 16, 17, 12), (20, 15, 10, 11, 16, 17, 18), (20, 15, 10, 11, 16, 17, 22), (20, 15, 10, 11, 16, 21, 22), (20, 15, 16, 11, 6, 1, 0), (20, 15, 16, 11, 6, 1, 2), (20, 15, 16, 11, 6, 5, 0), (20, 15, 16, 11, 6, 5, 10), (20, 15, 16, 11, 6, 7, 2), (20, 15, 16, 11, 6, 7, 8), (20, 15, 16, 11, 6, 7, 12), (20, 15, 16, 11, 10, 5, 0), (20, 15, 16, 11, 10, 5, 6), (20, 15, 16, 11, 12, 7, 2), (20, 15, 16, 11, 12, 7, 6), (20, 15, 16, 11, 12, 7, 8), (20, 15, 16, 11, 12, 13, 8), (20, 15, 16, 11, 12, 13, 14), (20, 15, 16, 11, 12, 13, 18), (20, 15, 16, 11, 12, 17, 18), (20, 15, 16, 11, 12, 17, 22), (20, 15, 16, 17, 12, 7, 2), (20, 15, 16, 17, 12, 7, 6), (20, 15, 16, 17, 12, 7, 8), (20, 15, 16, 17, 12, 11, 6), (20, 15, 16, 17, 12, 11, 10), (20, 15, 16, 17, 12, 13, 8), (20, 15, 16, 17, 12, 13, 14), (20, 15, 16, 17, 12, 13, 18), (20, 15, 16, 17, 18, 13, 8), (20, 15, 16, 17, 18, 13, 12), (20, 15, 16, 17, 18, 13, 14), (20, 15, 16, 17, 18, 19, 14), (20, 15, 16, 17, 18, 19, 24), (20, 15, 16, 17, 18, 23, 22), (20, 15, 16, 17, 18, 23, 24), (20, 15, 16, 17, 22, 23, 18), (20, 15, 16, 17, 22, 23, 24), (20, 15, 16, 21, 22, 17, 12), (20, 15, 16, 21, 22, 17, 18), (20, 15, 16, 21, 22, 23, 18), (20, 15, 16, 21, 22, 23, 24), (20, 21, 16, 11, 6, 1, 0), (20, 21, 16, 11, 6, 1, 2), (20, 21, 16, 11, 6, 5, 0), (20, 21, 16, 11, 6, 5, 10), (20, 21, 16, 11, 6, 7, 2), (20, 21, 16, 11, 6, 7, 8), (20, 21, 16, 11, 6, 7, 12), (20, 21, 16, 11, 10, 5, 0), (20, 21, 16, 11, 10, 5, 6), (20, 21, 16, 11, 12, 7, 2), (20, 21, 16, 11, 12, 7, 6), (20, 21, 16, 11, 12, 7, 8), (20, 21, 16, 11, 12, 13, 8), (20, 21, 16, 11, 12, 13, 14), (20, 21, 16, 11, 12, 13, 18), (20, 21, 16, 11, 12, 17, 18), (20, 21, 16, 11, 12, 17, 22), (20, 21, 16, 15, 10, 5, 0), (20, 21, 16, 15, 10, 5, 6), (20, 21, 16, 15, 10, 11, 6), (20, 21, 16, 15, 10, 11, 12), (20, 21, 16, 17, 12, 7, 2), (20, 21, 16, 17, 12, 7, 6), (20, 21, 16, 17, 12, 7, 8), (20, 21, 16, 17, 12, 11, 6), (20, 21, 16, 17, 12, 11, 10), (20, 21, 16, 17, 12, 13, 8), (20, 21, 16, 17, 12, 13, 14), (20, 21, 16, 17, 12, 13, 18), (20, 21, 16, 17, 18, 13, 8), (20, 21, 16, 17, 18, 13, 12), (20, 21, 16, 17, 18, 13, 14), (20, 21, 16, 17, 18, 19, 14), (20, 21, 16, 17, 18, 19, 24), (20, 21, 16, 17, 18, 23, 22), (20, 21, 16, 17, 18, 23, 24), (20, 21, 16, 17, 22, 23, 18), (20, 21, 16, 17, 22, 23, 24), (20, 21, 22, 17, 12, 7, 2), (20, 21, 22, 17, 12, 7, 6), (20, 21, 22, 17, 12, 7, 8), (20, 21, 22, 17, 12, 11, 6), (20, 21, 22, 17, 12, 11, 10), (20, 21, 22, 17, 12, 11, 16), (20, 21, 22, 17, 12, 13, 8), (20, 21, 22, 17, 12, 13, 14), (20, 21, 22, 17, 12, 13, 18), (20, 21, 22, 17, 16, 11, 6), (20, 21, 22, 17, 16, 11, 10), (20, 21, 22, 17, 16, 11, 12), (20, 21, 22, 17, 16, 15, 10), (20, 21, 22, 17, 18, 13, 8), (20, 21, 22, 17, 18, 13, 12), (20, 21, 22, 17, 18, 13, 14), (20, 21, 22, 17, 18, 19, 14), (20, 21, 22, 17, 18, 19, 24), (20, 21, 22, 17, 18, 23, 24), (20, 21, 22, 23, 18, 13, 8), (20, 21, 22, 23, 18, 13, 12), (20, 21, 22, 23, 18, 13, 14), (20, 21, 22, 23, 18, 17, 12), (20, 21, 22, 23, 18, 17, 16), (20, 21, 22, 23, 18, 19, 14), (20, 21, 22, 23, 18, 19, 24), (20, 21, 22, 23, 24, 19, 14), (20, 21, 22, 23, 24, 19, 18), (21, 16, 11, 6, 1, 0, 5), (21, 16, 11, 6, 1, 2, 3), (21, 16, 11, 6, 1, 2, 7), (21, 16, 11, 6, 5, 0, 1), (21, 16, 11, 6, 5, 10, 15), (21, 16, 11, 6, 7, 2, 1), (21, 16, 11, 6, 7, 2, 3), (21, 16, 11, 6, 7, 8, 3), (21, 16, 11, 6, 7, 8, 9), (21, 16, 11, 6, 7, 8, 13), (21, 16, 11, 6, 7, 12, 13), (21, 16, 11, 6, 7, 12, 17), (21, 16, 11, 10, 5, 0, 1), (21, 16, 11, 10, 5, 6, 1), (21, 16, 11, 10, 5, 6, 7), (21, 16, 11, 12, 7, 2, 1), (21, 16, 11, 12, 7, 2, 3), (21, 16, 11, 12, 7, 6, 1), (21, 16, 11, 12, 7, 6, 5), (21, 16, 11, 12, 7, 8, 3), (21, 16, 11, 12, 7, 8, 9), (21, 16, 11, 12, 7, 8, 13), (21, 16, 11, 12, 13, 8, 3), (21, 16, 11, 12, 13, 8, 7), (21, 16, 11, 12, 13, 8, 9), (21, 16, 11, 12, 13, 14, 9), (21, 16, 11, 12, 13, 14, 19), (21, 16, 11, 12, 13, 18, 17), (21, 16, 11, 12, 13, 18, 19), (21, 16, 11, 12, 13, 18, 23), (21, 16, 11, 12, 17, 18, 13), (21, 16, 11, 12, 17, 18, 19), (21, 16, 11, 12, 17, 18, 23), (21, 16, 11, 12, 17, 22, 23), (21, 16, 15, 10, 5, 0, 1), (21, 16, 15, 10, 5, 6, 1), (21, 16, 15, 10, 5, 6, 7), (21, 16, 15, 10, 5, 6, 11), (21, 16, 15, 10, 11, 6, 1), (21, 16, 15, 10, 11, 6, 5), (21, 16, 15, 10, 11, 6, 7), (21, 16, 15, 10, 11, 12, 7), (21, 16, 15, 10, 11, 12, 13), (21, 16, 15, 10, 11, 12, 17), (21, 16, 17, 12, 7, 2, 1), (21, 16, 17, 12, 7, 2, 3), (21, 16, 17, 12, 7, 6, 1), (21, 16, 17, 12, 7, 6, 5), (21, 16, 17, 12, 7, 6, 11), (21, 16, 17, 12, 7, 8, 3), (21, 16, 17, 12, 7, 8, 9), (21, 16, 17, 12, 7, 8, 13), (21, 16, 17, 12, 11, 6, 1), (21, 16, 17, 12, 11, 6, 5), (21, 16, 17, 12, 11, 6, 7), (21, 16, 17, 12, 11, 10, 5), (21, 16, 17, 12, 11, 10, 15), (21, 16, 17, 12, 13, 8, 3), (21, 16, 17, 12, 13, 8, 7), (21, 16, 17, 12, 13, 8, 9), (21, 16, 17, 12, 13, 14, 9), (21, 16, 17, 12, 13, 14, 19), (21, 16, 17, 12, 13, 18, 19), (21, 16, 17, 12, 13, 18, 23), (21, 16, 17, 18, 13, 8, 3), (21, 16, 17, 18, 13, 8, 7), (21, 16, 17, 18, 13, 8, 9), (21, 16, 17, 18, 13, 12, 7), (21, 16, 17, 18, 13, 12, 11), (21, 16, 17, 18, 13, 14, 9), (21, 16, 17, 18, 13, 14, 19), (21, 16, 17, 18, 19, 14, 9), (21, 16, 17, 18, 19, 14, 13), (21, 16, 17, 18, 19, 24, 23), (21, 16, 17, 18, 23, 24, 19), (21, 16, 17, 22, 23, 18, 13), (21, 16, 17, 22, 23, 18, 19), (21, 16, 17, 22, 23, 24, 19), (21, 20, 15, 10, 5, 0, 1), (21, 20, 15, 10, 5, 6, 1), (21, 20, 15, 10, 5, 6, 7), (21, 20, 15, 10, 5, 6, 11), (21, 20, 15, 10, 11, 6, 1), (21, 20, 15, 10, 11, 6, 5), (21, 20, 15, 10, 11, 6, 7), (21, 20, 15, 10, 11, 12, 7), (21, 20, 15, 10, 11, 12, 13), (21, 20, 15, 10, 11, 12, 17), (21, 20, 15, 10, 11, 16, 17), (21, 20, 15, 16, 11, 6, 1), (21, 20, 15, 16, 11, 6, 5), (21, 20, 15, 16, 11, 6, 7), (21, 20, 15, 16, 11, 10, 5), (21, 20, 15, 16, 11, 12, 7), (21, 20, 15, 16, 11, 12, 13), (21, 20, 15, 16, 11, 12, 17), (21, 20, 15, 16, 17, 12, 7), (21, 20, 15, 16, 17, 12, 11), (21, 20, 15, 16, 17, 12, 13), (21, 20, 15, 16, 17, 18, 13), (21, 20, 15, 16, 17, 18, 19), (21, 20, 15, 16, 17, 18, 23), (21, 20, 15, 16, 17, 22, 23), (21, 22, 17, 12, 7, 2, 1), (21, 22, 17, 12, 7, 2, 3), (21, 22, 17, 12, 7, 6, 1), (21, 22, 17, 12, 7, 6, 5), (21, 22, 17, 12, 7, 6, 11), (21, 22, 17, 12, 7, 8, 3), (21, 22, 17, 12, 7, 8, 9), (21, 22, 17, 12, 7, 8, 13), (21, 22, 17, 12, 11, 6, 1), (21, 22, 17, 12, 11, 6, 5), (21, 22, 17, 12, 11, 6, 7), (21, 22, 17, 12, 11, 10, 5), (21, 22, 17, 12, 11, 10, 15), (21, 22, 17, 12, 11, 16, 15), (21, 22, 17, 12, 13, 8, 3), (21, 22, 17, 12, 13, 8, 7), (21, 22, 17, 12, 13, 8, 9), (21, 22, 17, 12, 13, 14, 9), (21, 22, 17, 12, 13, 14, 19), (21, 22, 17, 12, 13, 18, 19), (21, 22, 17, 12, 13, 18, 23), (21, 22, 17, 16, 11, 6, 1), (21, 22, 17, 16, 11, 6, 5), (21, 22, 17, 16, 11, 6, 7), (21, 22, 17, 16, 11, 10, 5), (21, 22, 17, 16, 11, 10, 15), (21, 22, 17, 16, 11, 12, 7), (21, 22, 17, 16, 11, 12, 13), (21, 22, 17, 16, 15, 10, 5), (21, 22, 17, 16, 15, 10, 11), (21, 22, 17, 18, 13, 8, 3), (21, 22, 17, 18, 13, 8, 7), (21, 22, 17, 18, 13, 8, 9), (21, 22, 17, 18, 13, 12, 7), (21, 22, 17, 18, 13, 12, 11), (21, 22, 17, 18, 13, 14, 9), (21, 22, 17, 18, 13, 14, 19), (21, 22, 17, 18, 19, 14, 9), (21, 22, 17, 18, 19, 14, 13), (21, 22, 17, 18, 19, 24, 23), (21, 22, 17, 18, 23, 24, 19), (21, 22, 23, 18, 13, 8, 3), (21, 22, 23, 18, 13, 8, 7), (21, 22, 23, 18, 13, 8, 9), (21, 22, 23, 18, 13, 12, 7), (21, 22, 23, 18, 13, 12, 11), (21, 22, 23, 18, 13, 12, 17), (21, 22, 23, 18, 13, 14, 9), (21, 22, 23, 18, 13, 14, 19), (21, 22, 23, 18, 17, 12, 7), (21, 22, 23, 18, 17, 12, 11), (21, 22, 23, 18, 17, 12, 13), (21, 22, 23, 18, 17, 16, 11), (21, 22, 23, 18, 17, 16, 15), (21, 22, 23, 18, 19, 14, 9), (21, 22, 23, 18, 19, 14, 13), (21, 22, 23, 24, 19, 14, 9), (21, 22, 23, 24, 19, 14, 13), (21, 22, 23, 24, 19, 18, 13), (21, 22, 23, 24, 19, 18, 17), (22, 17, 12, 7, 2, 1, 0), (22, 17, 12, 7, 2, 1, 6), (22, 17, 12, 7, 2, 3, 4), (22, 17, 12, 7, 2, 3, 8), (22, 17, 12, 7, 6, 1, 0), (22, 17, 12, 7, 6, 1, 2), (22, 17, 12, 7, 6, 5, 0), (22, 17, 12, 7, 6, 5, 10), (22, 17, 12, 7, 6, 11, 10), (22, 17, 12, 7, 6, 11, 16), (22, 17, 12, 7, 8, 3, 2), (22, 17, 12, 7, 8, 3, 4), (22, 17, 12, 7, 8, 9, 4), (22, 17, 12, 7, 8, 9, 14), (22, 17, 12, 7, 8, 13, 14), (22, 17, 12, 7, 8, 13, 18), (22, 17, 12, 11, 6, 1, 0), (22, 17, 12, 11, 6, 1, 2), (22, 17, 12, 11, 6, 5, 0), (22, 17, 12, 11, 6, 5, 10), (22, 17, 12, 11, 6, 7, 2), (22, 17, 12, 11, 6, 7, 8), (22, 17, 12, 11, 10, 5, 0), (22, 17, 12, 11, 10, 5, 6), (22, 17, 12, 11, 10, 15, 16), (22, 17, 12, 11, 10, 15, 20), (22, 17, 12, 11, 16, 15, 10), (22, 17, 12, 11, 16, 15, 20), (22, 17, 12, 11, 16, 21, 20), (22, 17, 12, 13, 8, 3, 2), (22, 17, 12, 13, 8, 3, 4), (22, 17, 12, 13, 8, 7, 2), (22, 17, 12, 13, 8, 7, 6), (22, 17, 12, 13, 8, 9, 4), (22, 17, 12, 13, 8, 9, 14), (22, 17, 12, 13, 14, 9, 4), (22, 17, 12, 13, 14, 9, 8), (22, 17, 12, 13, 14, 19, 18), (22, 17, 12, 13, 14, 19, 24), (22, 17, 12, 13, 18, 19, 14), (22, 17, 12, 13, 18, 19, 24), (22, 17, 12, 13, 18, 23, 24), (22, 17, 16, 11, 6, 1, 0), (22, 17, 16, 11, 6, 1, 2), (22, 17, 16, 11, 6, 5, 0), (22, 17, 16, 11, 6, 5, 10), (22, 17, 16, 11, 6, 7, 2), (22, 17, 16, 11, 6, 7, 8), (22, 17, 16, 11, 6, 7, 12), (22, 17, 16, 11, 10, 5, 0), (22, 17, 16, 11, 10, 5, 6), (22, 17, 16, 11, 10, 15, 20), (22, 17, 16, 11, 12, 7, 2), (22, 17, 16, 11, 12, 7, 6), (22, 17, 16, 11, 12, 7, 8), (22, 17, 16, 11, 12, 13, 8), (22, 17, 16, 11, 12, 13, 14), (22, 17, 16, 11, 12, 13, 18), (22, 17, 16, 15, 10, 5, 0), (22, 17, 16, 15, 10, 5, 6), (22, 17, 16, 15, 10, 11, 6), (22, 17, 16, 15, 10, 11, 12), (22, 17, 16, 21, 20, 15, 10), (22, 17, 18, 13, 8, 3, 2), (22, 17, 18, 13, 8, 3, 4), (22, 17, 18, 13, 8, 7, 2), (22, 17, 18, 13, 8, 7, 6), (22, 17, 18, 13, 8, 7, 12), (22, 17, 18, 13, 8, 9, 4), (22, 17, 18, 13, 8, 9, 14), (22, 17, 18, 13, 12, 7, 2), (22, 17, 18, 13, 12, 7, 6), (22, 17, 18, 13, 12, 7, 8), (22, 17, 18, 13, 12, 11, 6), (22, 17, 18, 13, 12, 11, 10), (22, 17, 18, 13, 12, 11, 16), (22, 17, 18, 13, 14, 9, 4), (22, 17, 18, 13, 14, 9, 8), (22, 17, 18, 13, 14, 19, 24), (22, 17, 18, 19, 14, 9, 4), (22, 17, 18, 19, 14, 9, 8), (22, 17, 18, 19, 14, 13, 8), (22, 17, 18, 19, 14, 13, 12), (22, 17, 18, 23, 24, 19, 14), (22, 21, 16, 11, 6, 1, 0), (22, 21, 16, 11, 6, 1, 2), (22, 21, 16, 11, 6, 5, 0), (22, 21, 16, 11, 6, 5, 10), (22, 21, 16, 11, 6, 7, 2), (22, 21, 16, 11, 6, 7, 8), (22, 21, 16, 11, 6, 7, 12), (22, 21, 16, 11, 10, 5, 0), (22, 21, 16, 11, 10, 5, 6), (22, 21, 16, 11, 10, 15, 20), (22, 21, 16, 11, 12, 7, 2), (22, 21, 16, 11, 12, 7, 6), (22, 21, 16, 11, 12, 7, 8), (22, 21, 16, 11, 12, 13, 8), (22, 21, 16, 11, 12, 13, 14), (22, 21, 16, 11, 12, 13, 18), (22, 21, 16, 11, 12, 17, 18), (22, 21, 16, 15, 10, 5, 0), (22, 21, 16, 15, 10, 5, 6), (22, 21, 16, 15, 10, 11, 6), (22, 21, 16, 15, 10, 11, 12), (22, 21, 16, 17, 12, 7, 2), (22, 21, 16, 17, 12, 7, 6), (22, 21, 16, 17, 12, 7, 8), (22, 21, 16, 17, 12, 11, 6), (22, 21, 16, 17, 12, 11, 10), (22, 21, 16, 17, 12, 13, 8), (22, 21, 16, 17, 12, 13, 14), (22, 21, 16, 17, 12, 13, 18), (22, 21, 16, 17, 18, 13, 8), (22, 21, 16, 17, 18, 13, 12), (22, 21, 16, 17, 18, 13, 14), (22, 21, 16, 17, 18, 19, 14), (22, 21, 16, 17, 18, 19, 24), (22, 21, 16, 17, 18, 23, 24), (22, 21, 20, 15, 10, 5, 0), (22, 21, 20, 15, 10, 5, 6), (22, 21, 20, 15, 10, 11, 6), (22, 21, 20, 15, 10, 11, 12), (22, 21, 20, 15, 10, 11, 16), (22, 21, 20, 15, 16, 11, 6), (22, 21, 20, 15, 16, 11, 10), (22, 21, 20, 15, 16, 11, 12), (22, 21, 20, 15, 16, 17, 12), (22, 21, 20, 15, 16, 17, 18), (22, 23, 18, 13, 8, 3, 2), (22, 23, 18, 13, 8, 3, 4), (22, 23, 18, 13, 8, 7, 2), (22, 23, 18, 13, 8, 7, 6), (22, 23, 18, 13, 8, 7, 12), (22, 23, 18, 13, 8, 9, 4), (22, 23, 18, 13, 8, 9, 14), (22, 23, 18, 13, 12, 7, 2), (22, 23, 18, 13, 12, 7, 6), (22, 23, 18, 13, 12, 7, 8), (22, 23, 18, 13, 12, 11, 6), (22, 23, 18, 13, 12, 11, 10), (22, 23, 18, 13, 12, 11, 16), (22, 23, 18, 13, 12, 17, 16), (22, 23, 18, 13, 14, 9, 4), (22, 23, 18, 13, 14, 9, 8), (22, 23, 18, 13, 14, 19, 24), (22, 23, 18, 17, 12, 7, 2), (22, 23, 18, 17, 12, 7, 6), (22, 23, 18, 17, 12, 7, 8), (22, 23, 18, 17, 12, 11, 6), (22, 23, 18, 17, 12, 11, 10), (22, 23, 18, 17, 12, 11, 16), (22, 23, 18, 17, 12, 13, 8), (22, 23, 18, 17, 12, 13, 14), (22, 23, 18, 17, 16, 11, 6), (22, 23, 18, 17, 16, 11, 10), (22, 23, 18, 17, 16, 11, 12), (22, 23, 18, 17, 16, 15, 10), (22, 23, 18, 17, 16, 15, 20), (22, 23, 18, 17, 16, 21, 20), (22, 23, 18, 19, 14, 9, 4), (22, 23, 18, 19, 14, 9, 8), (22, 23, 18, 19, 14, 13, 8), (22, 23, 18, 19, 14, 13, 12), (22, 23, 24, 19, 14, 9, 4), (22, 23, 24, 19, 14, 9, 8), (22, 23, 24, 19, 14, 13, 8), (22, 23, 24, 19, 14, 13, 12), (22, 23, 24, 19, 14, 13, 18), (22, 23, 24, 19, 18, 13, 8), (22, 23, 24, 19, 18, 13, 12), (22, 23, 24, 19, 18, 13, 14), (22, 23, 24, 19, 18, 17, 12), (22, 23, 24, 19, 18, 17, 16), (23, 18, 13, 8, 3, 2, 1), (23, 18, 13, 8, 3, 2, 7), (23, 18, 13, 8, 3, 4, 9), (23, 18, 13, 8, 7, 2, 1), (23, 18, 13, 8, 7, 2, 3), (23, 18, 13, 8, 7, 6, 1), (23, 18, 13, 8, 7, 6, 5), (23, 18, 13, 8, 7, 6, 11), (23, 18, 13, 8, 7, 12, 11), (23, 18, 13, 8, 7, 12, 17), (23, 18, 13, 8, 9, 4, 3), (23, 18, 13, 8, 9, 14, 19), (23, 18, 13, 12, 7, 2, 1), (23, 18, 13, 12, 7, 2, 3), (23, 18, 13, 12, 7, 6, 1), (23, 18, 13, 12, 7, 6, 5), (23, 18, 13, 12, 7, 6, 11), (23, 18, 13, 12, 7, 8, 3), (23, 18, 13, 12, 7, 8, 9), (23, 18, 13, 12, 11, 6, 1), (23, 18, 13, 12, 11, 6, 5), (23, 18, 13, 12, 11, 6, 7), (23, 18, 13, 12, 11, 10, 5), (23, 18, 13, 12, 11, 10, 15), (23, 18, 13, 12, 11, 16, 15), (23, 18, 13, 12, 11, 16, 17), (23, 18, 13, 12, 11, 16, 21), (23, 18, 13, 12, 17, 16, 11), (23, 18, 13, 12, 17, 16, 15), (23, 18, 13, 12, 17, 16, 21), (23, 18, 13, 12, 17, 22, 21), (23, 18, 13, 14, 9, 4, 3), (23, 18, 13, 14, 9, 8, 3), (23, 18, 13, 14, 9, 8, 7), (23, 18, 17, 12, 7, 2, 1), (23, 18, 17, 12, 7, 2, 3), (23, 18, 17, 12, 7, 6, 1), (23, 18, 17, 12, 7, 6, 5), (23, 18, 17, 12, 7, 6, 11), (23, 18, 17, 12, 7, 8, 3), (23, 18, 17, 12, 7, 8, 9), (23, 18, 17, 12, 7, 8, 13), (23, 18, 17, 12, 11, 6, 1), (23, 18, 17, 12, 11, 6, 5), (23, 18, 17, 12, 11, 6, 7), (23, 18, 17, 12, 11, 10, 5), (23, 18, 17, 12, 11, 10, 15), (23, 18, 17, 12, 11, 16, 15), (23, 18, 17, 12, 11, 16, 21), (23, 18, 17, 12, 13, 8, 3), (23, 18, 17, 12, 13, 8, 7), (23, 18, 17, 12, 13, 8, 9), (23, 18, 17, 12, 13, 14, 9), (23, 18, 17, 12, 13, 14, 19), (23, 18, 17, 16, 11, 6, 1), (23, 18, 17, 16, 11, 6, 5), (23, 18, 17, 16, 11, 6, 7), (23, 18, 17, 16, 11, 10, 5), (23, 18, 17, 16, 11, 10, 15), (23, 18, 17, 16, 11, 12, 7), (23, 18, 17, 16, 11, 12, 13), (23, 18, 17, 16, 15, 10, 5), (23, 18, 17, 16, 15, 10, 11), (23, 18, 17, 16, 15, 20, 21), (23, 18, 17, 16, 21, 20, 15), (23, 18, 17, 22, 21, 16, 11), (23, 18, 17, 22, 21, 16, 15), (23, 18, 17, 22, 21, 20, 15), (23, 18, 19, 14, 9, 4, 3), (23, 18, 19, 14, 9, 8, 3), (23, 18, 19, 14, 9, 8, 7), (23, 18, 19, 14, 9, 8, 13), (23, 18, 19, 14, 13, 8, 3), (23, 18, 19, 14, 13, 8, 7), (23, 18, 19, 14, 13, 8, 9), (23, 18, 19, 14, 13, 12, 7), (23, 18, 19, 14, 13, 12, 11), (23, 18, 19, 14, 13, 12, 17), (23, 22, 17, 12, 7, 2, 1), (23, 22, 17, 12, 7, 2, 3), (23, 22, 17, 12, 7, 6, 1), (23, 22, 17, 12, 7, 6, 5), (23, 22, 17, 12, 7, 6, 11), (23, 22, 17, 12, 7, 8, 3), (23, 22, 17, 12, 7, 8, 9), (23, 22, 17, 12, 7, 8, 13), (23, 22, 17, 12, 11, 6, 1), (23, 22, 17, 12, 11, 6, 5), (23, 22, 17, 12, 11, 6, 7), (23, 22, 17, 12, 11, 10, 5), (23, 22, 17, 12, 11, 10, 15), (23, 22, 17, 12, 11, 16, 15), (23, 22, 17, 12, 11, 16, 21), (23, 22, 17, 12, 13, 8, 3), (23, 22, 17, 12, 13, 8, 7), (23, 22, 17, 12, 13, 8, 9), (23, 22, 17, 12, 13, 14, 9), (23, 22, 17, 12, 13, 14, 19), (23, 22, 17, 12, 13, 18, 19), (23, 22, 17, 16, 11, 6, 1), (23, 22, 17, 16, 11, 6, 5), (23, 22, 17, 16, 11, 6, 7), (23, 22, 17, 16, 11, 10, 5), (23, 22, 17, 16, 11, 10, 15), (23, 22, 17, 16, 11, 12, 7), (23, 22, 17, 16, 11, 12, 13), (23, 22, 17, 16, 15, 10, 5), (23, 22, 17, 16, 15, 10, 11), (23, 22, 17, 16, 15, 20, 21), (23, 22, 17, 16, 21, 20, 15), (23, 22, 17, 18, 13, 8, 3), (23, 22, 17, 18, 13, 8, 7), (23, 22, 17, 18, 13, 8, 9), (23, 22, 17, 18, 13, 12, 7), (23, 22, 17, 18, 13, 12, 11), (23, 22, 17, 18, 13, 14, 9), (23, 22, 17, 18, 13, 14, 19), (23, 22, 17, 18, 19, 14, 9), (23, 22, 17, 18, 19, 14, 13), (23, 22, 21, 16, 11, 6, 1), (23, 22, 21, 16, 11, 6, 5), (23, 22, 21, 16, 11, 6, 7), (23, 22, 21, 16, 11, 10, 5), (23, 22, 21, 16, 11, 10, 15), (23, 22, 21, 16, 11, 12, 7), (23, 22, 21, 16, 11, 12, 13), (23, 22, 21, 16, 11, 12, 17), (23, 22, 21, 16, 15, 10, 5), (23, 22, 21, 16, 15, 10, 11), (23, 22, 21, 16, 17, 12, 7), (23, 22, 21, 16, 17, 12, 11), (23, 22, 21, 16, 17, 12, 13), (23, 22, 21, 16, 17, 18, 13), (23, 22, 21, 16, 17, 18, 19), (23, 22, 21, 20, 15, 10, 5), (23, 22, 21, 20, 15, 10, 11), (23, 22, 21, 20, 15, 16, 11), (23, 22, 21, 20, 15, 16, 17), (23, 24, 19, 14, 9, 4, 3), (23, 24, 19, 14, 9, 8, 3), (23, 24, 19, 14, 9, 8, 7), (23, 24, 19, 14, 9, 8, 13), (23, 24, 19, 14, 13, 8, 3), (23, 24, 19, 14, 13, 8, 7), (23, 24, 19, 14, 13, 8, 9), (23, 24, 19, 14, 13, 12, 7), (23, 24, 19, 14, 13, 12, 11), (23, 24, 19, 14, 13, 12, 17), (23, 24, 19, 14, 13, 18, 17), (23, 24, 19, 18, 13, 8, 3), (23, 24, 19, 18, 13, 8, 7), (23, 24, 19, 18, 13, 8, 9), (23, 24, 19, 18, 13, 12, 7), (23, 24, 19, 18, 13, 12, 11), (23, 24, 19, 18, 13, 12, 17), (23, 24, 19, 18, 13, 14, 9), (23, 24, 19, 18, 17, 12, 7), (23, 24, 19, 18, 17, 12, 11), (23, 24, 19, 18, 17, 12, 13), (23, 24, 19, 18, 17, 16, 11), (23, 24, 19, 18, 17, 16, 15), (23, 24, 19, 18, 17, 16, 21), (23, 24, 19, 18, 17, 22, 21), (24, 19, 14, 9, 4, 3, 2), (24, 19, 14, 9, 4, 3, 8), (24, 19, 14, 9, 8, 3, 2), (24, 19, 14, 9, 8, 3, 4), (24, 19, 14, 9, 8, 7, 2), (24, 19, 14, 9, 8, 7, 6), (24, 19, 14, 9, 8, 7, 12), (24, 19, 14, 9, 8, 13, 12), (24, 19, 14, 9, 8, 13, 18), (24, 19, 14, 13, 8, 3, 2), (24, 19, 14, 13, 8, 3, 4), (24, 19, 14, 13, 8, 7, 2), (24, 19, 14, 13, 8, 7, 6), (24, 19, 14, 13, 8, 7, 12), (24, 19, 14, 13, 8, 9, 4), (24, 19, 14, 13, 12, 7, 2), (24, 19, 14, 13, 12, 7, 6), (24, 19, 14, 13, 12, 7, 8), (24, 19, 14, 13, 12, 11, 6), (24, 19, 14, 13, 12, 11, 10), (24, 19, 14, 13, 12, 11, 16), (24, 19, 14, 13, 12, 17, 16), (24, 19, 14, 13, 12, 17, 18), (24, 19, 14, 13, 12, 17, 22), (24, 19, 14, 13, 18, 17, 12), (24, 19, 14, 13, 18, 17, 16), (24, 19, 14, 13, 18, 17, 22), (24, 19, 14, 13, 18, 23, 22), (24, 19, 18, 13, 8, 3, 2), (24, 19, 18, 13, 8, 3, 4), (24, 19, 18, 13, 8, 7, 2), (24, 19, 18, 13, 8, 7, 6), (24, 19, 18, 13, 8, 7, 12), (24, 19, 18, 13, 8, 9, 4), (24, 19, 18, 13, 8, 9, 14), (24, 19, 18, 13, 12, 7, 2), (24, 19, 18, 13, 12, 7, 6), (24, 19, 18, 13, 12, 7, 8), (24, 19, 18, 13, 12, 11, 6), (24, 19, 18, 13, 12, 11, 10), (24, 19, 18, 13, 12, 11, 16), (24, 19, 18, 13, 12, 17, 16), (24, 19, 18, 13, 12, 17, 22), (24, 19, 18, 13, 14, 9, 4), (24, 19, 18, 13, 14, 9, 8), (24, 19, 18, 17, 12, 7, 2), (24, 19, 18, 17, 12, 7, 6), (24, 19, 18, 17, 12, 7, 8), (24, 19, 18, 17, 12, 11, 6), (24, 19, 18, 17, 12, 11, 10), (24, 19, 18, 17, 12, 11, 16), (24, 19, 18, 17, 12, 13, 8), (24, 19, 18, 17, 12, 13, 14), (24, 19, 18, 17, 16, 11, 6), (24, 19, 18, 17, 16, 11, 10), (24, 19, 18, 17, 16, 11, 12), (24, 19, 18, 17, 16, 15, 10), (24, 19, 18, 17, 16, 15, 20), (24, 19, 18, 17, 16, 21, 20), (24, 19, 18, 17, 16, 21, 22), (24, 19, 18, 17, 22, 21, 16), (24, 19, 18, 17, 22, 21, 20), (24, 19, 18, 23, 22, 17, 12), (24, 19, 18, 23, 22, 17, 16), (24, 19, 18, 23, 22, 21, 16), (24, 19, 18, 23, 22, 21, 20), (24, 23, 18, 13, 8, 3, 2), (24, 23, 18, 13, 8, 3, 4), (24, 23, 18, 13, 8, 7, 2), (24, 23, 18, 13, 8, 7, 6), (24, 23, 18, 13, 8, 7, 12), (24, 23, 18, 13, 8, 9, 4), (24, 23, 18, 13, 8, 9, 14), (24, 23, 18, 13, 12, 7, 2), (24, 23, 18, 13, 12, 7, 6), (24, 23, 18, 13, 12, 7, 8), (24, 23, 18, 13, 12, 11, 6), (24, 23, 18, 13, 12, 11, 10), (24, 23, 18, 13, 12, 11, 16), (24, 23, 18, 13, 12, 17, 16), (24, 23, 18, 13, 12, 17, 22), (24, 23, 18, 13, 14, 9, 4), (24, 23, 18, 13, 14, 9, 8), (24, 23, 18, 17, 12, 7, 2), (24, 23, 18, 17, 12, 7, 6), (24, 23, 18, 17, 12, 7, 8), (24, 23, 18, 17, 12, 11, 6), (24, 23, 18, 17, 12, 11, 10), (24, 23, 18, 17, 12, 11, 16), (24, 23, 18, 17, 12, 13, 8), (24, 23, 18, 17, 12, 13, 14), (24, 23, 18, 17, 16, 11, 6), (24, 23, 18, 17, 16, 11, 10), (24, 23, 18, 17, 16, 11, 12), (24, 23, 18, 17, 16, 15, 10), (24, 23, 18, 17, 16, 15, 20), (24, 23, 18, 17, 16, 21, 20), (24, 23, 18, 17, 16, 21, 22), (24, 23, 18, 17, 22, 21, 16), (24, 23, 18, 17, 22, 21, 20), (24, 23, 18, 19, 14, 9, 4), (24, 23, 18, 19, 14, 9, 8), (24, 23, 18, 19, 14, 13, 8), (24, 23, 18, 19, 14, 13, 12), (24, 23, 22, 17, 12, 7, 2), (24, 23, 22, 17, 12, 7, 6), (24, 23, 22, 17, 12, 7, 8), (24, 23, 22, 17, 12, 11, 6), (24, 23, 22, 17, 12, 11, 10), (24, 23, 22, 17, 12, 11, 16), (24, 23, 22, 17, 12, 13, 8), (24, 23, 22, 17, 12, 13, 14), (24, 23, 22, 17, 12, 13, 18), (24, 23, 22, 17, 16, 11, 6), (24, 23, 22, 17, 16, 11, 10), (24, 23, 22, 17, 16, 11, 12), (24, 23, 22, 17, 16, 15, 10), (24, 23, 22, 17, 16, 15, 20), (24, 23, 22, 17, 16, 21, 20), (24, 23, 22, 17, 18, 13, 8), (24, 23, 22, 17, 18, 13, 12), (24, 23, 22, 17, 18, 13, 14), (24, 23, 22, 17, 18, 19, 14), (24, 23, 22, 21, 16, 11, 6), (24, 23, 22, 21, 16, 11, 10), (24, 23, 22, 21, 16, 11, 12), (24, 23, 22, 21, 16, 15, 10), (24, 23, 22, 21, 16, 15, 20), (24, 23, 22, 21, 16, 17, 12), (24, 23, 22, 21, 16, 17, 18), (24, 23, 22, 21, 20, 15, 10), (24, 23, 22, 21, 20, 15, 16))
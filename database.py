@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+from threading import Lock
+from metrics import NullMetrics
+from urllib.request import pathname2url
+import sqlite3 as DB
+
+
+class DatabaseError(Exception):
+    """Пользовательский класс исключения для базы данных!"""
+    pass
+
+
+class Database:
+    """Слой доступа к словарю: одно долгоживущее соединение только для чтения!
+
+    Соединение открывается при первом запросе (mode=ro, immutable=1) и живет до
+    закрытия приложения. Все запросы параметризованы, поэтому их
+    подготовленные выражения берутся из кеша соединения, а не разбираются
+    заново на каждое касание."""
+
+    MMAP_SIZE = 64 * 1024 * 1024  # отображение файла базы в память
+    CACHE_SIZE = -4096  # кеш страниц в КБ
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.conn = None
+        self.lock = Lock()  # соединение общее для потоков
+        self.metrics = NullMetrics()  # число и время запросов (фаза 'sql')
+
+    def open(self) -> DB.Connection:
+        """Новое соединение только для чтения!"""
+        try:
+            uri = 'file:' + pathname2url(self.path) + '?mode=ro&immutable=1'
+            conn = DB.connect(uri, uri=True, check_same_thread=False, cached_statements=32)
+            conn.execute('pragma mmap_size = {}'.format(self.MMAP_SIZE))
+            conn.execute('pragma cache_size = {}'.format(self.CACHE_SIZE))
+        except DB.Error as err:
+            raise DatabaseError(err)
+        return conn
+
+    def connect(self) -> DB.Connection:
+        if self.conn is None:
+            self.conn = self.open()
+        return self.conn
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def query(self, sql: str, params=()) -> list:
+        with self.lock, self.metrics.phase('sql'):
+            try:
+                return self.connect().execute(sql, params).fetchall()
+            except DB.Error as err:
+                raise DatabaseError(err)  # если ошибка в SQL-запросе
+
+    def words(self) -> list:
+        """Все слова словаря (отдельным соединением: долгая загрузка в фоне не держит общее)!"""
+        with self.metrics.phase('sql'):
+            conn = self.open()
+            try:
+                return [row[0] for row in conn.execute('select WORD from DICT')]
+            except DB.Error as err:
+                raise DatabaseError(err)
+            finally:
+                conn.close()
+
+    def rowids_by_len(self, length: int) -> list:
+        """rowid слов заданной длины (таблица для выбора слова по номеру)!"""
+        return [row[0] for row in self.query('select rowid from DICT where LEN = ?', (length,))]
+
+    def word_by_rowid(self, rowid: int) -> str:
+        data = self.query('select WORD from DICT where rowid = ?', (rowid,))
+        return data[0][0] if data else ''
+
+    def has_word(self, word: str) -> bool:
+        return bool(self.query('select 1 from DICT where WORD = ? limit 1', (word,)))
+
+    def comment(self, word: str):
+        """Толкование слова или None!"""
+        data = self.query('select COMMENT from DICT where WORD = ? limit 1', (word,))
+        return data[0][0] if data else None
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Толкования слов в отдельном файле: сжатые zlib блоки по номеру слова!
+
+    python definitions.py dictionary.db definitions.bin
+
+Номер слова - позиция в отсортированном списке слов словаря в верхнем
+регистре (WordSet.words), поэтому индекс слов толкований не хранит. Формат
+(little-endian): заголовок, смещения блоков (count // BLOCK + 2 чисел), блоки
+по BLOCK толкований, разделенных нулевым символом."""
+
+from array import array
+from collections import OrderedDict
+from queue import Queue
+from threading import Lock, Thread
+from wordset import words_checksum
+import sqlite3
+import struct
+import sys
+import zlib
+
+MAGIC = b'BKDF'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIII')  # метка, версия, толкований в блоке, слов, crc32 слов, блоков
+BLOCK = 64
+
+
+class DefinitionsError(Exception):
+    """Файл толкований отсутствует, поврежден или от другого словаря!"""
+    pass
+
+
+def compile_definitions(db_path: str, out_path: str) -> int:
+    """Собрать файл толкований из таблицы DICT, вернуть число слов!"""
+    conn = sqlite3.connect(db_path)
+    try:
+        comments = {}
+        for word, comment in conn.execute('select WORD, COMMENT from DICT'):
+            comments.setdefault(word.upper(), comment or '')
+    finally:
+        conn.close()
+
+    words = sorted(comments)
+    blocks = [zlib.compress('\0'.join(comments[word] for word in words[i:i + BLOCK]).encode('utf-8'), 9)
+              for i in range(0, len(words), BLOCK)]
+    offsets = array('I', [HEADER.size + 4 * (len(blocks) + 1)])
+    for block in blocks:
+        offsets.append(offsets[-1] + len(block))
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+
+    with open(out_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, BLOCK, len(words), words_checksum(words), len(blocks)))
+        f.write(offsets.tobytes())
+        for block in blocks:
+            f.write(block)
+    return len(words)
+
+
+class DefinitionStore:
+    """Чтение файла толкований: блок читается и распаковывается по требованию!
+
+    Распакованные блоки хранятся в LRU-кеше не более CACHE_BLOCKS штук."""
+
+    CACHE_BLOCKS = 32
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file = None
+        self.lock = Lock()  # чтение из главного потока и потока предзагрузки
+        self.cache = OrderedDict()  # номер блока -> список толкований
+        self.count = 0
+        self.checksum = 0
+        self.block_size = BLOCK
+        self.offsets = None
+
+    def open(self) -> 'DefinitionStore':
+        try:
+            self.file = open(self.path, 'rb')
+            magic, version, self.block_size, self.count, self.checksum, blocks = HEADER.unpack(self.file.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise DefinitionsError('неизвестный формат ' + self.path)
+            self.offsets = array('I')
+            self.offsets.frombytes(self.file.read(4 * (blocks + 1)))
+            if sys.byteorder != 'little':
+                self.offsets.byteswap()
+        except (OSError, struct.error, ValueError) as err:
+            self.close()
+            raise DefinitionsError(err)
+        return self
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def block(self, n: int) -> list:
+        with self.lock:
+            data = self.cache.get(n)
+            if data is not None:
+                self.cache.move_to_end(n)
+                return data
+            self.file.seek(self.offsets[n])
+            data = zlib.decompress(self.file.read(self.offsets[n + 1] - self.offsets[n])).decode('utf-8').split('\0')
+            self.cache[n] = data
+            if len(self.cache) > self.CACHE_BLOCKS:
+                self.cache.popitem(last=False)
+            return data
+
+    def get(self, word_id: int):
+        """Толкование слова по номеру или None!"""
+        if not 0 <= word_id < self.count:
+            return None
+        return self.block(word_id // self.block_size)[word_id % self.block_size] or None
+
+
+class Definitions:
+    """Толкования для окна по нажатию на слово истории!
+
+    Берутся из файла толкований, когда он есть и построен по тому же словарю,
+    иначе (и пока словарь не загружен в фоне) - запросом к базе. Слова,
+    только что попавшие в историю, заранее читаются в кеш в фоновом потоке."""
+
+    def __init__(self, path: str, lexicon, db) -> None:
+        self.path = path
+        self.lexicon = lexicon
+        self.db = db
+        self.store = None  # None - еще не открыт, False - недоступен
+        self.lock = Lock()
+        self.queue = None
+
+    def opened(self):
+        """Файл толкований, если он подходит словарю, иначе None!"""
+        if self.store is None:
+            with self.lock:
+                if self.store is None:
+                    try:
+                        store = DefinitionStore(self.path).open()
+                    except DefinitionsError:
+                        store = False
+                    membership = self.lexicon.membership
+                    if store and (store.count != len(membership) or store.checksum != membership.checksum()):
+                        store.close()
+                        store = False
+                    self.store = store
+        return self.store or None
+
+    def comment(self, word: str):
+        """Толкование слова или None!"""
+        if self.store is None and not self.lexicon.is_loaded:
+            return self.db.comment(word.lower())  # не ждем загрузки словаря
+        store = self.opened()
+        if store is None:
+            return self.db.comment(word.lower())
+        return store.get(self.lexicon.membership.index(word.upper()))
+
+    def prefetch(self, word: str) -> None:
+        """Прочитать толкование в кеш в фоновом потоке!"""
+        if self.queue is None:
+            self.queue = Queue()
+            Thread(target=self.prefetch_worker, daemon=True).start()
+        self.queue.put(word)
+
+    def prefetch_worker(self) -> None:
+        while True:
+            word = self.queue.get()
+            try:
+                if self.opened() is not None:
+                    self.comment(word)
+            except (OSError, zlib.error):
+                pass  # предзагрузка не должна мешать игре
+
+    def close(self) -> None:
+        if self.store:
+            self.store.close()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        sys.exit(__doc__.splitlines()[2].strip())
+    print('толкований:', compile_definitions(sys.argv[1], sys.argv[2]))
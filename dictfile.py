@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+"""Компилятор словаря в двоичный файл для mmap и чтение этого файла!
+
+    python dictfile.py dictionary.db dictionary.bin [--definitions definitions.bin]
+    python dictfile.py dictionary.db dictionary.bin --verify
+
+Формат (little-endian, разделы выровнены по 4 байта):
+    заголовок HEADER;
+    таблица длин: для n = 0..max_len - смещение слов, число слов, смещение
+        номеров, смещение битовых множеств (по 4 байта);
+    слова длины n - отсортированный блок по n байт cp1251 на слово;
+    номера слов - позиция в общем отсортированном списке (номер толкования);
+    битовые множества шаблонного индекса: для каждой позиции и каждой буквы
+        алфавита (count + 7) // 8 байт, бит i - слово i блока.
+Файл открывается через mmap без разбора: строки и множества читаются из
+отображения по требованию, страницы делит кеш ОС."""
+
+from array import array
+import argparse
+import mmap
+import sqlite3
+import struct
+import sys
+from os.path import join, dirname
+from definitions import DefinitionStore, DefinitionsError
+from wordset import words_checksum
+
+MAGIC = b'BKDC'
+VERSION = 1
+ENCODING = 'cp1251'
+# метка, версия, max_len, слов, crc32 слов, длина алфавита, алфавит, файл толкований
+HEADER = struct.Struct('<4sHHIII64s64s')
+ROW = 4  # чисел в строке таблицы длин
+
+
+class DictFileError(Exception):
+    """Файл словаря отсутствует, поврежден или неизвестного формата!"""
+    pass
+
+
+def load_words(db_path: str) -> list:
+    conn = sqlite3.connect(db_path)
+    try:
+        return sorted({row[0].upper() for row in conn.execute('select WORD from DICT')})
+    finally:
+        conn.close()
+
+
+def align(f) -> int:
+    f.write(b'\0' * (-f.tell() % 4))
+    return f.tell()
+
+
+def compile_dictionary(db_path: str, out_path: str, definitions: str = 'definitions.bin') -> int:
+    """Собрать двоичный файл словаря из таблицы DICT, вернуть число слов!"""
+    words = load_words(db_path)
+    rank = {word: i for i, word in enumerate(words)}
+    alphabet = ''.join(sorted(set(''.join(words))))
+    if len(alphabet) > 64:
+        raise DictFileError('слишком большой алфавит: {}'.format(len(alphabet)))
+    codes = {ltr: i for i, ltr in enumerate(alphabet)}
+    max_len = max(len(word) for word in words)
+    by_len = [[] for _ in range(max_len + 1)]
+    for word in words:  # порядок строк и байтов cp1251 для заглавных букв совпадает
+        by_len[len(word)].append(word)
+
+    table = array('I', [0] * (max_len + 1) * ROW)
+    with open(out_path, 'wb') as f:
+        f.write(b'\0' * (HEADER.size + 4 * len(table)))
+        for n, group in enumerate(by_len):
+            data = ''.join(group).encode(ENCODING)
+            table[n * ROW] = align(f)
+            table[n * ROW + 1] = len(group)
+            f.write(data)
+
+            table[n * ROW + 2] = align(f)
+            f.write(array('I', [rank[word] for word in group]).tobytes())
+
+            table[n * ROW + 3] = align(f)
+            size = (len(group) + 7) // 8
+            for pos in range(n):
+                bits = [bytearray(size) for _ in alphabet]
+                for i, word in enumerate(group):
+                    bits[codes[word[pos]]][i >> 3] |= 1 << (i & 7)
+                for mask in bits:
+                    f.write(mask)
+
+        if sys.byteorder != 'little':
+            table.byteswap()
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, max_len, len(words), words_checksum(words), len(alphabet),
+                            alphabet.encode(ENCODING), definitions.encode('utf-8')))
+        f.write(table.tobytes())
+    return len(words)
+
+
+class CompiledDictionary:
+    """Словарь из двоичного файла через mmap: при открытии читается только заголовок!"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        try:
+            with open(path, 'rb') as f:
+                self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            (magic, version, self.max_len, self.count, self.checksum, alpha_len,
+             alphabet, definitions) = HEADER.unpack_from(self.mm)
+        except (OSError, ValueError, struct.error) as err:
+            raise DictFileError(err)
+        if magic != MAGIC or version != VERSION or sys.byteorder != 'little':
+            self.close()
+            raise DictFileError('неизвестный формат ' + path)
+        self.alphabet = alphabet[:alpha_len].decode(ENCODING)
+        self.codes = {ltr: i for i, ltr in enumerate(self.alphabet)}
+        self.definitions = definitions.rstrip(b'\0').decode('utf-8')
+        self.table = memoryview(self.mm)[HEADER.size:HEADER.size + 4 * ROW * (self.max_len + 1)].cast('I')
+        self._membership = None
+        self._index = None
+
+    def close(self) -> None:
+        self.table = None
+        self.mm.close()
+
+    def block(self, n: int) -> tuple:
+        """(смещение, число слов) блока слов длины n!"""
+        if not 0 < n <= self.max_len:
+            return 0, 0
+        return self.table[n * ROW], self.table[n * ROW + 1]
+
+    def word(self, n: int, i: int) -> str:
+        offset = self.table[n * ROW] + i * n
+        return self.mm[offset:offset + n].decode(ENCODING)
+
+    def words_by_len(self, n: int) -> list:
+        """Слова длины n!"""
+        offset, count = self.block(n)
+        data = self.mm[offset:offset + count * n].decode(ENCODING)
+        return [data[i:i + n] for i in range(0, count * n, n)]
+
+    def words(self) -> list:
+        """Все слова (по длине, внутри длины - по алфавиту)!"""
+        result = []
+        for n in range(1, self.max_len + 1):
+            result.extend(self.words_by_len(n))
+        return result
+
+    def find(self, word: str) -> int:
+        """Позиция слова в блоке его длины или -1 (двоичный поиск по отображению)!"""
+        n = len(word)
+        offset, count = self.block(n)
+        try:
+            key = word.encode(ENCODING)
+        except UnicodeEncodeError:
+            return -1
+        mm = self.mm
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            p = offset + mid * n
+            if mm[p:p + n] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        p = offset + lo * n
+        return lo if lo < count and mm[p:p + n] == key else -1
+
+    def rank(self, n: int, i: int) -> int:
+        p = self.table[n * ROW + 2] + 4 * i
+        return int.from_bytes(self.mm[p:p + 4], 'little')
+
+    def bitset(self, n: int, pos: int, code: int) -> int:
+        size = (self.table[n * ROW + 1] + 7) // 8
+        p = self.table[n * ROW + 3] + (pos * len(self.alphabet) + code) * size
+        return int.from_bytes(self.mm[p:p + size], 'little')
+
+    @property
+    def membership(self) -> 'MappedWordSet':
+        if self._membership is None:
+            self._membership = MappedWordSet(self)
+        return self._membership
+
+    @property
+    def index(self) -> 'MappedPatternIndex':
+        if self._index is None:
+            self._index = MappedPatternIndex(self)
+        return self._index
+
+
+class MappedWordSet:
+    """Проверка слова по файлу словаря (как WordSet)!"""
+
+    def __init__(self, source: CompiledDictionary) -> None:
+        self.source = source
+
+    def __len__(self) -> int:
+        return self.source.count
+
+    def checksum(self) -> int:
+        return self.source.checksum
+
+    def index(self, word: str) -> int:
+        """Номер слова в общем отсортированном списке или -1!"""
+        i = self.source.find(word)
+        return self.source.rank(len(word), i) if i >= 0 else -1
+
+    def contains(self, word: str) -> bool:
+        return self.source.find(word) >= 0
+
+    __contains__ = contains
+
+
+class MappedPatternIndex:
+    """Шаблонный индекс по файлу словаря (как PatternIndex)!
+
+    Битовое множество (длина, позиция, буква) превращается в целое число при
+    первом обращении и запоминается."""
+
+    BLANKS = ' _'
+
+    def __init__(self, source: CompiledDictionary) -> None:
+        self.source = source
+        self.bits = {}  # (длина, позиция, буква) -> битовое множество
+
+    def __len__(self) -> int:
+        return self.source.count
+
+    def mask(self, pattern: str) -> int:
+        """Битовое множество слов длины len(pattern), подходящих под шаблон!"""
+        source, n = self.source, len(pattern)
+        count = source.block(n)[1]
+        result = (1 << count) - 1
+        for pos, ltr in enumerate(pattern):
+            if ltr not in self.BLANKS:
+                key = (n, pos, ltr)
+                bits = self.bits.get(key)
+                if bits is None:
+                    code = source.codes.get(ltr)
+                    bits = self.bits[key] = 0 if code is None or not count else source.bitset(n, pos, code)
+                result &= bits
+                if not result:
+                    break
+        return result
+
+    def match(self, pattern: str) -> list:
+        """Слова, подходящие под шаблон ('_' или ' ' - любая буква)!"""
+        result = self.mask(pattern)
+        n = len(pattern)
+        found = []
+        while result:
+            low = result & -result
+            found.append(self.source.word(n, low.bit_length() - 1))
+            result ^= low
+        return found
+
+    def contains(self, word: str) -> bool:
+        if any(ltr in self.BLANKS for ltr in word):
+            return False
+        return self.source.find(word) >= 0
+
+    __contains__ = contains
+
+
+def open_compiled(path: str):
+    """Файл словаря или None, если его нет или он поврежден!"""
+    try:
+        return CompiledDictionary(path)
+    except DictFileError:
+        return None
+
+
+def verify(db_path: str, path: str) -> list:
+    """Сравнить файл словаря с базой: список расхождений (пустой - совпадает)!"""
+    from pattern import PatternIndex
+    errors = []
+    words = load_words(db_path)
+    compiled = CompiledDictionary(path)
+    try:
+        if compiled.count != len(words) or compiled.checksum != words_checksum(words):
+            errors.append('число слов или контрольная сумма: {} / {}'.format(compiled.count, len(words)))
+        if sorted(compiled.words()) != words:
+            errors.append('список слов не совпадает')
+        membership = compiled.membership
+        for i, word in enumerate(words):
+            if membership.index(word) != i:
+                errors.append('номер слова {}: {} вместо {}'.format(word, membership.index(word), i))
+                break
+        index = PatternIndex(words)
+        for n, positions in index.bits.items():
+            group = index.words[n]
+            if compiled.words_by_len(n) != group:
+                errors.append('блок слов длины {} не совпадает'.format(n))
+                continue
+            for pos in range(n):
+                for ltr in compiled.alphabet:
+                    if compiled.bitset(n, pos, compiled.codes[ltr]) != positions[pos].get(ltr, 0):
+                        errors.append('индекс ({}, {}, {}) не совпадает'.format(n, pos, ltr))
+        try:  # файл толкований, на который указывает словарь, если он уже собран
+            store = DefinitionStore(join(dirname(path), compiled.definitions)).open()
+        except DefinitionsError:
+            pass
+        else:
+            if store.count != compiled.count or store.checksum != compiled.checksum:
+                errors.append('файл толкований {} от другого словаря'.format(compiled.definitions))
+            store.close()
+    finally:
+        compiled.close()
+    return errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('db')
+    parser.add_argument('out')
+    parser.add_argument('--definitions', default='definitions.bin', help='файл толкований рядом с файлом словаря')
+    parser.add_argument('--verify', action='store_true', help='только сравнить готовый файл с базой')
+    args = parser.parse_args()
+
+    if not args.verify:
+        print('слов:', compile_dictionary(args.db, args.out, args.definitions))
+    errors = verify(args.db, args.out)
+    for error in errors:
+        print(error)
+    print('файл совпадает с базой' if not errors else 'расхождений: {}'.format(len(errors)))
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+from collections import namedtuple
+from itertools import islice
+from operator import attrgetter
+from threading import Lock
+import heapq
+from state import GameState
+from trie import WordTrie, find_moves, has_move, iter_moves, neighbours
+from pattern import PatternIndex
+from paths import get_paths, TABLE_SIZES
+from candidates import PathTracker
+from wordset import WordSet
+
+Move = namedtuple('Move', 'path word')  # ход: путь по клеткам и слово
+PASS = Move((), '')  # пропуск хода
+Variant = namedtuple('Variant', 'path letter word score')  # вариант хода для анализа: путь, новая буква, слово, очки
+
+# результаты проверки хода
+OK, BAD_SELECTION, USED_WORD, UNKNOWN_WORD = None, 'selection', 'used', 'unknown'
+
+
+class Lexicon:
+    """Словарь игры: слова и поисковые индексы, которые строятся при первом обращении!
+
+    Индексы можно построить заранее в фоновом потоке (preload); обращение к
+    еще не готовому индексу ждет его построения, а не строит второй раз. С
+    откомпилированным словарем (dictfile.CompiledDictionary) проверка слов и
+    шаблонный индекс читаются из его файла, строится только дерево. Пока
+    проверка слов не готова, слово проверяется функцией lookup (запросом к
+    базе), если она передана."""
+
+    def __init__(self, loader, compiled=None, lookup=None) -> None:
+        self.loader = loader  # функция, возвращающая слова словаря
+        self.compiled = compiled
+        self.lookup = lookup  # проверка одного слова до загрузки словаря
+        self.lock = Lock()
+        self._words = None
+        self._membership = compiled.membership if compiled else None
+        self._trie = None
+        self._index = compiled.index if compiled else None
+
+    @classmethod
+    def from_words(cls, words) -> 'Lexicon':
+        words = list(words)
+        return cls(lambda: words)
+
+    @property
+    def words(self) -> list:
+        if self._words is None:
+            with self.lock:
+                if self._words is None:
+                    self._words = self.compiled.words() if self.compiled else [word.upper() for word in self.loader()]
+        return self._words
+
+    @property
+    def membership(self) -> WordSet:
+        """Проверка слова без обращения к базе!"""
+        if self._membership is None:
+            words = self.words
+            with self.lock:
+                if self._membership is None:
+                    self._membership = WordSet(words)
+        return self._membership
+
+    @property
+    def trie(self) -> WordTrie:
+        if self._trie is None:
+            words = self.words
+            with self.lock:
+                if self._trie is None:
+                    self._trie = WordTrie(words)
+        return self._trie
+
+    @property
+    def index(self) -> PatternIndex:
+        if self._index is None:
+            words = self.words
+            with self.lock:
+                if self._index is None:
+                    self._index = PatternIndex(words)
+        return self._index
+
+    @property
+    def is_loaded(self) -> bool:
+        """Слова загружены и проверка слов готова!"""
+        return self._membership is not None
+
+    @property
+    def has_trie(self) -> bool:
+        """Префиксное дерево построено (поиск ходов не будет ждать его построения)!"""
+        return self._trie is not None
+
+    def preload(self) -> None:
+        """Построить все индексы (для фонового потока после запуска), дерево - первым: по нему проверяется конец игры!"""
+        self.trie, self.membership, self.index
+
+    def contains(self, word: str) -> bool:
+        if self.lookup is not None and not self.is_loaded:  # словарь еще строится в фоне - не ждем его
+            return self.lookup(word)
+        return self.membership.contains(word)
+
+
+class Game:
+    """Партия: состояние поля, очередь хода и журнал ходов для отмены!"""
+
+    def __init__(self, lexicon: Lexicon, size: int = 5, state: GameState = None, player_turn: int = 0) -> None:
+        self.lexicon = lexicon
+        self.size = size
+        self.state = state if state is not None else GameState(size)
+        self.player_turn = player_turn
+        self.moves = []  # (ход, игрок, клетка с новой буквой)
+        self._tracker = None
+        self._has_move = None  # есть ли ход в текущей позиции (сбрасывается ходом и отменой)
+
+    @classmethod
+    def new(cls, lexicon: Lexicon, start_word: str, player_turn: int = 0, size: int = 5) -> 'Game':
+        """Новая партия: слово start_word в центральной строке!"""
+        game = cls(lexicon, size, player_turn=player_turn)
+        row = size // 2 * size
+        game.state.set_word(tuple(range(row, row + size)), start_word)
+        return game
+
+    @classmethod
+    def restore(cls, lexicon: Lexicon, matrix, history, score, player_turn: int = 0, size: int = 5) -> 'Game':
+        """Партия по сохраненным данным (буквы поля, история, очки)!"""
+        return cls(lexicon, size, GameState.from_view(matrix, history, score, size), player_turn)
+
+    @property
+    def tracker(self) -> PathTracker:
+        """Учет путей с одной пустой клеткой для быстрого бота (создается при первом обращении)!
+
+        Только для полей с таблицей путей (TABLE_SIZES), на больших полях - None."""
+        if self.size not in TABLE_SIZES:
+            return None
+        if self._tracker is None:
+            self._tracker = PathTracker(get_paths(self.size))
+            self._tracker.reset(self.state.matrix())
+        return self._tracker
+
+    def copy(self) -> 'Game':
+        """Снимок партии для поиска в другом потоке!"""
+        game = Game(self.lexicon, self.size, self.state.copy(), self.player_turn)
+        game.moves = list(self.moves)
+        game._has_move = self._has_move
+        if self._tracker is not None:
+            game._tracker = self._tracker.copy()
+        return game
+
+    def adopt_exhausted(self, other: 'Game') -> None:
+        """Перенять исчерпанные пути, найденные ботом на снимке партии!
+
+        Если учета путей в партии еще нет, берется учет снимка: он создается
+        при первом ходе быстрого бота в потоке поиска, а не в главном потоке."""
+        if other._tracker is None or len(other.moves) != len(self.moves):  # снимок другой позиции
+            return
+        if self._tracker is None:
+            self._tracker = other._tracker
+            return
+        for pid in other._tracker.exhausted - self._tracker.exhausted:
+            self._tracker.exclude(pid)
+
+    def check_selection(self, path) -> bool:
+        """Путь - змейка из соседних клеток ровно с одной пустой клеткой!"""
+        if len(path) < 2 or len(set(path)) != len(path):
+            return False
+        if len(self.state.blanks(path)) != 1:
+            return False
+        nbrs = neighbours(self.size)
+        for i in range(1, len(path)):
+            if path[i] not in nbrs[path[i - 1]]:
+                return False
+        return True
+
+    def check_move(self, move: Move):
+        """Проверка хода игрока: OK или код ошибки!"""
+        if not self.check_selection(move.path) or len(move.word) != len(move.path):
+            return BAD_SELECTION
+        for cell, ltr in zip(move.path, move.word):
+            if self.state.letters[cell] and self.state.letter(cell) != ltr:
+                return BAD_SELECTION
+        if move.word in self.state.used_words:
+            return USED_WORD
+        if not self.lexicon.contains(move.word):
+            return UNKNOWN_WORD
+        return OK
+
+    def legal_moves(self) -> list:
+        """Все допустимые ходы в позиции!"""
+        return [Move(path, word) for path, word in
+                find_moves(self.state.matrix(), self.lexicon.trie, self.state.used_words, self.size)]
+
+    def has_any_legal_move(self) -> bool:
+        """Есть ли в позиции хоть один ход: обход дерева до первого найденного слова!"""
+        if self._has_move is None:
+            self._has_move = has_move(self.state.matrix(), self.lexicon.trie, self.state.used_words, self.size)
+        return self._has_move
+
+    def analyse(self, by_score: bool = False, first_n: int = None):
+        """Допустимые ходы позиции по одному (итератор Variant)!
+
+        Без by_score варианты отдаются по мере нахождения, и first_n обрывает
+        перебор после первых first_n ходов. С by_score перебираются все ходы,
+        а первые first_n лучших выбираются кучей без сортировки всего списка."""
+        matrix = self.state.matrix()
+        variants = (Variant(path, next(word[i] for i, cell in enumerate(path) if matrix[cell] == ' '), word, len(word))
+                    for path, word in iter_moves(matrix, self.lexicon.trie, self.state.used_words, self.size))
+        if not by_score:
+            return islice(variants, first_n)
+        if first_n is not None:
+            return iter(heapq.nlargest(first_n, variants, key=attrgetter('score')))
+        return iter(sorted(variants, key=attrgetter('score'), reverse=True))
+
+    def review(self, token=None) -> list:
+        """Разбор партии: (игрок, ход, лучший вариант в позиции перед ходом или None) по всем ходам!
+
+        token (bots.CancelToken) прерывает разбор между ходами."""
+        game = self.copy()
+        game._tracker = None
+        while game.moves:
+            game.undo()
+        result = []
+        for move, player, _ in self.moves:
+            if token: token.check()
+            result.append((player, move, next(game.analyse(True, 1), None)))
+            game.apply(move)
+        return result
+
+    def apply(self, move: Move) -> None:
+        """Сделать ход (проверка - в check_move) и передать очередь сопернику!"""
+        cell = -1
+        if move != PASS:
+            cell = self.state.place(move.path, move.word, self.player_turn)
+            if self._tracker is not None and cell >= 0:
+                self._tracker.place(cell)
+            self._has_move = None
+        self.moves.append((move, self.player_turn, cell))
+        self.player_turn = 1 - self.player_turn
+
+    def undo(self) -> Move:
+        """Отменить последний ход!"""
+        move, player, cell = self.moves.pop()
+        if move != PASS:
+            self.state.unplace(move.path, move.word, player, cell)
+            if self._tracker is not None and cell >= 0:
+                self._tracker.unplace(cell)
+            self._has_move = None
+        self.player_turn = player
+        return move
+
+    def is_over(self) -> bool:
+        """Поле заполнено или ни одного слова составить уже нельзя!"""
+        return self.state.is_full() or not self.has_any_legal_move()
+
+    def winner(self) -> int:
+        """0 - ничья, иначе номер победившего игрока (1 или 2)!"""
+        score = self.state.score
+        return 0 if score[0] == score[1] else 1 if score[0] > score[1] else 2
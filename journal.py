@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+from os.path import exists
+import json
+import os
+import struct
+from engine import Game, Move, PASS
+from state import LETTERS, CODES
+
+MAGIC = b'BKJ1'
+HEADER = struct.Struct('<4sBBBBI32s')  # метка, размер поля, первый ход, игра с ботом, уровень бота, зерно, первое слово
+RECORD = struct.Struct('<BBBBQ')  # вид и игрок, первая клетка, длина пути, код новой буквы, направления
+MOVE, PASS_TURN, END = 0, 1, 2  # виды записей
+SNAPSHOT_EVERY = 8  # записей между снимками партии
+
+
+def encode_path(path, size: int) -> int:
+    """Направления шагов пути по 2 бита: 0 - вправо, 1 - влево, 2 - вниз, 3 - вверх!"""
+    steps = {1: 0, -1: 1, size: 2, -size: 3}
+    code = 0
+    for i in range(len(path) - 1, 0, -1):
+        code = code << 2 | steps[path[i] - path[i - 1]]
+    return code
+
+
+def decode_path(start: int, length: int, code: int, size: int) -> tuple:
+    steps = (1, -1, size, -size)
+    path = [start]
+    for _ in range(length - 1):
+        path.append(path[-1] + steps[code & 3])
+        code >>= 2
+    return tuple(path)
+
+
+class Journal:
+    """Журнал партии: заголовок и по одной записи фиксированного размера на ход!
+
+    Запись дописывается в конец файла и сбрасывается на диск (fsync) сразу
+    после хода, поэтому сбой теряет не больше одного хода. Восстановление
+    проигрывает записи через правила партии (Game.apply); каждые
+    SNAPSHOT_EVERY записей состояние сохраняется снимком (JSON рядом с
+    журналом), и проигрываются только записи после него."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.snapshot_path = path + '.snap'
+        self.file = None
+        self.size = 5
+        self.records = 0  # записей в журнале
+        self.moves = []  # (игрок, слово) по порядку - для истории на экране
+
+    def open(self):
+        if self.file is None:
+            self.file = open(self.path, 'ab')
+        return self.file
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def write(self, data: bytes) -> None:
+        f = self.open()
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    def start(self, game: Game, seed: int, playerAI: bool, bot_level: int) -> None:
+        """Новая партия: журнал начинается заново с заголовка!"""
+        self.close()
+        if exists(self.snapshot_path):
+            os.remove(self.snapshot_path)
+        self.size = game.size
+        self.records = 0
+        self.moves = []
+        with open(self.path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, game.size, game.player_turn, playerAI, bot_level, seed,
+                                game.state.history[0].encode('utf-8')))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def append(self, game: Game) -> None:
+        """Записать последний ход партии!"""
+        move, player, cell = game.moves[-1]
+        if move == PASS:
+            self.write(RECORD.pack(PASS_TURN | player << 4, 0, 0, 0, 0))
+        else:
+            self.write(RECORD.pack(MOVE | player << 4, move.path[0], len(move.path),
+                                   CODES[move.word[move.path.index(cell)]] if cell >= 0 else 0,
+                                   encode_path(move.path, self.size)))
+            self.moves.append((player, move.word))
+        self.records += 1
+        if self.records % SNAPSHOT_EVERY == 0:
+            self.snapshot(game)
+
+    def end(self) -> None:
+        """Партия окончена!"""
+        self.write(RECORD.pack(END, 0, 0, 0, 0))
+        self.records += 1
+
+    def snapshot(self, game: Game) -> None:
+        state = game.state
+        data = {'records': self.records, 'matrix': ''.join(state.matrix()), 'history': state.history,
+                'score': state.score, 'player_turn': game.player_turn, 'moves': self.moves}
+        with open(self.snapshot_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(self.snapshot_path + '.tmp', self.snapshot_path)
+
+    def migrate(self, game: Game, moves, playerAI: bool, bot_level: int, over: bool) -> None:
+        """Журнал для партии из сохранения прежней версии (снимок без записей ходов)!"""
+        self.start(game, 0, playerAI, bot_level)
+        self.moves = [tuple(move) for move in moves]
+        self.snapshot(game)
+        if over:
+            self.end()
+
+    def read(self):
+        """(заголовок, содержимое файла журнала) или None, если журнала нет!"""
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+            magic, size, first, playerAI, bot_level, seed, word = HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return None
+        if magic != MAGIC:
+            return None
+        header = {'size': size, 'first': first, 'playerAI': bool(playerAI), 'bot_level': bot_level, 'seed': seed,
+                  'word': word.rstrip(b'\0').decode('utf-8')}
+        return header, data
+
+    def replay(self, game: Game, data: bytes, skip: int = 0, moves: list = None) -> tuple:
+        """Проиграть в партии game записи журнала, начиная с номера skip: (прочитано записей, партия окончена)!
+
+        Ходы для истории (игрок, слово) дописываются в moves, если он передан."""
+        size = game.size
+        count = (len(data) - HEADER.size) // RECORD.size  # неполная последняя запись (сбой) не читается
+        for i in range(count):
+            kind, start, length, code, directions = RECORD.unpack_from(data, HEADER.size + i * RECORD.size)
+            kind, player = kind & 15, kind >> 4
+            if kind == END:
+                return count, True
+            if i < skip:
+                continue
+            if kind == PASS_TURN:
+                game.player_turn = player
+                game.apply(PASS)
+                continue
+            path = decode_path(start, length, directions, size)
+            if not all(0 <= cell < size * size for cell in path) or not game.check_selection(path):
+                return i, False  # поврежденная запись - дальше не читаем
+            word = ''.join(LETTERS[code] if not game.state.letters[cell] else game.state.letter(cell) for cell in path)
+            game.player_turn = player
+            game.apply(Move(path, word))
+            if moves is not None:
+                moves.append((player, word))
+        return count, False
+
+    def load(self, lexicon):
+        """(заголовок, партия, ходы для истории, партия окончена) или None, если журнала нет!
+
+        Партия восстанавливается по снимку и записям после него."""
+        saved = self.read()
+        if saved is None:
+            return None
+        header, data = saved
+        size = self.size = header['size']
+
+        snapshot = None
+        try:
+            with open(self.snapshot_path, encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        if snapshot:
+            game = Game.restore(lexicon, list(snapshot['matrix']), snapshot['history'], snapshot['score'],
+                                snapshot['player_turn'], size)
+            self.moves = [tuple(move) for move in snapshot['moves']]
+            skip = snapshot['records']
+        else:
+            game = Game.new(lexicon, header['word'], header['first'], size)
+            self.moves = []
+            skip = 0
+
+        self.records, over = self.replay(game, data, skip, self.moves)
+        if self.records * RECORD.size != len(data) - HEADER.size:  # отрезаем неполную запись
+            with open(self.path, 'r+b') as f:
+                f.truncate(HEADER.size + self.records * RECORD.size)
+        return header, game, self.moves, over
+
+    def full_game(self, lexicon):
+        """Партия со всеми ходами от первого слова по записям журнала (для разбора партии) или None!"""
+        saved = self.read()
+        if saved is None:
+            return None
+        header, data = saved
+        game = Game.new(lexicon, header['word'], header['first'], header['size'])
+        self.replay(game, data)
+        return game
@@ -1,6 +1,9 @@
 #!python3
 # -*- coding: utf-8 -*-
 
+import time
+START = time.perf_counter()  # начало хронологии запуска
+
 import kivy
 from kivy.app import App
 from kivy.clock import Clock
@@ -11,15 +14,32 @@ from kivy.uix.widget import Widget
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.properties import ObjectProperty, ListProperty, NumericProperty, StringProperty, BooleanProperty
 from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.modalview import ModalView
-from kivy.core.audio import SoundLoader
 from kivy.storage.dictstore import DictStore
+from kivy.logger import Logger
 from os.path import join, dirname
-from combi import COMBI
-import sqlite3 as DB
+from functools import partial
+from threading import Thread
+from engine import Game, Lexicon, Move, PASS, BAD_SELECTION, USED_WORD
+from trie import neighbours
+from database import Database, DatabaseError
+from definitions import Definitions
+from dictfile import open_compiled
+from startwords import StartWords
+from journal import Journal
+from sounds import SoundManager
+from bots import CancelToken, SearchCancelled, STRATEGIES, FAST, SMART
+from metrics import NullMetrics, Timeline, create as create_metrics, timed
+from paths import get_paths, TABLE_SIZES
 import random
+import re
 import sys
 
+timeline = Timeline(START, Logger.info)
+timeline.mark('import')
+
 
 # Returns path containing content - either locally or in pyinstaller tmp file
 def resourcePath():
@@ -30,43 +50,134 @@ def resourcePath():
 
 # Строка соединения с БД
 DATABASE_URI = join(resourcePath(), 'dictionary.db')
+DEFINITIONS_PATH = join(resourcePath(), 'definitions.bin')  # толкования (python definitions.py dictionary.db definitions.bin)
+COMPILED_PATH = join(resourcePath(), 'dictionary.bin')  # словарь для mmap (python dictfile.py dictionary.db dictionary.bin)
 
 
-class DatabaseError(Exception):
-    """Пользовательский класс исключения для базы данных!"""
-    pass
-
-
-class UseDatabase:
-    """Класс диспетчера контекста для соединения с базой данных!"""
+class GameBoard(Widget):
+    """Игровое поле: выделение слова жестом целиком!
 
-    def __init__(self, config: str) -> None:
-        self.configuration = config
+    Клетка под касанием вычисляется по координатам, между соседними точками
+    касания путь проходится с шагом в четверть клетки (быстрый жест не
+    перескакивает клетки), а соседство клеток и число пустых клеток
+    проверяются сразу при входе в клетку.
 
-    def __enter__(self) -> 'cursor':
-        try:
-            self.conn = DB.connect(self.configuration)  # соединение с базой данных
-            self.cursor = self.conn.cursor()
-            return self.cursor
-        except Exception as err:
-            raise DatabaseError(err)
+    Буквы и подсветка клеток обновляются разницей: после изменения букв поля
+    перерисовка назначается один раз на кадр и трогает только изменившиеся
+    клетки. Клетки создаются по размеру поля (build), а не описываются в kv."""
 
-    def __exit__(self, exc_type, exc_value, exc_trace) -> None:
-        self.conn.commit()
-        self.cursor.close()
-        self.conn.close()
-        if exc_type:
-            raise DatabaseError(exc_value)  # если ошибка в SQL-запросе
+    size_board = NumericProperty(5)
+    last_pos = None
+    selected = None  # клетки выделения
+    blanks = 0  # пустые клетки в выделении
+    tiles = None  # номер клетки -> Tile
+    shown = None  # буквы на экране по клеткам
 
+    def __init__(self, **kwargs):
+        super(GameBoard, self).__init__(**kwargs)
+        self.highlighted = set()  # подсвеченные клетки
+        self.redraw = Clock.create_trigger(self.update_letters)  # не чаще раза в кадр
+
+    def build(self, size: int) -> None:
+        """Клетки поля size x size (пересоздаются только при смене размера)!"""
+        if self.tiles is not None and size == self.size_board:
+            return
+        grid = self.children[0]
+        grid.clear_widgets()
+        self.size_board = size
+        self.tiles = {}
+        for cell in range(size * size):
+            tile = Tile()
+            tile.tile_index = cell
+            grid.add_widget(tile)
+            self.tiles[cell] = tile
+        self.shown = [None] * (size * size)
+        self.highlighted = set()
+
+    def tile(self, cell: int):
+        return self.tiles[cell]
+
+    def update_letters(self, *args):
+        """Перерисовка: буквы только изменившихся клеток!"""
+        app = App.get_running_app()
+        with app.metrics.phase('board_redraw'):
+            changed = 0
+            for cell, ltr in enumerate(app.matrix):
+                if self.shown[cell] != ltr:
+                    self.shown[cell] = ltr
+                    self.tiles[cell].letter = ltr
+                    changed += 1
+            app.metrics.count('tiles_updated', changed)
+
+    def highlight(self, cells):
+        """Подсветить клетки cells (снимается только с лишних клеток)!"""
+        cells = set(cells)
+        for cell in self.highlighted - cells:
+            self.tile(cell).selection = False
+        for cell in cells - self.highlighted:
+            self.tile(cell).selection = True
+        self.highlighted = cells
+
+    def tile_step(self) -> tuple:
+        """(ширина клетки, шаг сетки) как в GridLayout поля!"""
+        spacing = self.width / 50
+        tile = (self.width - (self.size_board - 1) * spacing) / self.size_board
+        return tile, tile + spacing
+
+    def cell_at(self, x: float, y: float) -> int:
+        """Номер клетки под точкой или -1 (вне поля или между клетками)!"""
+        tile, step = self.tile_step()
+        dx, dy = x - self.x, self.top - y  # строки сетки идут сверху вниз
+        col, row = int(dx // step), int(dy // step)
+        if not (0 <= col < self.size_board and 0 <= row < self.size_board):
+            return -1
+        if dx - col * step > tile or dy - row * step > tile:
+            return -1
+        return row * self.size_board + col
 
-class GameBoard(Widget):
     def on_touch_down(self, touch):
-        if self.collide_point(touch.x, touch.y) and not App.get_running_app().is_block:
-            App.get_running_app().clear_game_board()
-            App.get_running_app().selection_mode = True
+        app = App.get_running_app()
+        if self.collide_point(touch.x, touch.y) and not app.is_block:
+            app.clear_game_board()
+            app.selection_mode = True
+            self.selected = set()
+            self.blanks = 0
+            self.last_pos = touch.pos
+            self.enter(self.cell_at(touch.x, touch.y))
+
+    def on_touch_move(self, touch):
+        if not App.get_running_app().selection_mode or self.last_pos is None:
+            return
+        (x0, y0), (x1, y1) = self.last_pos, touch.pos
+        self.last_pos = touch.pos
+        count = int(max(abs(x1 - x0), abs(y1 - y0)) / (self.tile_step()[0] / 4)) + 1
+        for i in range(1, count + 1):
+            if not self.enter(self.cell_at(x0 + (x1 - x0) * i / count, y0 + (y1 - y0) * i / count)):
+                break
+
+    def enter(self, cell: int) -> bool:
+        """Клетка под жестом: добавить в выделение, False - выделение отклонено!"""
+        app = App.get_running_app()
+        if cell < 0 or cell in self.selected:
+            return True
+        selection = app.matrix_selection
+        blank = app.matrix[cell] == ' '
+        if (selection and cell not in neighbours(self.size_board)[selection[-1]]) or (blank and self.blanks):
+            self.last_pos = None
+            app.selection_mode = False
+            app.cancel_player_selection('Выделите слово корректно!')
+            return False
+        self.selected.add(cell)
+        self.blanks += blank
+        selection.append(cell)
+        self.tile(cell).selection = True
+        self.highlighted.add(cell)
+        app.sounds.play('move')
+        return True
 
     def on_touch_up(self, touch):
         if App.get_running_app().selection_mode:
+            self.last_pos = None
             App.get_running_app().selection_mode = False
             App.get_running_app().is_block = True
             App.get_running_app().player_selection()
@@ -77,16 +188,18 @@ class Tile(Widget):
     selection = BooleanProperty(False)
     tile_index = 0
 
-    def on_touch_move(self, touch):
-        if self.collide_point(touch.x, touch.y) and App.get_running_app().selection_mode:
-            self.selection = True
-            if self.tile_index not in App.get_running_app().matrix_selection:
-                App.get_running_app().matrix_selection.append(self.tile_index)
-                if App.get_running_app().is_sound: App.get_running_app().sound_move_play()
+
+class HistoryCell(ButtonBehavior, Label):
+    entry = NumericProperty(-1)  # номер слова в истории (-1 - пустая ячейка)
 
 
-class HistoryLabel(Label):
-    pass
+class HistoryRow(BoxLayout):
+    left = StringProperty('')
+    right = StringProperty('')
+    left_id = NumericProperty(-1)
+    right_id = NumericProperty(-1)
+    single = BooleanProperty(False)  # строка первого слова во всю ширину
+    font_size = NumericProperty(24)
 
 
 class Btn(ButtonBehavior, Widget):
@@ -113,14 +226,70 @@ class ToggleBtn(ButtonBehavior, Widget):
                 if tbtn.text != self.text:
                     tbtn.is_select = False
             self.is_select = True if not self.is_select else False
-            if App.get_running_app().is_sound and App.get_running_app().sound_click: App.get_running_app().sound_click.play()
+            App.get_running_app().sounds.play('click')
             App.get_running_app().apply_btn.disabled = False if self.is_select else True
 
 
-class HistoryBoard(ScrollView):
+class HistoryBoard(RecycleView):
+    """История партии: первое слово, затем строки из слов игроков 1 и 2!
+
+    Слова хранятся записями с номерами (entries), строки экрана - словари data
+    с номерами слов, поэтому новое слово меняет одну строку RecycleView, а
+    нажатие на слово находит его по номеру."""
+
     font_size = NumericProperty(24)
-    text = StringProperty('')
-    player_text = ListProperty(['', ''])
+
+    def __init__(self, **kwargs):
+        super(HistoryBoard, self).__init__(**kwargs)
+        self.entries = []  # номер -> слово
+        self.columns = [0, 0]  # слов в столбце каждого игрока
+
+    def row(self, **fields) -> dict:
+        row = {'left': '', 'right': '', 'left_id': -1, 'right_id': -1, 'single': False, 'font_size': self.font_size}
+        row.update(fields)
+        return row
+
+    def clear(self):
+        self.entries = []
+        self.columns = [0, 0]
+        self.data = []
+
+    def set_start(self, word):
+        self.clear()
+        self.entries.append(word)
+        self.data = [self.row(left=word, left_id=0, single=True)]
+
+    def put(self, data, player, word):
+        entry = len(self.entries)
+        self.entries.append(word)
+        self.columns[player] += 1
+        index = self.columns[player]  # строка 0 - первое слово
+        side = 'left' if player == 0 else 'right'
+        fields = {side: word + '(' + str(len(word)) + ')', side + '_id': entry}
+        if index < len(data):
+            data[index] = dict(data[index], **fields)
+        else:
+            data.append(self.row(**fields))
+
+    def add(self, player, word):
+        """Слово игрока player (0 или 1) в конец его столбца!"""
+        self.put(self.data, player, word)
+        self.scroll_y = 0  # прокрутка в конец списка
+
+    def load(self, start_word, moves):
+        """История целиком по первому слову и ходам (игрок, слово)!"""
+        self.set_start(start_word)
+        data = list(self.data)
+        for player, word in moves:
+            self.put(data, player, word)
+        self.data = data
+        self.scroll_y = 0
+
+    def word(self, entry) -> str:
+        return self.entries[entry] if 0 <= entry < len(self.entries) else ''
+
+    def on_font_size(self, instance, value):
+        self.data = [dict(row, font_size=value) for row in self.data]
 
 
 class KeyBoard(Widget):
@@ -162,6 +331,8 @@ class ViewMode(Widget):
     text_hotseat = 'Хотсит'
     text_balda = 'Быстрый бот'
     text_AI = 'Умный бот'
+    text_strong = 'Сильный бот'
+    text_sizes = ('5 × 5', '6 × 6', '7 × 7')
 
 
 class BukvaApp(App):
@@ -177,6 +348,7 @@ class BukvaApp(App):
     info_btn = ObjectProperty(None)
     sound_btn = ObjectProperty(None)
     pass_btn = ObjectProperty(None)
+    hint_btn = ObjectProperty(None)
     new_btn = ObjectProperty(None)
     apply_btn = ObjectProperty(None)
     cancel_btn = ObjectProperty(None)
@@ -195,33 +367,57 @@ class BukvaApp(App):
     word_selection = StringProperty('')
     playerAI = BooleanProperty(True)
     temp_playerAI = BooleanProperty(True)
-    balda = BooleanProperty(True)  # признак быстрого бота
-    temp_balda = BooleanProperty(True)
-    black_list = ListProperty([])  # список исключенных из поиска вариантов для ИИ
+    bot_level = NumericProperty(FAST)  # уровень бота: быстрый, умный, сильный
+    temp_bot_level = NumericProperty(FAST)
+    size_board = NumericProperty(5)  # размер поля партии: 5, 6 или 7
+    temp_size_board = NumericProperty(5)
     is_game_over = BooleanProperty(False)
+    thinking = BooleanProperty(False)  # бот ищет ход в отдельном потоке
+    search_event = None  # отложенный запуск поиска хода бота
+    search_token = None  # признак отмены текущего поиска
+    search_paused = False  # поиск прерван паузой приложения и будет перезапущен
+    review_token = None  # признак отмены текущего разбора партии
+    trie_ready = BooleanProperty(False)  # дерево слов построено: подсказка не ждет фоновую загрузку
     store = ObjectProperty()
+    db = Database(DATABASE_URI)  # словарь (соединение открывается при первом запросе)
+    compiled = open_compiled(COMPILED_PATH)  # откомпилированный словарь, если есть (иначе - база)
+    lexicon = Lexicon(db.words, compiled, lambda word: db.has_word(word.lower()))  # слова и поисковые индексы (строятся при первом обращении)
+    definitions = Definitions(join(resourcePath(), compiled.definitions) if compiled else DEFINITIONS_PATH, lexicon, db)
+    game = None  # партия по правилам (свойства matrix, history, score, player_turn - ее отражение)
+    game_seed = 0  # зерно выбора первого слова и первого хода (для повтора партии)
+    start_words = None  # выбор первого слова по размеру поля (создается при первой игре этого размера)
+    journal = None  # журнал ходов партии (сохранение и восстановление)
+    metrics = NullMetrics()  # замеры ходов (BUKVA_METRICS=1 или настройка 'metrics')
     border_width = NumericProperty(2)
 
     # звуки
     is_sound = BooleanProperty(True)
-    sound_click = None
-    sound_popup = None
+    sounds = SoundManager({'click': ('click.wav', 1), 'popup': ('popup.wav', 1), 'move': ('move.wav', 3)})
 
-    # Диалоги
-    view_exit = ObjectProperty(None)
-    view_info = ObjectProperty(None)
-    view_info_small = ObjectProperty(None)
-    view_pass = ObjectProperty(None)
-    view_mode = ObjectProperty(None)
+    # Диалоги (строятся при первом открытии)
+    dialogs = None
+    view_exit = property(lambda self: self.get_dialog('exit'))
+    view_info = property(lambda self: self.get_dialog('info'))
+    view_info_small = property(lambda self: self.get_dialog('info_small'))
+    view_pass = property(lambda self: self.get_dialog('pass'))
+    view_mode = property(lambda self: self.get_dialog('mode'))
+    data_dir = ''
 
     def on_start(self):
+        timeline.mark('on_start')
+        self.dialogs = {}
+        self.start_words = {}
         self.game_board = self.root.ids.game_board
+        self.game_board.build(self.size_board)
+        self.game_board.redraw()
         self.info_btn = self.root.ids.info_btn
         self.info_btn.text = 'инфо'
         self.sound_btn = self.root.ids.sound_btn
         self.sound_btn.text = 'звук'
         self.pass_btn = self.root.ids.pass_btn
         self.pass_btn.text = 'пас'
+        self.hint_btn = self.root.ids.hint_btn
+        self.hint_btn.text = 'совет'
         self.new_btn = self.root.ids.new_btn
         self.new_btn.text = 'игра'
         self.apply_btn = self.root.ids.key_board.apply_btn
@@ -239,65 +435,124 @@ class BukvaApp(App):
         for i, item in enumerate(self.key_board.children[2].children):
             item.text = alphabet[-(i + 1)]
 
-        # sounds
-        self.sound_click = SoundLoader.load('click.wav')
-        self.sound_popup = SoundLoader.load('popup.wav')
-
-        # info dialog
-        self.view_info = ModalView(size_hint=(None, None), size=[min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48, (min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48) * 0.75], auto_dismiss=False, background = 'data/background.png')
-        self.view_info.add_widget(ViewInfo())
-        self.view_info_small = ModalView(size_hint=(None, None), size=[min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48, (min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48) * 0.75], auto_dismiss=False, background = 'data/background.png')
-        self.view_info_small.add_widget(ViewInfoSmall())
-
-        # exit dialog
-        self.view_exit = ModalView(size_hint=(None, None), size=[min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48, (min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48) * 0.75], auto_dismiss=False, background = 'data/background.png')
-        self.view_exit.add_widget(ViewChoice(text='Выйти из игры?'))
-        self.view_exit.children[0].ids.yes_btn.bind(on_release=self.stop)
-
-        # pass dialog
-        self.view_pass = ModalView(size_hint=(None, None), size=[min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48, (min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48) * 0.75], auto_dismiss=False, background = 'data/background.png')
-        self.view_pass.add_widget(ViewChoice(text='Пропустить ход?'))
-        self.view_pass.children[0].ids.yes_btn.bind(on_release=self.pass_turn)
-
-        # mode dialog
-        self.view_mode = ModalView(size_hint=(None, None), size=[min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48, (min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48) * 0.75], auto_dismiss=False, background = 'data/background.png')
-        self.view_mode.add_widget(ViewMode())
-        self.view_mode.children[0].ids.yes_btn.bind(on_release=self.new_game)
-
         Window.bind(on_key_down=self.on_key_down)
         if platform in ['win', 'linux', 'mac']: Window.bind(on_request_close=self.on_request_close)
         self.game_board.bind(size=Clock.schedule_once(self.resize, 0.150))
-        self.history_board.children[0].children[1].bind(on_ref_press=self.print_it)
-        self.history_board.children[0].children[0].children[1].children[0].bind(on_ref_press=self.print_it)
-        self.history_board.children[0].children[0].children[0].children[0].bind(on_ref_press=self.print_it)
 
         # load data settings
         if platform in ['win', 'linux', 'mac']:  # desktop
-            self.store = DictStore(join(self.user_data_dir, 'store.dat'))
+            data_dir = self.user_data_dir
         else:  # if platform in ['android', 'ios']
-            self.store = DictStore('store.dat')  # android API 26+ без запроса разрешений доступа
+            data_dir = ''  # android API 26+ без запроса разрешений доступа
+        self.data_dir = data_dir
+        self.store = DictStore(join(data_dir, 'store.dat'))
+        self.journal = Journal(join(data_dir, 'journal.bin'))
+
+        # замеры ходов в user_data_dir/metrics.jsonl (профиль хода бота - BUKVA_PROFILE=1)
+        self.metrics = create_metrics(join(self.user_data_dir, 'metrics.jsonl'),
+                                      self.store.exists('metrics') and self.store.get('metrics')['value'])
+        self.db.metrics = self.metrics
+
+        if self.store.exists('is_sound'):
+            self.is_sound = self.store.get('is_sound')['value']
+            self.sound_btn.text = '[s]звук[/s]' if not self.is_sound else 'звук'
 
-        if self.store.exists('matrix'):
+        timeline.mark('board')
+        Clock.schedule_once(self.load_game)  # партия - после первого кадра с полем
+
+    def load_game(self, *args):
+        """Восстановление партии из журнала или новая партия, затем загрузка в фоне!"""
+        timeline.mark('first_frame')
+        saved = self.journal.load(self.lexicon)
+        if saved:  # партия из журнала ходов
+            header, self.game, moves, self.is_game_over = saved
+            self.size_board = self.game.size
+            self.playerAI = header['playerAI']
+            self.bot_level = header['bot_level']
+            self.game_seed = header['seed']
+            self.player_turn = self.game.player_turn
+            self.sync_view()
+            self.show_history(header['word'], moves)
+
+            if self.is_game_over:  # подсветка победителя
+                winner = self.game.winner()
+                if winner: self.player_turn = winner - 1
+            else:  # продолжаем игру
+                self.resume_game()
+        elif self.store.exists('matrix'):  # сохранение прежней версии
             self.matrix = self.store.get('matrix')['value'].split('#')
             self.history = self.store.get('history')['value'].split('#')
             self.score = [int(x) for x in self.store.get('score')['value'].split('#')]
             self.playerAI = self.store.get('playerAI')['value']
-            self.balda = self.store.get('balda')['value']
+            if self.store.exists('bot_level'):
+                self.bot_level = self.store.get('bot_level')['value']
+            else:  # сохранение без уровня бота
+                self.bot_level = FAST if self.store.get('balda')['value'] else SMART
             self.player_turn = self.store.get('player_turn')['value']
             self.is_game_over = self.store.get('is_game_over')['value']
-            self.history_board.text = self.store.get('board_history')['value']
-            self.history_board.player_text = self.store.get('board_player')['value'].split('#')
-            self.is_sound = self.store.get('is_sound')['value']
-            self.sound_btn.text = '[s]звук[/s]' if not self.is_sound else 'звук'
+            board_player = self.store.get('board_player')['value'].split('#')
+            self.game = Game.restore(self.lexicon, self.matrix, self.history, self.score, self.player_turn)
+
+            moves = [(player, word) for player in (0, 1) for word in re.findall(r'\[ref=([^\]]+)\]', board_player[player])]
+            self.show_history(self.history[0], moves)
+            self.journal.migrate(self.game, moves, self.playerAI, self.bot_level, self.is_game_over)
+            for key in ('matrix', 'history', 'score', 'playerAI', 'bot_level', 'balda', 'player_turn', 'is_game_over', 'board_history', 'board_player'):
+                if self.store.exists(key): self.store.delete(key)
 
             if not self.is_game_over:  # продолжаем игру
                 self.resume_game()
         else:
             self.begin_game()
+        timeline.mark('game')
 
-    def sound_move_play(self):
-        sound_move  = SoundLoader.load('move.wav')
-        if sound_move: sound_move.play()
+        self.sounds.on_loaded = lambda: timeline.mark('sounds')
+        Clock.schedule_once(self.sounds.load_async)
+        Thread(target=self.warm_up, daemon=True).start()
+
+    def warm_up(self):
+        """Словарь, индексы и пути поля строятся в фоне, до их готовности слова игрока проверяются запросом к базе!"""
+        try:
+            self.lexicon.preload()
+            Clock.schedule_once(lambda dt: setattr(self, 'trie_ready', True))
+            if self.size_board in TABLE_SIZES:  # на больших полях пути перебираются на лету
+                get_paths(self.size_board)
+        except DatabaseError as err:
+            Logger.warning('Bukva: ' + str(err))
+        timeline.mark('warm_up')
+        if self.metrics.enabled:  # в файл - только с замерами (BUKVA_METRICS=1 или настройка), иначе отметки только в лог
+            timeline.save(join(self.data_dir, 'startup.jsonl'), platform=platform, compiled=bool(self.compiled))
+
+    def dialog_size(self):
+        return [min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48, (min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48) * 0.75]
+
+    def get_dialog(self, name):
+        """Диалог name, построенный при первом обращении!"""
+        view = self.dialogs.get(name)
+        if view is None:
+            view = ModalView(size_hint=(None, None), size=self.dialog_size(), auto_dismiss=False, background = 'data/background.png')
+            if name == 'info':  # info dialog
+                view.add_widget(ViewInfo())
+            elif name == 'info_small':
+                view.add_widget(ViewInfoSmall())
+            elif name == 'exit':  # exit dialog
+                view.add_widget(ViewChoice(text='Выйти из игры?'))
+                view.children[0].ids.yes_btn.bind(on_release=self.stop)
+            elif name == 'pass':  # pass dialog
+                view.add_widget(ViewChoice(text='Пропустить ход?'))
+                view.children[0].ids.yes_btn.bind(on_release=self.pass_turn)
+            elif name == 'mode':  # mode dialog
+                view.add_widget(ViewMode())
+                view.children[0].ids.yes_btn.bind(on_release=self.new_game)
+            self.dialogs[name] = view
+            timeline.mark('dialog_' + name)
+        return view
+
+    def on_is_sound(self, instance, value):
+        self.sounds.enabled = value
+
+    def on_is_game_over(self, instance, value):
+        if self.hint_btn:
+            self.hint_btn.text = 'итог' if value else 'совет'
 
     def press_apply_btn(self, *args):
         self.show_keyboard = False
@@ -310,14 +565,19 @@ class BukvaApp(App):
     def set_sound(self):
         self.is_sound = True if not self.is_sound else False
         self.sound_btn.text = '[s]звук[/s]' if not self.is_sound else 'звук'
+        self.store.put('is_sound', value=self.is_sound)
 
-    def show_about(self):
-        about = "[size=" + str(int(min(self.view_info.width, self.view_info.height)/14)) + "]БУКВА[/size]\n\n" \
+    def about_text(self):
+        """Текст правил под текущий размер поля!"""
+        size = int(self.size_board)
+        row = "центральной строки" if size % 2 else str(size // 2 + 1) + "-й сверху строки"  # на чётном поле
+        return "[size=" + str(int(min(self.view_info.width, self.view_info.height)/14)) + "]БУКВА[/size]\n\n" \
                 "Лингвистическая настольная игра для 2 игроков, в которой необходимо составлять слова с " \
                 "помощью букв, добавляемых определённым образом на квадратное игровое поле.\n\nСлова составляются " \
-                "посредством переходов от буквы к букве под прямым углом. Игровое поле представляет собой " \
-                "25-клеточную квадратную таблицу, клетки центральной строки которой содержат по одной букве, " \
-                "а строка целиком — произвольное 5-буквенное нарицательное имя существительное в именительном падеже " \
+                "посредством переходов от буквы к букве под прямым углом. Игровое поле представляет собой " + \
+                str(size * size) + "-клеточную квадратную таблицу, клетки " + row + " которой содержат по одной букве, " \
+                "а строка целиком — произвольное " + str(size) + "-буквенное нарицательное имя существительное " \
+                "в именительном падеже " \
                 "и единственном числе (множественном числе, если слово не имеет единственного числа).\n\nВо время " \
                 "своего хода игрок может добавить букву в клетку, примыкающую по вертикали или горизонтали к " \
                 "заполненной клетке таким образом, чтобы получалась неразрывная и несамопересекающаяся прямоугольная " \
@@ -335,56 +595,134 @@ class BukvaApp(App):
                 "очередное слово согласно указанным выше правилам. Выигрывает тот игрок, который наберёт большее " \
                 "количество очков.[size=" + str(int(min(self.view_info.width, self.view_info.height)/30)) + "]\n\n" \
                 "* * *\n(c) Антон Бездольный, 2020\n/ вер. 2.2 /[/size]"
+
+    def show_about(self):
+        about = self.about_text()
         self.view_info.children[0].text = about
         self.view_info.open()
 
+    def show_hint(self):
+        """Подсказка: подсветить путь лучшего хода позиции!"""
+        best = next(self.game.analyse(by_score=True, first_n=1), None)
+        if best is None:
+            self.info_label = 'Возможных вариантов нет!'
+            return
+        self.game_board.highlight(best.path)
+        self.info_label = 'Подсказка: слово из ' + str(best.score) + ' букв'
+
+    def show_review(self):
+        """Разбор партии в отдельном потоке: ходы игроков и лучшие ходы, которые были возможны!"""
+        if self.review_token:  # разбор уже идет
+            return
+        self.review_token = CancelToken()
+        self.info_label = 'Разбор партии ...'
+        Thread(target=self.review_worker, args=(self.review_token, self.game.copy()), daemon=True).start()
+
+    def review_worker(self, token, current):
+        game = self.journal.full_game(self.lexicon)  # все ходы по записям журнала (после восстановления в партии - только последние)
+        if game is None or game.state.matrix() != current.state.matrix():  # сохранение прежней версии: ходов с начала нет
+            game = current
+        try:
+            review = game.review(token)
+        except SearchCancelled:
+            return
+        except DatabaseError as err:
+            Clock.schedule_once(partial(self.finish_review, token, str(err)))
+            return
+
+        lines = []
+        lost = [0, 0]
+        missing = len(game.state.history) - 1 - sum(1 for player, move, best in review if move != PASS)
+        for player, move, best in review:
+            if move == PASS:
+                line = 'пас'
+            else:
+                line = move.word + ' (' + str(len(move.word)) + ')'
+            if best is not None and best.score > len(move.word):
+                lost[player] += best.score - len(move.word)
+                line += '  >>  ' + best.word + ' (' + str(best.score) + ')'
+            lines.append('Игрок ' + str(player + 1) + ': ' + line)
+        if missing > 0:  # партия из сохранения прежней версии: первые ходы без путей
+            lines.insert(0, 'Первые ходы (' + str(missing) + ') не сохранены и не разобраны')
+        text = '[b]Разбор партии[/b]\n\nУпущено очков: ' + str(lost[0]) + ' : ' + str(lost[1]) + '\n\n' + '\n'.join(lines)
+        Clock.schedule_once(partial(self.finish_review, token, text))
+
+    def finish_review(self, token, text, *args):
+        if token.cancelled or token is not self.review_token:  # результат устарел
+            return
+        self.review_token = None
+        self.info_label = 'Конец игры!'
+        self.view_info.children[0].text = text
+        self.view_info.open()
+
+    def cancel_review(self):
+        if self.review_token:
+            self.review_token.cancel()
+            self.review_token = None
+
     def pass_turn(self, *args):
         self.is_block = True
         self.info_label = 'Пропуск хода'
+        self.play_move(PASS)
         self.next_turn()
 
     def print_it(self, instance, value):
-        if self.is_sound and self.sound_popup: self.sound_popup.play()
-        _SQL = "select COMMENT from DICT where WORD = '{s_word}'".format(s_word=value.lower())
+        self.sounds.play('popup')
         data = None
 
         try:
-            with UseDatabase(DATABASE_URI) as cursor:
-                cursor.execute(_SQL)
-                data = cursor.fetchall()
+            data = self.definitions.comment(value)
         except DatabaseError as err:
             self.info_label = str(err)
 
         if data:  # найдено в словаре
-            self.view_info.children[0].text = data[0][0]
+            self.view_info.children[0].text = data
             self.view_info.open()
         else:  # не найдено
             self.view_info_small.children[0].text = value
             self.view_info_small.open()
 
     def clear_game_board(self):
-        for tile in self.game_board.children[0].children:
-            tile.selection = False
+        self.game_board.highlight(())
+
+    def on_matrix(self, instance, value):
+        if self.game_board:
+            self.game_board.redraw()
 
     def clear_key_board(self):
         for item in self.key_board.children[2].children:
             item.is_select = False
 
-    def resume_game(self):
-        if self.playerAI:
-            self.black_list = [(10, 11, 12, 13, 14), ]
+    def play_move(self, move):
+        """Ход в партии и запись его в журнал!"""
+        self.game.apply(move)
+        self.journal.append(self.game)
+
+    def show_history(self, start_word, moves):
+        """История на экране по первому слову и ходам (игрок, слово)!"""
+        self.history_board.load(start_word, moves)
+
+    def sync_view(self):
+        self.game_board.build(self.game.size)
+        self.matrix = self.game.state.matrix()
+        self.history = self.game.state.history[:]
+        self.score = self.game.state.score[:]
 
+    def resume_game(self):
         # информационное сообщение
         self.info_label = 'Ход игрока ' + str(self.player_turn + 1) + (' >> Выделите слово!' if self.player_turn == 0 or (self.player_turn == 1 and not self.playerAI) else ' ...')
 
         if not self.playerAI or (self.playerAI and self.player_turn == 0):  # ход человека
             self.is_block = False
         elif self.playerAI and self.player_turn == 1:  # ход ИИ
-            Clock.schedule_once(self.searchAI, 0.5)  # таймаут
+            self.schedule_searchAI()
 
     def new_game(self, *args):
         self.playerAI = self.temp_playerAI
-        self.balda = self.temp_balda
+        self.bot_level = self.temp_bot_level
+        self.size_board = self.temp_size_board
+        self.cancel_searchAI()
+        self.cancel_review()
 
         # очищаем результаты прошлой игры
         self.clear_game_board()
@@ -395,43 +733,40 @@ class BukvaApp(App):
 
         self.history = []
         self.score = [0, 0]
-        self.history_board.text = ''
-        self.history_board.player_text[0] = ''
-        self.history_board.player_text[1] = ''
+        self.history_board.clear()
         self.word_selection = ''
         self.matrix_selection = []
-        self.matrix = [' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ', ' ']
+        self.game_board.build(self.size_board)
+        self.matrix = [' '] * (self.size_board * self.size_board)
 
         self.begin_game()
 
+    @timed('begin_game')
     def begin_game(self):
-        _SQL = 'select WORD from DICT where LEN = {len_word}'.format(len_word=5)
-        data = None
+        random_word = None
+        self.game_seed = random.randrange(1 << 32)
+        rnd = random.Random(self.game_seed)
 
         try:
-            with UseDatabase(DATABASE_URI) as cursor:
-                cursor.execute(_SQL)
-                data = cursor.fetchall()
+            size = self.size_board
+            if size not in self.start_words:  # таблица слов длины size (недавние первые слова не повторяются)
+                recent = self.store.get(self.recent_key())['value'].split('#') if self.store.exists(self.recent_key()) else ()
+                self.start_words[size] = StartWords.from_compiled(self.compiled, size, recent) if self.compiled else StartWords.from_database(self.db, size, recent)
+            # определяем первое случайное слово
+            random_word = self.start_words[size].choose(rnd)
         except DatabaseError as err:
             self.info_label = str(err)
 
-        if data:
-            # определяем первое случайное слово
-            random_word = random.choice(data)[0].upper()
-            self.history.append(random_word)
-            self.history_board.text = '[ref=' + random_word + ']' + random_word + '[/ref]'
-
-            self.matrix[10] = random_word[0]
-            self.matrix[11] = random_word[1]
-            self.matrix[12] = random_word[2]
-            self.matrix[13] = random_word[3]
-            self.matrix[14] = random_word[4]
-
-            if self.playerAI:
-                self.black_list = [(10, 11, 12, 13, 14), ]
+        if random_word:
+            self.history_board.set_start(random_word)
+            self.definitions.prefetch(random_word)
 
             # определяем право первого хода
-            self.player_turn = 0 if random.randint(1, 100) <= 50 else 1
+            self.game = Game.new(self.lexicon, random_word, rnd.randint(0, 1), self.size_board)
+            self.journal.start(self.game, self.game_seed, self.playerAI, self.bot_level)
+            self.store.put(self.recent_key(), value="#".join(self.start_words[self.size_board].recent))
+            self.player_turn = self.game.player_turn
+            self.sync_view()
             self.info_label = 'Ход игрока ' + str(self.player_turn + 1) + (
                 ' >> Выделите слово!' if self.player_turn == 0 or (
                             self.player_turn == 1 and not self.playerAI) else ' ...')
@@ -439,37 +774,22 @@ class BukvaApp(App):
             if not self.playerAI or (self.playerAI and self.player_turn == 0):  # ход человека
                 self.is_block = False
             elif self.playerAI and self.player_turn == 1:  # ход ИИ
-                Clock.schedule_once(self.searchAI, 0.5)  # таймаут
+                self.schedule_searchAI()
+
+            if self.metrics.enabled:
+                Clock.schedule_once(partial(self.flush_metrics, 'begin_game', word=random_word, seed=self.game_seed))
 
         else:  # словарь пустой !!!
             self.view_info_small.children[0].text = 'Пустой словарь!'
-            if self.is_sound and self.sound_popup: self.sound_popup.play()
+            self.sounds.play('popup')
             self.view_info_small.open()
 
-    def is_correct_select(self):
-        if len(self.word_selection) < 2:  # берем только варианты из как минимум двух элементов
-            return False
+    def recent_key(self):
+        """Ключ недавних первых слов в store (у поля 5 x 5 - прежний ключ)!"""
+        return 'recent_words' if self.size_board == 5 else 'recent_words_' + str(self.size_board)
 
-        count_space = 0
-        for ltr in self.word_selection:
-            if ltr == ' ':
-                count_space += 1
-        if count_space != 1:  # берем только варианты содержащие один пробел
-            return False
-
-        # исключаем варианты в которых разница между соседними элементами нас не устраивает (не +-1 и не +-5)
-        for i in range(1, len(self.matrix_selection)):
-            i1 = self.matrix_selection[i]
-            i2 = self.matrix_selection[i - 1]
-            sub_i1_i2 = i1 - i2
-            if sub_i1_i2 != 1 and sub_i1_i2 != -1 and sub_i1_i2 != 5 and sub_i1_i2 != -5:
-                return False
-            if (i1 == 4 and i2 == 5) or (i1 == 5 and i2 == 4) or (i1 == 9 and i2 == 10) or (i1 == 10 and i2 == 9) or (
-                    i1 == 14 and i2 == 15) or (i1 == 15 and i2 == 14) or (i1 == 19 and i2 == 20) or (
-                    i1 == 20 and i2 == 19):
-                return False
-
-        return True
+    def is_correct_select(self):
+        return self.game.check_selection(self.matrix_selection)
 
     def player_selection(self):
         for i in self.matrix_selection:
@@ -491,167 +811,144 @@ class BukvaApp(App):
         self.clear_game_board()
         self.is_block = False
 
+    @timed('search_word')
     def search_word(self):
         select_key = ''
         for item in self.key_board.children[2].children:
             if item.is_select:
                 select_key = item.text
         s_word = self.word_selection.replace(' ', select_key)
+        move = Move(tuple(self.matrix_selection), s_word)
+        error = None
 
-        # проверка на повтор в истории
-        if s_word in self.history:
-            self.cancel_player_selection(s_word + ' >> Слово уже было!')
-
-        # поиск в базе
-        else:
-            _SQL = "select WORD from DICT where WORD = '{s_word}'".format(s_word=s_word.lower())
-            data = None
-
-            try:
-                with UseDatabase(DATABASE_URI) as cursor:
-                    cursor.execute(_SQL)
-                    data = cursor.fetchall()
-            except DatabaseError as err:
-                self.info_label = str(err)
-
-            if data:  # найдено в словаре
-                self.history.append(s_word)
-                self.history_board.player_text[self.player_turn] += '[ref=' + s_word + ']' + s_word + '(' + str(len(s_word)) + ')[/ref]\n'
-                self.history_board.scroll_y = 0  # прокрутка в конец списка
-                self.info_label = s_word
-
-                for i, item in enumerate(self.matrix_selection):
-                    self.matrix[item] = s_word[i]
-
-                if self.playerAI:
-                    self.black_list.append(tuple(self.matrix_selection))
+        try:
+            error = self.game.check_move(move)
+        except DatabaseError as err:
+            error = str(err)
 
-                self.score[self.player_turn] += len(s_word)
-                self.next_turn()
-            else:  # нет такого слова
-                self.cancel_player_selection(s_word + ' >> Нет такого слова!')
+        if error == USED_WORD:  # проверка на повтор в истории
+            self.metrics.count('rejected_used')
+            self.cancel_player_selection(s_word + ' >> Слово уже было!')
+        elif error == BAD_SELECTION:
+            self.cancel_player_selection('Выделите слово корректно!')
+        elif error:  # нет такого слова
+            self.cancel_player_selection(s_word + ' >> Нет такого слова!')
+        else:  # найдено в словаре
+            self.history_board.add(self.player_turn, s_word)
+            self.info_label = s_word
+            self.definitions.prefetch(s_word)
+
+            self.play_move(move)
+            self.sync_view()
+            self.next_turn()
 
+    def schedule_searchAI(self):
+        self.search_event = Clock.schedule_once(self.searchAI, 0.5)  # таймаут
+
+    def cancel_searchAI(self):
+        """Прервать ожидание и поиск хода бота!"""
+        if self.search_event:
+            self.search_event.cancel()
+            self.search_event = None
+        if self.search_token:
+            self.search_token.cancel()
+            self.search_token = None
+            self.thinking = False
+            if platform in ['win', 'linux', 'mac']:
+                Window.set_system_cursor('arrow')
+
+    @timed('searchAI')
     def searchAI(self, *args):
+        self.search_event = None
         if platform in ['win', 'linux', 'mac']:
             Window.set_system_cursor('wait')
 
-        variantsAI = []  # варианты ИИ
+        # поиск идет в отдельном потоке по снимку партии
+        self.thinking = True
+        self.search_token = CancelToken()
+        Thread(target=self.search_worker, args=(self.search_token, self.game.copy(), self.bot_level), daemon=True).start()
 
-        for elem in COMBI:
-            if elem not in self.black_list and self.matrix[elem[0]] not in ['Ь', 'Ъ', 'Ы']:
-                count_space = 0
-
-                for i in elem:
-                    if self.matrix[i] == ' ':
-                        count_space += 1
-
-                if count_space == 1:
-                    variantsAI.append(elem)
-
-        data = None
-        result = False
-        is_over = False
+    def search_worker(self, token, game, bot_level):
+        move, error = None, None
+        bot = STRATEGIES[bot_level]()
+        t = time.perf_counter()
 
         try:
-            with UseDatabase(DATABASE_URI) as cursor:
-                while not result:
-                    if self.balda:  # быстрый бот
-                        self.matrix_selection = list(random.choice(variantsAI))
-                    else:  # умный бот
-                        len_max = max([len(x) for x in variantsAI])  # max длина варианта
-                        var_max = [v for v in variantsAI if len(v) == len_max]  # список вариантов с max длиной
-                        self.matrix_selection = list(random.choice(var_max))
-
-                    self.word_selection = ''
-
-                    for index in self.matrix_selection:
-                        self.word_selection += self.matrix[index]
-
-                    s_word = self.word_selection.replace(' ', '_')
-
-                    _SQL = "select WORD from DICT where WORD like '{s_word}' and LEN = {s_len}".format(s_word=s_word.lower(), s_len=len(s_word))
-                    cursor.execute(_SQL)
-                    data = cursor.fetchall()
-
-                    if data:  # найдено в словаре
-                        # перебор возможных слов в выбранной комбинации
-                        words = [word[0].upper() for word in data]
-
-                        is_word = False  # признак найденного подходящего слова
-                        while not is_word:
-                            select_word = random.choice(words)
-                            if select_word not in self.history:
-                                self.history.append(select_word)
-                                self.history_board.player_text[
-                                    self.player_turn] += '[ref=' + select_word + ']' + select_word + '(' + str(len(select_word)) + ')[/ref]\n'
-                                self.history_board.scroll_y = 0  # прокрутка в конец списка
-                                self.info_label = select_word
-                                for i, item in enumerate(self.matrix_selection):
-                                    self.matrix[item] = select_word[i]
-                                for tile in self.game_board.children[0].children:  # выделение на игровом поле
-                                    tile.selection = False  # убираем сначала предыдущее выделение игроком-человеком
-                                    if tile.tile_index in self.matrix_selection:
-                                        tile.selection = True
-                                self.black_list.append(tuple(self.matrix_selection))
-                                self.score[self.player_turn] += len(select_word)
-                                is_word = True
-                                result = True
-                            else:  # слово уже было
-                                words.remove(select_word)
-                                if len(words) == 0:
-                                    is_word = True  # закончились возможные слова в выбранной комбинации, но результата нет ...
-
-                        if not result:  # нет результата в переборке выбранных слов
-                            variantsAI.remove(tuple(self.matrix_selection))
-                            self.black_list.append(tuple(self.matrix_selection))
-
-                    else:  # не найдено в словаре
-                        variantsAI.remove(tuple(self.matrix_selection))
-                        self.black_list.append(tuple(self.matrix_selection))
-
-                    if len(variantsAI) == 0:  # закончились возможные варианты, но результата нет ...
-                        result = True
-                        is_over = True
-
+            move = self.metrics.profile(bot.choose, game, token)
+        except SearchCancelled:
+            return
         except DatabaseError as err:
-            self.info_label = str(err)
+            error = str(err)
+
+        self.metrics.add('search_bot', time.perf_counter() - t)
+        for name, n in bot.stats.items():  # просмотренные пути, повторы, отброшенные слова
+            self.metrics.count(name, n)
+        Clock.schedule_once(partial(self.finish_searchAI, token, game, move, error))
+
+    def finish_searchAI(self, token, game, move, error, *args):
+        if token.cancelled or token is not self.search_token:  # результат устарел
+            return
+        self.search_token = None
+        self.thinking = False
+        self.game.adopt_exhausted(game)
+
+        if move:
+            self.matrix_selection = list(move.path)
+            select_word = move.word
+            self.history_board.add(self.player_turn, select_word)
+            self.info_label = select_word
+            self.definitions.prefetch(select_word)
+            self.play_move(move)
+            self.sync_view()
+            self.game_board.highlight(self.matrix_selection)  # выделение хода бота вместо выделения игрока
+        elif error:
+            self.info_label = error
+            self.play_move(PASS)
 
         if platform in ['win', 'linux', 'mac']:
             Window.set_system_cursor('arrow')
 
         # итог
-        if is_over:  # конец игры !!!
+        if not move and not error:  # конец игры !!!
             self.info_label = 'Возможных вариантов нет!'
             Clock.schedule_once(self.game_over, 0.5)  # таймаут
         else:  # продолжаем игру
             self.next_turn()
 
+    @timed('next_turn')
     def next_turn(self):
         self.matrix_selection = []
         self.word_selection = ''
 
-        # проверка на конец игры !!!
-        count_space = 0
-        for item in self.matrix:
-            if item == ' ':
-                count_space += 1
-        if count_space == 0:  # конец игры !!!
-            self.info_label = 'Конец игры!'
+        if self.metrics.enabled:  # запись хода - в следующем кадре, после замера next_turn
+            move, player = self.game.moves[-1][:2]
+            Clock.schedule_once(partial(self.flush_metrics, 'turn', player=player + 1, word=move.word,
+                                        bot=self.bot_level if self.playerAI and player == 1 else None))
+
+        # проверка на конец игры: поле заполнено или ходов не осталось (пока дерево строится в фоне -
+        # только заполненное поле, чтобы ход не ждал его построения) !!!
+        state = self.game.state
+        if state.is_full() or (self.lexicon.has_trie and not self.game.has_any_legal_move()):  # конец игры !!!
+            self.info_label = 'Конец игры!' if state.is_full() else 'Возможных вариантов нет!'
             Clock.schedule_once(self.game_over, 0.5)  # таймаут
         else:  # игра продолжается
-            self.player_turn = 0 if self.player_turn == 1 else 1
+            self.player_turn = self.game.player_turn
             self.info_label += ' >> Ход игрока ' + str(self.player_turn + 1)
 
             if not self.playerAI or (self.playerAI and self.player_turn == 0):  # ход человека
                 self.is_block = False
             elif self.playerAI and self.player_turn == 1:  # ход ИИ
-                Clock.schedule_once(self.searchAI, 0.5)  # таймаут
+                self.schedule_searchAI()
+
+    def flush_metrics(self, event, *args, **fields):
+        self.metrics.flush(event, **fields)
 
     def game_over(self, *args):
         self.is_game_over = True
+        self.journal.end()
 
         # определение победителя
-        winner = 0 if self.score[0] == self.score[1] else 1 if self.score[0] > self.score[1] else 2
+        winner = self.game.winner()
         string_win = 'Ничья!\n\n' if winner == 0 else 'Победил Игрок ' + str(winner) + '!\n\n'
 
         # подсветка победителя (если ничья, то не трогаем)
@@ -659,77 +956,47 @@ class BukvaApp(App):
         if winner == 2: self.player_turn = 1
 
         self.view_info_small.children[0].text = string_win + str(self.score[0]) + ' : ' + str(self.score[1])
-        if self.is_sound and self.sound_popup: self.sound_popup.play()
+        self.sounds.play('popup')
         self.view_info_small.open()
 
     def resize(self, *args):
         self.border_width = min(self.root.width, self.root.height)/480
         
-        self.view_info.size = [min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48, (min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48) * 0.75]
-        self.view_info_small.size = [min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48, (min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48) * 0.75]
-        self.view_exit.size = [min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48, (min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48) * 0.75]
-        self.view_pass.size = [min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48, (min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48) * 0.75]
-        self.view_mode.size = [min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48, (min(self.root.width, self.root.height) - 2*min(self.root.width, self.root.height)/48) * 0.75]
-
-        if self.view_info.children[0].text[1:5] == 'size':
-            about = "[size=" + str(int(min(self.view_info.width, self.view_info.height)/14)) + "]БУКВА[/size]\n\n" \
-                    "Лингвистическая настольная игра для 2 игроков, в которой необходимо составлять слова с " \
-                    "помощью букв, добавляемых определённым образом на квадратное игровое поле.\n\nСлова составляются " \
-                    "посредством переходов от буквы к букве под прямым углом. Игровое поле представляет собой " \
-                    "25-клеточную квадратную таблицу, клетки центральной строки которой содержат по одной букве, " \
-                    "а строка целиком — произвольное 5-буквенное нарицательное имя существительное в именительном падеже " \
-                    "и единственном числе (множественном числе, если слово не имеет единственного числа).\n\nВо время " \
-                    "своего хода игрок может добавить букву в клетку, примыкающую по вертикали или горизонтали к " \
-                    "заполненной клетке таким образом, чтобы получалась неразрывная и несамопересекающаяся прямоугольная " \
-                    "ломаная («змейка») из клетки с добавленной буквой и других заполненных клеток, представляющая собой " \
-                    "слово (соответствующее описанным выше требованиям), или пропустить ход.\n\nВ течение игры должны " \
-                    "соблюдаться также следующие правила:\n- Игроки ходят по очереди.\n- Каждая клетка содержит только " \
-                    "одну букву, каждая буква в составленном слове приносит игроку одно очко.\n- Слово должно содержаться " \
-                    "хотя бы в одном толковом или энциклопедическом словаре (или энциклопедии), при этом запрещаются " \
-                    "аббревиатуры, слова с уменьшительно-ласкательными (банька, дочурка, ножик) и размерно-оценочными " \
-                    "суффиксами (домина, зверюга, ножища), если такие слова не имеют специального значения, " \
-                    "а также слова, не входящие в состав русского литературного языка, то есть вульгаризмы, диалектизмы и " \
-                    "жаргонизмы (имеющие словарные пометки вульг., диал., жарг. и аналогичные, например, сокращённые " \
-                    "названия соответствующих регионов).\n- Слова в одной игре повторяться не могут, даже если это " \
-                    "омонимы.\n\nИгра заканчивается тогда, когда либо заполнены все клетки, либо невозможно составить " \
-                    "очередное слово согласно указанным выше правилам. Выигрывает тот игрок, который наберёт большее " \
-                    "количество очков.[size=" + str(int(min(self.view_info.width, self.view_info.height)/30)) + "]\n\n" \
-                    "* * *\n(c) Антон Бездольный, 2020\n/ вер. 2.2 /[/size]"
+        for view in self.dialogs.values():  # только уже построенные диалоги
+            view.size = self.dialog_size()
+
+        if 'info' in self.dialogs and self.view_info.children[0].text[1:5] == 'size':
+            about = self.about_text()
             self.view_info.children[0].text = about
             self.view_info.children[0].scroll_label.scroll_y = 1
 
     def on_key_down(self, window, key, *args):
         if key in [27, 4]:  # ESC and BACK_BUTTON
-            if self.is_sound and self.sound_popup: self.sound_popup.play()
+            self.sounds.play('popup')
             self.view_exit.open()
             return True
 
     def on_request_close(self, *args):
-        if self.is_sound and self.sound_popup: self.sound_popup.play()
+        self.sounds.play('popup')
         self.view_exit.open()
         return True
 
-    def save_data(self):
-        self.store.put('matrix', value="#".join(self.matrix))
-        self.store.put('history', value="#".join(self.history))
-        self.store.put('score', value="#".join([str(x) for x in self.score]))
-        self.store.put('playerAI', value=self.playerAI)
-        self.store.put('balda', value=self.balda)
-        self.store.put('player_turn', value=self.player_turn)
-        self.store.put('is_game_over', value=self.is_game_over)
-        self.store.put('board_history', value=self.history_board.text)
-        self.store.put('board_player', value="#".join(self.history_board.player_text))
-        self.store.put('is_sound', value=self.is_sound)
-
     def on_pause(self):
-        self.save_data()
+        self.search_paused = self.search_event is not None or self.search_token is not None
+        self.cancel_searchAI()  # партия уже в журнале - сохранять нечего
         return True
 
     def on_resume(self):
-        pass
+        if self.search_paused:  # ход бота прерван паузой - ищем заново
+            self.search_paused = False
+            self.schedule_searchAI()
 
     def on_stop(self):
-        self.save_data()
+        self.cancel_searchAI()
+        self.journal.close()
+        self.definitions.close()
+        if self.compiled: self.compiled.close()
+        self.db.close()
         sys.exit(0)  # for Android and other OS
 
 
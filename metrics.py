@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+import cProfile
+import json
+import os
+import time
+
+ENV_METRICS = 'BUKVA_METRICS'  # 1 - писать замеры ходов
+ENV_PROFILE = 'BUKVA_PROFILE'  # 1 - снять cProfile одного хода бота
+
+
+class NullMetrics:
+    """Выключенные замеры: все вызовы пустые!"""
+
+    enabled = False
+    profile_next = False
+
+    @contextmanager
+    def phase(self, name: str):
+        yield
+
+    def add(self, name: str, seconds: float) -> None:
+        pass
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+    def flush(self, event: str, **fields) -> None:
+        pass
+
+    def profile(self, func, *args):
+        return func(*args)
+
+
+class Metrics(NullMetrics):
+    """Замеры по ходам: время фаз, запросы к базе и счетчики, запись в JSON lines!
+
+    Каждая запись - одна строка файла: время, событие (ход, начало партии),
+    суммарное время и число вызовов по фазам и счетчики, накопленные с
+    предыдущей записи."""
+
+    enabled = True
+
+    def __init__(self, path: str, profile_next: bool = False) -> None:
+        self.path = path
+        self.profile_next = profile_next  # снять профиль следующего хода бота
+        self.lock = Lock()  # фазы пишутся и из потока поиска хода
+        self.phases = {}
+        self.counters = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - t)
+
+    def add(self, name: str, seconds: float) -> None:
+        with self.lock:
+            phase = self.phases.setdefault(name, [0, 0.0])
+            phase[0] += 1
+            phase[1] += seconds
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def flush(self, event: str, **fields) -> None:
+        with self.lock:
+            record = {'ts': round(time.time(), 3), 'event': event}
+            record.update(fields)
+            record['phases'] = {name: {'n': n, 'ms': round(seconds * 1000, 3)} for name, (n, seconds) in self.phases.items()}
+            record['counters'] = self.counters
+            self.phases = {}
+            self.counters = {}
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except OSError:
+            pass  # замеры не должны мешать игре
+
+    def profile(self, func, *args):
+        """Выполнить func под cProfile, если запрошен профиль хода!"""
+        if not self.profile_next:
+            return func(*args)
+        self.profile_next = False
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args)
+        finally:
+            profiler.dump_stats(os.path.join(os.path.dirname(self.path), 'profile-{}.prof'.format(int(time.time()))))
+
+
+class Timeline:
+    """Хронология запуска: отметки фаз в мс от старта процесса, в лог и в JSON lines!"""
+
+    def __init__(self, start: float, log=None) -> None:
+        self.start = start  # time.perf_counter() в начале main.py
+        self.log = log
+        self.marks = []
+
+    def mark(self, phase: str) -> None:
+        ms = round((time.perf_counter() - self.start) * 1000, 1)
+        self.marks.append((phase, ms))
+        if self.log:
+            self.log('Timeline: {} {} ms'.format(phase, ms))
+
+    def save(self, path: str, **fields) -> None:
+        """Дописать запуск одной строкой (отметки на момент вызова)!"""
+        record = {'ts': round(time.time(), 3)}
+        record.update(fields)
+        record['marks'] = dict(self.marks)
+        try:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except OSError:
+            pass
+
+
+def create(path: str, enabled: bool = False):
+    """Замеры включаются переменной окружения BUKVA_METRICS или настройкой!"""
+    profile = os.environ.get(ENV_PROFILE) == '1'
+    if enabled or profile or os.environ.get(ENV_METRICS) == '1':
+        return Metrics(path, profile)
+    return NullMetrics()
+
+
+def timed(name: str):
+    """Декоратор метода: время вызова в фазу name замеров self.metrics!"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.metrics.enabled:
+                return method(self, *args, **kwargs)
+            with self.metrics.phase(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+from trie import neighbours
+
+TABLE_SIZES = (5,)  # поля с таблицей путей, на больших полях пути перебираются по дереву на лету
+
+
+class PathTable:
+    """Компактная таблица возможных комбинаций построения слов для ИИ!
+
+    Все несамопересекающиеся пути («змейки») длины от min_len до max_len на поле
+    size x size хранятся одним плоским массивом клеток со смещениями, вместо
+    тысяч кортежей. Порядок путей - по длине, затем лексикографический."""
+
+    def __init__(self, size: int = 5, min_len: int = 2, max_len: int = 7) -> None:
+        self.size = size
+        self.cells = array('b')  # клетки всех путей подряд
+        self.offsets = array('l', [0])  # начало i-го пути, offsets[i + 1] - его конец
+        nbrs = neighbours(size)
+
+        def walk(path, mask, length):
+            if len(path) == length:
+                self.cells.extend(path)
+                self.offsets.append(len(self.cells))
+                return
+            for nxt in nbrs[path[-1]]:
+                if not mask >> nxt & 1:
+                    path.append(nxt)
+                    walk(path, mask | 1 << nxt, length)
+                    path.pop()
+
+        for length in range(min_len, max_len + 1):
+            for cell in range(size * size):
+                walk([cell], 1 << cell, length)
+
+        # обратный индекс для учета путей (candidates.PathTracker): клетка -> номера путей через нее
+        self.by_cell = [array('H') for _ in range(size * size)]
+        for pid in range(len(self)):
+            for cell in self.cells[self.offsets[pid]:self.offsets[pid + 1]]:
+                self.by_cell[cell].append(pid)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> tuple:
+        return tuple(self.cells[self.offsets[i]:self.offsets[i + 1]])
+
+    def __iter__(self):
+        cells, offsets = self.cells, self.offsets
+        for i in range(len(self.offsets) - 1):
+            yield tuple(cells[offsets[i]:offsets[i + 1]])
+
+    def length(self, i: int) -> int:
+        return self.offsets[i + 1] - self.offsets[i]
+
+
+_tables = {}
+
+
+def get_paths(size: int = 5) -> PathTable:
+    """Таблица путей для поля size x size (строится один раз при первом обращении)!"""
+    if size not in _tables:
+        _tables[size] = PathTable(size)
+    return _tables[size]
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+
+class PatternIndex:
+    """Позиционный индекс слов для поиска по шаблону с пропусками!
+
+    Для каждой длины слова хранятся битовые множества (целые числа Python) по
+    ключу (позиция, буква). Шаблон вида 'К_Т' разрешается пересечением
+    множеств известных позиций, без перебора словаря."""
+
+    BLANKS = ' _'  # символы пропуска в шаблоне
+
+    def __init__(self, words) -> None:
+        by_len = {}
+        for word in set(words):
+            by_len.setdefault(len(word), []).append(word)
+
+        self.words = {}  # длина -> отсортированный список слов
+        self.bits = {}  # длина -> список словарей {буква: битовое множество} по позициям
+        for n, group in by_len.items():
+            group.sort()
+            positions = [{} for _ in range(n)]
+            for i, word in enumerate(group):
+                for pos, ltr in enumerate(word):
+                    positions[pos].setdefault(ltr, []).append(i)
+
+            size = len(group) // 8 + 1
+            for pos in range(n):
+                for ltr, indexes in positions[pos].items():
+                    mask = bytearray(size)
+                    for i in indexes:
+                        mask[i >> 3] |= 1 << (i & 7)
+                    positions[pos][ltr] = int.from_bytes(mask, 'little')
+
+            self.words[n] = group
+            self.bits[n] = positions
+
+    def __len__(self) -> int:
+        return sum(len(group) for group in self.words.values())
+
+    def mask(self, pattern: str) -> int:
+        """Битовое множество слов длины len(pattern), подходящих под шаблон!"""
+        positions = self.bits.get(len(pattern))
+        if positions is None:
+            return 0
+
+        result = (1 << len(self.words[len(pattern)])) - 1
+        for pos, ltr in enumerate(pattern):
+            if ltr not in self.BLANKS:
+                result &= positions[pos].get(ltr, 0)
+                if not result:
+                    break
+        return result
+
+    def match(self, pattern: str) -> list:
+        """Слова, подходящие под шаблон ('_' или ' ' - любая буква)!"""
+        result = self.mask(pattern)
+        words = self.words.get(len(pattern), [])
+        found = []
+        while result:
+            low = result & -result
+            found.append(words[low.bit_length() - 1])
+            result ^= low
+        return found
+
+    def contains(self, word: str) -> bool:
+        """Есть ли слово в словаре (шаблон без пропусков)!"""
+        if any(ltr in self.BLANKS for ltr in word):
+            return False
+        return self.mask(word) != 0
+
+    __contains__ = contains
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Самоигра ботов для оценки силы: тысячи партий бот против бота на всех ядрах!
+
+    python selfplay.py --games 1000 --bot1 fast --bot2 smart [--processes 4] [--seed 1] [--size 5]
+
+Партия i начинается со случайного слова длины size (5, 6 или 7), выбранного генератором
+с зерном seed + i, поэтому прогоны повторяемы (кроме сильного бота, глубина
+поиска которого зависит от скорости машины)."""
+
+import argparse
+import multiprocessing
+import random
+import time
+from os.path import join, dirname
+from engine import Game, Lexicon
+from database import Database
+from bots import STRATEGIES, FAST, SMART, STRONG, StrongBot
+from startwords import StartWords
+
+BOTS = {'fast': FAST, 'smart': SMART, 'strong': STRONG}
+
+_lexicon = None  # словарь процесса (после fork - общие страницы родителя)
+_start_words = None
+_size = 5
+
+
+def init_worker(path: str, size: int) -> None:
+    if _lexicon is None:  # при spawn словарь загружается в каждом процессе
+        load(path, size)
+
+
+def load(path: str, size: int = 5) -> None:
+    global _lexicon, _start_words, _size
+    _lexicon = Lexicon(Database(path).words)
+    _lexicon.trie, _lexicon.index  # строим индексы до запуска процессов
+    _size = size
+    _start_words = StartWords.from_words(_lexicon.words, size, keep=0)  # без исключения недавних: партии независимы
+
+
+def make_bot(name: str, budget: float):
+    return StrongBot(budget) if BOTS[name] == STRONG else STRATEGIES[BOTS[name]]()
+
+
+def play(task: tuple) -> tuple:
+    """Одна партия: (очки, число ходов, задержки ходов каждого бота)!"""
+    seed, names, budget = task
+    random.seed(seed)
+    game = Game.new(_lexicon, _start_words.choose(), random.randint(0, 1), _size)
+    bots = [make_bot(name, budget) for name in names]
+    latency = ([], [])
+
+    while not game.is_over():
+        player = game.player_turn
+        t = time.perf_counter()
+        move = bots[player].choose(game)
+        latency[player].append(time.perf_counter() - t)
+        if move is None:  # возможных вариантов нет - конец игры
+            break
+        game.apply(move)
+
+    return tuple(game.state.score), len(game.moves), latency
+
+
+def percentile(values: list, p: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--bot1', choices=BOTS, default='fast')
+    parser.add_argument('--bot2', choices=BOTS, default='smart')
+    parser.add_argument('--processes', type=int, default=multiprocessing.cpu_count())
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--size', type=int, choices=(5, 6, 7), default=5, help='размер поля')
+    parser.add_argument('--budget', type=float, default=0.3, help='время на ход сильного бота, сек')
+    parser.add_argument('--db', default=join(dirname(__file__), 'dictionary.db'))
+    args = parser.parse_args()
+
+    load(args.db, args.size)
+    names = (args.bot1, args.bot2)
+    tasks = [(args.seed + i, names, args.budget) for i in range(args.games)]
+
+    t = time.perf_counter()
+    with multiprocessing.Pool(args.processes, init_worker, (args.db, args.size)) as pool:
+        results = pool.map(play, tasks, chunksize=max(1, args.games // (args.processes * 8)))
+    elapsed = time.perf_counter() - t
+
+    wins = [0, 0, 0]  # ничья, игрок 1, игрок 2
+    scores = [0, 0]
+    moves = 0
+    latency = ([], [])
+    for score, length, lat in results:
+        wins[0 if score[0] == score[1] else 1 if score[0] > score[1] else 2] += 1
+        scores[0] += score[0]
+        scores[1] += score[1]
+        moves += length
+        latency[0].extend(lat[0])
+        latency[1].extend(lat[1])
+
+    games = len(results)
+    print('партий: {}, процессов: {}, {:.1f} с, {:.1f} партий/с'.format(games, args.processes, elapsed, games / elapsed))
+    print('средняя длина партии: {:.1f} ходов'.format(moves / games))
+    print('ничьи: {:.1%}'.format(wins[0] / games))
+    for i, name in enumerate(names):
+        print('бот {} ({}): побед {:.1%}, средний счет {:.1f}, задержка хода p50/p90/p99/max: {}'.format(
+            i + 1, name, wins[i + 1] / games, scores[i] / games,
+            ' / '.join('{:.1f}'.format(percentile(latency[i], p) * 1000) for p in (0.5, 0.9, 0.99, 1.0)) + ' мс'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+from kivy.clock import Clock
+from kivy.core.audio import SoundLoader
+import time
+
+
+class SoundManager:
+    """Звуки игры: файлы загружаются один раз, после первого кадра, по одному за кадр!
+
+    Для каждого звука держится несколько готовых голосов, чтобы звуки
+    накладывались (быстрый проход по клеткам), а повтор одного звука чаще
+    MIN_INTERVAL пропускается."""
+
+    MIN_INTERVAL = 0.04  # сек между повторами одного звука
+
+    def __init__(self, sounds: dict) -> None:
+        self.sounds = sounds  # имя -> (файл, число голосов)
+        self.voices = {}  # имя -> загруженные голоса
+        self.next = {}  # имя -> номер следующего голоса
+        self.last = {}  # имя -> время последнего запуска
+        self.enabled = True
+        self.queue = []
+        self.on_loaded = None  # вызывается, когда загружены все звуки
+
+    def load_async(self, *args) -> None:
+        """Начать загрузку в следующих кадрах!"""
+        self.queue = [(name, filename) for name, (filename, count) in self.sounds.items() for _ in range(count)]
+        Clock.schedule_once(self.load_next)
+
+    def load_next(self, *args) -> None:
+        if not self.queue:
+            if self.on_loaded: self.on_loaded()
+            return
+        name, filename = self.queue.pop(0)
+        sound = SoundLoader.load(filename)
+        if sound:
+            self.voices.setdefault(name, []).append(sound)
+        Clock.schedule_once(self.load_next)
+
+    def play(self, name: str) -> None:
+        """Проиграть звук свободным голосом (если звук еще не загружен - тишина)!"""
+        voices = self.voices.get(name)
+        if not self.enabled or not voices:
+            return
+        now = time.perf_counter()
+        if now - self.last.get(name, 0.0) < self.MIN_INTERVAL:
+            return
+        self.last[name] = now
+
+        i = self.next.get(name, 0) % len(voices)
+        for k in range(len(voices)):  # свободный голос, иначе - самый давний
+            if voices[(i + k) % len(voices)].state != 'play':
+                i = (i + k) % len(voices)
+                break
+        self.next[name] = i + 1
+        voice = voices[i]
+        if voice.state == 'play':
+            voice.stop()
+        voice.play()
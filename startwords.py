@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+from collections import deque
+import random
+
+
+class StartWords:
+    """Выбор первого слова партии: случайный номер в таблице слов нужной длины!
+
+    Слово берется по номеру (get), поэтому выбор не зависит от размера
+    словаря и не загружает все слова длины. Недавние первые слова
+    исключаются повторным выбором (не больше ATTEMPTS раз), а генератор
+    случайных чисел можно передать с зерном для повтора партии."""
+
+    RECENT = 20  # сколько последних первых слов не повторять
+    ATTEMPTS = 8
+
+    def __init__(self, count: int, get, recent=(), keep: int = RECENT) -> None:
+        self.count = count  # число слов нужной длины
+        self.get = get  # функция: номер -> слово
+        self.recent = deque(recent, maxlen=keep)
+
+    @classmethod
+    def from_compiled(cls, compiled, length: int = 5, recent=(), keep: int = RECENT) -> 'StartWords':
+        """По блоку слов длины length откомпилированного словаря!"""
+        return cls(compiled.block(length)[1], lambda i: compiled.word(length, i), recent, keep)
+
+    @classmethod
+    def from_database(cls, db, length: int = 5, recent=(), keep: int = RECENT) -> 'StartWords':
+        """По таблице rowid слов длины length (читается один раз)!"""
+        rowids = array('l', db.rowids_by_len(length))
+        return cls(len(rowids), lambda i: db.word_by_rowid(rowids[i]), recent, keep)
+
+    @classmethod
+    def from_words(cls, words, length: int = 5, recent=(), keep: int = RECENT) -> 'StartWords':
+        words = sorted(word for word in words if len(word) == length)
+        return cls(len(words), words.__getitem__, recent, keep)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def choose(self, rnd: random.Random = None) -> str:
+        """Случайное слово (в верхнем регистре) или None, если слов нет!"""
+        if not self.count:
+            return None
+        rnd = rnd or random
+        for _ in range(self.ATTEMPTS):
+            word = self.get(rnd.randrange(self.count)).upper()
+            if word not in self.recent:
+                break
+        if self.recent.maxlen:
+            self.recent.append(word)
+        return word
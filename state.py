@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+LETTERS = ' АБВГДЕЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯЁ'  # код буквы - индекс в строке, 0 - пустая клетка
+CODES = {ltr: code for code, ltr in enumerate(LETTERS)}
+
+
+class GameState:
+    """Компактное состояние партии для проверки правил!
+
+    Занятость поля - битовая маска, буквы - bytearray кодов, сыгранные
+    слова - хеш-множество. Kivy-свойства приложения только отражают это
+    состояние, а копия стоит несколько байт и одно множество."""
+
+    __slots__ = ('size', 'letters', 'occupied', 'used_words', 'history', 'score')
+
+    def __init__(self, size: int = 5) -> None:
+        self.size = size
+        self.letters = bytearray(size * size)  # коды букв по клеткам
+        self.occupied = 0  # битовая маска заполненных клеток
+        self.used_words = set()  # сыгранные слова
+        self.history = []  # сыгранные слова по порядку
+        self.score = [0, 0]
+
+    @classmethod
+    def from_view(cls, matrix, history, score, size: int = 5) -> 'GameState':
+        """Состояние по сохраненным данным представления (список букв поля и история)!"""
+        state = cls(size)
+        for cell, ltr in enumerate(matrix):
+            if ltr != ' ':
+                state.letters[cell] = CODES[ltr]
+                state.occupied |= 1 << cell
+        state.history = list(history)
+        state.used_words = set(history)
+        state.score = list(score)
+        return state
+
+    def copy(self) -> 'GameState':
+        state = GameState.__new__(GameState)
+        state.size = self.size
+        state.letters = bytearray(self.letters)
+        state.occupied = self.occupied
+        state.used_words = set(self.used_words)
+        state.history = list(self.history)
+        state.score = list(self.score)
+        return state
+
+    def letter(self, cell: int) -> str:
+        return LETTERS[self.letters[cell]]
+
+    def matrix(self) -> list:
+        """Буквы поля списком строк (' ' - пустая клетка)!"""
+        return [LETTERS[code] for code in self.letters]
+
+    def word(self, path) -> str:
+        return ''.join(LETTERS[self.letters[cell]] for cell in path)
+
+    def is_full(self) -> bool:
+        return self.occupied == (1 << len(self.letters)) - 1
+
+    def blanks(self, path) -> list:
+        """Пустые клетки пути!"""
+        return [cell for cell in path if not self.occupied >> cell & 1]
+
+    def set_word(self, path, word: str) -> None:
+        """Первое слово партии (без начисления очков)!"""
+        for cell, ltr in zip(path, word):
+            self.letters[cell] = CODES[ltr]
+            self.occupied |= 1 << cell
+        self.used_words.add(word)
+        self.history.append(word)
+
+    def place(self, path, word: str, player: int) -> int:
+        """Ход: слово word по пути path, возвращает клетку с новой буквой (-1 если ее нет)!"""
+        cell = -1
+        for i, ltr in zip(path, word):
+            if not self.occupied >> i & 1:
+                cell = i
+                self.letters[i] = CODES[ltr]
+                self.occupied |= 1 << i
+        self.used_words.add(word)
+        self.history.append(word)
+        self.score[player] += len(word)
+        return cell
+
+    def unplace(self, path, word: str, player: int, cell: int) -> None:
+        """Отмена хода place!"""
+        if cell >= 0:
+            self.letters[cell] = 0
+            self.occupied &= ~(1 << cell)
+        self.used_words.discard(word)
+        self.history.pop()
+        self.score[player] -= len(word)
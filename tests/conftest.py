@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Общие данные тестов: синтетический словарь без базы и без Kivy!"""
+
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+import pytest
+from synthetic import make_words
+from engine import Game, Lexicon, PASS
+
+
+@pytest.fixture(scope='session')
+def lexicon() -> Lexicon:
+    return Lexicon.from_words(make_words(20000, seed=3))
+
+
+def start_word(lexicon: Lexicon, size: int) -> str:
+    """Первое по алфавиту слово длины size!"""
+    return next(word for word in lexicon.words if len(word) == size)
+
+
+def play(game: Game, moves: int, seed: int = 1, pass_every: int = 0, on_move=None) -> None:
+    """Сыграть до moves случайных допустимых ходов, каждым pass_every-м - пропуск хода!"""
+    rnd = random.Random(seed)
+    for i in range(1, moves + 1):
+        if pass_every and i % pass_every == 0:
+            game.apply(PASS)
+        else:
+            legal = game.legal_moves()
+            if not legal:
+                return
+            game.apply(rnd.choice(legal))
+        if on_move is not None:
+            on_move(game)
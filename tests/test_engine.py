@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+from conftest import play, start_word
+from engine import Game, Lexicon, Move, PASS, OK, BAD_SELECTION, USED_WORD, UNKNOWN_WORD
+
+WORDS = ['балда', 'бал', 'лад', 'ладья', 'да']
+
+
+@pytest.fixture
+def game() -> Game:
+    """БАЛДА в центральной строке 5 x 5: клетки 10-14!"""
+    return Game.new(Lexicon.from_words(WORDS), 'БАЛДА')
+
+
+def test_new_game(game):
+    assert game.state.matrix()[10:15] == list('БАЛДА')
+    assert game.state.history == ['БАЛДА'] and game.state.score == [0, 0]
+    assert not game.is_over()
+
+
+def test_check_selection(game):
+    assert game.check_selection((10, 11, 6))  # Б, А и пустая клетка над А
+    assert game.check_selection((5, 10))
+    assert not game.check_selection((5,))  # слишком короткий путь
+    assert not game.check_selection((10, 11))  # нет пустой клетки
+    assert not game.check_selection((5, 6, 11))  # две пустые клетки
+    assert not game.check_selection((10, 12, 7))  # клетки не соседние
+    assert not game.check_selection((14, 15, 16))  # переход через край поля
+    assert not game.check_selection((10, 11, 10, 5))  # клетка дважды
+
+
+def test_check_move(game):
+    assert game.check_move(Move((10, 11, 12), 'БАЛ')) == BAD_SELECTION  # нет новой буквы
+    assert game.check_move(Move((12, 13, 8), 'ЛАД')) == BAD_SELECTION  # буква на поле другая
+    assert game.check_move(Move((13, 14, 9), 'ДА')) == BAD_SELECTION  # длина слова не равна пути
+    assert game.check_move(Move((7, 12, 11, 10, 5), 'БАЛДА')) == BAD_SELECTION
+    assert game.check_move(Move((17, 12, 11), 'БАЛ')) == BAD_SELECTION
+    assert game.check_move(Move((13, 14, 9), 'ДАЯ')) == UNKNOWN_WORD
+    assert game.check_move(Move((12, 11, 16), 'ЛАД')) == OK
+    game.apply(Move((12, 11, 16), 'ЛАД'))
+    assert game.check_move(Move((12, 11, 6), 'ЛАД')) == USED_WORD
+
+
+def test_apply_and_undo(game):
+    before = game.state.copy()
+    move = Move((12, 11, 16), 'ЛАД')
+    game.apply(move)
+    assert game.state.letter(16) == 'Д'
+    assert game.state.score == [3, 0] and game.player_turn == 1
+    assert game.state.history[-1] == 'ЛАД' and 'ЛАД' in game.state.used_words
+    game.apply(PASS)
+    assert game.player_turn == 0 and game.state.score == [3, 0]
+
+    assert game.undo() == PASS and game.player_turn == 1
+    assert game.undo() == move and game.player_turn == 0
+    assert game.state.letters == before.letters and game.state.occupied == before.occupied
+    assert game.state.history == before.history and game.state.used_words == before.used_words
+    assert game.state.score == before.score
+
+
+def test_legal_moves_are_checked(game):
+    moves = game.legal_moves()
+    assert Move((12, 11, 16), 'ЛАД') in moves
+    assert all(game.check_move(move) == OK for move in moves)
+
+
+def test_game_over_and_winner(game):
+    game.apply(Move((12, 11, 16), 'ЛАД'))
+    game.apply(PASS)
+    assert game.winner() == 1
+    while not game.is_over():
+        game.apply(game.legal_moves()[0])
+    assert not game.legal_moves()
+
+
+def test_undo_restores_random_game(lexicon):
+    game = Game.new(lexicon, start_word(lexicon, 5))
+    before = game.state.copy()
+    play(game, 10, seed=2, pass_every=3)
+    while game.moves:
+        game.undo()
+    assert game.state.letters == before.letters and game.state.history == before.history
+    assert game.state.score == [0, 0] and game.player_turn == 0
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pytest
+from conftest import play, start_word
+from engine import Game
+from journal import Journal, encode_path, decode_path, HEADER, RECORD, SNAPSHOT_EVERY
+from paths import PathTable, get_paths
+
+
+def state_of(game: Game) -> tuple:
+    state = game.state
+    return state.matrix(), state.history, state.score, game.player_turn
+
+
+def journal_game(lexicon, path: str, size: int, moves: int, pass_every: int = 4):
+    """Партия с записью каждого хода в журнал: (журнал, партия, ходы для истории)!"""
+    game = Game.new(lexicon, start_word(lexicon, size), 0, size)
+    journal = Journal(path)
+    journal.start(game, 7, True, 1)
+    history = []
+
+    def on_move(game):
+        journal.append(game)
+        move, player, _ = game.moves[-1]
+        if move.word:
+            history.append((player, move.word))
+
+    play(game, moves, seed=size, pass_every=pass_every, on_move=on_move)
+    journal.close()
+    return journal, game, history
+
+
+@pytest.mark.parametrize('size', [5, 7])
+def test_encode_decode_path(size):
+    table = get_paths(size) if size == 5 else PathTable(size, max_len=4)
+    for path in table:
+        assert decode_path(path[0], len(path), encode_path(path, size), size) == path
+
+
+@pytest.mark.parametrize('size', [5, 7])
+def test_load_equals_saved_game(lexicon, tmp_path, size):
+    path = str(tmp_path / 'game.bkj')
+    journal, game, history = journal_game(lexicon, path, size, 2 * SNAPSHOT_EVERY + 3)
+    assert journal.records == len(game.moves) > 2 * SNAPSHOT_EVERY
+    assert os.path.exists(journal.snapshot_path)
+
+    loaded = Journal(path)
+    header, restored, moves, over = loaded.load(lexicon)
+    assert header['size'] == size and header['seed'] == 7 and header['playerAI']
+    assert state_of(restored) == state_of(game)
+    assert moves == history
+    assert loaded.records == journal.records
+    assert not over
+
+
+def test_replay_without_snapshot(lexicon, tmp_path):
+    path = str(tmp_path / 'game.bkj')
+    journal, game, history = journal_game(lexicon, path, 5, SNAPSHOT_EVERY + 5)
+    os.remove(journal.snapshot_path)
+
+    header, restored, moves, over = Journal(path).load(lexicon)
+    assert state_of(restored) == state_of(game)
+    assert moves == history
+
+
+def test_snapshot_and_tail(lexicon, tmp_path):
+    path = str(tmp_path / 'game.bkj')
+    journal, game, _ = journal_game(lexicon, path, 5, SNAPSHOT_EVERY + 3)
+
+    loaded = Journal(path)
+    _, restored, _, _ = loaded.load(lexicon)
+    assert len(restored.moves) == 3  # после снимка проиграны только записи хвоста
+    assert state_of(restored) == state_of(game)
+
+
+def test_torn_tail_is_truncated(lexicon, tmp_path):
+    path = str(tmp_path / 'game.bkj')
+    journal, game, history = journal_game(lexicon, path, 5, SNAPSHOT_EVERY + 3)
+    with open(path, 'ab') as f:
+        f.write(b'\x00' * (RECORD.size - 5))  # сбой посреди записи
+
+    header, restored, moves, over = Journal(path).load(lexicon)
+    assert state_of(restored) == state_of(game)
+    assert moves == history
+    assert os.path.getsize(path) == HEADER.size + journal.records * RECORD.size
+
+
+def test_end_and_full_game(lexicon, tmp_path):
+    path = str(tmp_path / 'game.bkj')
+    journal, game, _ = journal_game(lexicon, path, 5, SNAPSHOT_EVERY + 3)
+    journal.end()
+    journal.close()
+
+    _, restored, _, over = Journal(path).load(lexicon)
+    assert over
+    full = Journal(path).full_game(lexicon)
+    assert [move for move, _, _ in full.moves] == [move for move, _, _ in game.moves]
+    assert state_of(full) == state_of(game)
+
+
+def test_missing_journal(lexicon, tmp_path):
+    assert Journal(str(tmp_path / 'none.bkj')).load(lexicon) is None
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+from conftest import play, start_word
+from engine import Game, Lexicon
+from paths import get_paths
+from state import LETTERS
+from synthetic import make_words
+from trie import find_moves, has_move
+
+
+@pytest.fixture(scope='module')
+def short_lexicon() -> Lexicon:
+    """Слова не длиннее путей таблицы (7 клеток)!"""
+    return Lexicon.from_words(word for word in make_words(20000, seed=3) if len(word) <= 7)
+
+
+def brute_force(game: Game) -> set:
+    """Ходы перебором всех путей таблицы: ровно одна пустая клетка, слово в словаре и еще не сыграно!"""
+    state, words = game.state, set(game.lexicon.words)
+    matrix = state.matrix()
+    moves = set()
+    for path in get_paths(game.size):
+        blanks = state.blanks(path)
+        if len(blanks) != 1:
+            continue
+        i = path.index(blanks[0])
+        for ltr in LETTERS[1:]:
+            word = ''.join(ltr if j == i else matrix[cell] for j, cell in enumerate(path))
+            if word in words and word not in state.used_words:
+                moves.add((path, word))
+    return moves
+
+
+def test_moves_equal_brute_force(short_lexicon):
+    game = Game.new(short_lexicon, start_word(short_lexicon, 5))
+    positions = []
+    play(game, 12, seed=5, on_move=lambda game: positions.append(game.copy()))
+    assert len(positions) > 6
+    for position in [Game.new(short_lexicon, start_word(short_lexicon, 5))] + positions:
+        moves = find_moves(position.state.matrix(), short_lexicon.trie, position.state.used_words)
+        assert len(moves) == len(set(moves))
+        assert set(moves) == brute_force(position)
+        assert has_move(position.state.matrix(), short_lexicon.trie, position.state.used_words) == bool(moves)
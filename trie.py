@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+
+
+_neighbours = {}
+
+
+def neighbours(size: int = 5) -> tuple:
+    """Соседние клетки (по вертикали и горизонтали) для каждой клетки поля size x size!"""
+    if size in _neighbours:
+        return _neighbours[size]
+    result = []
+    for i in range(size * size):
+        row, col = divmod(i, size)
+        cells = []
+        if row > 0: cells.append(i - size)
+        if col > 0: cells.append(i - 1)
+        if col < size - 1: cells.append(i + 1)
+        if row < size - 1: cells.append(i + size)
+        result.append(tuple(cells))
+    _neighbours[size] = tuple(result)
+    return _neighbours[size]
+
+
+class WordTrie:
+    """Компактное префиксное дерево слов словаря!
+
+    Узлы хранятся в плоских массивах: дети каждого узла лежат подряд, поэтому
+    переход по букве - это поиск символа в срезе строки меток."""
+
+    def __init__(self, words) -> None:
+        words = sorted(set(words))
+        labels = [' ']  # метка (буква) узла, 0 - корень
+        self.first = array('l', [0])  # индекс первого ребенка узла
+        self.count = array('B', [0])  # количество детей узла
+        self.terminal = bytearray(1)  # признак конца слова в узле
+
+        # обход в ширину по диапазонам отсортированного списка слов с общим префиксом
+        queue = [(0, 0, len(words), 0)]  # (узел, начало, конец, глубина)
+        for node, lo, hi, depth in queue:
+            if lo < hi and len(words[lo]) == depth:  # слово-префикс всегда первое в диапазоне
+                self.terminal[node] = 1
+                lo += 1
+            self.first[node] = len(labels)
+            start = lo
+            while start < hi:
+                ltr = words[start][depth]
+                end = start + 1
+                while end < hi and words[end][depth] == ltr:
+                    end += 1
+                queue.append((len(labels), start, end, depth + 1))
+                labels.append(ltr)
+                self.first.append(0)
+                self.count.append(0)
+                self.terminal.append(0)
+                self.count[node] += 1
+                start = end
+
+        self.labels = ''.join(labels)
+        self.size = len(words)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def child(self, node: int, letter: str) -> int:
+        """Узел-ребенок по букве или -1!"""
+        first = self.first[node]
+        return self.labels.find(letter, first, first + self.count[node])
+
+    def find(self, prefix: str) -> int:
+        """Узел префикса или -1!"""
+        node = 0
+        for ltr in prefix:
+            node = self.child(node, ltr)
+            if node < 0:
+                break
+        return node
+
+    def __contains__(self, word: str) -> bool:
+        node = self.find(word)
+        return node >= 0 and self.terminal[node] == 1
+
+
+def iter_moves(matrix, trie: WordTrie, exclude=(), size: int = 5, starts=None):
+    """Все допустимые ходы на поле по одному (генератор пар (путь, слово))!
+
+    Путь содержит ровно одну пустую клетку, в которую ставится буква. Обход
+    начинается с каждой заполненной клетки и с каждой пустой клетки рядом с
+    заполненной и обрывается, как только в дереве нет такого префикса. Обход
+    в глубину идет по явному стеку, поэтому ходы отдаются сразу по мере
+    нахождения и перебор можно прервать на первом же подходящем. Память
+    обхода ограничена глубиной пути, а не числом путей на поле, поэтому
+    таблица путей для больших полей не нужна. starts - порядок начальных
+    клеток (по умолчанию все по порядку): ходы от одной начальной клетки
+    отдаются подряд."""
+    nbrs = neighbours(size)
+    labels, first, count, terminal = trie.labels, trie.first, trie.count, trie.terminal
+    stack = []  # (путь, узел, слово, посещенные клетки, есть ли пустая клетка)
+
+    for cell in range(len(matrix)) if starts is None else starts:
+        ltr = matrix[cell]
+        if ltr != ' ':
+            node = trie.child(0, ltr)
+            if node >= 0:
+                stack.append(((cell,), node, ltr, 1 << cell, False))
+        elif any(matrix[i] != ' ' for i in nbrs[cell]):
+            for child in range(first[0] + count[0] - 1, first[0] - 1, -1):
+                stack.append(((cell,), child, labels[child], 1 << cell, True))
+
+        while stack:
+            path, node, word, visited, blank = stack.pop()
+            if blank and terminal[node] and len(path) > 1 and word not in exclude:
+                yield path, word
+            f, n = first[node], count[node]
+            if not n:
+                continue
+            for nxt in nbrs[path[-1]]:
+                if visited >> nxt & 1:
+                    continue
+                ltr = matrix[nxt]
+                if ltr == ' ':
+                    if blank:  # вторая пустая клетка в пути недопустима
+                        continue
+                    for child in range(f, f + n):
+                        stack.append((path + (nxt,), child, word + labels[child], visited | 1 << nxt, True))
+                else:
+                    child = labels.find(ltr, f, f + n)
+                    if child >= 0:
+                        stack.append((path + (nxt,), child, word + ltr, visited | 1 << nxt, blank))
+
+
+def has_move(matrix, trie: WordTrie, exclude=(), size: int = 5) -> bool:
+    """Есть ли хоть один допустимый ход (обход обрывается на первом найденном)!"""
+    for _ in iter_moves(matrix, trie, exclude, size):
+        return True
+    return False
+
+
+def find_moves(matrix, trie: WordTrie, exclude=(), size: int = 5) -> list:
+    """Все допустимые ходы на поле: список пар (путь, слово)!"""
+    return list(iter_moves(matrix, trie, exclude, size))
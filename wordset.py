@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_left
+import zlib
+
+MASK64 = (1 << 64) - 1
+
+
+def words_checksum(words) -> int:
+    """crc32 отсортированного списка слов: файлы толкований и словаря построены по этому словарю!"""
+    return zlib.crc32('\n'.join(words).encode('utf-8'))
+
+
+class WordSet:
+    """Множество слов словаря: фильтр Блума и отсортированный массив!
+
+    Фильтр Блума (около 10 бит на слово, 7 хешей, ложные срабатывания ~1%)
+    отвечает на большинство проверок несуществующих слов за k обращений к
+    битовому массиву; только прошедшие фильтр слова ищутся двоичным поиском
+    в отсортированном списке. Хеш - встроенный hash строки (кешируется в
+    объекте строки), поэтому фильтр не сохраняется между запусками."""
+
+    BITS_PER_WORD = 10
+    HASHES = 7
+
+    def __init__(self, words) -> None:
+        self.words = sorted(set(words))
+        self.size = max(64, len(self.words) * self.BITS_PER_WORD)  # бит в фильтре
+        self.bloom = bytearray(self.size // 8 + 1)
+        bloom = self.bloom
+        for word in self.words:
+            for bit in self.bits(word):
+                bloom[bit >> 3] |= 1 << (bit & 7)
+
+    def bits(self, word: str) -> list:
+        """Номера бит слова в фильтре (двойное хеширование)!"""
+        h = hash(word) & MASK64
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.HASHES)]
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def checksum(self) -> int:
+        """crc32 списка слов: файл толкований построен по этому словарю!"""
+        return words_checksum(self.words)
+
+    def maybe(self, word: str) -> bool:
+        """False - слова точно нет, True - возможно есть!"""
+        bloom, size = self.bloom, self.size
+        h = hash(word) & MASK64
+        bit, h2 = (h & 0xFFFFFFFF) % size, ((h >> 32) | 1) % size
+        for _ in range(self.HASHES):
+            if not bloom[bit >> 3] & (1 << (bit & 7)):
+                return False
+            bit += h2
+            if bit >= size:
+                bit -= size
+        return True
+
+    def index(self, word: str) -> int:
+        """Номер слова в отсортированном списке или -1!"""
+        if not self.maybe(word):
+            return -1
+        i = bisect_left(self.words, word)
+        return i if i < len(self.words) and self.words[i] == word else -1
+
+    def contains(self, word: str) -> bool:
+        return self.index(word) >= 0
+
+    __contains__ = contains